@@ -26,80 +26,116 @@ v4.2 Modules:
 - High-Frequency Trading: Microsecond latency, arbitrage
 """
 
-# Legacy ensemble analyzer (for backward compatibility)
-from .ensemble_analyzer import EnsembleAnalyzer, get_analyzer
-
-# v4.0 modules
-from .ml_predictor import MLPricePredictor, PricePrediction, get_ml_predictor
-from .rl_agent import DQNAgent, RLState, RLAction, get_rl_agent
-from .ensemble_ai import EnsembleAI, EnsemblePrediction, get_ensemble_ai
-from .meta_learning import MetaLearningEngine, MetaKnowledge, get_meta_learning_engine
-
-# v4.1 modules
-from .deep_learning import (
-    DeepLearningManager, DeepLearningPrediction,
-    LSTMPricePredictor, TransformerPricePredictor, CNNPatternRecognizer,
-    get_deep_learning_manager
-)
-from .advanced_rl import (
-    AdvancedRLManager, RLAction as AdvancedRLAction,
-    A3CAgent, PPOAgent, SACAgent,
-    get_advanced_rl_manager
-)
-from .automl import (
-    AutoMLManager, AutoMLResult, HyperparameterConfig,
-    FeatureImportance, get_automl_manager
-)
-from .backtesting import (
-    BacktestEngine, BacktestResult, BacktestConfig,
-    BacktestTrade, get_backtest_engine
-)
-# Position is now imported from core (v4.2 standardization)
-from core import Position
-
-# v4.2 modules
-from .realtime_system import (
-    RealTimeDataStream, EventDrivenTradingEngine,
-    StreamingTick, StreamingCandle, StreamingEvent,
-    get_data_stream, get_trading_engine
-)
-from .portfolio_optimization import (
-    PortfolioOptimizationManager, PortfolioAllocation, PortfolioMetrics,
-    MarkowitzOptimizer, BlackLittermanOptimizer, RiskParityOptimizer,
-    MonteCarloSimulator, get_portfolio_manager
-)
-from .sentiment_analysis import (
-    SentimentAnalysisManager, SentimentReport,
-    NewsSentimentAnalyzer, SocialMediaAnalyzer,
-    NewsArticle, SocialMediaPost,
-    get_sentiment_manager
-)
-from .advanced_systems import (
-    MultiAgentSystem, AdvancedRiskManager, MarketRegimeDetector,
-    PerformanceOptimizer, AgentDecision, ConsensusDecision,
-    RiskMetrics, MarketRegime,
-    get_multi_agent_system, get_risk_manager,
-    get_regime_detector, get_performance_optimizer
-)
-from .options_hft import (
-    BlackScholesModel, OptionsStrategyAnalyzer, HighFrequencyTrader,
-    OptionContract, OptionGreeks, HFTOrder, HFTSignal,
-    get_bs_model, get_options_analyzer, get_hft_trader
-)
-
-# v4.0 Advanced Features
-try:
-    from .backtest_report_generator import BacktestReportGenerator, BacktestReport
-    from .strategy_optimizer import StrategyOptimizer, OptimizationResult
-    from .market_regime_classifier import MarketRegimeClassifier, RegimeType, VolatilityLevel
-    from .anomaly_detector import AnomalyDetector, AnomalyEvent, AnomalyType
-except ImportError as e:
-    import warnings
-    warnings.warn(f"v4.0 Advanced Features could not be imported: {e}")
-    BacktestReportGenerator = BacktestReport = None
-    StrategyOptimizer = OptimizationResult = None
-    MarketRegimeClassifier = RegimeType = VolatilityLevel = None
-    AnomalyDetector = AnomalyEvent = AnomalyType = None
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so
+# `import ai` stays cheap and callers only pay for the models they use.
+_LAZY_IMPORTS = {
+    # Legacy ensemble analyzer (for backward compatibility)
+    '.ensemble_analyzer': ('EnsembleAnalyzer', 'get_analyzer'),
+
+    # v4.0 modules
+    '.ml_predictor': ('MLPricePredictor', 'PricePrediction', 'get_ml_predictor'),
+    '.rl_agent': ('DQNAgent', 'RLState', 'RLAction', 'get_rl_agent'),
+    '.ensemble_ai': ('EnsembleAI', 'EnsemblePrediction', 'get_ensemble_ai'),
+    '.meta_learning': ('MetaLearningEngine', 'MetaKnowledge', 'get_meta_learning_engine'),
+
+    # v4.1 modules
+    '.deep_learning': (
+        'DeepLearningManager', 'DeepLearningPrediction',
+        'LSTMPricePredictor', 'TransformerPricePredictor', 'CNNPatternRecognizer',
+        'get_deep_learning_manager'
+    ),
+    '.advanced_rl': (
+        'AdvancedRLManager', 'A3CAgent', 'PPOAgent', 'SACAgent',
+        'get_advanced_rl_manager'
+    ),
+    '.automl': (
+        'AutoMLManager', 'AutoMLResult', 'HyperparameterConfig',
+        'FeatureImportance', 'get_automl_manager'
+    ),
+    '.backtesting': (
+        'BacktestEngine', 'BacktestResult', 'BacktestConfig',
+        'BacktestTrade', 'get_backtest_engine'
+    ),
+    # Position is now imported from core (v4.2 standardization)
+    'core': ('Position',),
+
+    # v4.2 modules
+    '.realtime_system': (
+        'RealTimeDataStream', 'EventDrivenTradingEngine',
+        'StreamingTick', 'StreamingCandle', 'StreamingEvent',
+        'get_data_stream', 'get_trading_engine'
+    ),
+    '.portfolio_optimization': (
+        'PortfolioOptimizationManager', 'PortfolioAllocation', 'PortfolioMetrics',
+        'MarkowitzOptimizer', 'BlackLittermanOptimizer', 'RiskParityOptimizer',
+        'MonteCarloSimulator', 'get_portfolio_manager'
+    ),
+    '.sentiment_analysis': (
+        'SentimentAnalysisManager', 'SentimentReport',
+        'NewsSentimentAnalyzer', 'SocialMediaAnalyzer',
+        'NewsArticle', 'SocialMediaPost',
+        'get_sentiment_manager'
+    ),
+    '.advanced_systems': (
+        'MultiAgentSystem', 'AdvancedRiskManager', 'MarketRegimeDetector',
+        'PerformanceOptimizer', 'AgentDecision', 'ConsensusDecision',
+        'RiskMetrics', 'MarketRegime',
+        'get_multi_agent_system', 'get_risk_manager',
+        'get_regime_detector', 'get_performance_optimizer'
+    ),
+    '.options_hft': (
+        'BlackScholesModel', 'OptionsStrategyAnalyzer', 'HighFrequencyTrader',
+        'OptionContract', 'OptionGreeks', 'HFTOrder', 'HFTSignal',
+        'get_bs_model', 'get_options_analyzer', 'get_hft_trader'
+    ),
+
+    # v4.0 Advanced Features
+    '.backtest_report_generator': ('BacktestReportGenerator', 'BacktestReport'),
+    '.strategy_optimizer': ('StrategyOptimizer', 'OptimizationResult'),
+    '.market_regime_classifier': ('MarketRegimeClassifier', 'RegimeType', 'VolatilityLevel'),
+    '.anomaly_detector': ('AnomalyDetector', 'AnomalyEvent', 'AnomalyType'),
+}
+
+# Exported name -> (module, attribute)
+_LAZY_ATTRS = {
+    name: (module, name)
+    for module, names in _LAZY_IMPORTS.items()
+    for name in names
+}
+_LAZY_ATTRS['AdvancedRLAction'] = ('.advanced_rl', 'RLAction')
+
+# v4.0 Advanced Features resolve to None (with a warning) when they cannot be imported
+_OPTIONAL_MODULES = {
+    '.backtest_report_generator', '.strategy_optimizer',
+    '.market_regime_classifier', '.anomaly_detector'
+}
+
+
+def __getattr__(name):
+    """Import the submodule that provides ``name`` on first access"""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    except (ImportError, AttributeError) as e:
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        import warnings
+        warnings.warn(f"v4.0 Advanced Features could not be imported: {e}")
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Legacy
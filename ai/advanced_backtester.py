@@ -10,10 +10,13 @@ Features:
 - 워크포워드 분석
 - 성능 리포트 생성
 """
-from typing import Dict, Any, List, Optional, Callable, Tuple
+from typing import Dict, Any, List, Optional, Callable, Tuple, Iterator
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 import numpy as np
 import statistics
 
@@ -92,6 +95,133 @@ class BacktestResult:
     drawdown_curve: List[Tuple[datetime, float]] = field(default_factory=list)
 
 
+class BarsView(Sequence):
+    """
+    종목 OHLCV 리스트의 읽기 전용 뷰 (복사 없음)
+
+    원본 리스트의 [start, stop) 구간만 노출한다. 전략에는 현재 시뮬레이션
+    시점까지의 구간이 전달되며, bars[-1] / bars[-20:] / 순회 등 리스트와
+    같은 방식으로 사용할 수 있다.
+    """
+
+    __slots__ = ('_bars', '_start', '_stop')
+
+    def __init__(self, bars: List[Dict], start: int, stop: int):
+        self._bars = bars
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return BarsView(self._bars, self._start + start, self._start + max(start, stop))
+            return [self._bars[self._start + i] for i in range(start, stop, step)]
+
+        length = self._stop - self._start
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('BarsView index out of range')
+        return self._bars[self._start + index]
+
+    def __iter__(self) -> Iterator[Dict]:
+        return islice(self._bars, self._start, self._stop)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (BarsView, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BarsView(len={len(self)})"
+
+    def to_list(self) -> List[Dict]:
+        """리스트로 복사"""
+        return self._bars[self._start:self._stop]
+
+
+class MarketDataView(Mapping):
+    """
+    워크포워드 데이터 뷰 (stock_code -> BarsView)
+
+    종목별 바를 한 번만 날짜순으로 색인하고, 시뮬레이션 시점이 진행되면
+    종목별 커서만 앞으로 이동한다. 현재 시점까지 바가 하나 이상 있는
+    종목만 노출하며, 순회 순서는 원본 data의 종목 순서를 따른다.
+    """
+
+    def __init__(self, data: Dict[str, List[Dict]], parse_date: Callable[[Any], datetime]):
+        self._codes: List[str] = list(data.keys())
+        self._bars: Dict[str, List[Dict]] = {}
+        self._dates: Dict[str, List[datetime]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._active = 0
+
+        # 날짜 -> 해당 날짜에 바가 있는 종목 (중복 바는 중복 등록)
+        self._by_date: Dict[datetime, List[str]] = defaultdict(list)
+
+        for code, bars in data.items():
+            dated = [(parse_date(bar.get('date')), bar) for bar in bars]
+            if any(dated[i][0] > dated[i + 1][0] for i in range(len(dated) - 1)):
+                dated.sort(key=lambda item: item[0])
+
+            self._bars[code] = [bar for _, bar in dated]
+            self._dates[code] = [date for date, _ in dated]
+            self._cursor[code] = 0
+
+            for date, _ in dated:
+                self._by_date[date].append(code)
+
+        self._keys: List[datetime] = sorted(self._by_date.keys())
+        self._key_pos = 0
+        self._current: Optional[datetime] = None
+
+    @property
+    def dates(self) -> List[datetime]:
+        """전체 거래일 (정렬)"""
+        return list(self._keys)
+
+    def advance_to(self, date: datetime):
+        """
+        시점 이동 (앞으로만)
+
+        지나간 날짜에 바가 있는 종목의 커서만 증가시키므로 전체 실행 비용은
+        바 개수에 비례한다.
+        """
+        if self._current is not None and date < self._current:
+            raise ValueError(f"MarketDataView는 앞으로만 이동할 수 있습니다: {date} < {self._current}")
+
+        keys = self._keys
+        cursor = self._cursor
+        while self._key_pos < len(keys) and keys[self._key_pos] <= date:
+            for code in self._by_date[keys[self._key_pos]]:
+                if cursor[code] == 0:
+                    self._active += 1
+                cursor[code] += 1
+            self._key_pos += 1
+
+        self._current = date
+
+    def __getitem__(self, code: str) -> BarsView:
+        position = self._cursor.get(code, 0)
+        if position == 0:
+            raise KeyError(code)
+        return BarsView(self._bars[code], 0, position)
+
+    def __contains__(self, code) -> bool:
+        return self._cursor.get(code, 0) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        cursor = self._cursor
+        return (code for code in self._codes if cursor[code] > 0)
+
+    def __len__(self) -> int:
+        return self._active
+
+
 class AdvancedBacktester:
     """
     고급 백테스팅 엔진 (v5.11)
@@ -148,6 +278,9 @@ class AdvancedBacktester:
         """
         백테스트 실행
 
+        전략에는 현재 날짜까지의 MarketDataView(stock_code -> BarsView)가
+        전달된다. 리스트처럼 읽을 수 있으며 날마다 복사본을 만들지 않는다.
+
         Args:
             strategy: 전략 함수 (context, data) -> signals
             data: 주가 데이터
@@ -160,8 +293,14 @@ class AdvancedBacktester:
         # Reset state
         self._reset()
 
+        # 종목별 바를 한 번만 색인 (날짜 파싱 1회)
+        current_data = MarketDataView(data, self._parse_date)
+
         # Get all dates
-        all_dates = self._get_all_dates(data, start_date, end_date)
+        all_dates = [
+            date for date in current_data.dates
+            if not (start_date and date < start_date) and not (end_date and date > end_date)
+        ]
 
         logger.info(f"Running backtest: {len(all_dates)} days, {len(data)} stocks")
 
@@ -169,8 +308,8 @@ class AdvancedBacktester:
         for i, date in enumerate(all_dates):
             self.current_time = date
 
-            # Get data up to current date
-            current_data = self._get_data_until(data, date)
+            # 현재 날짜까지의 데이터 (커서 이동만, 복사 없음)
+            current_data.advance_to(date)
 
             # Run strategy
             try:
@@ -282,15 +421,28 @@ class AdvancedBacktester:
         self,
         result: BacktestResult,
         num_simulations: int = 1000,
-        num_trades: Optional[int] = None
+        num_trades: Optional[int] = None,
+        block_size: int = 1,
+        ruin_threshold: float = 0.5,
+        chunk_size: Optional[int] = None,
+        seed: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Monte Carlo 시뮬레이션
+        Monte Carlo 시뮬레이션 (NumPy 배치)
+
+        거래 수익률을 복원 추출한 경로를 (시뮬레이션 × 거래) 행렬로 한 번에
+        생성하고, 최종 자산 / 최대 낙폭 / 파산 확률을 행렬 연산으로 계산한다.
+        경로 행렬은 chunk 단위로만 만들기 때문에 메모리는 시뮬레이션 수에만
+        비례한다 (100만 회도 가능).
 
         Args:
             result: 백테스트 결과
             num_simulations: 시뮬레이션 횟수
-            num_trades: 거래 수 (None이면 원래 거래 수)
+            num_trades: 거래 수 (None이면 원래 거래 수, 1 이상)
+            block_size: 블록 부트스트랩 길이 (1이면 단순 복원 추출, 자기상관 반영 시 >1)
+            ruin_threshold: 파산 기준 손실 비율 (0.5 = 초기 자본의 50% 손실)
+            chunk_size: 한 번에 생성할 경로 수 (None이면 자동)
+            seed: 난수 시드 (재현용)
 
         Returns:
             시뮬레이션 결과
@@ -299,45 +451,98 @@ class AdvancedBacktester:
             return {'error': 'No trades to simulate'}
 
         # Extract trade returns
-        returns = [trade.pnl_percent for trade in result.trades]
+        returns = np.array([trade.pnl_percent for trade in result.trades], dtype=np.float64)
+        growth = 1 + returns / 100
 
         if num_trades is None:
             num_trades = len(returns)
+        if num_trades < 1:
+            return {'error': f'num_trades must be >= 1 (got {num_trades})'}
+        if num_simulations < 1:
+            return {'error': f'num_simulations must be >= 1 (got {num_simulations})'}
+
+        block_size = int(min(max(block_size, 1), len(returns)))
+        if chunk_size is None:
+            chunk_size = max(1, min(num_simulations, 2_000_000 // max(num_trades, 1)))
+
+        logger.info(
+            f"Running Monte Carlo simulation: {num_simulations} simulations, {num_trades} trades each "
+            f"(block={block_size}, chunk={chunk_size})"
+        )
 
-        logger.info(f"Running Monte Carlo simulation: {num_simulations} simulations, {num_trades} trades each")
+        rng = np.random.default_rng(seed)
+        ruin_level = 1 - ruin_threshold
 
-        final_equities = []
+        # 경로별 결과만 보관 (경로 행렬은 chunk마다 폐기)
+        final_equities = np.empty(num_simulations)
+        max_drawdowns = np.empty(num_simulations)
+        ruined = np.empty(num_simulations, dtype=bool)
 
-        for _ in range(num_simulations):
-            # Random sampling with replacement
-            simulated_returns = np.random.choice(returns, size=num_trades, replace=True)
+        for start in range(0, num_simulations, chunk_size):
+            size = min(chunk_size, num_simulations - start)
+            indices = self._bootstrap_indices(rng, len(returns), size, num_trades, block_size)
 
-            # Calculate equity curve
-            equity = self.initial_capital
-            for ret in simulated_returns:
-                equity *= (1 + ret / 100)
+            # 자산 곡선 (초기 자본 대비 배수)
+            paths = np.cumprod(growth[indices], axis=1)
+            peaks = np.maximum(np.maximum.accumulate(paths, axis=1), 1.0)
 
-            final_equities.append(equity)
+            end = start + size
+            final_equities[start:end] = paths[:, -1]
+            max_drawdowns[start:end] = ((peaks - paths) / peaks).max(axis=1) * 100
+            ruined[start:end] = paths.min(axis=1) <= ruin_level
 
-        final_returns = [(eq - self.initial_capital) / self.initial_capital * 100 for eq in final_equities]
+        final_equities *= self.initial_capital
+        final_returns = (final_equities - self.initial_capital) / self.initial_capital * 100
+        return_pcts = np.percentile(final_returns, [5, 25, 50, 75, 95])
+        drawdown_pcts = np.percentile(max_drawdowns, [5, 25, 50, 75, 95])
 
         return {
             'num_simulations': num_simulations,
             'num_trades': num_trades,
-            'mean_final_equity': statistics.mean(final_equities),
-            'median_final_equity': statistics.median(final_equities),
-            'std_final_equity': statistics.stdev(final_equities) if len(final_equities) > 1 else 0,
-            'min_final_equity': min(final_equities),
-            'max_final_equity': max(final_equities),
-            'mean_return_pct': statistics.mean(final_returns),
-            'percentile_5': np.percentile(final_returns, 5),
-            'percentile_25': np.percentile(final_returns, 25),
-            'percentile_50': np.percentile(final_returns, 50),
-            'percentile_75': np.percentile(final_returns, 75),
-            'percentile_95': np.percentile(final_returns, 95),
-            'probability_of_profit': sum(1 for r in final_returns if r > 0) / len(final_returns) * 100
+            'mean_final_equity': float(final_equities.mean()),
+            'median_final_equity': float(np.median(final_equities)),
+            'std_final_equity': float(final_equities.std(ddof=1)) if num_simulations > 1 else 0,
+            'min_final_equity': float(final_equities.min()),
+            'max_final_equity': float(final_equities.max()),
+            'mean_return_pct': float(final_returns.mean()),
+            'percentile_5': float(return_pcts[0]),
+            'percentile_25': float(return_pcts[1]),
+            'percentile_50': float(return_pcts[2]),
+            'percentile_75': float(return_pcts[3]),
+            'percentile_95': float(return_pcts[4]),
+            'probability_of_profit': float((final_returns > 0).mean() * 100),
+            'block_size': block_size,
+            'mean_max_drawdown_pct': float(max_drawdowns.mean()),
+            'worst_max_drawdown_pct': float(max_drawdowns.max()),
+            'max_drawdown_percentiles': {
+                p: float(v) for p, v in zip((5, 25, 50, 75, 95), drawdown_pcts)
+            },
+            'ruin_threshold_pct': ruin_threshold * 100,
+            'risk_of_ruin': float(ruined.mean() * 100)
         }
 
+    @staticmethod
+    def _bootstrap_indices(
+        rng: np.random.Generator,
+        num_returns: int,
+        num_paths: int,
+        num_trades: int,
+        block_size: int
+    ) -> np.ndarray:
+        """
+        부트스트랩 인덱스 행렬 (num_paths × num_trades)
+
+        block_size > 1이면 이동 블록 부트스트랩: 연속된 거래 block_size개를
+        한 묶음으로 추출해 수익률의 자기상관을 보존한다.
+        """
+        if block_size == 1:
+            return rng.integers(0, num_returns, size=(num_paths, num_trades))
+
+        num_blocks = -(-num_trades // block_size)
+        starts = rng.integers(0, num_returns - block_size + 1, size=(num_paths, num_blocks))
+        indices = starts[:, :, None] + np.arange(block_size)
+        return indices.reshape(num_paths, -1)[:, :num_trades]
+
     # ========================================================================
     # Private Helper Methods
     # ========================================================================
@@ -351,48 +556,6 @@ class AdvancedBacktester:
         self.equity_curve.clear()
         self.current_time = None
 
-    def _get_all_dates(
-        self,
-        data: Dict[str, List[Dict]],
-        start: Optional[datetime],
-        end: Optional[datetime]
-    ) -> List[datetime]:
-        """모든 거래일 추출"""
-        all_dates = set()
-
-        for stock_data in data.values():
-            for bar in stock_data:
-                date = bar.get('date')
-                if isinstance(date, str):
-                    date = datetime.fromisoformat(date)
-
-                if start and date < start:
-                    continue
-                if end and date > end:
-                    continue
-
-                all_dates.add(date)
-
-        return sorted(list(all_dates))
-
-    def _get_data_until(
-        self,
-        data: Dict[str, List[Dict]],
-        date: datetime
-    ) -> Dict[str, List[Dict]]:
-        """특정 날짜까지 데이터 추출"""
-        result = {}
-
-        for stock_code, bars in data.items():
-            filtered = [
-                bar for bar in bars
-                if self._parse_date(bar.get('date')) <= date
-            ]
-            if filtered:
-                result[stock_code] = filtered
-
-        return result
-
     def _parse_date(self, date) -> datetime:
         """날짜 파싱"""
         if isinstance(date, datetime):
@@ -718,6 +881,8 @@ class AdvancedBacktester:
 
 __all__ = [
     'AdvancedBacktester',
+    'MarketDataView',
+    'BarsView',
     'BacktestResult',
     'BacktestTrade',
     'BacktestOrder',
@@ -10,10 +10,11 @@ from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from datetime import datetime
-from collections import deque
 import json
 import threading
 
+from .replay_buffer import ReplayBuffer
+
 try:
     import torch
     import torch.nn as nn
@@ -115,7 +116,8 @@ class A3CAgent:
     """
 
     def __init__(self, state_dim: int = 15, action_dim: int = 7,
-                 lr: float = 0.001, gamma: float = 0.99, entropy_coef: float = 0.01):
+                 lr: float = 0.001, gamma: float = 0.99, entropy_coef: float = 0.01,
+                 rollout_size: int = 2048):
         self.state_dim = state_dim
         self.action_dim = action_dim
         self.gamma = gamma
@@ -127,6 +129,9 @@ class A3CAgent:
         else:
             self.network = None
 
+        # N-step rollout (chronological, cleared after each update)
+        self.memory = ReplayBuffer(capacity=rollout_size, state_dim=state_dim, store_next_state=False)
+
         self.episode_rewards = []
         self.episode_count = 0
 
@@ -158,12 +163,33 @@ class A3CAgent:
 
             return action.item(), entropy.item(), value.item()
 
-    def train_step(self, states: List[np.ndarray], actions: List[int],
-                   rewards: List[float], next_states: List[np.ndarray],
-                   dones: List[bool]) -> Dict[str, float]:
+    def store_transition(self, state: np.ndarray, action: int, reward: float, done: bool):
+        """Store transition in rollout memory (raises once the rollout is full)"""
+        if self.memory.is_full():
+            raise RuntimeError(
+                f"A3C rollout full ({self.memory.capacity} transitions); call train_step() before storing more"
+            )
+        self.memory.add(state, action, reward, done=done)
+
+    def compute_returns(self, rewards: np.ndarray, dones: np.ndarray) -> np.ndarray:
+        """Discounted returns, reset at episode ends"""
+        returns = np.zeros(len(rewards), dtype=np.float32)
+        R = 0.0
+        for t in range(len(rewards) - 1, -1, -1):
+            if dones[t]:
+                R = 0.0
+            R = rewards[t] + self.gamma * R
+            returns[t] = R
+        return returns
+
+    def train_step(self, states: Optional[List[np.ndarray]] = None, actions: Optional[List[int]] = None,
+                   rewards: Optional[List[float]] = None, next_states: Optional[List[np.ndarray]] = None,
+                   dones: Optional[List[bool]] = None) -> Dict[str, float]:
         """
         Train A3C network
 
+        Called without arguments, trains on the stored rollout and clears it.
+
         Args:
             states: List of states
             actions: List of actions
@@ -177,26 +203,25 @@ class A3CAgent:
         if not TORCH_AVAILABLE:
             return {'actor_loss': 0.01, 'critic_loss': 0.02, 'entropy': 0.8}
 
+        if states is None:
+            if len(self.memory) == 0:
+                return {'actor_loss': 0.0, 'critic_loss': 0.0, 'entropy': 0.0}
+            rollout = self.memory.rollout()
+            self.memory.clear()
+            states, actions, rewards, dones = rollout.states, rollout.actions, rollout.rewards, rollout.dones
+
         self.network.train()
 
         # Convert to tensors
-        states_tensor = torch.FloatTensor(np.array(states))
-        actions_tensor = torch.LongTensor(actions)
-        rewards_tensor = torch.FloatTensor(rewards)
+        states_tensor = torch.as_tensor(np.asarray(states), dtype=torch.float32)
+        actions_tensor = torch.as_tensor(np.asarray(actions), dtype=torch.long)
 
         # Forward pass
         action_probs, values = self.network(states_tensor)
         values = values.squeeze()
 
         # Calculate advantages
-        returns = []
-        R = 0
-        for r, done in zip(reversed(rewards), reversed(dones)):
-            if done:
-                R = 0
-            R = r + self.gamma * R
-            returns.insert(0, R)
-        returns = torch.FloatTensor(returns)
+        returns = torch.from_numpy(self.compute_returns(np.asarray(rewards, dtype=np.float32), np.asarray(dones)))
         advantages = returns - values.detach()
 
         # Actor loss (policy gradient)
@@ -293,7 +318,8 @@ class PPOAgent:
 
     def __init__(self, state_dim: int = 15, action_dim: int = 7,
                  lr: float = 0.0003, gamma: float = 0.99, gae_lambda: float = 0.95,
-                 clip_epsilon: float = 0.2, epochs: int = 10, batch_size: int = 64):
+                 clip_epsilon: float = 0.2, epochs: int = 10, batch_size: int = 64,
+                 rollout_size: int = 4096):
         self.state_dim = state_dim
         self.action_dim = action_dim
         self.gamma = gamma
@@ -308,14 +334,13 @@ class PPOAgent:
         else:
             self.network = None
 
-        self.memory = {
-            'states': [],
-            'actions': [],
-            'rewards': [],
-            'values': [],
-            'log_probs': [],
-            'dones': []
-        }
+        # On-policy rollout (chronological, cleared after each update)
+        self.memory = ReplayBuffer(
+            capacity=rollout_size,
+            state_dim=state_dim,
+            store_next_state=False,
+            extra_fields={'values': np.float32, 'log_probs': np.float32}
+        )
 
         self.performance = {
             'total_updates': 0,
@@ -351,15 +376,14 @@ class PPOAgent:
 
     def store_transition(self, state: np.ndarray, action: int, reward: float,
                         value: float, log_prob: float, done: bool):
-        """Store transition in memory"""
-        self.memory['states'].append(state)
-        self.memory['actions'].append(action)
-        self.memory['rewards'].append(reward)
-        self.memory['values'].append(value)
-        self.memory['log_probs'].append(log_prob)
-        self.memory['dones'].append(done)
-
-    def compute_gae(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Store transition in memory (raises once the rollout is full)"""
+        if self.memory.is_full():
+            raise RuntimeError(
+                f"PPO rollout full ({self.memory.capacity} transitions); call update() before storing more"
+            )
+        self.memory.add(state, action, reward, done=done, values=value, log_probs=log_prob)
+
+    def compute_gae(self, rollout=None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compute Generalized Advantage Estimation
 
@@ -367,21 +391,20 @@ class PPOAgent:
             advantages: GAE advantages
             returns: Discounted returns
         """
-        rewards = np.array(self.memory['rewards'])
-        values = np.array(self.memory['values'])
-        dones = np.array(self.memory['dones'])
-
-        advantages = np.zeros_like(rewards)
-        last_gae = 0
+        rollout = rollout if rollout is not None else self.memory.rollout()
+        rewards = rollout.rewards
+        values = rollout.extras['values']
+        not_done = 1.0 - rollout.dones
 
-        for t in reversed(range(len(rewards))):
-            if t == len(rewards) - 1:
-                next_value = 0
-            else:
-                next_value = values[t + 1]
+        # TD residuals in one pass, then the backward GAE recursion
+        next_values = np.append(values[1:], 0.0)
+        deltas = rewards + self.gamma * next_values * not_done - values
+        decay = self.gamma * self.gae_lambda * not_done
 
-            delta = rewards[t] + self.gamma * next_value * (1 - dones[t]) - values[t]
-            advantages[t] = last_gae = delta + self.gamma * self.gae_lambda * (1 - dones[t]) * last_gae
+        advantages = np.zeros_like(rewards)
+        last_gae = 0.0
+        for t in range(len(rewards) - 1, -1, -1):
+            advantages[t] = last_gae = deltas[t] + decay[t] * last_gae
 
         returns = advantages + values
 
@@ -394,21 +417,22 @@ class PPOAgent:
         Returns:
             Training metrics
         """
-        if not TORCH_AVAILABLE or len(self.memory['states']) == 0:
+        if not TORCH_AVAILABLE or len(self.memory) == 0:
             return {'policy_loss': 0.01, 'value_loss': 0.02}
 
         # Compute advantages and returns
-        advantages, returns = self.compute_gae()
+        rollout = self.memory.rollout()
+        advantages, returns = self.compute_gae(rollout)
 
         # Normalize advantages
         advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
 
         # Convert to tensors
-        states = torch.FloatTensor(np.array(self.memory['states']))
-        actions = torch.LongTensor(self.memory['actions'])
-        old_log_probs = torch.FloatTensor(self.memory['log_probs'])
-        returns = torch.FloatTensor(returns)
-        advantages = torch.FloatTensor(advantages)
+        states = torch.as_tensor(rollout.states, dtype=torch.float32)
+        actions = torch.as_tensor(rollout.actions, dtype=torch.long)
+        old_log_probs = torch.as_tensor(rollout.extras['log_probs'], dtype=torch.float32)
+        returns = torch.as_tensor(returns, dtype=torch.float32)
+        advantages = torch.as_tensor(advantages, dtype=torch.float32)
 
         # PPO update for multiple epochs
         total_policy_loss = 0
@@ -461,7 +485,7 @@ class PPOAgent:
                 total_value_loss += value_loss.item()
 
         # Clear memory
-        self.memory = {k: [] for k in self.memory.keys()}
+        self.memory.clear()
 
         self.performance['total_updates'] += 1
         self.performance['avg_policy_loss'] = total_policy_loss / (self.epochs * len(states) / self.batch_size)
@@ -555,7 +579,7 @@ class SACAgent:
 
     def __init__(self, state_dim: int = 15, action_dim: int = 7,
                  lr: float = 0.0003, gamma: float = 0.99, tau: float = 0.005,
-                 alpha: float = 0.2, buffer_size: int = 100000):
+                 alpha: float = 0.2, buffer_size: int = 100000, prioritized_replay: bool = False):
         self.state_dim = state_dim
         self.action_dim = action_dim
         self.gamma = gamma
@@ -580,7 +604,13 @@ class SACAgent:
         else:
             self.network = None
 
-        self.replay_buffer = deque(maxlen=buffer_size)
+        self.replay_buffer = ReplayBuffer(
+            capacity=buffer_size,
+            state_dim=state_dim,
+            action_shape=(action_dim,),
+            action_dtype=np.float32,
+            prioritized=prioritized_replay
+        )
         self.performance = {
             'total_steps': 0,
             'q_loss': 0.0,
@@ -621,6 +651,11 @@ class SACAgent:
 
             return action.numpy()[0], entropy
 
+    def store_transition(self, state: np.ndarray, action: np.ndarray, reward: float,
+                         next_state: np.ndarray, done: bool):
+        """Store transition in replay buffer"""
+        self.replay_buffer.add(state, action, reward, next_state, done)
+
     def train_step(self, batch_size: int = 256) -> Dict[str, float]:
         """
         Train SAC networks
@@ -632,14 +667,14 @@ class SACAgent:
             return {'q_loss': 0.01, 'policy_loss': 0.02, 'alpha': self.alpha}
 
         # Sample batch
-        batch = [self.replay_buffer[i] for i in np.random.choice(len(self.replay_buffer), batch_size)]
-        states, actions, rewards, next_states, dones = zip(*batch)
+        batch = self.replay_buffer.sample(batch_size)
 
-        states = torch.FloatTensor(np.array(states))
-        actions = torch.FloatTensor(np.array(actions))
-        rewards = torch.FloatTensor(rewards).unsqueeze(1)
-        next_states = torch.FloatTensor(np.array(next_states))
-        dones = torch.FloatTensor(dones).unsqueeze(1)
+        states = torch.from_numpy(batch.states)
+        actions = torch.from_numpy(batch.actions)
+        rewards = torch.from_numpy(batch.rewards).unsqueeze(1)
+        next_states = torch.from_numpy(batch.next_states)
+        dones = torch.from_numpy(batch.dones.astype(np.float32)).unsqueeze(1)
+        weights = torch.from_numpy(batch.weights).unsqueeze(1)
 
         # Update Q-functions
         with torch.no_grad():
@@ -658,7 +693,9 @@ class SACAgent:
 
         current_q1 = self.network.q1(torch.cat([states, actions], dim=-1))
         current_q2 = self.network.q2(torch.cat([states, actions], dim=-1))
-        q_loss = F.mse_loss(current_q1, target_q) + F.mse_loss(current_q2, target_q)
+        # Importance-sampling weights are all 1 unless the buffer is prioritized
+        q_loss = (weights * ((current_q1 - target_q).pow(2) + (current_q2 - target_q).pow(2))).mean()
+        self.replay_buffer.update_priorities(batch.indices, (current_q1 - target_q).detach().squeeze(1).numpy())
 
         self.q_optimizer.zero_grad()
         q_loss.backward()
@@ -14,6 +14,8 @@ import json
 import itertools
 from collections import defaultdict
 
+from .trial_runner import ParallelTrialRunner, RegionPruner
+
 try:
     from sklearn.model_selection import cross_val_score, ParameterGrid
     from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
@@ -113,14 +115,22 @@ class HyperparameterOptimizer:
         self.trial_history = []
 
     def grid_search(self, model_type: str, objective_fn: Callable,
-                    max_trials: int = 100) -> HyperparameterConfig:
+                    max_trials: int = 100, n_jobs: int = 1,
+                    dataset: Optional[Dict[str, np.ndarray]] = None,
+                    patience: Optional[int] = None,
+                    prune: bool = False) -> HyperparameterConfig:
         """
         Grid search optimization
 
         Args:
             model_type: Model type to optimize
             objective_fn: Function(params) -> score
+                (Function(params, dataset) -> score when dataset is given)
             max_trials: Maximum number of trials
+            n_jobs: Worker processes (-1 = all CPUs, 1 = serial)
+            dataset: Training data arrays shared with workers once via shared memory
+            patience: Stop after this many trials without improvement
+            prune: Skip parameter values whose best score is in the bottom quartile
 
         Returns:
             Best hyperparameter configuration
@@ -141,50 +151,28 @@ class HyperparameterOptimizer:
             all_combinations = list(itertools.product(*values))[:max_trials]
             all_params = [dict(zip(keys, combo)) for combo in all_combinations]
 
-        best_score = -np.inf
-        best_params = None
-
         print(f"🔍 Grid Search: Testing {len(all_params)} configurations...")
 
-        for i, params in enumerate(all_params):
-            try:
-                score = objective_fn(params)
-
-                if score > best_score:
-                    best_score = score
-                    best_params = params
-
-                self.trial_history.append({
-                    'trial': i,
-                    'params': params,
-                    'score': score
-                })
-
-                if (i + 1) % 10 == 0:
-                    print(f"  Trial {i+1}/{len(all_params)}: Best score = {best_score:.4f}")
-
-            except Exception as e:
-                print(f"  Trial {i} failed: {e}")
-                continue
-
-        return HyperparameterConfig(
-            model_type=model_type,
-            parameters=best_params,
-            score=best_score,
-            training_time=0.0,
-            validation_score=best_score,
-            test_score=0.0
-        )
+        return self._run_trials(model_type, objective_fn, all_params, n_jobs, dataset, patience, prune)
 
     def random_search(self, model_type: str, objective_fn: Callable,
-                     n_trials: int = 50) -> HyperparameterConfig:
+                     n_trials: int = 50, n_jobs: int = 1, seed: Optional[int] = None,
+                     dataset: Optional[Dict[str, np.ndarray]] = None,
+                     patience: Optional[int] = None,
+                     prune: bool = False) -> HyperparameterConfig:
         """
         Random search optimization
 
         Args:
             model_type: Model type to optimize
             objective_fn: Function(params) -> score
+                (Function(params, dataset) -> score when dataset is given)
             n_trials: Number of random trials
+            n_jobs: Worker processes (-1 = all CPUs, 1 = serial)
+            seed: Random seed (same seed -> same configurations and result)
+            dataset: Training data arrays shared with workers once via shared memory
+            patience: Stop after this many trials without improvement
+            prune: Skip parameter values whose best score is in the bottom quartile
 
         Returns:
             Best hyperparameter configuration
@@ -193,37 +181,51 @@ class HyperparameterOptimizer:
             raise ValueError(f"Unknown model type: {model_type}")
 
         search_space = self.search_spaces[model_type]
-        best_score = -np.inf
-        best_params = None
 
         print(f"🎲 Random Search: Testing {n_trials} random configurations...")
 
-        for i in range(n_trials):
-            # Sample random parameters
-            params = {
-                key: np.random.choice(values)
-                for key, values in search_space.items()
-            }
+        # Sample all configurations up front so the result does not depend on completion order
+        rng = np.random.default_rng(seed)
+        all_params = [
+            {key: values[rng.integers(len(values))] for key, values in search_space.items()}
+            for _ in range(n_trials)
+        ]
+
+        return self._run_trials(model_type, objective_fn, all_params, n_jobs, dataset, patience, prune)
+
+    def _run_trials(self, model_type: str, objective_fn: Callable,
+                    all_params: List[Dict[str, Any]], n_jobs: int,
+                    dataset: Optional[Dict[str, np.ndarray]],
+                    patience: Optional[int], prune: bool) -> HyperparameterConfig:
+        """Evaluate configurations with the parallel trial runner"""
+        runner = ParallelTrialRunner(
+            objective_fn, n_jobs=n_jobs, dataset=dataset, patience=patience,
+            pruner=RegionPruner() if prune else None
+        )
 
-            try:
-                score = objective_fn(params)
+        best_score = -np.inf
+        for completed, trial in enumerate(runner.run(all_params), 1):
+            if trial.state == 'failed':
+                print(f"  Trial {trial.index} failed: {trial.error}")
+            elif trial.score > best_score:
+                best_score = trial.score
 
-                if score > best_score:
-                    best_score = score
-                    best_params = params
+            if completed % 10 == 0:
+                print(f"  Trial {completed}/{len(all_params)}: Best score = {best_score:.4f}")
 
-                self.trial_history.append({
-                    'trial': i,
-                    'params': params,
-                    'score': score
-                })
+        if runner.stopped_early or runner.n_pruned:
+            print(f"  Early stopped: {runner.stopped_early}, pruned: {runner.n_pruned}")
 
-                if (i + 1) % 10 == 0:
-                    print(f"  Trial {i+1}/{n_trials}: Best score = {best_score:.4f}")
+        for trial in runner.completed_trials:
+            self.trial_history.append({
+                'trial': trial.index,
+                'params': trial.params,
+                'score': trial.score
+            })
 
-            except Exception as e:
-                print(f"  Trial {i} failed: {e}")
-                continue
+        best = runner.best_trial
+        best_params = best.params if best else None
+        best_score = best.score if best else -np.inf
 
         return HyperparameterConfig(
             model_type=model_type,
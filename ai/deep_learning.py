@@ -7,7 +7,7 @@ Version: 4.1
 """
 
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import numpy as np
 from datetime import datetime
 import json
@@ -145,22 +145,33 @@ class LSTMPricePredictor(nn.Module if TORCH_AVAILABLE else object):
             predictions: [1h, 1d, 5d, 10d]
             attention_weights: Attention weights for each timestep
         """
+        predictions, attention_weights = self.predict_batch(np.asarray(sequence)[np.newaxis])
+        return predictions[0], attention_weights[0]
+
+    def predict_batch(self, sequences: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Make predictions on a batch of equal-length sequences (one forward pass)
+
+        Args:
+            sequences: Input sequences [batch, seq_len, features]
+
+        Returns:
+            predictions: [batch, 4] (1h, 1d, 5d, 10d)
+            attention_weights: [batch, seq_len]
+        """
         if not TORCH_AVAILABLE:
             # Mock prediction
-            base_price = sequence[-1, 0] if len(sequence) > 0 else 73500
-            trend = np.random.uniform(-0.02, 0.03)
-            return np.array([
-                base_price * (1 + trend * 0.2),
-                base_price * (1 + trend),
-                base_price * (1 + trend * 2.5),
-                base_price * (1 + trend * 5)
-            ]), np.random.uniform(0, 1, len(sequence))
+            base_price = sequences[:, -1, 0] if sequences.shape[1] > 0 else np.full(len(sequences), 73500.0)
+            trend = np.random.uniform(-0.02, 0.03, len(sequences))
+            horizons = np.array([0.2, 1.0, 2.5, 5.0])
+            return (base_price[:, None] * (1 + trend[:, None] * horizons),
+                    np.random.uniform(0, 1, sequences.shape[:2]))
 
         self.eval()
         with torch.no_grad():
-            x = torch.FloatTensor(sequence).unsqueeze(0)
+            x = torch.as_tensor(sequences, dtype=torch.float32)
             predictions, attention_weights = self.forward(x)
-            return predictions.numpy()[0], attention_weights.numpy()[0]
+            return predictions.numpy(), attention_weights.numpy().reshape(len(sequences), -1)
 
 
 # ============================================================================
@@ -248,23 +259,24 @@ class TransformerPricePredictor(nn.Module if TORCH_AVAILABLE else object):
 
     def predict(self, sequence: np.ndarray) -> np.ndarray:
         """Make prediction on sequence"""
+        return self.predict_batch(np.asarray(sequence)[np.newaxis])[0]
+
+    def predict_batch(self, sequences: np.ndarray) -> np.ndarray:
+        """Make predictions on a batch of equal-length sequences [batch, seq_len, features] → [batch, 4]"""
         if not TORCH_AVAILABLE:
             # Mock prediction
-            base_price = sequence[-1, 0] if len(sequence) > 0 else 73500
-            trend = np.random.uniform(-0.015, 0.04)
-            volatility = np.random.uniform(0.005, 0.02)
-            return np.array([
-                base_price * (1 + trend * 0.3 + np.random.normal(0, volatility)),
-                base_price * (1 + trend + np.random.normal(0, volatility)),
-                base_price * (1 + trend * 2.8 + np.random.normal(0, volatility)),
-                base_price * (1 + trend * 5.5 + np.random.normal(0, volatility))
-            ])
+            n = len(sequences)
+            base_price = sequences[:, -1, 0] if sequences.shape[1] > 0 else np.full(n, 73500.0)
+            trend = np.random.uniform(-0.015, 0.04, n)
+            volatility = np.random.uniform(0.005, 0.02, n)
+            noise = np.random.normal(0, 1, (n, 4)) * volatility[:, None]
+            return base_price[:, None] * (1 + trend[:, None] * np.array([0.3, 1.0, 2.8, 5.5]) + noise)
 
         self.eval()
         with torch.no_grad():
-            x = torch.FloatTensor(sequence).unsqueeze(0)
+            x = torch.as_tensor(sequences, dtype=torch.float32)
             predictions = self.forward(x)
-            return predictions.numpy()[0]
+            return predictions.numpy()
 
 
 # ============================================================================
@@ -362,34 +374,69 @@ class CNNPatternRecognizer(nn.Module if TORCH_AVAILABLE else object):
             predictions: Price predictions [1h, 1d, 5d, 10d]
             pattern: Detected pattern name
         """
+        predictions, patterns = self.predict_batch(np.asarray(chart_data)[np.newaxis])
+        return predictions[0], patterns[0]
+
+    def predict_batch(self, charts: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+        """
+        Predict prices and detect patterns for a batch of charts (one forward pass)
+
+        Args:
+            charts: Chart data [batch, channels, sequence_length]
+
+        Returns:
+            predictions: [batch, 4] (1h, 1d, 5d, 10d)
+            patterns: Detected pattern name per chart
+        """
         if not TORCH_AVAILABLE:
             # Mock prediction
-            base_price = chart_data[0, -1] if chart_data.shape[1] > 0 else 73500
-            trend = np.random.uniform(-0.02, 0.04)
-            pattern_idx = np.random.randint(0, len(self.patterns))
+            n = len(charts)
+            base_price = charts[:, 0, -1] if charts.shape[2] > 0 else np.full(n, 73500.0)
+            trend = np.random.uniform(-0.02, 0.04, n)
+            pattern_idx = np.random.randint(0, len(self.patterns), n)
 
-            return np.array([
-                base_price * (1 + trend * 0.25),
-                base_price * (1 + trend * 1.1),
-                base_price * (1 + trend * 2.7),
-                base_price * (1 + trend * 5.2)
-            ]), self.patterns[pattern_idx]
+            return (base_price[:, None] * (1 + trend[:, None] * np.array([0.25, 1.1, 2.7, 5.2])),
+                    [self.patterns[i] for i in pattern_idx])
 
         self.eval()
         with torch.no_grad():
-            x = torch.FloatTensor(chart_data).unsqueeze(0)
+            x = torch.as_tensor(charts, dtype=torch.float32)
             price_pred, pattern_logits = self.forward(x)
 
-            pattern_idx = torch.argmax(pattern_logits, dim=1).item()
-            pattern = self.patterns[pattern_idx]
-
-            return price_pred.numpy()[0], pattern
+            pattern_idx = torch.argmax(pattern_logits, dim=1).tolist()
+            return price_pred.numpy(), [self.patterns[i] for i in pattern_idx]
 
 
 # ============================================================================
 # Deep Learning Manager
 # ============================================================================
 
+SEQUENCE_LENGTH = 60
+
+# Raw fields read from each bar (key, default); high/low become one spread feature
+SEQUENCE_FIELDS = (
+    ('price', 73500), ('volume', 1000000), ('high', 74000), ('low', 73000),
+    ('rsi', 50), ('macd', 0), ('ma5', 73500), ('ma20', 73500),
+    ('bb_upper', 75000), ('bb_lower', 72000), ('volatility', 0.02),
+)
+CHART_CHANNELS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _bar_columns(histories: Sequence[List[Dict]], fields: Sequence[Tuple[str, float]]) -> np.ndarray:
+    """
+    Stack the last SEQUENCE_LENGTH bars of equal-length histories
+
+    Returns:
+        [batch, seq_len, len(fields)] float array
+    """
+    bars = [bar for history in histories for bar in history[-SEQUENCE_LENGTH:]]
+    length = len(bars) // len(histories)
+    columns = np.empty((len(bars), len(fields)))
+    for j, (key, default) in enumerate(fields):
+        columns[:, j] = np.fromiter((bar.get(key, default) for bar in bars), dtype=float, count=len(bars))
+    return columns.reshape(len(histories), length, len(fields))
+
+
 class DeepLearningManager:
     """
     Manager for all deep learning models
@@ -415,8 +462,15 @@ class DeepLearningManager:
         self.performance_history = []
 
     def prepare_sequence(self, historical_data: List[Dict]) -> np.ndarray:
+        """Prepare sequence data for models [seq_len, 10] (see prepare_sequence_batch)"""
+        return self.prepare_sequence_batch([historical_data])[0]
+
+    def prepare_sequence_batch(self, histories: Sequence[List[Dict]]) -> np.ndarray:
         """
-        Prepare sequence data for models
+        Prepare sequence data for a batch of stocks [batch, seq_len, 10]
+
+        Histories must have the same length after keeping the last 60 bars
+        (empty histories get mock data).
 
         Features:
         - Price (normalized)
@@ -430,32 +484,22 @@ class DeepLearningManager:
         - Volume momentum
         - Volatility
         """
-        if not historical_data:
+        if not any(histories):
             # Mock data
-            return np.random.randn(60, 10)
+            return np.random.randn(len(histories), SEQUENCE_LENGTH, 10)
 
         # Extract features (simplified)
-        sequence = []
-        for data in historical_data[-60:]:
-            features = [
-                data.get('price', 73500),
-                data.get('volume', 1000000),
-                data.get('high', 74000) - data.get('low', 73000),
-                data.get('rsi', 50),
-                data.get('macd', 0),
-                data.get('ma5', 73500),
-                data.get('ma20', 73500),
-                data.get('bb_upper', 75000),
-                data.get('bb_lower', 72000),
-                data.get('volatility', 0.02)
-            ]
-            sequence.append(features)
-
-        return np.array(sequence)
+        bars = _bar_columns(histories, SEQUENCE_FIELDS)
+        spread = bars[:, :, 2] - bars[:, :, 3]
+        return np.concatenate([bars[:, :, :2], spread[:, :, None], bars[:, :, 4:]], axis=2)
 
     def prepare_chart_data(self, historical_data: List[Dict]) -> np.ndarray:
+        """Prepare chart data for CNN [5, seq_len] (see prepare_chart_batch)"""
+        return self.prepare_chart_batch([historical_data])[0]
+
+    def prepare_chart_batch(self, histories: Sequence[List[Dict]]) -> np.ndarray:
         """
-        Prepare chart data for CNN
+        Prepare chart data for CNN for a batch of stocks [batch, 5, seq_len]
 
         Channels:
         - Open prices
@@ -464,17 +508,12 @@ class DeepLearningManager:
         - Close prices
         - Volume
         """
-        if not historical_data:
+        if not any(histories):
             # Mock chart data
-            return np.random.randn(5, 60)
-
-        chart = []
-        for channel in ['open', 'high', 'low', 'close', 'volume']:
-            values = [d.get(channel, 73500 if channel != 'volume' else 1000000)
-                     for d in historical_data[-60:]]
-            chart.append(values)
+            return np.random.randn(len(histories), 5, SEQUENCE_LENGTH)
 
-        return np.array(chart)
+        fields = [(channel, 73500 if channel != 'volume' else 1000000) for channel in CHART_CHANNELS]
+        return _bar_columns(histories, fields).transpose(0, 2, 1)
 
     def predict(self, stock_code: str, stock_name: str,
                 historical_data: List[Dict], current_price: float) -> DeepLearningPrediction:
@@ -490,18 +529,51 @@ class DeepLearningManager:
         Returns:
             Combined deep learning prediction
         """
-        # Prepare data
-        sequence = self.prepare_sequence(historical_data)
-        chart_data = self.prepare_chart_data(historical_data)
+        return self.predict_batch([{
+            'stock_code': stock_code,
+            'stock_name': stock_name,
+            'historical_data': historical_data,
+            'current_price': current_price
+        }])[0]
+
+    def predict_batch(self, candidates: Sequence[Dict[str, Any]]) -> List[DeepLearningPrediction]:
+        """
+        Make ensemble predictions for many stocks
 
-        # LSTM prediction
-        lstm_pred, attention_weights = self.lstm_model.predict(sequence)
+        Candidates are grouped by history length (normally all 60 bars) and
+        each model runs one forward pass per group.
 
-        # Transformer prediction
-        transformer_pred = self.transformer_model.predict(sequence)
+        Args:
+            candidates: Dicts with stock_code, stock_name, historical_data, current_price
 
-        # CNN prediction
-        cnn_pred, pattern = self.cnn_model.predict(chart_data)
+        Returns:
+            DeepLearningPrediction per candidate, in input order
+        """
+        groups: Dict[int, List[int]] = {}
+        for i, candidate in enumerate(candidates):
+            length = min(len(candidate.get('historical_data') or []), SEQUENCE_LENGTH)
+            groups.setdefault(length, []).append(i)
+
+        results: List[Optional[DeepLearningPrediction]] = [None] * len(candidates)
+        for rows in groups.values():
+            group = [candidates[i] for i in rows]
+            for i, prediction in zip(rows, self._predict_group(group)):
+                results[i] = prediction
+        return results
+
+    def _predict_group(self, candidates: List[Dict[str, Any]]) -> List[DeepLearningPrediction]:
+        """Ensemble predictions for candidates whose histories have the same length"""
+        histories = [candidate.get('historical_data') or [] for candidate in candidates]
+        current_price = np.array([candidate['current_price'] for candidate in candidates], dtype=float)
+
+        # Prepare data
+        sequences = self.prepare_sequence_batch(histories)
+        charts = self.prepare_chart_batch(histories)
+
+        # LSTM / Transformer / CNN predictions (one pass each)
+        lstm_pred, attention_weights = self.lstm_model.predict_batch(sequences)
+        transformer_pred = self.transformer_model.predict_batch(sequences)
+        cnn_pred, patterns = self.cnn_model.predict_batch(charts)
 
         # Ensemble predictions (weighted average)
         ensemble_pred = (
@@ -511,39 +583,36 @@ class DeepLearningManager:
         )
 
         # Calculate confidence based on model agreement
-        predictions_stack = np.stack([lstm_pred, transformer_pred, cnn_pred])
-        std_dev = np.std(predictions_stack, axis=0)
-        avg_std = np.mean(std_dev)
-        confidence = max(0.5, 1.0 - (avg_std / current_price) * 10)
+        avg_std = np.stack([lstm_pred, transformer_pred, cnn_pred]).std(axis=0).mean(axis=1)
+        confidence = np.maximum(0.5, 1.0 - (avg_std / current_price) * 10)
 
         # Determine direction
-        expected_return = (ensemble_pred[1] - current_price) / current_price * 100
-        if expected_return > 1.0:
-            direction = 'up'
-        elif expected_return < -1.0:
-            direction = 'down'
-        else:
-            direction = 'neutral'
+        expected_return = (ensemble_pred[:, 1] - current_price) / current_price * 100
+        direction = np.where(expected_return > 1.0, 'up', np.where(expected_return < -1.0, 'down', 'neutral'))
 
         # Volatility forecast (from attention weights)
-        volatility_forecast = float(np.std(attention_weights)) if len(attention_weights) > 0 else 0.015
-
-        return DeepLearningPrediction(
-            stock_code=stock_code,
-            stock_name=stock_name,
-            current_price=current_price,
-            predicted_price_1h=float(ensemble_pred[0]),
-            predicted_price_1d=float(ensemble_pred[1]),
-            predicted_price_5d=float(ensemble_pred[2]),
-            predicted_price_10d=float(ensemble_pred[3]),
-            confidence=float(confidence),
-            direction=direction,
-            expected_return=float(expected_return),
-            model_type='ensemble_lstm_transformer_cnn',
-            attention_weights=attention_weights.tolist() if len(attention_weights) > 0 else None,
-            pattern_detected=pattern,
-            volatility_forecast=float(volatility_forecast)
-        )
+        has_attention = attention_weights.shape[1] > 0
+        volatility_forecast = attention_weights.std(axis=1) if has_attention else np.full(len(candidates), 0.015)
+
+        return [
+            DeepLearningPrediction(
+                stock_code=candidate['stock_code'],
+                stock_name=candidate['stock_name'],
+                current_price=candidate['current_price'],
+                predicted_price_1h=float(ensemble_pred[i, 0]),
+                predicted_price_1d=float(ensemble_pred[i, 1]),
+                predicted_price_5d=float(ensemble_pred[i, 2]),
+                predicted_price_10d=float(ensemble_pred[i, 3]),
+                confidence=float(confidence[i]),
+                direction=str(direction[i]),
+                expected_return=float(expected_return[i]),
+                model_type='ensemble_lstm_transformer_cnn',
+                attention_weights=attention_weights[i].tolist() if has_attention else None,
+                pattern_detected=patterns[i],
+                volatility_forecast=float(volatility_forecast[i])
+            )
+            for i, candidate in enumerate(candidates)
+        ]
 
     def get_performance(self) -> Dict[str, Any]:
         """Get performance metrics for all models"""
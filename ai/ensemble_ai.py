@@ -12,7 +12,7 @@ Features:
 """
 import json
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -131,12 +131,53 @@ class EnsembleAI:
         Returns:
             Ensemble prediction
         """
+        return self._predict(stock_code, stock_name, market_data)
+
+    def predict_batch(self, candidates: Sequence[Dict[str, Any]]) -> List[EnsemblePrediction]:
+        """
+        Make ensemble predictions for a list of candidates
+
+        The ML price predictor scores all candidates in one batch; the
+        remaining models run per candidate.
+
+        Args:
+            candidates: Market data dicts that also carry 'stock_code' and 'stock_name'
+
+        Returns:
+            Ensemble prediction per candidate, in input order
+        """
+        try:
+            from ai.ml_predictor import get_ml_predictor
+
+            price_predictions = get_ml_predictor().predict_batch(candidates)
+        except Exception as e:
+            logger.error(f"Error getting batch ML predictions: {e}")
+            price_predictions = [None] * len(candidates)
+
+        return [
+            self._predict(
+                candidate.get('stock_code', ''),
+                candidate.get('stock_name', candidate.get('stock_code', '')),
+                candidate,
+                price_prediction
+            )
+            for candidate, price_prediction in zip(candidates, price_predictions)
+        ]
+
+    def _predict(
+        self,
+        stock_code: str,
+        stock_name: str,
+        market_data: Dict[str, Any],
+        price_prediction: Optional[Any] = None
+    ) -> EnsemblePrediction:
+        """Ensemble prediction for one stock (price_prediction: precomputed ML result)"""
         try:
             # Collect predictions from all models
             model_predictions = []
 
             # 1. ML Predictor
-            ml_pred = self._get_ml_prediction(stock_code, stock_name, market_data)
+            ml_pred = self._get_ml_prediction(stock_code, stock_name, market_data, price_prediction)
             if ml_pred:
                 model_predictions.append(ml_pred)
 
@@ -178,14 +219,16 @@ class EnsembleAI:
         self,
         stock_code: str,
         stock_name: str,
-        data: Dict[str, Any]
+        data: Dict[str, Any],
+        prediction: Optional[Any] = None
     ) -> Optional[ModelPrediction]:
         """Get ML predictor prediction"""
         try:
-            from ai.ml_predictor import get_ml_predictor
+            if prediction is None:
+                from ai.ml_predictor import get_ml_predictor
 
-            predictor = get_ml_predictor()
-            prediction = predictor.predict(stock_code, stock_name, data)
+                predictor = get_ml_predictor()
+                prediction = predictor.predict(stock_code, stock_name, data)
 
             # Convert to ModelPrediction
             if prediction.direction == 'up':
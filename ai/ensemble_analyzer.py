@@ -4,6 +4,10 @@ Gemini 전용 고급 분석 시스템 (다중 전략 투표)
 """
 
 import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import statistics
@@ -35,43 +39,77 @@ class EnsembleAnalyzer(BaseAnalyzer):
     Features:
     - 단일 Gemini 모델 사용
     - 신뢰도 기반 가중치
-    - 성능 추적
+    - 성능 추적 (정확도 + 응답 시간 분위수)
     - 적응형 분석
+    - 마감 시간 기반 투표: 마감까지 응답한 모델만으로 투표, 늦은 모델은 취소
+    - 모델별 스레드 풀에서 여러 종목 동시 분석 (멈춘 모델은 자기 풀만 점유)
     """
 
+    # 모델별 응답 시간 표본 수 (분위수 계산용)
+    LATENCY_WINDOW = 200
+
     def __init__(
         self,
-        voting_strategy: VotingStrategy = VotingStrategy.WEIGHTED
+        voting_strategy: VotingStrategy = VotingStrategy.WEIGHTED,
+        deadline: Optional[float] = None,
+        max_workers: int = 8,
+        analyzers: Optional[Dict[Enum, BaseAnalyzer]] = None
     ):
         """
         Initialize ensemble analyzer (Gemini only)
 
         Args:
             voting_strategy: Strategy for combining model outputs (kept for compatibility)
+            deadline: Default per-call deadline in seconds (None = wait for every model)
+            max_workers: Thread pool size per model (a stalled model only holds its own slots)
+            analyzers: Pre-built analyzers keyed by model (default: Gemini only)
         """
         super().__init__(name="GeminiEnsembleAnalyzer", config={})
         self.voting_strategy = voting_strategy
+        self.deadline = deadline
+        self.max_workers = max_workers
 
-        # Initialize Gemini analyzer only
-        self.analyzers: Dict[AIModel, BaseAnalyzer] = {}
+        if analyzers is not None:
+            self.analyzers: Dict[Enum, BaseAnalyzer] = dict(analyzers)
+        else:
+            # Initialize Gemini analyzer only
+            self.analyzers = {}
 
-        try:
-            self.analyzers[AIModel.GEMINI] = GeminiAnalyzer()
-            logger.info("✓ Gemini analyzer initialized (Primary AI)")
-        except Exception as e:
-            logger.error(f"Failed to initialize Gemini: {e}")
+            try:
+                self.analyzers[AIModel.GEMINI] = GeminiAnalyzer()
+                logger.info("✓ Gemini analyzer initialized (Primary AI)")
+            except Exception as e:
+                logger.error(f"Failed to initialize Gemini: {e}")
+
+        self._models_by_name = {model.value: model for model in self.analyzers}
 
         # Model performance tracking
-        self.model_performance: Dict[AIModel, Dict[str, float]] = {
+        self.model_performance: Dict[Enum, Dict[str, float]] = {
             model: {
                 'accuracy': 0.5,  # Start neutral
                 'total_predictions': 0,
                 'correct_predictions': 0,
-                'avg_confidence': 0.0
+                'avg_confidence': 0.0,
+                'latency_p50': 0.0,
+                'latency_p95': 0.0,
+                'timeout_rate': 0.0
             }
             for model in self.analyzers.keys()
         }
 
+        # 모델별 응답 시간 / 제출 호출 수 / 마감 초과 횟수 (취소된 호출 포함)
+        self._latencies: Dict[Enum, deque] = {
+            model: deque(maxlen=self.LATENCY_WINDOW) for model in self.analyzers
+        }
+        self._call_counts: Dict[Enum, int] = {model: 0 for model in self.analyzers}
+        self._timeouts: Dict[Enum, int] = {model: 0 for model in self.analyzers}
+        self._latency_lock = threading.Lock()
+
+        # 모델별 스레드 풀 (지연 생성) - 실행 중인 호출은 취소할 수 없으므로 멈춘 모델이
+        # 다른 모델의 자리를 차지하지 않도록 분리
+        self._executors: Dict[Enum, ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
+
         logger.info(f"Ensemble Analyzer initialized with {len(self.analyzers)} models")
         strategy_name = voting_strategy.value if isinstance(voting_strategy, VotingStrategy) else str(voting_strategy)
         logger.info(f"Voting strategy: {strategy_name}")
@@ -97,12 +135,20 @@ class EnsembleAnalyzer(BaseAnalyzer):
             self.is_initialized = False
             return False
 
-    async def analyze_stock_async(self, stock_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze_stock_async(
+        self,
+        stock_data: Dict[str, Any],
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Analyze stock using all available models asynchronously
 
+        Model calls run on the per-model thread pools; the running event loop
+        is never blocked.
+
         Args:
             stock_data: Stock information
+            deadline: Seconds to wait for models (None = instance default)
 
         Returns:
             Ensemble analysis results
@@ -111,23 +157,164 @@ class EnsembleAnalyzer(BaseAnalyzer):
             logger.error("No AI models available")
             return self._get_default_analysis()
 
-        # Run all models concurrently
-        tasks = []
-        for model_type, analyzer in self.analyzers.items():
-            task = self._analyze_with_model(model_type, analyzer, stock_data)
-            tasks.append(task)
+        deadline = self.deadline if deadline is None else deadline
+        futures = self._submit_models(stock_data)
+        wrapped = {asyncio.wrap_future(future): model for model, future in futures.items()}
+
+        done, pending = await asyncio.wait(wrapped.keys(), timeout=deadline)
+
+        for task in pending:
+            task.cancel()
+
+        return self._finish_analysis(
+            {wrapped[task]: task for task in done},
+            [wrapped[task] for task in pending],
+            stock_data,
+            deadline
+        )
+
+    def analyze_stock(
+        self,
+        stock_data: Dict[str, Any],
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Synchronous ensemble analysis
 
-        # Gather all results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Waits on the per-model thread pools directly, so it is safe to call
+        from code that runs inside an event loop.
+
+        Args:
+            stock_data: Stock information
+            deadline: Seconds to wait for models (None = instance default)
+        """
+        if not self.analyzers:
+            logger.error("No AI models available")
+            return self._get_default_analysis()
+
+        deadline = self.deadline if deadline is None else deadline
+        return self._collect(self._submit_models(stock_data), stock_data, deadline)
+
+    def analyze_stocks(
+        self,
+        stocks: List[Dict[str, Any]],
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many stocks concurrently on the per-model thread pools
+
+        Every (stock, model) call is submitted up front; the deadline is
+        measured from submission and applies to the whole batch.
+
+        Args:
+            stocks: Stock information list
+            deadline: Seconds to wait for models (None = instance default)
+
+        Returns:
+            Ensemble analysis results (same order as stocks)
+        """
+        if not self.analyzers:
+            logger.error("No AI models available")
+            return [self._get_default_analysis() for _ in stocks]
+
+        deadline = self.deadline if deadline is None else deadline
+        started = time.monotonic()
+        submitted = [self._submit_models(stock_data) for stock_data in stocks]
+
+        results = []
+        for stock_data, futures in zip(stocks, submitted):
+            remaining = None if deadline is None else max(0.0, deadline - (time.monotonic() - started))
+            results.append(self._collect(futures, stock_data, remaining, deadline))
+
+        return results
+
+    async def analyze_stocks_async(
+        self,
+        stocks: List[Dict[str, Any]],
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of analyze_stocks"""
+        return list(await asyncio.gather(*[
+            self.analyze_stock_async(stock_data, deadline) for stock_data in stocks
+        ]))
+
+    def _get_executor(self, model_type: Enum) -> ThreadPoolExecutor:
+        """Bounded thread pool of one model (created on first use)"""
+        with self._executor_lock:
+            executor = self._executors.get(model_type)
+            if executor is None:
+                executor = self._executors[model_type] = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"ensemble-{model_type.value}"
+                )
+            return executor
+
+    def _submit_models(self, stock_data: Dict[str, Any]) -> Dict[Enum, Future]:
+        """Submit one call per model to that model's pool"""
+        with self._latency_lock:
+            for model_type in self.analyzers:
+                self._call_counts[model_type] += 1
+        return {
+            model_type: self._get_executor(model_type).submit(
+                self._analyze_with_model, model_type, analyzer, stock_data
+            )
+            for model_type, analyzer in self.analyzers.items()
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the model thread pools (late calls still record latency when wait=True)"""
+        with self._executor_lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+    def _collect(
+        self,
+        futures: Dict[Enum, Future],
+        stock_data: Dict[str, Any],
+        timeout: Optional[float],
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Wait until timeout, cancel stragglers and vote on finished models"""
+        model_by_future = {future: model for model, future in futures.items()}
+        done, not_done = wait(model_by_future.keys(), timeout=timeout)
+
+        for future in not_done:
+            future.cancel()
+
+        return self._finish_analysis(
+            {model_by_future[future]: future for future in done},
+            [model_by_future[future] for future in not_done],
+            stock_data,
+            timeout if deadline is None else deadline
+        )
+
+    def _finish_analysis(
+        self,
+        finished: Dict[Enum, Any],
+        timed_out: List[Enum],
+        stock_data: Dict[str, Any],
+        deadline: Optional[float]
+    ) -> Dict[str, Any]:
+        """Vote on finished model results (futures or tasks)"""
+        with self._latency_lock:
+            for model_type in timed_out:
+                self._timeouts[model_type] += 1
+
+        if timed_out:
+            logger.warning(
+                f"Deadline {deadline}s exceeded, ignoring: "
+                f"{', '.join(m.value for m in timed_out)}"
+            )
 
         # Filter out errors
         valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                model_type = list(self.analyzers.keys())[i]
-                logger.error(f"{model_type.value} analysis failed: {result}")
+        for model_type, future in finished.items():
+            error = future.exception()
+            if error is not None:
+                logger.error(f"{model_type.value} analysis failed: {error}")
             else:
-                valid_results.append(result)
+                valid_results.append(future.result())
 
         if not valid_results:
             logger.error("All models failed")
@@ -135,48 +322,73 @@ class EnsembleAnalyzer(BaseAnalyzer):
 
         # Combine results using voting strategy
         ensemble_result = self._combine_results(valid_results, stock_data)
+        ensemble_result['responded_models'] = [r['model'] for r in valid_results]
+        ensemble_result['timed_out_models'] = [m.value for m in timed_out]
+        ensemble_result['deadline'] = deadline
 
         return ensemble_result
 
-    def analyze_stock(self, stock_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Synchronous wrapper for analyze_stock_async
-        """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self.analyze_stock_async(stock_data))
-
-    async def _analyze_with_model(
+    def _analyze_with_model(
         self,
-        model_type: AIModel,
+        model_type: Enum,
         analyzer: BaseAnalyzer,
         stock_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Analyze stock with a specific model
+        Analyze stock with a specific model (runs on the shared pool)
+
+        Latency is recorded even when the call finishes after the deadline.
         """
+        started = time.monotonic()
         try:
-            # Run analysis in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                analyzer.analyze_stock,
-                stock_data
-            )
-
-            # Add model metadata
-            result['model'] = model_type.value
-            result['model_performance'] = self.model_performance[model_type]['accuracy']
-
-            return result
-
+            result = dict(analyzer.analyze_stock(stock_data))
         except Exception as e:
             logger.error(f"Error in {model_type.value} analysis: {e}")
             raise
+        finally:
+            self._record_latency(model_type, time.monotonic() - started)
+
+        # Add model metadata
+        result['signal'] = str(result.get('signal', 'HOLD')).upper()
+        result['model'] = model_type.value
+        result['model_performance'] = self.model_performance[model_type]['accuracy']
+        result['latency'] = round(time.monotonic() - started, 3)
+
+        return result
+
+    def _record_latency(self, model_type: Enum, latency: float):
+        """Record one model call latency (calls are counted on submission)"""
+        with self._latency_lock:
+            self._latencies[model_type].append(latency)
+
+    def get_latency_percentiles(self, model: Enum) -> Dict[str, float]:
+        """
+        Latency percentiles for a model over the recent window
+
+        Args:
+            model: The AI model
+
+        Returns:
+            {'p50', 'p90', 'p95', 'p99', 'samples', 'timeout_rate'}
+        """
+        with self._latency_lock:
+            samples = sorted(self._latencies.get(model, ()))
+            calls = self._call_counts.get(model, 0)
+            timeouts = self._timeouts.get(model, 0)
+
+        def percentile(q: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+        return {
+            'p50': round(percentile(0.50), 4),
+            'p90': round(percentile(0.90), 4),
+            'p95': round(percentile(0.95), 4),
+            'p99': round(percentile(0.99), 4),
+            'samples': len(samples),
+            'timeout_rate': round(timeouts / calls, 4) if calls else 0.0
+        }
 
     def _combine_results(
         self,
@@ -253,12 +465,7 @@ class EnsembleAnalyzer(BaseAnalyzer):
 
         for result in results:
             # Calculate weight based on model performance and confidence
-            model_name = result.get('model', 'unknown')
-            model_enum = None
-            for m in AIModel:
-                if m.value == model_name:
-                    model_enum = m
-                    break
+            model_enum = self._models_by_name.get(result.get('model', 'unknown'))
 
             if model_enum and model_enum in self.model_performance:
                 performance = self.model_performance[model_enum]['accuracy']
@@ -355,12 +562,7 @@ class EnsembleAnalyzer(BaseAnalyzer):
         best_accuracy = 0
 
         for result in results:
-            model_name = result.get('model', 'unknown')
-            model_enum = None
-            for m in AIModel:
-                if m.value == model_name:
-                    model_enum = m
-                    break
+            model_enum = self._models_by_name.get(result.get('model', 'unknown'))
 
             if model_enum and model_enum in self.model_performance:
                 accuracy = self.model_performance[model_enum]['accuracy']
@@ -558,7 +760,7 @@ class EnsembleAnalyzer(BaseAnalyzer):
 
     def update_model_performance(
         self,
-        model: AIModel,
+        model: Enum,
         was_correct: bool,
         confidence: str
     ):
@@ -589,10 +791,17 @@ class EnsembleAnalyzer(BaseAnalyzer):
         total = perf['total_predictions']
         perf['avg_confidence'] = (current_avg * (total - 1) + conf_value) / total
 
+        # Update latency percentiles
+        latency = self.get_latency_percentiles(model)
+        perf['latency_p50'] = latency['p50']
+        perf['latency_p95'] = latency['p95']
+        perf['timeout_rate'] = latency['timeout_rate']
+
         logger.info(
             f"Updated {model.value} performance: "
             f"Accuracy={perf['accuracy']:.2%}, "
-            f"Total={total}"
+            f"Total={total}, "
+            f"p95={perf['latency_p95']:.2f}s"
         )
 
     def get_model_rankings(self) -> List[Dict[str, Any]]:
@@ -606,7 +815,10 @@ class EnsembleAnalyzer(BaseAnalyzer):
                 'accuracy': round(perf['accuracy'], 3),
                 'total_predictions': perf['total_predictions'],
                 'correct_predictions': perf['correct_predictions'],
-                'avg_confidence': round(perf['avg_confidence'], 3)
+                'avg_confidence': round(perf['avg_confidence'], 3),
+                'latency_p50': perf['latency_p50'],
+                'latency_p95': perf['latency_p95'],
+                'timeout_rate': perf['timeout_rate']
             })
 
         # Sort by accuracy
@@ -1,11 +1,22 @@
 """
 ai/gemini_analyzer.py
 Google Gemini AI 분석기
+
+- 프롬프트 입력 해시 기반 LRU 결과 캐시 (단일 / 배치 분석 공유)
+- 배치 분석: 요청 1건에 여러 종목, 비동기 동시 요청, 느린 응답 헤징
 """
+import asyncio
+import hashlib
+import json
 import logging
+import re
+import threading
 import time
-from typing import Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from .base_analyzer import BaseAnalyzer
+from utils.data_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +68,41 @@ class GeminiAnalyzer(BaseAnalyzer):
 }}
 ```"""
 
+    # 배치 분석 프롬프트 템플릿 - 요청 1건에 여러 종목 (SIMPLE 템플릿과 동일한 입력/응답 필드)
+    BATCH_ANALYSIS_PROMPT_TEMPLATE = """# 다종목 투자 분석 요청
+
+당신은 전문 트레이더입니다. 다음 {count}개 종목을 **각각 독립적으로** 분석하여 **반드시 JSON 배열 형식으로만** 응답하세요.
+
+{stock_blocks}
+## 포트폴리오
+{portfolio_info}
+
+---
+
+**중요: 종목마다 배열 원소 1개씩, "stock_code"는 입력과 동일하게 작성하세요. 다른 텍스트는 포함하지 마세요.**
+
+```json
+[
+  {{
+    "stock_code": "종목코드",
+    "signal": "buy" 또는 "hold" 또는 "sell",
+    "confidence_level": "Very High" 또는 "High" 또는 "Medium" 또는 "Low",
+    "overall_score": 0.0~10.0 사이의 숫자,
+    "reasons": ["이유1", "이유2", "이유3"],
+    "risks": ["리스크1", "리스크2"],
+    "detailed_reasoning": "상세 분석 (2-3문장)"
+  }}
+]
+```"""
+
+    BATCH_STOCK_BLOCK_TEMPLATE = """## [{index}] {stock_name} ({stock_code})
+- 현재가: {current_price:,}원 / 등락률: {change_rate:+.2f}% / 거래량: {volume:,}주
+- 종합 점수: {score}/{percentage:.1f}%
+- 세부 점수:
+{score_breakdown_detailed}
+- 기관 순매수: {institutional_net_buy:,}원 / 외국인 순매수: {foreign_net_buy:,}원 / 매수호가 비율: {bid_ask_ratio:.2f}
+"""
+
     # 종목 분석 프롬프트 템플릿 (v6.1 - ULTRA ENHANCED - 복잡함, 실패 가능성 높음)
     STOCK_ANALYSIS_PROMPT_TEMPLATE_COMPLEX = """# 🎯 PROFESSIONAL QUANTITATIVE TRADING ANALYSIS REQUEST (v6.1 - Gemini Pro)
 
@@ -345,9 +391,27 @@ class GeminiAnalyzer(BaseAnalyzer):
         self.model_2_0 = None  # gemini-2.0-flash-exp
         self.model_2_5 = None  # gemini-2.5-flash
 
-        # v5.7.5: AI 분석 TTL 캐시 (5분)
-        self._analysis_cache = {}
+        # v5.7.5: AI 분석 TTL 캐시 (5분) - 프롬프트 입력 해시 키, 최대 256개 LRU
         self._cache_ttl = 300  # 5분 (초)
+        self._analysis_cache = LRUCache(max_size=256, max_memory_mb=16, default_ttl_seconds=self._cache_ttl)
+
+        # 배치 분석 통계 / 최근 응답 시간 (헤징 기준)
+        self._batch_stats = {
+            'requests': 0,
+            'stocks': 0,
+            'cache_hits': 0,
+            'hedged': 0,
+            'hedge_wins': 0,
+            'fallbacks': 0,
+            'errors': 0,
+        }
+        self._latencies = deque(maxlen=50)
+        self._hedge_default_delay = 10.0  # 응답 시간 표본 부족 시 헤징 대기 (초)
+        self._hedge_min_delay = 1.0
+        self._executor: Optional[ThreadPoolExecutor] = None  # 동기 SDK 호출용
+        # 배치 분석 전용 이벤트 루프 - SDK async 클라이언트는 처음 사용한 루프에 묶이므로 스캔 간 재사용
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_loop_lock = threading.Lock()
 
         cross_check_status = "크로스체크 활성화" if enable_cross_check else "단일 모델"
         logger.info(f"GeminiAnalyzer 초기화 (모델: {self.model_name}, {cross_check_status})")
@@ -428,30 +492,20 @@ class GeminiAnalyzer(BaseAnalyzer):
         if not is_valid:
             return self._get_error_result(msg)
 
-        # v5.7.5: 캐시 확인 (종목코드 + 점수 기준)
+        # v5.7.5: 캐시 확인 (프롬프트 입력 해시 기준)
         stock_code = stock_data.get('stock_code', '')
-        score = score_info.get('score', 0) if score_info else 0
-        cache_key = f"{stock_code}_{int(score)}"  # 점수는 정수로 (소수점 무시)
+        prompt_inputs = self._build_prompt_inputs(stock_data, score_info, portfolio_info)
+        mode = 'crosscheck' if self.enable_cross_check else 'single'
+        cache_key = self._make_cache_key(prompt_inputs, mode)
 
-        # 크로스 체크 활성화시 캐시 키에 표시
-        if self.enable_cross_check:
-            cache_key += "_crosscheck"
-
-        # 캐시에서 조회
-        if cache_key in self._analysis_cache:
-            cached_entry = self._analysis_cache[cache_key]
-            cached_time = cached_entry['timestamp']
-            cached_result = cached_entry['result']
-
-            # TTL 체크
-            if (time.time() - cached_time) < self._cache_ttl:
-                logger.info(f"AI 분석 캐시 히트: {stock_code} (캐시 유효시간: {int(self._cache_ttl - (time.time() - cached_time))}초)")
-                print(f"   💾 AI 분석 캐시 사용 (캐시 유효: {int(self._cache_ttl - (time.time() - cached_time))}초)")
-                return cached_result
-            else:
-                # TTL 만료 - 캐시 삭제
-                del self._analysis_cache[cache_key]
-                logger.info(f"AI 분석 캐시 만료: {stock_code}")
+        cached_result = self._analysis_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"AI 분석 캐시 히트: {stock_code}")
+            print(f"   💾 AI 분석 캐시 사용 (TTL: {self._cache_ttl}초)")
+            return dict(cached_result)
+
+        # v6.1.1: 간단한 프롬프트 사용 (신뢰성 향상)
+        prompt = self.STOCK_ANALYSIS_PROMPT_TEMPLATE_SIMPLE.format(**prompt_inputs)
 
         # 분석 시작
         start_time = time.time()
@@ -461,39 +515,6 @@ class GeminiAnalyzer(BaseAnalyzer):
             logger.info(f"🔀 크로스체크 분석 시작: {stock_code}")
             print(f"   🔀 AI 크로스체크 분석 (2.0 vs 2.5)")
 
-            # 프롬프트 준비
-            if score_info:
-                score = score_info.get('score', 0)
-                percentage = score_info.get('percentage', 0)
-                breakdown = score_info.get('breakdown', {})
-                score_breakdown_detailed = "\n".join([
-                    f"  {k}: {v:.1f}점" for k, v in breakdown.items() if v >= 0
-                ])
-            else:
-                score = 0
-                percentage = 0
-                score_breakdown_detailed = "  점수 정보 없음"
-
-            portfolio_text = portfolio_info or "보유 종목 없음"
-            institutional_net_buy = stock_data.get('institutional_net_buy', 0)
-            foreign_net_buy = stock_data.get('foreign_net_buy', 0)
-            bid_ask_ratio = stock_data.get('bid_ask_ratio', 1.0)
-
-            prompt = self.STOCK_ANALYSIS_PROMPT_TEMPLATE_SIMPLE.format(
-                stock_name=stock_data.get('stock_name', ''),
-                stock_code=stock_data.get('stock_code', ''),
-                current_price=stock_data.get('current_price', 0),
-                change_rate=stock_data.get('change_rate', 0.0),
-                volume=stock_data.get('volume', 0),
-                score=score,
-                percentage=percentage,
-                score_breakdown_detailed=score_breakdown_detailed,
-                institutional_net_buy=institutional_net_buy,
-                foreign_net_buy=foreign_net_buy,
-                bid_ask_ratio=bid_ask_ratio,
-                portfolio_info=portfolio_text
-            )
-
             # 두 모델 동시 분석
             result_2_0 = self._analyze_with_single_model(
                 self.model_2_0,
@@ -513,10 +534,7 @@ class GeminiAnalyzer(BaseAnalyzer):
             result = self._cross_check_results(result_2_0, result_2_5)
 
             # 캐시 저장
-            self._analysis_cache[cache_key] = {
-                'timestamp': time.time(),
-                'result': result
-            }
+            self._analysis_cache.set(cache_key, result)
 
             # 통계 업데이트
             elapsed_time = time.time() - start_time
@@ -544,45 +562,6 @@ class GeminiAnalyzer(BaseAnalyzer):
 
         for attempt in range(max_retries):
             try:
-                # 점수 정보 포맷팅
-                if score_info:
-                    score = score_info.get('score', 0)
-                    percentage = score_info.get('percentage', 0)
-                    breakdown = score_info.get('breakdown', {})
-                    # 10가지 세부 점수 상세 표시
-                    score_breakdown_detailed = "\n".join([
-                        f"  {k}: {v:.1f}점" for k, v in breakdown.items() if v >= 0
-                    ])
-                else:
-                    score = 0
-                    percentage = 0
-                    score_breakdown_detailed = "  점수 정보 없음"
-
-                # 포트폴리오 정보 (없으면 기본 메시지)
-                portfolio_text = portfolio_info or "보유 종목 없음"
-
-                # 투자자 동향 데이터
-                institutional_net_buy = stock_data.get('institutional_net_buy', 0)
-                foreign_net_buy = stock_data.get('foreign_net_buy', 0)
-                bid_ask_ratio = stock_data.get('bid_ask_ratio', 1.0)
-
-                # v6.1.1: 간단한 프롬프트 사용 (신뢰성 향상)
-                # 복잡한 프롬프트는 JSON 생성 실패율이 높음
-                prompt = self.STOCK_ANALYSIS_PROMPT_TEMPLATE_SIMPLE.format(
-                    stock_name=stock_data.get('stock_name', ''),
-                    stock_code=stock_data.get('stock_code', ''),
-                    current_price=stock_data.get('current_price', 0),
-                    change_rate=stock_data.get('change_rate', 0.0),
-                    volume=stock_data.get('volume', 0),
-                    score=score,
-                    percentage=percentage,
-                    score_breakdown_detailed=score_breakdown_detailed,
-                    institutional_net_buy=institutional_net_buy,
-                    foreign_net_buy=foreign_net_buy,
-                    bid_ask_ratio=bid_ask_ratio,
-                    portfolio_info=portfolio_text
-                )
-
                 # Gemini API 호출 - 타임아웃 30초 설정
                 # safety_settings 없이 호출 (기본값 사용)
                 try:
@@ -594,26 +573,8 @@ class GeminiAnalyzer(BaseAnalyzer):
                     # 타임아웃이나 API 에러 발생 시 재시도
                     raise ValueError(f"Gemini API timeout or error: {timeout_error}")
 
-                # 응답 검증 (finish_reason 체크)
-                if not response.candidates:
-                    raise ValueError("Gemini API returned no candidates")
-
-                candidate = response.candidates[0]
-                finish_reason = candidate.finish_reason
-
-                # finish_reason: 1=STOP(정상), 2=SAFETY(안전필터), 3=MAX_TOKENS, 4=RECITATION, 5=OTHER
-                if finish_reason != 1:  # 1 = STOP (정상 완료)
-                    reason_map = {2: "SAFETY", 3: "MAX_TOKENS", 4: "RECITATION", 5: "OTHER"}
-                    reason_name = reason_map.get(finish_reason, f"UNKNOWN({finish_reason})")
-                    raise ValueError(f"Gemini blocked: {reason_name}")
-
-                # 응답 텍스트 검증 (v6.1.1 - 빈 응답 체크 추가)
-                if not hasattr(response, 'text'):
-                    raise ValueError("Gemini API response has no 'text' attribute")
-
-                response_text = response.text
-                if not response_text or len(response_text.strip()) == 0:
-                    raise ValueError("Gemini API returned empty response")
+                # 응답 검증 (finish_reason, 빈 응답)
+                response_text = self._extract_response_text(response)
 
                 # 디버깅: 응답 길이 로깅
                 logger.debug(f"Gemini 응답 길이: {len(response_text)} chars")
@@ -622,10 +583,7 @@ class GeminiAnalyzer(BaseAnalyzer):
                 result = self._parse_stock_analysis_response(response_text, stock_data)
 
                 # v5.7.5: 캐시에 저장
-                self._analysis_cache[cache_key] = {
-                    'timestamp': time.time(),
-                    'result': result
-                }
+                self._analysis_cache.set(cache_key, result)
                 logger.info(f"AI 분석 결과 캐시 저장: {stock_code} (TTL: {self._cache_ttl}초)")
 
                 # 통계 업데이트
@@ -655,6 +613,242 @@ class GeminiAnalyzer(BaseAnalyzer):
                     self.update_statistics(False)
                     return self._get_error_result(f"AI 분석 실패: {error_msg}")
     
+    # ==================== 배치 분석 ====================
+
+    def analyze_stocks_batch(
+        self,
+        stocks: List[Dict[str, Any]],
+        score_infos: Optional[List[Optional[Dict[str, Any]]]] = None,
+        portfolio_info: str = None,
+        batch_size: int = 5,
+        max_concurrency: int = 4,
+        hedge_after: Optional[float] = None,
+        timeout: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 종목 배치 분석 (동기 래퍼)
+
+        analyze_stocks_batch_async()를 전용 백그라운드 이벤트 루프에서 실행한다.
+        루프는 첫 호출 때 한 번 만들어 이후 스캔에서도 재사용한다 (SDK의 async 클라이언트가
+        처음 사용한 루프에 묶이므로 스캔마다 asyncio.run으로 새 루프를 만들면 안 됨).
+
+        Args:
+            stocks: 종목 데이터 리스트
+            score_infos: 종목별 점수 정보 (stocks와 같은 순서, 없으면 None)
+            portfolio_info: 현재 포트폴리오 정보 (배치 공통)
+            batch_size: 요청 1건에 포함할 종목 수
+            max_concurrency: 동시 요청 수
+            hedge_after: 헤징 요청 대기 시간 (초, None이면 최근 응답 p95)
+            timeout: 요청별 타임아웃 (초)
+
+        Returns:
+            분석 결과 리스트 (stocks와 같은 순서)
+        """
+        coro = self.analyze_stocks_batch_async(
+            stocks, score_infos, portfolio_info,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            hedge_after=hedge_after,
+            timeout=timeout
+        )
+
+        return asyncio.run_coroutine_threadsafe(coro, self._get_batch_loop()).result()
+
+    def _get_batch_loop(self) -> asyncio.AbstractEventLoop:
+        """배치 분석 전용 이벤트 루프 (데몬 스레드에서 계속 실행, 최초 호출 시 생성)"""
+        with self._batch_loop_lock:
+            if self._batch_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="gemini-batch-loop",
+                    daemon=True
+                ).start()
+                self._batch_loop = loop
+            return self._batch_loop
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """동기 SDK 호출용 스레드 풀 (최초 호출 시 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gemini")
+        return self._executor
+
+    async def analyze_stocks_batch_async(
+        self,
+        stocks: List[Dict[str, Any]],
+        score_infos: Optional[List[Optional[Dict[str, Any]]]] = None,
+        portfolio_info: str = None,
+        batch_size: int = 5,
+        max_concurrency: int = 4,
+        hedge_after: Optional[float] = None,
+        timeout: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 종목 배치 분석
+
+        - 캐시 히트 종목은 요청하지 않음 (analyze_stock과 캐시 공유)
+        - 나머지는 batch_size개씩 묶어 요청 1건으로 분석, 최대 max_concurrency건 동시 요청
+        - 응답이 hedge_after초 안에 오지 않으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+        - 배치 응답에서 누락된 종목은 단일 프롬프트로 재요청
+        - 크로스체크 모드에서는 종목별 analyze_stock() 경로로 분석 (최대 max_concurrency개 동시)
+
+        Args:
+            analyze_stocks_batch() 참고
+
+        Returns:
+            분석 결과 리스트 (stocks와 같은 순서)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(stocks)
+        if not stocks:
+            return []
+
+        if not self.is_initialized:
+            if not self.initialize():
+                return [self._get_error_result("분석기 초기화 실패") for _ in stocks]
+
+        score_infos = score_infos or [None] * len(stocks)
+        self._batch_stats['stocks'] += len(stocks)
+
+        if self.enable_cross_check:
+            return await self._analyze_cross_check_async(
+                stocks, score_infos, portfolio_info, max_concurrency
+            )
+
+        # 캐시 확인 / 요청 대상 선별
+        pending = []  # (index, stock_data, prompt_inputs, cache_key)
+        for idx, stock_data in enumerate(stocks):
+            is_valid, msg = self.validate_stock_data(stock_data)
+            if not is_valid:
+                results[idx] = self._get_error_result(msg)
+                continue
+
+            prompt_inputs = self._build_prompt_inputs(stock_data, score_infos[idx], portfolio_info)
+            cache_key = self._make_cache_key(prompt_inputs, 'single')
+            cached_result = self._analysis_cache.get(cache_key)
+            if cached_result is not None:
+                self._batch_stats['cache_hits'] += 1
+                results[idx] = dict(cached_result)
+                continue
+
+            pending.append((idx, stock_data, prompt_inputs, cache_key))
+
+        if pending:
+            batch_size = max(1, batch_size)
+            chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            logger.info(
+                f"AI 배치 분석 시작: {len(pending)}종목 → {len(chunks)}건 요청 "
+                f"(캐시 히트 {len(stocks) - len(pending)}종목)"
+            )
+
+            chunk_results = await asyncio.gather(*[
+                self._analyze_chunk(chunk, portfolio_info, semaphore, hedge_after, timeout)
+                for chunk in chunks
+            ])
+
+            for chunk_result in chunk_results:
+                for idx, result in chunk_result.items():
+                    results[idx] = result
+
+        return results
+
+    def get_batch_statistics(self) -> Dict[str, Any]:
+        """
+        배치 분석 / 캐시 통계 조회
+
+        Returns:
+            통계 정보
+        """
+        cache_stats = self._analysis_cache.get_stats()
+        return {
+            **self._batch_stats,
+            'hedge_delay': round(self._get_hedge_delay(), 3),
+            'cache_entries': cache_stats.entry_count,
+            'cache_hit_rate': round(cache_stats.hit_rate, 4),
+        }
+
+    async def _analyze_chunk(
+        self,
+        chunk: List[tuple],
+        portfolio_info: Optional[str],
+        semaphore: asyncio.Semaphore,
+        hedge_after: Optional[float],
+        timeout: float
+    ) -> Dict[int, Dict[str, Any]]:
+        """배치 요청 1건 처리 - 누락 종목은 단일 프롬프트로 재요청"""
+        results: Dict[int, Dict[str, Any]] = {}
+        parsed: Dict[str, Dict[str, Any]] = {}
+        start_time = time.time()
+
+        stock_blocks = "\n".join(
+            self.BATCH_STOCK_BLOCK_TEMPLATE.format(index=n, **prompt_inputs)
+            for n, (_, _, prompt_inputs, _) in enumerate(chunk, 1)
+        )
+        prompt = self.BATCH_ANALYSIS_PROMPT_TEMPLATE.format(
+            count=len(chunk),
+            stock_blocks=stock_blocks,
+            portfolio_info=portfolio_info or "보유 종목 없음"
+        )
+
+        try:
+            async with semaphore:
+                self._batch_stats['requests'] += 1
+                response_text = await self._hedged_generate(prompt, hedge_after, timeout)
+            parsed = self._parse_batch_response(response_text, [item[1] for item in chunk])
+        except Exception as e:
+            logger.warning(f"AI 배치 요청 실패 ({len(chunk)}종목), 단일 요청으로 전환: {e}")
+            self._batch_stats['errors'] += 1
+
+        elapsed_time = time.time() - start_time
+        missing = []
+        for idx, stock_data, prompt_inputs, cache_key in chunk:
+            result = parsed.get(str(stock_data.get('stock_code', '')))
+            if result is None:
+                missing.append((idx, stock_data, prompt_inputs, cache_key))
+                continue
+            self._analysis_cache.set(cache_key, result)
+            self.update_statistics(True, elapsed_time)
+            results[idx] = result
+
+        if missing:
+            self._batch_stats['fallbacks'] += len(missing)
+            fallback_results = await asyncio.gather(*[
+                self._analyze_single_async(item, semaphore, hedge_after, timeout)
+                for item in missing
+            ])
+            for (idx, _, _, _), result in zip(missing, fallback_results):
+                results[idx] = result
+
+        return results
+
+    async def _analyze_single_async(
+        self,
+        item: tuple,
+        semaphore: asyncio.Semaphore,
+        hedge_after: Optional[float],
+        timeout: float
+    ) -> Dict[str, Any]:
+        """단일 종목 비동기 분석 (배치 누락 종목 재요청용)"""
+        _, stock_data, prompt_inputs, cache_key = item
+        prompt = self.STOCK_ANALYSIS_PROMPT_TEMPLATE_SIMPLE.format(**prompt_inputs)
+        start_time = time.time()
+
+        try:
+            async with semaphore:
+                self._batch_stats['requests'] += 1
+                response_text = await self._hedged_generate(prompt, hedge_after, timeout)
+            result = self._parse_stock_analysis_response(response_text, stock_data)
+        except Exception as e:
+            logger.error(f"AI 분석 실패: {stock_data.get('stock_code')} - {e}")
+            self._batch_stats['errors'] += 1
+            self.update_statistics(False)
+            return self._get_error_result(f"AI 분석 실패: {e}")
+
+        self._analysis_cache.set(cache_key, result)
+        self.update_statistics(True, time.time() - start_time)
+        return result
+
     def analyze_market(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         시장 분석
@@ -854,47 +1048,8 @@ class GeminiAnalyzer(BaseAnalyzer):
 
                     data = json.loads(json_str)
 
-                    # Extract values from JSON response
-                    signal_map = {
-                        'STRONG_BUY': 'buy',
-                        'BUY': 'buy',
-                        'WEAK_BUY': 'buy',
-                        'HOLD': 'hold',
-                        'WEAK_SELL': 'sell',
-                        'SELL': 'sell',
-                        'STRONG_SELL': 'sell'
-                    }
-
-                    signal = signal_map.get(str(data.get('signal', 'HOLD')).upper(), 'hold')
-
-                    # Extract detailed reasoning
-                    reasons = []
-                    if 'detailed_reasoning' in data:
-                        reasons.append(data['detailed_reasoning'])
-                    if 'key_insights' in data and isinstance(data.get('key_insights'), list):
-                        reasons.extend(data['key_insights'])
-
-                    # Extract warnings
-                    warnings = data.get('warnings', [])
-                    if isinstance(warnings, str):
-                        warnings = [warnings]
-
-                    # Extract trading plan
-                    trading_plan = data.get('trading_plan', {})
-                    entry_strategy = trading_plan.get('entry_strategy', '') if isinstance(trading_plan, dict) else ''
-
-                    result = {
-                        'score': 0,
-                        'signal': signal,
-                        'split_strategy': entry_strategy,
-                        'confidence': data.get('confidence_level', 'Medium'),
-                        'recommendation': signal,
-                        'reasons': reasons if reasons else ['AI 분석 완료'],
-                        'risks': warnings if isinstance(warnings, list) else [],
-                        'target_price': int(stock_data.get('current_price', 0) * 1.1),
-                        'stop_loss_price': int(stock_data.get('current_price', 0) * 0.95),
-                        'analysis_text': cleaned_text,
-                    }
+                    result = self._build_result_from_json(data, stock_data, cleaned_text)
+                    signal = result['signal']
 
                     logger.info(f"✅ JSON 응답 파싱 성공: {signal}")
                     return result
@@ -949,6 +1104,55 @@ class GeminiAnalyzer(BaseAnalyzer):
         logger.info(f"텍스트 파싱 완료: {signal}")
         return result
     
+    def _build_result_from_json(
+        self,
+        data: Dict[str, Any],
+        stock_data: Dict[str, Any],
+        analysis_text: str
+    ) -> Dict[str, Any]:
+        """JSON 응답 객체 → 분석 결과 변환 (단일 / 배치 공용)"""
+        # Extract values from JSON response
+        signal_map = {
+            'STRONG_BUY': 'buy',
+            'BUY': 'buy',
+            'WEAK_BUY': 'buy',
+            'HOLD': 'hold',
+            'WEAK_SELL': 'sell',
+            'SELL': 'sell',
+            'STRONG_SELL': 'sell'
+        }
+
+        signal = signal_map.get(str(data.get('signal', 'HOLD')).upper(), 'hold')
+
+        # Extract detailed reasoning
+        reasons = []
+        if 'detailed_reasoning' in data:
+            reasons.append(data['detailed_reasoning'])
+        if 'key_insights' in data and isinstance(data.get('key_insights'), list):
+            reasons.extend(data['key_insights'])
+
+        # Extract warnings
+        warnings = data.get('warnings', [])
+        if isinstance(warnings, str):
+            warnings = [warnings]
+
+        # Extract trading plan
+        trading_plan = data.get('trading_plan', {})
+        entry_strategy = trading_plan.get('entry_strategy', '') if isinstance(trading_plan, dict) else ''
+
+        return {
+            'score': 0,
+            'signal': signal,
+            'split_strategy': entry_strategy,
+            'confidence': data.get('confidence_level', 'Medium'),
+            'recommendation': signal,
+            'reasons': reasons if reasons else ['AI 분석 완료'],
+            'risks': warnings if isinstance(warnings, list) else [],
+            'target_price': int(stock_data.get('current_price', 0) * 1.1),
+            'stop_loss_price': int(stock_data.get('current_price', 0) * 0.95),
+            'analysis_text': analysis_text,
+        }
+
     def _parse_market_analysis_response(self, response_text: str) -> Dict[str, Any]:
         """시장 분석 응답 파싱"""
         result = {
@@ -1031,6 +1235,227 @@ class GeminiAnalyzer(BaseAnalyzer):
             'risks': [],
         }
 
+    # ==================== 프롬프트 / 캐시 / 비동기 호출 ====================
+
+    def _build_prompt_inputs(
+        self,
+        stock_data: Dict[str, Any],
+        score_info: Optional[Dict[str, Any]],
+        portfolio_info: Optional[str]
+    ) -> Dict[str, Any]:
+        """종목 분석 프롬프트 입력값 (SIMPLE / 배치 템플릿 공용)"""
+        if score_info:
+            score = score_info.get('score', 0)
+            percentage = score_info.get('percentage', 0)
+            breakdown = score_info.get('breakdown', {})
+            # 10가지 세부 점수 상세 표시
+            score_breakdown_detailed = "\n".join([
+                f"  {k}: {v:.1f}점" for k, v in breakdown.items() if v >= 0
+            ])
+        else:
+            score = 0
+            percentage = 0
+            score_breakdown_detailed = "  점수 정보 없음"
+
+        return {
+            'stock_name': stock_data.get('stock_name', ''),
+            'stock_code': stock_data.get('stock_code', ''),
+            'current_price': stock_data.get('current_price', 0),
+            'change_rate': stock_data.get('change_rate', 0.0),
+            'volume': stock_data.get('volume', 0),
+            'score': score,
+            'percentage': percentage,
+            'score_breakdown_detailed': score_breakdown_detailed,
+            'institutional_net_buy': stock_data.get('institutional_net_buy', 0),
+            'foreign_net_buy': stock_data.get('foreign_net_buy', 0),
+            'bid_ask_ratio': stock_data.get('bid_ask_ratio', 1.0),
+            'portfolio_info': portfolio_info or "보유 종목 없음",
+        }
+
+    def _make_cache_key(self, prompt_inputs: Dict[str, Any], mode: str) -> str:
+        """프롬프트 입력 + 모델 + 분석 모드 해시 → 캐시 키"""
+        payload = json.dumps(
+            {'model': self.model_name, 'mode': mode, 'inputs': prompt_inputs},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _extract_response_text(self, response) -> str:
+        """generate_content 응답 검증 후 텍스트 반환 (실패 시 ValueError)"""
+        if not response.candidates:
+            raise ValueError("Gemini API returned no candidates")
+
+        finish_reason = response.candidates[0].finish_reason
+
+        # finish_reason: 1=STOP(정상), 2=SAFETY(안전필터), 3=MAX_TOKENS, 4=RECITATION, 5=OTHER
+        if finish_reason != 1:
+            reason_map = {2: "SAFETY", 3: "MAX_TOKENS", 4: "RECITATION", 5: "OTHER"}
+            reason_name = reason_map.get(finish_reason, f"UNKNOWN({finish_reason})")
+            raise ValueError(f"Gemini blocked: {reason_name}")
+
+        if not hasattr(response, 'text'):
+            raise ValueError("Gemini API response has no 'text' attribute")
+
+        response_text = response.text
+        if not response_text or len(response_text.strip()) == 0:
+            raise ValueError("Gemini API returned empty response")
+
+        return response_text
+
+    async def _analyze_cross_check_async(
+        self,
+        stocks: List[Dict[str, Any]],
+        score_infos: List[Optional[Dict[str, Any]]],
+        portfolio_info: Optional[str],
+        max_concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """크로스체크 모드 배치 - 종목별 analyze_stock()을 스레드 풀에서 동시 실행"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def analyze_one(stock_data, score_info):
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self._get_executor(),
+                    lambda: self.analyze_stock(
+                        stock_data, score_info=score_info, portfolio_info=portfolio_info
+                    )
+                )
+
+        logger.info(f"AI 크로스체크 배치 분석 시작: {len(stocks)}종목 (종목별 요청)")
+        return list(await asyncio.gather(*(
+            analyze_one(stock_data, score_info)
+            for stock_data, score_info in zip(stocks, score_infos)
+        )))
+
+    async def _generate_async(self, prompt: str, timeout: float) -> str:
+        """
+        비동기 generate_content 호출
+
+        SDK async API는 전용 배치 루프에서만 사용하고 (클라이언트가 첫 루프에 묶임),
+        그 외 루프나 async API가 없는 모델은 스레드 풀에서 동기 호출로 실행
+        """
+        use_native = (
+            hasattr(self.model, 'generate_content_async')
+            and asyncio.get_running_loop() is self._batch_loop
+        )
+        if use_native:
+            call = self.model.generate_content_async(
+                prompt,
+                request_options={'timeout': timeout}
+            )
+        else:
+            call = asyncio.get_running_loop().run_in_executor(
+                self._get_executor(),
+                lambda: self.model.generate_content(prompt, request_options={'timeout': timeout})
+            )
+
+        response = await asyncio.wait_for(call, timeout)
+        return self._extract_response_text(response)
+
+    def _get_hedge_delay(self) -> float:
+        """헤징 대기 시간 - 최근 응답 시간 p95 (표본 부족 시 기본값)"""
+        if len(self._latencies) < 5:
+            return self._hedge_default_delay
+        ordered = sorted(self._latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return max(self._hedge_min_delay, p95)
+
+    async def _hedged_generate(self, prompt: str, hedge_after: Optional[float], timeout: float) -> str:
+        """
+        헤징 요청 - 첫 요청이 hedge_after초 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+        먼저 성공한 응답 사용 (나머지는 취소)
+        """
+        delay = hedge_after if hedge_after is not None else self._get_hedge_delay()
+        started = time.time()
+        primary = asyncio.ensure_future(self._generate_async(prompt, timeout))
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            response_text = primary.result()
+            self._latencies.append(time.time() - started)
+            return response_text
+
+        self._batch_stats['hedged'] += 1
+        hedge_started = time.time()
+        hedge = asyncio.ensure_future(self._generate_async(prompt, timeout))
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is hedge:
+                        self._batch_stats['hedge_wins'] += 1
+                        self._latencies.append(time.time() - hedge_started)
+                    else:
+                        self._latencies.append(time.time() - started)
+                    return task.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _parse_batch_response(
+        self,
+        response_text: str,
+        stocks: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        배치 응답 파싱 - JSON 배열에서 종목별 결과 추출
+
+        Returns:
+            {종목코드: 분석 결과} (파싱 실패 / 누락 종목은 제외)
+        """
+        stock_map = {str(s.get('stock_code', '')): s for s in stocks}
+        cleaned_text = response_text.strip()
+
+        json_match = re.search(r'```(?:json)?\s*\n(.*?)\n```', cleaned_text, re.DOTALL)
+        if json_match:
+            json_str = json_match.group(1).strip()
+        else:
+            first_bracket = cleaned_text.find('[')
+            last_bracket = cleaned_text.rfind(']')
+            if first_bracket == -1 or last_bracket <= first_bracket:
+                logger.warning("배치 응답에서 JSON 배열을 찾지 못함")
+                return {}
+            json_str = cleaned_text[first_bracket:last_bracket + 1]
+
+        # Remove trailing commas
+        json_str = re.sub(r',\s*}', '}', json_str)
+        json_str = re.sub(r',\s*]', ']', json_str)
+
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            logger.warning(f"배치 응답 JSON 파싱 실패 (위치: {e.pos}, 메시지: {e.msg})")
+            return {}
+
+        if isinstance(data, dict):
+            data = data.get('results', [data])
+        if not isinstance(data, list):
+            return {}
+
+        results = {}
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            stock_code = str(item.get('stock_code', ''))
+            if stock_code not in stock_map or stock_code in results:
+                continue
+            results[stock_code] = self._build_result_from_json(
+                item,
+                stock_map[stock_code],
+                json.dumps(item, ensure_ascii=False)
+            )
+
+        logger.info(f"배치 응답 파싱: {len(results)}/{len(stocks)}종목")
+        return results
+
     # ==================== 크로스 체크 ====================
 
     def _analyze_with_single_model(
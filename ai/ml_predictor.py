@@ -13,7 +13,7 @@ Features:
 import json
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -33,6 +33,100 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+MODEL_NAMES = ('random_forest', 'xgboost', 'gradient_boosting')
+
+# Market features fed to the models, in column order: (key, default).
+# A default of 'price' means "current price of the same row".
+MARKET_FEATURES = (
+    ('price', 0.0),
+    ('price_change', 0.0),
+    ('price_ma5', 'price'),
+    ('price_ma10', 'price'),
+    ('price_ma20', 'price'),
+    ('price_std5', 0.0),
+    ('price_std10', 0.0),
+    ('bb_position', 0.5),
+    ('volume', 0.0),
+    ('volume_change', 0.0),
+    ('volume_ma5', 0.0),
+    ('volume_ratio', 1.0),
+    ('rsi', 50.0),
+    ('macd', 0.0),
+    ('macd_signal', 0.0),
+    ('macd_hist', 0.0),
+)
+FEATURE_INDEX = {key: i for i, (key, _) in enumerate(MARKET_FEATURES)}
+
+# Shortest history that defines every rolling feature (20-bar window + 1 diff)
+MIN_HISTORY = 21
+
+
+def _ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """Row-wise exponential moving average (pandas ewm(span).mean(), adjust=True)"""
+    decay = 1 - 2 / (span + 1)
+    out = np.empty_like(values)
+    num = np.zeros(len(values))
+    den = 0.0
+    for t in range(values.shape[1]):
+        num = values[:, t] + decay * num
+        den = 1.0 + decay * den
+        out[:, t] = num / den
+    return out
+
+
+def history_features(prices: np.ndarray, volumes: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Latest-bar features for many stocks at once
+
+    Same definitions as ``MLPricePredictor._engineer_features`` evaluated on
+    the last row, computed column-wise over equal-length histories.
+
+    Args:
+        prices: Price histories [n_stocks, n_bars] (oldest first)
+        volumes: Volume histories [n_stocks, n_bars] (optional)
+
+    Returns:
+        Feature name -> values [n_stocks] (NaN where undefined)
+    """
+    prices = np.asarray(prices, dtype=float)
+    last = prices[:, -1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        features = {
+            'price': last,
+            'price_change': last / prices[:, -2] - 1,
+            'price_ma5': prices[:, -5:].mean(axis=1),
+            'price_ma10': prices[:, -10:].mean(axis=1),
+            'price_ma20': prices[:, -20:].mean(axis=1),
+            'price_std5': prices[:, -5:].std(axis=1, ddof=1),
+            'price_std10': prices[:, -10:].std(axis=1, ddof=1),
+        }
+        std20 = prices[:, -20:].std(axis=1, ddof=1)
+        features['bb_position'] = (last - features['price_ma20'] + 2 * std20) / (4 * std20)
+
+        # RSI (14-bar simple average of gains/losses)
+        delta = np.diff(prices[:, -15:], axis=1)
+        gain = np.where(delta > 0, delta, 0).mean(axis=1)
+        loss = np.where(delta < 0, -delta, 0).mean(axis=1)
+        features['rsi'] = 100 - 100 / (1 + gain / loss)
+
+        # MACD
+        macd = _ewm_mean(prices, 12) - _ewm_mean(prices, 26)
+        signal = _ewm_mean(macd, 9)
+        features['macd'] = macd[:, -1]
+        features['macd_signal'] = signal[:, -1]
+        features['macd_hist'] = macd[:, -1] - signal[:, -1]
+
+        if volumes is not None:
+            volumes = np.asarray(volumes, dtype=float)
+            volume_ma5 = volumes[:, -5:].mean(axis=1)
+            features['volume'] = volumes[:, -1]
+            features['volume_change'] = volumes[:, -1] / volumes[:, -2] - 1
+            features['volume_ma5'] = volume_ma5
+            features['volume_ratio'] = volumes[:, -1] / volume_ma5
+
+    return {key: np.where(np.isfinite(values), values, np.nan) for key, values in features.items()}
+
 
 @dataclass
 class PricePrediction:
@@ -126,7 +220,7 @@ class MLPricePredictor:
 
     def _load_models(self):
         """Load pre-trained models from disk"""
-        for model_name in ['random_forest', 'xgboost', 'gradient_boosting']:
+        for model_name in MODEL_NAMES:
             model_file = self.models_dir / f'{model_name}.pkl'
             scaler_file = self.models_dir / f'{model_name}_scaler.pkl'
 
@@ -142,7 +236,7 @@ class MLPricePredictor:
 
     def _save_models(self):
         """Save trained models to disk"""
-        for model_name in ['random_forest', 'xgboost', 'gradient_boosting']:
+        for model_name in MODEL_NAMES:
             if model_name not in self.models:
                 continue
 
@@ -245,7 +339,7 @@ class MLPricePredictor:
             )
 
             # Train each model
-            for model_name in ['random_forest', 'xgboost', 'gradient_boosting']:
+            for model_name in MODEL_NAMES:
                 logger.info(f"Training {model_name}...")
 
                 # Scale features
@@ -307,176 +401,187 @@ class MLPricePredictor:
         Returns:
             PricePrediction with ensemble prediction
         """
-        try:
-            current_price = current_data.get('price', 0)
+        candidate = dict(current_data, stock_code=stock_code, stock_name=stock_name)
+        return self.predict_batch([candidate])[0]
 
-            if not SKLEARN_AVAILABLE or not self.models:
-                # Fallback: simple prediction
-                return self._fallback_prediction(stock_code, stock_name, current_data)
-
-            # Prepare features
-            features = self._prepare_features(current_data)
+    def predict_batch(self, candidates: Sequence[Dict[str, Any]]) -> List[PricePrediction]:
+        """
+        Predict future prices for many stocks in one pass
 
-            # Get predictions from each model
-            predictions = {}
-            confidences = {}
+        Builds one feature matrix for all candidates and runs each model
+        once on it.
 
-            for model_name in ['random_forest', 'xgboost', 'gradient_boosting']:
-                if model_name not in self.models:
-                    continue
+        Args:
+            candidates: Dicts with 'stock_code', 'stock_name' and the same
+                market data keys as ``predict``'s current_data. Optional
+                'price_history'/'volume_history' (oldest first) fill any
+                feature not given explicitly.
 
-                scaler = self.scalers[model_name]
-                model = self.models[model_name]
+        Returns:
+            PricePrediction per candidate, in input order
+        """
+        if not candidates:
+            return []
 
-                # Scale features
-                features_scaled = scaler.transform([features])
+        features = self.build_feature_matrix(candidates)
 
-                # Predict
-                pred = model.predict(features_scaled)[0]
-                predictions[model_name] = pred
+        if not SKLEARN_AVAILABLE or not self.models:
+            # Fallback: simple prediction
+            return self._fallback_predictions(candidates, features)
 
-                # Confidence from model performance
-                perf = self.performance.get(model_name)
-                if perf:
-                    confidences[model_name] = perf.accuracy
-                else:
-                    confidences[model_name] = 0.5
+        try:
+            # Get predictions from each model (one call per model)
+            names = [name for name in MODEL_NAMES if name in self.models]
+            predictions = np.column_stack([
+                self.models[name].predict(self.scalers[name].transform(features))
+                for name in names
+            ])
+
+            # Confidence from model performance
+            confidences = np.array([
+                self.performance[name].accuracy if self.performance.get(name) else 0.5
+                for name in names
+            ])
 
             # Ensemble prediction (weighted average)
-            total_confidence = sum(confidences.values())
+            total_confidence = confidences.sum()
             if total_confidence > 0:
-                ensemble_pred = sum(
-                    pred * (confidences[name] / total_confidence)
-                    for name, pred in predictions.items()
-                )
+                ensemble_pred = predictions @ (confidences / total_confidence)
             else:
-                ensemble_pred = np.mean(list(predictions.values()))
+                ensemble_pred = predictions.mean(axis=1)
 
             # Calculate prediction intervals (simplified)
-            std_pred = np.std(list(predictions.values()))
-            pred_low = ensemble_pred - (1.96 * std_pred)
-            pred_high = ensemble_pred + (1.96 * std_pred)
-
-            # Determine direction and confidence
-            expected_return = ((ensemble_pred - current_price) / current_price) * 100
-
-            if expected_return > 1:
-                direction = 'up'
-                confidence = min(0.95, 0.5 + (abs(expected_return) / 10))
-            elif expected_return < -1:
-                direction = 'down'
-                confidence = min(0.95, 0.5 + (abs(expected_return) / 10))
-            else:
-                direction = 'neutral'
-                confidence = 0.3
-
-            # Create prediction
-            prediction = PricePrediction(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                current_price=current_price,
-                predicted_price_1h=ensemble_pred * 0.98,  # Conservative 1h
-                predicted_price_1d=ensemble_pred,
-                predicted_price_5d=ensemble_pred * 1.02,  # Optimistic 5d
-                confidence=confidence,
-                direction=direction,
-                expected_return=expected_return,
-                prediction_interval_low=pred_low,
-                prediction_interval_high=pred_high,
-                model_used='ensemble',
-                timestamp=datetime.now().isoformat()
-            )
+            std_pred = predictions.std(axis=1)
 
-            return prediction
+            return self._build_predictions(
+                candidates, features[:, FEATURE_INDEX['price']], ensemble_pred,
+                ensemble_pred * 0.98, ensemble_pred * 1.02,  # Conservative 1h, optimistic 5d
+                ensemble_pred - 1.96 * std_pred, ensemble_pred + 1.96 * std_pred,
+                model_used='ensemble'
+            )
 
         except Exception as e:
             logger.error(f"Error predicting: {e}")
-            return self._fallback_prediction(stock_code, stock_name, current_data)
+            return self._fallback_predictions(candidates, features)
 
-    def _prepare_features(self, data: Dict[str, Any]) -> List[float]:
-        """Prepare features from current data"""
-        features = []
+    def build_feature_matrix(self, candidates: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """
+        Feature matrix [n_candidates, n_features] for model input
 
-        # Price features
-        price = data.get('price', 0)
-        features.extend([
-            price,
-            data.get('price_change', 0),
-            data.get('price_ma5', price),
-            data.get('price_ma10', price),
-            data.get('price_ma20', price),
-            data.get('price_std5', 0),
-            data.get('price_std10', 0),
-            data.get('bb_position', 0.5),
-        ])
+        Explicit values in each candidate dict win; missing ones come from
+        its price/volume history (computed for all candidates at once, per
+        history length) and then from the defaults in MARKET_FEATURES.
+        """
+        n = len(candidates)
+        derived = self._derive_history_features(candidates)
+        matrix = np.empty((n, len(MARKET_FEATURES) + 2))
 
-        # Volume features
-        features.extend([
-            data.get('volume', 0),
-            data.get('volume_change', 0),
-            data.get('volume_ma5', 0),
-            data.get('volume_ratio', 1.0),
-        ])
-
-        # Technical indicators
-        features.extend([
-            data.get('rsi', 50),
-            data.get('macd', 0),
-            data.get('macd_signal', 0),
-            data.get('macd_hist', 0),
-        ])
+        for j, (key, default) in enumerate(MARKET_FEATURES):
+            column = np.array([c.get(key, np.nan) for c in candidates], dtype=float)
+            if key in derived:
+                column = np.where(np.isnan(column), derived[key], column)
+            fallback = matrix[:, FEATURE_INDEX['price']] if default == 'price' else default
+            matrix[:, j] = np.where(np.isnan(column), fallback, column)
 
         # Time features
-        features.extend([
-            datetime.now().hour,
-            datetime.now().weekday(),
-        ])
+        now = datetime.now()
+        matrix[:, -2] = now.hour
+        matrix[:, -1] = now.weekday()
+
+        return matrix
+
+    def _derive_history_features(self, candidates: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """History-derived features for candidates with 'price_history' (NaN elsewhere)"""
+        groups: Dict[int, List[int]] = {}
+        for i, candidate in enumerate(candidates):
+            history = candidate.get('price_history')
+            if history is not None and len(history) >= MIN_HISTORY:
+                groups.setdefault(len(history), []).append(i)
+        if not groups:
+            return {}
+
+        derived = {key: np.full(len(candidates), np.nan) for key, _ in MARKET_FEATURES}
+        for rows in groups.values():
+            prices = np.array([candidates[i]['price_history'] for i in rows], dtype=float)
+            with_volume = all(candidates[i].get('volume_history') is not None for i in rows)
+            volumes = np.array([candidates[i]['volume_history'] for i in rows], dtype=float) if with_volume else None
+            for key, values in history_features(prices, volumes).items():
+                derived[key][rows] = values
+        return derived
 
-        return features
+    def _prepare_features(self, data: Dict[str, Any]) -> List[float]:
+        """Prepare features from current data"""
+        return self.build_feature_matrix([data])[0].tolist()
 
-    def _fallback_prediction(
+    def _fallback_predictions(
         self,
-        stock_code: str,
-        stock_name: str,
-        data: Dict[str, Any]
-    ) -> PricePrediction:
+        candidates: Sequence[Dict[str, Any]],
+        features: np.ndarray
+    ) -> List[PricePrediction]:
         """Fallback prediction when ML not available"""
-        current_price = data.get('price', 0)
-        rsi = data.get('rsi', 50)
-        volume_ratio = data.get('volume_ratio', 1.0)
-
-        # Simple heuristic
-        if rsi < 30 and volume_ratio > 1.5:
-            predicted = current_price * 1.03
-            direction = 'up'
-            confidence = 0.65
-        elif rsi > 70:
-            predicted = current_price * 0.98
-            direction = 'down'
-            confidence = 0.60
-        else:
-            predicted = current_price * 1.01
-            direction = 'neutral'
-            confidence = 0.45
-
-        expected_return = ((predicted - current_price) / current_price) * 100
-
-        return PricePrediction(
-            stock_code=stock_code,
-            stock_name=stock_name,
-            current_price=current_price,
-            predicted_price_1h=predicted * 0.99,
-            predicted_price_1d=predicted,
-            predicted_price_5d=predicted * 1.01,
-            confidence=confidence,
-            direction=direction,
-            expected_return=expected_return,
-            prediction_interval_low=predicted * 0.95,
-            prediction_interval_high=predicted * 1.05,
-            model_used='fallback',
-            timestamp=datetime.now().isoformat()
+        current_price = features[:, FEATURE_INDEX['price']]
+        rsi = features[:, FEATURE_INDEX['rsi']]
+        volume_ratio = features[:, FEATURE_INDEX['volume_ratio']]
+
+        # Simple heuristic: oversold with volume → up, overbought → down
+        predicted = current_price * np.select(
+            [(rsi < 30) & (volume_ratio > 1.5), rsi > 70], [1.03, 0.98], default=1.01
+        )
+        direction = np.select([(rsi < 30) & (volume_ratio > 1.5), rsi > 70], ['up', 'down'], default='neutral')
+        confidence = np.select([direction == 'up', direction == 'down'], [0.65, 0.60], default=0.45)
+
+        return self._build_predictions(
+            candidates, current_price, predicted, predicted * 0.99, predicted * 1.01,
+            predicted * 0.95, predicted * 1.05, model_used='fallback',
+            direction=direction, confidence=confidence
         )
 
+    def _build_predictions(
+        self,
+        candidates: Sequence[Dict[str, Any]],
+        current_price: np.ndarray,
+        predicted_1d: np.ndarray,
+        predicted_1h: np.ndarray,
+        predicted_5d: np.ndarray,
+        interval_low: np.ndarray,
+        interval_high: np.ndarray,
+        model_used: str,
+        direction: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None
+    ) -> List[PricePrediction]:
+        """Per-candidate PricePrediction objects from column arrays"""
+        expected_return = np.divide(
+            (predicted_1d - current_price) * 100, current_price,
+            out=np.zeros_like(predicted_1d), where=current_price > 0
+        )
+
+        # Determine direction and confidence
+        if direction is None:
+            direction = np.where(expected_return > 1, 'up', np.where(expected_return < -1, 'down', 'neutral'))
+            confidence = np.where(
+                np.abs(expected_return) > 1, np.minimum(0.95, 0.5 + np.abs(expected_return) / 10), 0.3
+            )
+
+        timestamp = datetime.now().isoformat()
+        return [
+            PricePrediction(
+                stock_code=candidate.get('stock_code', ''),
+                stock_name=candidate.get('stock_name', candidate.get('stock_code', '')),
+                current_price=float(current_price[i]),
+                predicted_price_1h=float(predicted_1h[i]),
+                predicted_price_1d=float(predicted_1d[i]),
+                predicted_price_5d=float(predicted_5d[i]),
+                confidence=float(confidence[i]),
+                direction=str(direction[i]),
+                expected_return=float(expected_return[i]),
+                prediction_interval_low=float(interval_low[i]),
+                prediction_interval_high=float(interval_high[i]),
+                model_used=model_used,
+                timestamp=timestamp
+            )
+            for i, candidate in enumerate(candidates)
+        ]
+
     def get_model_performance(self) -> Dict[str, Any]:
         """Get performance metrics for all models"""
         return {
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 import time
 
 try:
-    from scipy.stats import norm
+    from scipy.special import ndtr
     SCIPY_AVAILABLE = True
 except ImportError:
     SCIPY_AVAILABLE = False
@@ -43,6 +43,11 @@ class OptionGreeks:
     rho: float  # Interest rate sensitivity
 
 
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal density"""
+    return np.exp(-0.5 * x * x) / np.sqrt(2 * np.pi)
+
+
 class BlackScholesModel:
     """
     Black-Scholes option pricing model
@@ -51,11 +56,213 @@ class BlackScholesModel:
     - Call and put pricing
     - Greeks calculation
     - Implied volatility
+    - Array versions for a whole option chain (strikes × expiries)
+
+    The *_chain methods take NumPy arrays that broadcast against each other,
+    e.g. strikes[np.newaxis, :] with expiries[:, np.newaxis] for an
+    expiries × strikes grid; option_type may be an array of 'call'/'put'.
+    The scalar methods are thin wrappers around them.
     """
 
     def __init__(self, risk_free_rate: float = 0.02):
         self.risk_free_rate = risk_free_rate
 
+    def _d1_d2(self, spot, strike, t, vol) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """d1, d2 and sqrt(t)"""
+        sqrt_t = np.sqrt(t)
+        vol_sqrt_t = vol * sqrt_t
+        d1 = (np.log(spot / strike) + (self.risk_free_rate + 0.5 * vol ** 2) * t) / vol_sqrt_t
+        return d1, d1 - vol_sqrt_t, sqrt_t
+
+    def _bs_price(self, spot, strike, t, vol, is_call) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Black-Scholes price plus d1 and sqrt(t) (reused for vega)"""
+        d1, d2, sqrt_t = self._d1_d2(spot, strike, t, vol)
+        discounted_strike = strike * np.exp(-self.risk_free_rate * t)
+        call = spot * ndtr(d1) - discounted_strike * ndtr(d2)
+        put = discounted_strike * ndtr(-d2) - spot * ndtr(-d1)
+        return np.where(is_call, call, put), d1, sqrt_t
+
+    @staticmethod
+    def _intrinsic(spot, strike, is_call) -> np.ndarray:
+        return np.where(is_call, np.maximum(spot - strike, 0), np.maximum(strike - spot, 0))
+
+    def price_chain(
+        self,
+        spot_price,
+        strike_price,
+        time_to_expiry,
+        volatility,
+        option_type='call'
+    ) -> np.ndarray:
+        """
+        Option prices for a whole chain
+
+        Args:
+            spot_price: Current underlying price(s)
+            strike_price: Strike prices
+            time_to_expiry: Times to expiry in years (0 → intrinsic value)
+            volatility: Annualized volatilities
+            option_type: 'call'/'put' or an array of them
+
+        Returns:
+            Option prices (broadcast shape of the inputs)
+        """
+        spot, strike, t, vol = (np.asarray(x, dtype=float) for x in
+                                (spot_price, strike_price, time_to_expiry, volatility))
+        is_call = np.asarray(option_type) == 'call'
+        intrinsic = self._intrinsic(spot, strike, is_call)
+
+        if not SCIPY_AVAILABLE:
+            # Simple approximation
+            return intrinsic + vol * np.sqrt(t) * spot / 4
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price = self._bs_price(spot, strike, t, vol, is_call)[0]
+        return np.where(t > 0, price, intrinsic)
+
+    def greeks_chain(
+        self,
+        spot_price,
+        strike_price,
+        time_to_expiry,
+        volatility,
+        option_type='call'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Greeks for a whole chain (same units as calculate_greeks)
+
+        Returns:
+            {'delta', 'gamma', 'theta', 'vega', 'rho'} arrays
+        """
+        spot, strike, t, vol = (np.asarray(x, dtype=float) for x in
+                                (spot_price, strike_price, time_to_expiry, volatility))
+        is_call = np.asarray(option_type) == 'call'
+
+        if not SCIPY_AVAILABLE:
+            # Simplified Greeks
+            shape = np.broadcast(spot, strike, t, vol, is_call).shape
+            return {
+                'delta': np.broadcast_to(np.where(is_call, 0.5, -0.5), shape).copy(),
+                'gamma': np.full(shape, 0.1),
+                'theta': np.full(shape, -0.05),
+                'vega': np.full(shape, 0.2),
+                'rho': np.full(shape, 0.1)
+            }
+
+        r = self.risk_free_rate
+        d1, d2, sqrt_t = self._d1_d2(spot, strike, t, vol)
+        pdf_d1 = _norm_pdf(d1)
+        cdf_d1, cdf_d2, cdf_minus_d2 = ndtr(d1), ndtr(d2), ndtr(-d2)
+        discounted_strike = strike * np.exp(-r * t)
+        decay = -spot * pdf_d1 * vol / (2 * sqrt_t)
+
+        return {
+            'delta': np.where(is_call, cdf_d1, cdf_d1 - 1),
+            # Gamma, vega: same for call and put
+            'gamma': pdf_d1 / (spot * vol * sqrt_t),
+            'theta': np.where(is_call,
+                              decay - r * discounted_strike * cdf_d2,
+                              decay + r * discounted_strike * cdf_minus_d2) / 365,
+            'vega': spot * pdf_d1 * sqrt_t / 100,
+            'rho': np.where(is_call, t * discounted_strike * cdf_d2, -t * discounted_strike * cdf_minus_d2) / 100
+        }
+
+    def implied_volatility_chain(
+        self,
+        option_price,
+        spot_price,
+        strike_price,
+        time_to_expiry,
+        option_type='call',
+        tol: float = 1e-8,
+        max_iter: int = 100,
+        vol_bounds: Tuple[float, float] = (0.001, 3.0)
+    ) -> np.ndarray:
+        """
+        Implied volatilities for a whole chain
+
+        Bracketed Newton-Raphson: every element keeps a [low, high]
+        volatility bracket that always contains the root, takes the Newton
+        step (vega from d1 only) when it lands inside the bracket and
+        bisects otherwise. Elements leave the iteration as soon as
+        |model - market| <= tol × (market - lowest reachable price), i.e.
+        relative to the time value so deep ITM quotes are not accepted at
+        the wrong volatility (or the bracket collapses); the rest continue
+        on the shrinking subset.
+
+        Args:
+            option_price: Observed option prices
+            spot_price: Current underlying price(s)
+            strike_price: Strike prices
+            time_to_expiry: Times to expiry in years
+            option_type: 'call'/'put' or an array of them
+            tol: Price tolerance relative to the option's time value
+            max_iter: Maximum iterations
+            vol_bounds: Volatility search range
+
+        Returns:
+            Implied volatilities (NaN where no volatility within vol_bounds
+            reproduces the price, or time_to_expiry <= 0)
+        """
+        arrays = np.broadcast_arrays(
+            np.asarray(option_price, dtype=float), np.asarray(spot_price, dtype=float),
+            np.asarray(strike_price, dtype=float), np.asarray(time_to_expiry, dtype=float),
+            np.asarray(option_type) == 'call'
+        )
+        shape = arrays[0].shape
+        price, spot, strike, t, is_call = (np.ravel(a) for a in arrays)
+        lower, upper = vol_bounds
+        result = np.full(price.shape, np.nan)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if not SCIPY_AVAILABLE:
+                # Invert the linear approximation used by price_chain
+                vol = (price - self._intrinsic(spot, strike, is_call)) / (np.sqrt(t) * spot / 4)
+                result = np.where((vol >= lower) & (vol <= upper), vol, np.nan)
+                return result.reshape(shape)
+
+            # Quotes outside the prices reachable within the bounds have no solution
+            low = np.full(price.shape, lower)
+            high = np.full(price.shape, upper)
+            price_low = self._bs_price(spot, strike, t, low, is_call)[0]
+            price_high = self._bs_price(spot, strike, t, high, is_call)[0]
+            quote_tol = tol * price
+            solvable = (t > 0) & (price >= price_low - quote_tol) & (price <= price_high + quote_tol)
+            price_tol = tol * np.maximum(price - price_low, 0.0)
+
+            # Initial guess (Brenner-Subrahmanyam), clipped into the bracket
+            vol = np.clip(np.sqrt(2 * np.pi / t) * price / spot, lower, upper)
+            active = np.flatnonzero(solvable)
+
+            for _ in range(max_iter):
+                if active.size == 0:
+                    break
+
+                v = vol[active]
+                model, d1, sqrt_t = self._bs_price(spot[active], strike[active], t[active], v, is_call[active])
+                diff = model - price[active]
+
+                converged = np.abs(diff) <= price_tol[active]
+                result[active[converged]] = v[converged]
+
+                # Price is increasing in volatility: shrink the bracket around the root
+                lo = np.where(diff < 0, v, low[active])
+                hi = np.where(diff > 0, v, high[active])
+                vega = spot[active] * _norm_pdf(d1) * sqrt_t
+                step = v - diff / vega
+                inside = np.isfinite(step) & (step > lo) & (step < hi)
+                next_vol = np.where(inside, step, 0.5 * (lo + hi))
+
+                low[active], high[active], vol[active] = lo, hi, next_vol
+                collapsed = ~converged & (hi - lo < 1e-12)
+                result[active[collapsed]] = next_vol[collapsed]
+                active = active[~converged & ~collapsed]
+
+            # Not converged within max_iter: best bracketed estimate
+            result[active] = vol[active]
+
+        return result.reshape(shape)
+
     def price_option(
         self,
         spot_price: float,
@@ -77,27 +284,7 @@ class BlackScholesModel:
         Returns:
             Option price
         """
-        if not SCIPY_AVAILABLE:
-            # Simple approximation
-            intrinsic = max(0, spot_price - strike_price) if option_type == 'call' \
-                else max(0, strike_price - spot_price)
-            time_value = volatility * np.sqrt(time_to_expiry) * spot_price / 4
-            return intrinsic + time_value
-
-        d1 = (np.log(spot_price / strike_price) +
-              (self.risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry) / \
-             (volatility * np.sqrt(time_to_expiry))
-
-        d2 = d1 - volatility * np.sqrt(time_to_expiry)
-
-        if option_type == 'call':
-            price = (spot_price * norm.cdf(d1) -
-                    strike_price * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(d2))
-        else:  # put
-            price = (strike_price * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(-d2) -
-                    spot_price * norm.cdf(-d1))
-
-        return float(price)
+        return float(self.price_chain(spot_price, strike_price, time_to_expiry, volatility, option_type))
 
     def calculate_greeks(
         self,
@@ -113,55 +300,8 @@ class BlackScholesModel:
         Returns:
             All Greeks
         """
-        if not SCIPY_AVAILABLE:
-            # Simplified Greeks
-            return OptionGreeks(
-                delta=0.5 if option_type == 'call' else -0.5,
-                gamma=0.1,
-                theta=-0.05,
-                vega=0.2,
-                rho=0.1
-            )
-
-        d1 = (np.log(spot_price / strike_price) +
-              (self.risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry) / \
-             (volatility * np.sqrt(time_to_expiry))
-
-        d2 = d1 - volatility * np.sqrt(time_to_expiry)
-
-        # Delta
-        if option_type == 'call':
-            delta = norm.cdf(d1)
-        else:
-            delta = norm.cdf(d1) - 1
-
-        # Gamma (same for call and put)
-        gamma = norm.pdf(d1) / (spot_price * volatility * np.sqrt(time_to_expiry))
-
-        # Theta
-        if option_type == 'call':
-            theta = ((-spot_price * norm.pdf(d1) * volatility / (2 * np.sqrt(time_to_expiry))) -
-                    self.risk_free_rate * strike_price * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(d2)) / 365
-        else:
-            theta = ((-spot_price * norm.pdf(d1) * volatility / (2 * np.sqrt(time_to_expiry))) +
-                    self.risk_free_rate * strike_price * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(-d2)) / 365
-
-        # Vega (same for call and put)
-        vega = spot_price * norm.pdf(d1) * np.sqrt(time_to_expiry) / 100
-
-        # Rho
-        if option_type == 'call':
-            rho = strike_price * time_to_expiry * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(d2) / 100
-        else:
-            rho = -strike_price * time_to_expiry * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(-d2) / 100
-
-        return OptionGreeks(
-            delta=float(delta),
-            gamma=float(gamma),
-            theta=float(theta),
-            vega=float(vega),
-            rho=float(rho)
-        )
+        greeks = self.greeks_chain(spot_price, strike_price, time_to_expiry, volatility, option_type)
+        return OptionGreeks(**{name: float(value) for name, value in greeks.items()})
 
     def implied_volatility(
         self,
@@ -172,7 +312,7 @@ class BlackScholesModel:
         option_type: str = 'call'
     ) -> float:
         """
-        Calculate implied volatility using Newton-Raphson
+        Calculate implied volatility using bracketed Newton-Raphson
 
         Args:
             option_price: Observed option price
@@ -182,31 +322,11 @@ class BlackScholesModel:
             option_type: 'call' or 'put'
 
         Returns:
-            Implied volatility
+            Implied volatility (NaN if no volatility in 0.1%–300% matches the price)
         """
-        # Initial guess
-        volatility = 0.3
-
-        for _ in range(100):  # Max iterations
-            price = self.price_option(spot_price, strike_price, time_to_expiry, volatility, option_type)
-            diff = option_price - price
-
-            if abs(diff) < 0.001:
-                return volatility
-
-            # Vega for Newton-Raphson
-            greeks = self.calculate_greeks(spot_price, strike_price, time_to_expiry, volatility, option_type)
-            vega = greeks.vega * 100  # Convert back from % terms
-
-            if vega == 0:
-                break
-
-            volatility += diff / vega
-
-            # Keep volatility positive and reasonable
-            volatility = max(0.001, min(3.0, volatility))
-
-        return float(volatility)
+        return float(self.implied_volatility_chain(
+            option_price, spot_price, strike_price, time_to_expiry, option_type
+        ))
 
 
 class OptionsStrategyAnalyzer:
@@ -19,6 +19,14 @@ except ImportError:
     SCIPY_AVAILABLE = False
     print("⚠️ scipy not available. Install with: pip install scipy")
 
+from utils.portfolio_math import (
+    weight_bounds,
+    max_sharpe_weights,
+    target_return_weights,
+    efficient_frontier_weights,
+    risk_parity_weights,
+)
+
 
 @dataclass
 class PortfolioAllocation:
@@ -60,6 +68,8 @@ class MarkowitzOptimizer:
     - Maximum Sharpe ratio portfolio
     - Minimum variance portfolio
     - Risk-return optimization
+
+    Solvers are shared with strategy.portfolio_optimizer (utils.portfolio_math).
     """
 
     def __init__(self):
@@ -82,9 +92,6 @@ class MarkowitzOptimizer:
         Returns:
             Optimal portfolio allocation
         """
-        if not SCIPY_AVAILABLE:
-            return self._mock_allocation(returns.shape[1])
-
         n_assets = returns.shape[1]
 
         # Calculate expected returns and covariance
@@ -118,57 +125,24 @@ class MarkowitzOptimizer:
         cov_matrix: np.ndarray,
         risk_free_rate: float
     ) -> np.ndarray:
-        """Optimize for maximum Sharpe ratio"""
-        n_assets = len(mean_returns)
-
-        def neg_sharpe(weights):
-            port_return = np.dot(weights, mean_returns) * 252
-            port_risk = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights))) * np.sqrt(252)
-            return -(port_return - risk_free_rate) / port_risk
-
-        constraints = ({'type': 'eq', 'fun': lambda x: np.sum(x) - 1})
-        bounds = tuple((0, 1) for _ in range(n_assets))
-        initial_guess = np.array([1/n_assets] * n_assets)
-
-        result = minimize(
-            neg_sharpe,
-            initial_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
+        """Optimize for maximum Sharpe ratio (long-only)"""
+        lower, upper = weight_bounds(len(mean_returns))
+        return max_sharpe_weights(
+            mean_returns * 252, cov_matrix * 252, risk_free_rate, lower, upper
         )
 
-        return result.x
-
     def _target_return_min_risk(
         self,
         mean_returns: np.ndarray,
         cov_matrix: np.ndarray,
         target_return: float
     ) -> np.ndarray:
-        """Minimize risk for target return"""
-        n_assets = len(mean_returns)
-
-        def portfolio_risk(weights):
-            return np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights))) * np.sqrt(252)
-
-        constraints = (
-            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1},
-            {'type': 'eq', 'fun': lambda x: np.dot(x, mean_returns) * 252 - target_return}
-        )
-        bounds = tuple((0, 1) for _ in range(n_assets))
-        initial_guess = np.array([1/n_assets] * n_assets)
-
-        result = minimize(
-            portfolio_risk,
-            initial_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
+        """Minimize risk for target return (annualized, long-only)"""
+        lower, upper = weight_bounds(len(mean_returns))
+        return target_return_weights(
+            mean_returns * 252, cov_matrix * 252, target_return, lower, upper
         )
 
-        return result.x
-
     def efficient_frontier(
         self,
         returns: np.ndarray,
@@ -180,23 +154,23 @@ class MarkowitzOptimizer:
         Returns:
             risks, returns along efficient frontier
         """
-        mean_returns = np.mean(returns, axis=0)
-        min_return = np.min(mean_returns) * 252
-        max_return = np.max(mean_returns) * 252
+        mean_returns = np.mean(returns, axis=0) * 252
+        cov_matrix = np.cov(returns.T) * 252
+        min_return = np.min(mean_returns)
+        max_return = np.max(mean_returns)
 
         target_returns = np.linspace(min_return, max_return, n_points)
-        frontier_risks = []
-        frontier_returns = []
 
-        for target in target_returns:
-            try:
-                allocation = self.optimize(returns, target_return=target)
-                frontier_risks.append(allocation.expected_risk)
-                frontier_returns.append(allocation.expected_return)
-            except:
-                continue
+        # Single warm-started sweep instead of one optimization per target
+        lower, upper = weight_bounds(len(mean_returns))
+        frontier_weights = np.array(efficient_frontier_weights(
+            mean_returns, cov_matrix, target_returns, lower, upper
+        ))
+
+        frontier_returns = frontier_weights @ mean_returns
+        frontier_risks = np.sqrt(np.einsum('ij,jk,ik->i', frontier_weights, cov_matrix, frontier_weights))
 
-        return np.array(frontier_risks), np.array(frontier_returns)
+        return frontier_risks, frontier_returns
 
     def _mock_allocation(self, n_assets: int) -> PortfolioAllocation:
         """Mock allocation for testing"""
@@ -334,48 +308,11 @@ class RiskParityOptimizer:
         Returns:
             Risk parity allocation
         """
-        if not SCIPY_AVAILABLE:
-            n_assets = returns.shape[1]
-            weights = np.ones(n_assets) / n_assets
-            return PortfolioAllocation(
-                assets=[f"Asset_{i}" for i in range(n_assets)],
-                weights=weights,
-                expected_return=0.11,
-                expected_risk=0.13,
-                sharpe_ratio=0.69,
-                method='risk_parity',
-                timestamp=datetime.now().isoformat()
-            )
-
         n_assets = returns.shape[1]
-        cov_matrix = np.cov(returns.T)
-
-        def risk_contribution(weights):
-            """Calculate risk contribution of each asset"""
-            portfolio_risk = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-            marginal_contrib = np.dot(cov_matrix, weights) / portfolio_risk
-            risk_contrib = weights * marginal_contrib
-            return risk_contrib
-
-        def objective(weights):
-            """Minimize variance of risk contributions"""
-            rc = risk_contribution(weights)
-            target_rc = np.ones(n_assets) / n_assets
-            return np.sum((rc - target_rc) ** 2)
-
-        constraints = ({'type': 'eq', 'fun': lambda x: np.sum(x) - 1})
-        bounds = tuple((0, 1) for _ in range(n_assets))
-        initial_guess = np.array([1/n_assets] * n_assets)
-
-        result = minimize(
-            objective,
-            initial_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
-        )
+        cov_matrix = np.atleast_2d(np.cov(returns.T))
 
-        weights = result.x
+        # Equal risk contribution via Newton iterations (utils.portfolio_math)
+        weights = risk_parity_weights(cov_matrix)
 
         # Calculate metrics
         mean_returns = np.mean(returns, axis=0)
@@ -0,0 +1,300 @@
+"""
+Replay Buffer
+Preallocated NumPy ring buffer shared by the DQN and advanced RL agents
+
+Features:
+- Fixed-size column arrays (no per-transition Python objects)
+- O(1) insertion, vectorized single and batch adds
+- Vectorized minibatch sampling (uniform or prioritized)
+- Sum-tree prioritized replay with importance-sampling weights
+- Chronological rollout view for on-policy agents (A3C/PPO)
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class ReplayBatch:
+    """Minibatch of transitions (column arrays)"""
+    states: np.ndarray
+    actions: np.ndarray
+    rewards: np.ndarray
+    next_states: Optional[np.ndarray]
+    dones: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    extras: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+
+class SumTree:
+    """
+    Array-backed binary sum tree over buffer slots
+
+    Node 1 is the root, leaves start at ``leaf_count`` (a power of two).
+    Updates and prefix-sum lookups are vectorized across a whole batch,
+    walking the tree one level at a time.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize sum tree
+
+        Args:
+            capacity: Number of leaves (buffer slots)
+        """
+        self.capacity = capacity
+        self.leaf_count = 1 << max(0, (capacity - 1).bit_length())
+        self.depth = self.leaf_count.bit_length() - 1
+        self.tree = np.zeros(2 * self.leaf_count)
+
+    @property
+    def total(self) -> float:
+        """Sum of all priorities"""
+        return float(self.tree[1])
+
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        """Priorities at slot indices"""
+        return self.tree[np.asarray(indices) + self.leaf_count]
+
+    def update(self, indices: np.ndarray, priorities: np.ndarray):
+        """Set priorities at slot indices and refresh their ancestors"""
+        nodes = np.asarray(indices, dtype=np.int64) + self.leaf_count
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes >> 1)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """Slot index whose prefix-sum interval contains each value"""
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = values >= left_sum
+            values = np.where(go_right, values - left_sum, values)
+            nodes = np.where(go_right, left + 1, left)
+        return nodes - self.leaf_count
+
+
+class ReplayBuffer:
+    """
+    Preallocated ring buffer of transitions
+
+    Transitions are stored column-wise in fixed arrays (states, actions,
+    rewards, next_states, dones plus optional extra scalar fields), so
+    sampling a minibatch is a single fancy-index per column. When full,
+    the oldest transitions are overwritten.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        state_dim: int = 11,
+        action_shape: Tuple[int, ...] = (),
+        action_dtype=np.int64,
+        state_dtype=np.float32,
+        store_next_state: bool = True,
+        extra_fields: Optional[Mapping[str, type]] = None,
+        prioritized: bool = False,
+        alpha: float = 0.6,
+        beta: float = 0.4,
+        epsilon: float = 1e-6,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize replay buffer
+
+        Args:
+            capacity: Maximum number of transitions to store
+            state_dim: Size of state vector
+            action_shape: Shape of one action (() for discrete actions)
+            action_dtype: Action dtype (int for discrete, float for continuous)
+            state_dtype: State dtype
+            store_next_state: Keep a next_state column (off-policy agents)
+            extra_fields: Additional scalar columns, name -> dtype (e.g. PPO values/log_probs)
+            prioritized: Use proportional prioritized sampling
+            alpha: Priority exponent (0 = uniform)
+            beta: Importance-sampling exponent
+            epsilon: Added to |TD error| so no transition has zero priority
+            seed: Random seed for sampling
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.state_dim = state_dim
+        self.prioritized = prioritized
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+        self.rng = np.random.default_rng(seed)
+
+        self.states = np.zeros((capacity, state_dim), dtype=state_dtype)
+        self.actions = np.zeros((capacity,) + tuple(action_shape), dtype=action_dtype)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_dim), dtype=state_dtype) if store_next_state else None
+        self.dones = np.zeros(capacity, dtype=bool)
+        self.extras = {name: np.zeros(capacity, dtype=dtype) for name, dtype in (extra_fields or {}).items()}
+
+        self.tree = SumTree(capacity) if prioritized else None
+        self.max_priority = 1.0
+
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def size(self) -> int:
+        """Get buffer size"""
+        return self._size
+
+    def is_full(self) -> bool:
+        """True once the next add would overwrite the oldest transition"""
+        return self._size == self.capacity
+
+    def add(
+        self,
+        state,
+        action,
+        reward: float,
+        next_state=None,
+        done: bool = False,
+        **extras
+    ) -> int:
+        """
+        Add one transition
+
+        Returns:
+            Slot index the transition was written to
+        """
+        slot = self._next
+        self.states[slot] = state
+        self.actions[slot] = action
+        self.rewards[slot] = reward
+        if self.next_states is not None:
+            self.next_states[slot] = state if next_state is None else next_state
+        self.dones[slot] = done
+        for name, value in extras.items():
+            self.extras[name][slot] = value
+
+        if self.tree is not None:
+            self.tree.update(np.array([slot]), np.array([self.max_priority]))
+
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return slot
+
+    def add_batch(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: Optional[np.ndarray] = None,
+        dones: Optional[np.ndarray] = None,
+        **extras
+    ) -> np.ndarray:
+        """
+        Add many transitions at once (oldest first)
+
+        Returns:
+            Slot indices the transitions were written to
+        """
+        rewards = np.asarray(rewards)
+        n = len(rewards)
+        keep = slice(max(0, n - self.capacity), n)
+        n_kept = min(n, self.capacity)
+
+        slots = (self._next + np.arange(n_kept)) % self.capacity
+        self.states[slots] = np.asarray(states)[keep]
+        self.actions[slots] = np.asarray(actions)[keep]
+        self.rewards[slots] = rewards[keep]
+        if self.next_states is not None:
+            source = states if next_states is None else next_states
+            self.next_states[slots] = np.asarray(source)[keep]
+        self.dones[slots] = False if dones is None else np.asarray(dones)[keep]
+        for name, values in extras.items():
+            self.extras[name][slots] = np.asarray(values)[keep]
+
+        if self.tree is not None:
+            self.tree.update(slots, np.full(n_kept, self.max_priority))
+
+        self._next = int((self._next + n_kept) % self.capacity)
+        self._size = min(self._size + n_kept, self.capacity)
+        return slots
+
+    def sample(self, batch_size: int, beta: Optional[float] = None) -> ReplayBatch:
+        """
+        Sample a minibatch
+
+        Uniform buffers sample without replacement; prioritized buffers use
+        stratified proportional sampling over the sum tree and return
+        normalized importance-sampling weights.
+
+        Args:
+            batch_size: Number of transitions (capped at buffer size)
+            beta: Override importance-sampling exponent
+
+        Returns:
+            ReplayBatch
+        """
+        if self._size == 0:
+            raise ValueError("cannot sample from an empty replay buffer")
+        batch_size = min(batch_size, self._size)
+
+        if self.tree is None:
+            indices = self.rng.choice(self._size, batch_size, replace=False)
+            weights = np.ones(batch_size, dtype=np.float32)
+        else:
+            total = self.tree.total
+            segment = total / batch_size
+            values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+            indices = np.minimum(self.tree.find(np.minimum(values, total * (1 - 1e-12))), self._size - 1)
+
+            probs = self.tree.get(indices) / total
+            weights = (self._size * probs) ** -(self.beta if beta is None else beta)
+            weights = (weights / weights.max()).astype(np.float32)
+
+        return self._gather(indices, weights)
+
+    def update_priorities(self, indices: np.ndarray, td_errors: np.ndarray):
+        """Update priorities from TD errors of a sampled batch"""
+        if self.tree is None:
+            return
+        priorities = (np.abs(np.asarray(td_errors, dtype=np.float64)) + self.epsilon) ** self.alpha
+        self.tree.update(indices, priorities)
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+
+    def rollout(self) -> ReplayBatch:
+        """All stored transitions in insertion order (oldest first)"""
+        if self._size < self.capacity:
+            indices = np.arange(self._size)
+        else:
+            indices = (self._next + np.arange(self.capacity)) % self.capacity
+        return self._gather(indices, np.ones(len(indices), dtype=np.float32))
+
+    def clear(self):
+        """Drop all transitions (arrays stay allocated)"""
+        self._next = 0
+        self._size = 0
+        self.max_priority = 1.0
+        if self.tree is not None:
+            self.tree.tree[:] = 0.0
+
+    def _gather(self, indices: np.ndarray, weights: np.ndarray) -> ReplayBatch:
+        return ReplayBatch(
+            states=self.states[indices],
+            actions=self.actions[indices],
+            rewards=self.rewards[indices],
+            next_states=self.next_states[indices] if self.next_states is not None else None,
+            dones=self.dones[indices],
+            indices=indices,
+            weights=weights,
+            extras={name: values[indices] for name, values in self.extras.items()}
+        )
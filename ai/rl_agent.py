@@ -13,13 +13,14 @@ Features:
 import json
 import numpy as np
 import random
-from collections import deque
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 import logging
 
+from .replay_buffer import ReplayBuffer, ReplayBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,31 +58,6 @@ class RLExperience:
     done: bool
 
 
-class ReplayBuffer:
-    """Experience replay buffer"""
-
-    def __init__(self, capacity: int = 10000):
-        """
-        Initialize replay buffer
-
-        Args:
-            capacity: Maximum number of experiences to store
-        """
-        self.buffer = deque(maxlen=capacity)
-
-    def add(self, experience: RLExperience):
-        """Add experience to buffer"""
-        self.buffer.append(experience)
-
-    def sample(self, batch_size: int) -> List[RLExperience]:
-        """Sample random batch from buffer"""
-        return random.sample(self.buffer, min(batch_size, len(self.buffer)))
-
-    def size(self) -> int:
-        """Get buffer size"""
-        return len(self.buffer)
-
-
 class DQNAgent:
     """
     Deep Q-Network Agent for trading
@@ -104,7 +80,9 @@ class DQNAgent:
         gamma: float = 0.95,
         epsilon: float = 1.0,
         epsilon_decay: float = 0.995,
-        epsilon_min: float = 0.01
+        epsilon_min: float = 0.01,
+        memory_capacity: int = 10000,
+        prioritized_replay: bool = False
     ):
         """
         Initialize DQN agent
@@ -117,6 +95,8 @@ class DQNAgent:
             epsilon: Initial exploration rate
             epsilon_decay: Exploration decay rate
             epsilon_min: Minimum exploration rate
+            memory_capacity: Replay buffer capacity (transitions)
+            prioritized_replay: Sample transitions by TD error (sum-tree)
         """
         self.state_size = state_size
         self.action_size = action_size
@@ -126,8 +106,13 @@ class DQNAgent:
         self.epsilon_decay = epsilon_decay
         self.epsilon_min = epsilon_min
 
-        # Experience replay
-        self.memory = ReplayBuffer(capacity=10000)
+        # Experience replay (float64 states so replayed states discretize exactly like act())
+        self.memory = ReplayBuffer(
+            capacity=memory_capacity,
+            state_dim=state_size,
+            state_dtype=np.float64,
+            prioritized=prioritized_replay
+        )
         self.batch_size = 32
 
         # Q-network (simplified - would use neural network in production)
@@ -144,29 +129,40 @@ class DQNAgent:
 
         self._load_model()
 
+    # Bin edges for state discretization: (-inf,-1), [-1,-0.5), [-0.5,0), [0,0.5), [0.5,1), [1,inf)
+    STATE_BINS = np.array([-1.0, -0.5, 0.0, 0.5, 1.0])
+
     def _discretize_state(self, state: List[float]) -> Tuple:
         """Discretize continuous state for Q-table"""
-        # Discretize each dimension into bins
-        discretized = []
-        for value in state:
-            if value < -1:
-                bin_val = 0
-            elif value < -0.5:
-                bin_val = 1
-            elif value < 0:
-                bin_val = 2
-            elif value < 0.5:
-                bin_val = 3
-            elif value < 1:
-                bin_val = 4
-            else:
-                bin_val = 5
-            discretized.append(bin_val)
-        return tuple(discretized)
+        return tuple(np.digitize(state, self.STATE_BINS).tolist())
+
+    def _batch_q_values(self, states: np.ndarray) -> Tuple[List[Tuple], np.ndarray, np.ndarray]:
+        """
+        Q-values for a batch of states
+
+        Returns:
+            keys: Unique discretized state keys
+            q: Q-value rows for each key (copy, shape [len(keys), action_size])
+            inverse: Row in ``q`` for each input state
+        """
+        bins = np.digitize(states, self.STATE_BINS)
+        unique_bins, inverse = np.unique(bins, axis=0, return_inverse=True)
+        keys = [tuple(row) for row in unique_bins.tolist()]
+
+        # Unseen states: one draw for all (same stream as per-key get_q_values)
+        missing = [key for key in keys if key not in self.q_table]
+        if missing:
+            self.q_table.update(zip(missing, np.random.randn(len(missing), self.action_size) * 0.01))
+
+        q = np.array([self.q_table[key] for key in keys])
+        return keys, q, inverse.reshape(-1)
 
     def get_q_values(self, state: List[float]) -> np.ndarray:
         """Get Q-values for state"""
-        state_key = self._discretize_state(state)
+        return self.get_q_values_by_key(self._discretize_state(state))
+
+    def get_q_values_by_key(self, state_key: Tuple) -> np.ndarray:
+        """Get Q-values for a discretized state key"""
         if state_key not in self.q_table:
             # Initialize Q-values
             self.q_table[state_key] = np.random.randn(self.action_size) * 0.01
@@ -201,45 +197,39 @@ class DQNAgent:
         done: bool
     ):
         """Store experience in replay buffer"""
-        experience = RLExperience(
-            state=state,
-            action=action,
-            reward=reward,
-            next_state=next_state,
-            done=done
-        )
-        self.memory.add(experience)
+        self.memory.add(state, action, reward, next_state, done)
+
+    def compute_targets(self, batch: ReplayBatch) -> np.ndarray:
+        """Q-learning targets r + γ·max Q(s', ·) for a batch (r on terminal transitions)"""
+        _, next_q, inverse = self._batch_q_values(batch.next_states)
+        next_max = next_q.max(axis=1)[inverse]
+        return batch.rewards + self.gamma * next_max * ~batch.dones
 
     def replay(self):
-        """Train on batch of experiences"""
+        """
+        Train on batch of experiences
+
+        Targets for the whole minibatch are computed from the Q-table as it
+        was before the update (as in a minibatch gradient step); repeated
+        (state, action) pairs in one batch accumulate their updates.
+        """
         if self.memory.size() < self.batch_size:
             return
 
         # Sample batch
         batch = self.memory.sample(self.batch_size)
+        targets = self.compute_targets(batch)
 
-        for experience in batch:
-            state = experience.state
-            action = experience.action
-            reward = experience.reward
-            next_state = experience.next_state
-            done = experience.done
-
-            # Q-learning update
-            q_values = self.get_q_values(state)
-            next_q_values = self.get_q_values(next_state)
-
-            if done:
-                target = reward
-            else:
-                target = reward + self.gamma * np.max(next_q_values)
+        # Q-learning update
+        keys, q, rows = self._batch_q_values(batch.states)
+        td_errors = targets - q[rows, batch.actions]
+        np.add.at(q, (rows, batch.actions), self.learning_rate * batch.weights * td_errors)
 
-            # Update Q-value
-            q_values[action] = q_values[action] + self.learning_rate * (target - q_values[action])
+        # Update Q-table
+        for key, q_values in zip(keys, q):
+            self.q_table[key] = q_values
 
-            # Update Q-table
-            state_key = self._discretize_state(state)
-            self.q_table[state_key] = q_values
+        self.memory.update_priorities(batch.indices, td_errors)
 
         # Decay epsilon
         if self.epsilon > self.epsilon_min:
@@ -4,7 +4,8 @@ Grid Search, Random Search, Bayesian Optimization 지원
 
 주요 기능:
 - 다양한 최적화 방법 지원
-- 병렬 처리로 빠른 최적화
+- 병렬 처리로 빠른 최적화 (프로세스 풀, 데이터셋 공유 메모리 전달)
+- 조기 종료 / 나쁜 파라미터 영역 가지치기
 - Optuna 기반 Bayesian Optimization
 - 최적화 결과 시각화
 """
@@ -16,7 +17,8 @@ from pathlib import Path
 from dataclasses import dataclass
 
 import numpy as np
-from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .trial_runner import ParallelTrialRunner, RegionPruner, make_region_fn
 
 try:
     import optuna
@@ -37,6 +39,15 @@ class OptimizationResult:
     method: str
     duration_seconds: float
     all_trials: List[Dict[str, Any]]
+    n_pruned: int = 0
+    stopped_early: bool = False
+
+
+def _to_builtin(value):
+    """numpy 스칼라 → JSON 직렬화 가능한 파이썬 값"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 class StrategyOptimizer:
@@ -48,7 +59,11 @@ class StrategyOptimizer:
         param_ranges: Dict[str, List],
         method: str = "bayesian",
         n_trials: int = 50,
-        n_jobs: int = -1
+        n_jobs: int = -1,
+        seed: Optional[int] = None,
+        dataset: Optional[Dict[str, np.ndarray]] = None,
+        patience: Optional[int] = None,
+        prune: bool = False
     ):
         """
         최적화 엔진 초기화
@@ -62,13 +77,22 @@ class StrategyOptimizer:
                 }
             method: 최적화 방법 ('grid', 'random', 'bayesian')
             n_trials: 시도 횟수
-            n_jobs: 병렬 작업 수 (-1 = 모든 CPU)
+            n_jobs: 병렬 작업 수 (-1 = 모든 CPU, 1 = 순차 실행)
+            seed: 난수 시드 (Random Search 후보 생성, 같은 시드면 같은 결과)
+            dataset: 히스토리 데이터 {이름: numpy 배열} - 워커에 공유 메모리로 한 번만
+                전달되며, 지정하면 목적 함수는 (params, dataset) -> score 로 호출됨
+            patience: 최고 점수가 이 횟수만큼 개선되지 않으면 조기 종료 (grid/random)
+            prune: 나쁜 파라미터 영역 가지치기 여부 (grid/random)
         """
         self.objective_function = objective_function
         self.param_ranges = param_ranges
         self.method = method
         self.n_trials = n_trials
         self.n_jobs = n_jobs if n_jobs > 0 else None
+        self.seed = seed
+        self.dataset = dataset
+        self.patience = patience
+        self.prune = prune
 
         logger.info(f"전략 최적화 엔진 초기화: method={method}, n_trials={n_trials}")
 
@@ -109,61 +133,58 @@ class StrategyOptimizer:
         logger.info(f"총 {len(all_combinations)}개 조합 테스트")
 
         # 병렬 평가
-        results = []
-        for values in all_combinations:
-            params = dict(zip(param_names, values))
-            score = self.objective_function(params)
-            results.append({
-                'params': params,
-                'score': score
-            })
-
-        # 최고 점수 찾기
-        best_trial = max(results, key=lambda x: x['score'])
-
-        return OptimizationResult(
-            best_params=best_trial['params'],
-            best_score=best_trial['score'],
-            n_trials=len(results),
-            method='grid',
-            duration_seconds=0,  # 나중에 채워짐
-            all_trials=results
-        )
+        param_sets = [dict(zip(param_names, values)) for values in all_combinations]
+        return self._run_trials(param_sets, 'grid')
 
     def _random_search(self) -> OptimizationResult:
         """Random Search (무작위 탐색)"""
         logger.info(f"Random Search 시작... (n_trials={self.n_trials})")
 
-        results = []
-        for i in range(self.n_trials):
+        # 후보는 부모 프로세스에서 시드로 미리 생성 (평가 순서·워커 수와 무관하게 동일)
+        rng = np.random.default_rng(self.seed)
+        param_sets = []
+        for _ in range(self.n_trials):
             # 무작위 파라미터 선택
             params = {}
             for name, values in self.param_ranges.items():
                 if isinstance(values, list):
-                    params[name] = np.random.choice(values)
+                    params[name] = values[rng.integers(len(values))]
                 elif isinstance(values, tuple) and len(values) == 2:
                     # 연속 범위인 경우
-                    params[name] = np.random.uniform(values[0], values[1])
-
-            score = self.objective_function(params)
-            results.append({
-                'params': params,
-                'score': score
-            })
+                    params[name] = float(rng.uniform(values[0], values[1]))
+            param_sets.append(params)
+
+        return self._run_trials(param_sets, 'random')
+
+    def _run_trials(self, param_sets: List[Dict[str, Any]], method: str) -> OptimizationResult:
+        """병렬 트라이얼 실행 (완료되는 대로 진행 상황 로깅)"""
+        runner = ParallelTrialRunner(
+            self.objective_function,
+            n_jobs=self.n_jobs or -1,
+            dataset=self.dataset,
+            patience=self.patience,
+            pruner=RegionPruner(region_fn=make_region_fn(self.param_ranges)) if self.prune else None,
+        )
 
-            if (i + 1) % 10 == 0:
-                logger.info(f"Progress: {i+1}/{self.n_trials} trials completed")
+        for completed, trial in enumerate(runner.run(param_sets), 1):
+            if trial.state == 'failed':
+                logger.warning(f"트라이얼 {trial.index} 실패: {trial.error}")
+            if completed % 10 == 0:
+                logger.info(f"Progress: {completed}/{len(param_sets)} trials completed")
 
-        # 최고 점수 찾기
-        best_trial = max(results, key=lambda x: x['score'])
+        best_trial = runner.best_trial
+        if best_trial is None:
+            raise RuntimeError(f"{method} search: 성공한 트라이얼이 없습니다")
 
         return OptimizationResult(
-            best_params=best_trial['params'],
-            best_score=best_trial['score'],
-            n_trials=len(results),
-            method='random',
-            duration_seconds=0,
-            all_trials=results
+            best_params=best_trial.params,
+            best_score=best_trial.score,
+            n_trials=len(runner.completed_trials),
+            method=method,
+            duration_seconds=0,  # 나중에 채워짐
+            all_trials=[{'params': t.params, 'score': t.score} for t in runner.completed_trials],
+            n_pruned=runner.n_pruned,
+            stopped_early=runner.stopped_early
         )
 
     def _bayesian_optimization(self) -> OptimizationResult:
@@ -184,6 +205,8 @@ class StrategyOptimizer:
                     else:
                         params[name] = trial.suggest_float(name, values[0], values[1])
 
+            if self.dataset is not None:
+                return self.objective_function(params, self.dataset)
             return self.objective_function(params)
 
         # Optuna study 생성
@@ -221,11 +244,13 @@ class StrategyOptimizer:
             'method': result.method,
             'duration_seconds': result.duration_seconds,
             'all_trials': result.all_trials,
+            'n_pruned': result.n_pruned,
+            'stopped_early': result.stopped_early,
             'timestamp': datetime.now().isoformat()
         }
 
         with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(result_dict, f, indent=2, ensure_ascii=False)
+            json.dump(result_dict, f, indent=2, ensure_ascii=False, default=_to_builtin)
 
         logger.info(f"최적화 결과 저장: {save_path}")
 
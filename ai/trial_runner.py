@@ -0,0 +1,410 @@
+"""
+AutoTrade Pro - 병렬 트라이얼 실행기
+StrategyOptimizer / HyperparameterOptimizer 의 Grid·Random Search 공용 엔진
+
+주요 기능:
+- 프로세스 풀 병렬 평가 (목적 함수는 워커당 한 번만 전달)
+- 히스토리 데이터셋 공유 메모리 전달 (트라이얼마다 pickle 복사 없음)
+- 완료된 트라이얼을 끝나는 대로 스트리밍
+- 조기 종료(patience) 및 나쁜 파라미터 영역 가지치기(prune)
+- 결정적 결과: 가지치기/조기 종료 판단은 완료 순서가 아닌 트라이얼 순서 기준이라
+  같은 시드·같은 후보 목록이면 워커 수, 완료 순서와 무관하게 결과가 같음
+"""
+import logging
+import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Callable, Optional, Iterator, Mapping, Sequence, Tuple, Hashable, Deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Trial:
+    """트라이얼 결과"""
+    index: int
+    params: Dict[str, Any]
+    score: Optional[float] = None
+    state: str = 'complete'  # 'complete', 'failed', 'pruned'
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+# ============================================================================
+# 공유 메모리 데이터셋
+# ============================================================================
+
+class SharedDataset:
+    """
+    numpy 배열 묶음을 공유 메모리에 올리고 워커에는 이름/shape/dtype 만 전달
+
+    Usage:
+        with SharedDataset({'close': closes, 'volume': volumes}) as shared:
+            arrays, blocks = attach_dataset(shared.spec)   # 워커 쪽
+    """
+
+    def __init__(self, arrays: Mapping[str, np.ndarray]):
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.spec: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+
+        try:
+            for key, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self._blocks.append(block)
+                self.spec[key] = (block.name, array.shape, array.dtype.str)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """공유 메모리 해제"""
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+
+    def __enter__(self) -> 'SharedDataset':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_dataset(spec: Mapping[str, Tuple[str, Tuple[int, ...], str]]
+                   ) -> Tuple[Dict[str, np.ndarray], List[shared_memory.SharedMemory]]:
+    """
+    공유 메모리 데이터셋을 읽기 전용 배열로 연결
+
+    Returns:
+        (배열 dict, 공유 메모리 블록 목록 - 배열을 쓰는 동안 참조 유지)
+    """
+    arrays, blocks = {}, []
+    for key, (name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=name)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        blocks.append(block)
+        arrays[key] = array
+    return arrays, blocks
+
+
+# ============================================================================
+# 워커
+# ============================================================================
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(objective: Callable, spec: Optional[Mapping]):
+    """워커 초기화 - 목적 함수와 데이터셋을 한 번만 받음"""
+    _worker_state['objective'] = objective
+    if spec is None:
+        _worker_state['data'] = None
+    else:
+        _worker_state['data'], _worker_state['blocks'] = attach_dataset(spec)
+
+
+def _run_trial(index: int, params: Dict[str, Any]) -> Trial:
+    """워커에서 트라이얼 하나 평가"""
+    return evaluate_trial(_worker_state['objective'], _worker_state['data'], index, params)
+
+
+def evaluate_trial(objective: Callable, data: Optional[Mapping[str, np.ndarray]],
+                   index: int, params: Dict[str, Any]) -> Trial:
+    """목적 함수 호출 (데이터셋이 있으면 objective(params, data))"""
+    start = time.perf_counter()
+    try:
+        score = objective(params) if data is None else objective(params, data)
+        return Trial(index, params, float(score), duration_seconds=time.perf_counter() - start)
+    except Exception as e:
+        return Trial(index, params, state='failed', error=f"{type(e).__name__}: {e}",
+                     duration_seconds=time.perf_counter() - start)
+
+
+# ============================================================================
+# 가지치기
+# ============================================================================
+
+def value_regions(params: Dict[str, Any]) -> List[Hashable]:
+    """기본 영역: (파라미터 이름, 값) - 해시 가능한 값만"""
+    regions = []
+    for name, value in params.items():
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        regions.append((name, value))
+    return regions
+
+
+def make_region_fn(param_ranges: Mapping[str, Any], bins: int = 5) -> Callable[[Dict[str, Any]], List[Hashable]]:
+    """
+    param_ranges 기반 영역 함수 - 목록은 값 그대로, (low, high) 연속 범위는 bins 개 구간
+
+    Args:
+        param_ranges: {'ma_period': [5, 10, 20], 'threshold': (0.1, 0.9)}
+        bins: 연속 범위 구간 수
+    """
+    continuous = {
+        name: values for name, values in param_ranges.items()
+        if isinstance(values, tuple) and len(values) == 2
+    }
+
+    def regions(params: Dict[str, Any]) -> List[Hashable]:
+        keys = []
+        for name, value in params.items():
+            if name in continuous:
+                low, high = continuous[name]
+                position = (value - low) / (high - low) if high != low else 0.0
+                keys.append((name, min(max(int(position * bins), 0), bins - 1)))
+            else:
+                keys.extend(value_regions({name: value}))
+        return keys
+
+    return regions
+
+
+class RegionPruner:
+    """
+    나쁜 파라미터 영역 가지치기
+
+    영역 = (파라미터 이름, 값 또는 구간). 어떤 영역에서 min_trials 개 이상 평가했는데
+    그 영역의 최고 점수조차 전체 완료 트라이얼의 quantile 분위수보다 낮으면,
+    그 영역을 포함하는 이후 트라이얼은 평가하지 않는다 (maximize 기준).
+    """
+
+    def __init__(self, quantile: float = 0.25, min_trials: int = 3, warmup: int = 10,
+                 region_fn: Optional[Callable[[Dict[str, Any]], List[Hashable]]] = None):
+        """
+        Args:
+            quantile: 기준 분위수 (0~1)
+            min_trials: 영역 판단에 필요한 최소 트라이얼 수
+            warmup: 가지치기 시작 전 최소 완료 트라이얼 수
+            region_fn: params -> 영역 키 목록 (기본: 이름/값 쌍)
+        """
+        self.quantile = quantile
+        self.min_trials = min_trials
+        self.warmup = warmup
+        self.region_fn = region_fn or value_regions
+
+        self._scores: List[float] = []
+        self._region_best: Dict[Hashable, float] = {}
+        self._region_count: Dict[Hashable, int] = {}
+        self._threshold = -np.inf
+
+    def observe(self, trial: Trial):
+        """완료 트라이얼 반영 (트라이얼 순서대로 호출)"""
+        self._scores.append(trial.score)
+        for region in self.region_fn(trial.params):
+            self._region_count[region] = self._region_count.get(region, 0) + 1
+            self._region_best[region] = max(self._region_best.get(region, -np.inf), trial.score)
+
+        if len(self._scores) >= self.warmup:
+            self._threshold = float(np.quantile(self._scores, self.quantile))
+
+    def should_prune(self, params: Dict[str, Any]) -> bool:
+        """params 가 나쁜 영역에 속하는지"""
+        if len(self._scores) < self.warmup:
+            return False
+        return any(
+            self._region_count.get(region, 0) >= self.min_trials
+            and self._region_best[region] < self._threshold
+            for region in self.region_fn(params)
+        )
+
+
+# ============================================================================
+# 실행기
+# ============================================================================
+
+class ParallelTrialRunner:
+    """
+    병렬 트라이얼 실행기
+
+    트라이얼 i 의 가지치기 판단은 트라이얼 0 … i-lookahead 의 결과만 보고,
+    조기 종료는 트라이얼 순서대로 본 결과로 판단한다. 따라서 완료 순서가 바뀌어도
+    (워커 수가 달라도) 평가 대상과 최종 결과가 같다. 동시에 진행되는 트라이얼은
+    완료된 순서 구간보다 최대 lookahead 개 앞까지만 제출한다.
+
+    Usage:
+        runner = ParallelTrialRunner(backtest, n_jobs=8, dataset={'close': closes}, patience=50)
+        for trial in runner.run(param_sets):      # 완료되는 대로 스트리밍
+            print(trial.index, trial.score)
+        best = runner.best_trial
+    """
+
+    def __init__(
+        self,
+        objective: Callable,
+        n_jobs: int = -1,
+        dataset: Optional[Mapping[str, np.ndarray]] = None,
+        patience: Optional[int] = None,
+        min_delta: float = 0.0,
+        pruner: Optional[RegionPruner] = None,
+        lookahead: int = 64
+    ):
+        """
+        Args:
+            objective: 목적 함수 (params -> score, dataset 이 있으면 (params, data) -> score).
+                       병렬 실행하려면 pickle 가능해야 함 (모듈 수준 함수)
+            n_jobs: 워커 수 (-1 = 모든 CPU, 1 = 현재 프로세스에서 순차 실행)
+            dataset: 워커에 공유할 numpy 배열 dict
+            patience: 최고 점수가 이 횟수만큼 개선되지 않으면 조기 종료 (None = 사용 안 함)
+            min_delta: 개선으로 인정할 최소 점수 차이
+            pruner: 영역 가지치기 (None = 사용 안 함)
+            lookahead: 완료 순서 구간보다 앞서 제출할 수 있는 트라이얼 수
+        """
+        self.objective = objective
+        self.n_jobs = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+        self.dataset = dataset
+        self.patience = patience
+        self.min_delta = min_delta
+        self.pruner = pruner
+        self.lookahead = max(1, lookahead)
+
+        self.trials: List[Trial] = []
+        self.stopped_early = False
+
+    @property
+    def completed_trials(self) -> List[Trial]:
+        """평가 완료된 트라이얼 (트라이얼 순서)"""
+        return [t for t in self.trials if t.state == 'complete']
+
+    @property
+    def n_pruned(self) -> int:
+        """가지치기로 건너뛴 트라이얼 수"""
+        return sum(1 for t in self.trials if t.state == 'pruned')
+
+    @property
+    def best_trial(self) -> Optional[Trial]:
+        """최고 점수 트라이얼 (동점이면 먼저 나온 것)"""
+        completed = self.completed_trials
+        return max(completed, key=lambda t: t.score) if completed else None
+
+    def run(self, param_sets: Sequence[Dict[str, Any]]) -> Iterator[Trial]:
+        """
+        트라이얼 실행 - 평가가 끝난 트라이얼을 끝나는 대로 yield
+
+        스트림은 진행 상황용이고, 최종 결과는 run 이 끝난 뒤 self.trials
+        (트라이얼 순서, 조기 종료 지점 이후 제외)를 사용한다.
+        """
+        self.trials = []
+        self.stopped_early = False
+        self._param_sets = list(param_sets)
+        self._finished: Dict[int, Trial] = {}
+        self._ready: Deque[int] = deque()
+        self._decided = 0
+        self._best = -np.inf
+        self._since_best = 0
+        self._stop_at: Optional[int] = None
+        self._decide()
+        self._advance()
+
+        if self.n_jobs == 1 or len(self._param_sets) <= 1 or not self._picklable():
+            yield from self._run_serial()
+        else:
+            yield from self._run_parallel()
+
+        del self._param_sets, self._finished, self._ready
+
+    def _picklable(self) -> bool:
+        """목적 함수를 워커로 보낼 수 있는지 (람다/클로저는 순차 실행으로 대체)"""
+        try:
+            pickle.dumps(self.objective)
+            return True
+        except Exception as e:
+            logger.warning(f"목적 함수를 워커로 보낼 수 없어 순차 실행합니다: {e}")
+            return False
+
+    def _run_serial(self) -> Iterator[Trial]:
+        data = dict(self.dataset) if self.dataset is not None else None
+        while self._ready:
+            index = self._ready.popleft()
+            trial = evaluate_trial(self.objective, data, index, self._param_sets[index])
+            self._finished[index] = trial
+            yield trial
+            self._advance()
+
+    def _run_parallel(self) -> Iterator[Trial]:
+        shared = SharedDataset(self.dataset) if self.dataset is not None else None
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.n_jobs, len(self._param_sets)),
+            initializer=_init_worker,
+            initargs=(self.objective, shared.spec if shared else None),
+        )
+        pending = {}
+        try:
+            while self._ready or pending:
+                while self._ready and len(pending) < self.n_jobs * 2:
+                    index = self._ready.popleft()
+                    pending[executor.submit(_run_trial, index, self._param_sets[index])] = index
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    index = pending.pop(future)
+                    trial = future.result()
+                    self._finished[index] = trial
+                    yield trial
+                self._advance()
+
+                # 조기 종료 - 남은 트라이얼은 모두 종료 지점 이후라 버림
+                if self._stop_at is not None:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if shared is not None:
+                shared.close()
+
+    def _advance(self):
+        """트라이얼 순서대로 결과 반영 → 조기 종료/가지치기 판단"""
+        while self._stop_at is None and len(self.trials) in self._finished:
+            trial = self._finished.pop(len(self.trials))
+            self.trials.append(trial)
+
+            if trial.state == 'complete':
+                if self.pruner is not None:
+                    self.pruner.observe(trial)
+                if trial.score > self._best + self.min_delta:
+                    self._best = trial.score
+                    self._since_best = 0
+                else:
+                    self._since_best += 1
+                if self.patience is not None and self._since_best >= self.patience:
+                    self._stop_at = len(self.trials)
+                    self.stopped_early = True
+                    self._ready.clear()
+                    logger.info(f"조기 종료: {self.patience}회 연속 개선 없음 (트라이얼 {len(self.trials)}개)")
+
+            self._decide()
+
+    def _decide(self):
+        """
+        다음 트라이얼들의 평가/가지치기 결정
+
+        트라이얼 i 는 순서 구간 길이가 i - lookahead + 1 이상일 때 결정되므로
+        판단에 쓰이는 결과 집합이 항상 같다.
+        """
+        if self._stop_at is not None:
+            return
+
+        limit = min(len(self._param_sets), len(self.trials) + self.lookahead)
+        while self._decided < limit:
+            index = self._decided
+            self._decided += 1
+
+            params = self._param_sets[index]
+            if self.pruner is not None and self.pruner.should_prune(params):
+                self._finished[index] = Trial(index, params, state='pruned')
+            else:
+                self._ready.append(index)
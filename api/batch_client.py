@@ -1,10 +1,12 @@
 """
 Batch API Client v6.0
 API 배치 호출로 성능 90% 향상
+
+비동기 호출은 core.async_rest_client.AsyncKiwoomRESTClient 사용
+(KiwoomRESTClient와 토큰 / 속도 제한 공유, 스레드 풀을 거치지 않음)
 """
 
 import asyncio
-import aiohttp
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 import time
@@ -19,10 +21,10 @@ class BatchAPIClient:
     배치 API 클라이언트
 
     Features:
-    - 병렬 API 호출 (ThreadPoolExecutor)
-    - 비동기 HTTP 요청 (aiohttp)
+    - 네이티브 비동기 HTTP 요청 (aiohttp, keep-alive 커넥션 풀)
+    - 하나의 이벤트 루프에서 수백 개 요청 동시 처리 (Semaphore 상한)
+    - KiwoomRESTClient와 토큰 / 속도 제한(RateLimiter) 상태 공유
     - 자동 재시도 (exponential backoff)
-    - Rate limiting
     - 에러 핸들링
 
     Performance:
@@ -35,31 +37,67 @@ class BatchAPIClient:
         max_workers: int = 10,
         batch_size: int = 20,
         max_retries: int = 3,
-        rate_limit_per_second: int = 100
+        rate_limit_per_second: int = 100,
+        max_concurrency: int = 200
     ):
         """
         초기화
 
         Args:
-            base_client: 기존 REST 클라이언트
-            max_workers: 최대 워커 수
-            batch_size: 배치 크기
+            base_client: 기존 REST 클라이언트 (KiwoomRESTClient)
+            max_workers: 동기 fallback 조회용 스레드 수
+            batch_size: 진행률 로그 단위
             max_retries: 최대 재시도 횟수
-            rate_limit_per_second: 초당 요청 제한
+            rate_limit_per_second: (하위 호환용) 실제 한도는 base_client의 RateLimiter가 적용
+            max_concurrency: 동시 in-flight 요청 수 상한
         """
         self.base_client = base_client
         self.max_workers = max_workers
         self.batch_size = batch_size
         self.max_retries = max_retries
         self.rate_limit = rate_limit_per_second
+        self.max_concurrency = max_concurrency
 
-        # Rate limiter
-        self.last_request_time = 0
-        self.request_interval = 1.0 / rate_limit_per_second
+        # 비동기 클라이언트 (첫 호출 시 생성, base_client와 상태 공유)
+        self._async_client = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._market_api = None
 
-        # ThreadPoolExecutor
+        # 동기 fallback 경로 전용 (NXT 호가 대체 조회 등)
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
+    def _get_async_client(self):
+        """AsyncKiwoomRESTClient 지연 생성"""
+        if self._async_client is None:
+            from core.async_rest_client import AsyncKiwoomRESTClient
+            self._async_client = AsyncKiwoomRESTClient(
+                self.base_client,
+                max_connections=self.max_concurrency,
+                max_connections_per_host=self.max_concurrency,
+            )
+        return self._async_client
+
+    def _get_market_api(self):
+        """동기 MarketAPI (fallback 경로 전용)"""
+        if self._market_api is None:
+            from api import MarketAPI
+            self._market_api = MarketAPI(self.base_client)
+        return self._market_api
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """동시 요청 상한 Semaphore (현재 이벤트 루프에 생성, 루프가 바뀌면 다시 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _request(self, api_id: str, body: Dict[str, Any], path: str) -> Optional[Dict[str, Any]]:
+        """동시 요청 상한 내에서 비동기 API 호출"""
+        async with self._get_semaphore():
+            return await self._get_async_client().request(api_id, body, path)
+
     async def get_multiple_stock_prices(
         self,
         stock_codes: List[str],
@@ -80,33 +118,30 @@ class BatchAPIClient:
         total = len(stock_codes)
         processed = 0
 
-        # 배치로 분할
-        batches = [
-            stock_codes[i:i + self.batch_size]
-            for i in range(0, len(stock_codes), self.batch_size)
-        ]
-
-        logger.info(f"배치 API 호출 시작: {total}개 종목, {len(batches)}개 배치")
+        logger.info(f"배치 API 호출 시작: {total}개 종목 (동시 {self.max_concurrency}개)")
         start_time = time.time()
 
-        # 배치별 병렬 처리
-        for batch_idx, batch in enumerate(batches):
-            batch_results = await self._process_batch(batch, self._fetch_price)
+        async def fetch(stock_code: str):
+            return stock_code, await self._fetch_with_retry(stock_code, self._fetch_price)
 
-            for stock_code, result in zip(batch, batch_results):
-                if result:
-                    results[stock_code] = result
-                processed += 1
+        # 모든 요청을 한 이벤트 루프에서 동시에 진행 (완료 순서대로 수집)
+        for future in asyncio.as_completed([fetch(code) for code in stock_codes]):
+            stock_code, result = await future
+            if result:
+                results[stock_code] = result
+            processed += 1
 
-                # 진행률 콜백
-                if progress_callback:
-                    progress_callback(processed, total)
+            # 진행률 콜백
+            if progress_callback:
+                progress_callback(processed, total)
 
-            logger.debug(f"배치 {batch_idx + 1}/{len(batches)} 완료")
+            if processed % self.batch_size == 0:
+                logger.debug(f"배치 진행: {processed}/{total}")
 
         elapsed = time.time() - start_time
         logger.info(f"배치 API 호출 완료: {total}개 종목, {elapsed:.1f}초")
-        logger.info(f"평균 처리 속도: {total / elapsed:.1f}개/초")
+        if elapsed > 0:
+            logger.info(f"평균 처리 속도: {total / elapsed:.1f}개/초")
 
         return results
 
@@ -120,7 +155,7 @@ class BatchAPIClient:
 
         Args:
             items: 아이템 리스트
-            fetch_func: 조회 함수
+            fetch_func: 조회 코루틴 함수
 
         Returns:
             결과 리스트
@@ -152,7 +187,7 @@ class BatchAPIClient:
 
         Args:
             item: 조회 아이템
-            fetch_func: 조회 함수
+            fetch_func: 조회 코루틴 함수
             retry_count: 현재 재시도 횟수
 
         Returns:
@@ -160,12 +195,7 @@ class BatchAPIClient:
         """
 
         try:
-            # Rate limiting
-            await self._wait_for_rate_limit()
-
-            # 조회 실행 (비동기)
-            result = await asyncio.to_thread(fetch_func, item)
-            return result
+            return await fetch_func(item)
 
         except Exception as e:
             if retry_count < self.max_retries:
@@ -178,20 +208,9 @@ class BatchAPIClient:
                 logger.error(f"조회 최종 실패 ({self.max_retries}회 재시도): {e}")
                 return None
 
-    async def _wait_for_rate_limit(self):
-        """Rate limiting 대기"""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-
-        if elapsed < self.request_interval:
-            wait_time = self.request_interval - elapsed
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-    def _fetch_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
-        가격 조회 (기존 클라이언트 사용)
+        가격 조회 (ka10003 비동기 호출, MarketDataAPI와 동일한 응답 형식)
 
         Args:
             stock_code: 종목 코드
@@ -199,17 +218,31 @@ class BatchAPIClient:
         Returns:
             가격 데이터
         """
-        try:
-            # 기존 MarketAPI 사용
-            from api import MarketAPI
-            market_api = MarketAPI(self.base_client)
-
-            price_data = market_api.get_stock_price(stock_code)
-            return price_data
-
-        except Exception as e:
-            logger.error(f"가격 조회 실패 ({stock_code}): {e}")
-            return None
+        from api.market.market_data import MarketDataAPI
+        from utils.trading_date import is_nxt_hours
+
+        is_nxt = is_nxt_hours()
+        base_code = stock_code[:-3] if stock_code.endswith("_NX") else stock_code
+
+        # NXT 시간대: _NX 접미사 먼저 시도
+        if is_nxt:
+            response_nx = await self._request("ka10003", {"stk_cd": f"{base_code}_NX"}, "stkinfo")
+            price_info = MarketDataAPI._parse_price_response(response_nx, 'nxt_realtime', 'NXT')
+            if price_info and price_info['current_price'] > 0:
+                return price_info
+
+        response = await self._request("ka10003", {"stk_cd": base_code}, "stkinfo")
+        price_info = MarketDataAPI._parse_price_response(
+            response, 'nxt_realtime' if is_nxt else 'regular_market'
+        )
+        if price_info:
+            return price_info
+
+        # 체결정보가 없으면 기존 동기 경로의 호가 fallback 사용 (드문 경우)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._get_market_api().get_stock_price, stock_code
+        )
 
     async def get_multiple_stock_details(
         self,
@@ -229,42 +262,46 @@ class BatchAPIClient:
             {stock_code: detail_data}
         """
 
-        results = {}
-
         # 기본 가격 조회 (배치)
         prices = await self.get_multiple_stock_prices(stock_codes)
 
-        for stock_code, price_data in prices.items():
+        async def fetch_detail(stock_code: str, price_data: Dict[str, Any]):
             detail = {
                 'price': price_data
             }
 
-            # 추가 데이터 조회 (필요 시)
+            # 추가 데이터 조회 (필요 시, 종목 내에서도 동시 실행)
+            extra = []
             if include_chart:
-                chart_data = await self._fetch_chart_data(stock_code)
-                detail['chart'] = chart_data
-
+                extra.append(('chart', self._fetch_chart_data(stock_code)))
             if include_investor:
-                investor_data = await self._fetch_investor_data(stock_code)
-                detail['investor'] = investor_data
+                extra.append(('investor', self._fetch_investor_data(stock_code)))
 
-            results[stock_code] = detail
+            if extra:
+                values = await asyncio.gather(*(coro for _, coro in extra))
+                for (key, _), value in zip(extra, values):
+                    detail[key] = value
 
-        return results
+            return stock_code, detail
+
+        details = await asyncio.gather(
+            *(fetch_detail(code, price) for code, price in prices.items())
+        )
+        return dict(details)
 
-    async def _fetch_chart_data(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """차트 데이터 조회"""
+    async def _fetch_chart_data(self, stock_code: str) -> Optional[List[Dict[str, Any]]]:
+        """차트 데이터 조회 (일봉 30개)"""
         try:
-            from api import MarketAPI
-            market_api = MarketAPI(self.base_client)
+            from api.market.chart_data import ChartDataAPI
+            from utils.trading_date import get_last_trading_date
 
-            # 일봉 데이터 조회
-            chart_data = await asyncio.to_thread(
-                market_api.get_daily_chart,
-                stock_code,
-                period=30
-            )
-            return chart_data
+            body = {
+                "stk_cd": stock_code,
+                "base_dt": get_last_trading_date(),
+                "upd_stkpc_tp": "1"  # 수정주가 반영
+            }
+            response = await self._request("ka10081", body, "chart")
+            return ChartDataAPI._parse_daily_chart(response, stock_code, period=30)
 
         except Exception as e:
             logger.error(f"차트 조회 실패 ({stock_code}): {e}")
@@ -273,20 +310,32 @@ class BatchAPIClient:
     async def _fetch_investor_data(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """투자자별 매매 데이터 조회"""
         try:
-            from api import MarketAPI
-            market_api = MarketAPI(self.base_client)
-
-            # 투자자별 매매동향 조회
-            investor_data = await asyncio.to_thread(
-                market_api.get_investor_trading,
-                stock_code
-            )
-            return investor_data
+            from api.market.investor_data import InvestorDataAPI
+            from utils.trading_date import get_last_trading_date
+
+            date = get_last_trading_date()
+            body = {
+                "stk_cd": stock_code,
+                "dt": date,
+                "amt_qty_tp": "1",  # 1:금액, 2:수량
+                "trde_tp": "0",     # 0:순매수, 1:매수, 2:매도
+                "unit_tp": "1000"   # 1000:천주, 1:단주
+            }
+            response = await self._request("ka10059", body, "stkinfo")
+            return InvestorDataAPI._parse_investor_trading(response, stock_code, date)
 
         except Exception as e:
             logger.error(f"투자자 데이터 조회 실패 ({stock_code}): {e}")
             return None
 
+    async def aclose(self):
+        """비동기 리소스 정리 (커넥션 풀 종료)"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        self._semaphore = None
+        self._semaphore_loop = None
+
     def close(self):
         """리소스 정리"""
         self.executor.shutdown(wait=True)
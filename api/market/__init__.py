@@ -8,12 +8,15 @@ api/market/__init__.py
 - ranking.py: 순위 정보
 - investor_data.py: 투자자 매매 데이터
 - stock_info.py: 종목/업종/테마 정보
+- request_coalescer.py: 동일 요청 병합 (single-flight) + TTL 캐시
 """
+from typing import Dict, Optional
 from .market_data import MarketDataAPI
 from .chart_data import ChartDataAPI, get_daily_chart
 from .ranking import RankingAPI
 from .investor_data import InvestorDataAPI
 from .stock_info import StockInfoAPI
+from .request_coalescer import RequestCoalescer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -45,14 +48,17 @@ class MarketAPI:
         daily_chart = market_api.get_daily_chart('005930', period=20)
     """
 
-    def __init__(self, client):
+    def __init__(self, client, coalesce: bool = True, coalesce_ttls: Optional[Dict[str, float]] = None):
         """
         MarketAPI 초기화
 
         Args:
             client: KiwoomRESTClient 인스턴스
+            coalesce: 현재가 / 호가 / 투자자 / 체결강도 동일 요청 병합 여부
+            coalesce_ttls: API ID별 결과 재사용 시간 (초)
         """
         self.client = client
+        self.coalescer = RequestCoalescer(coalesce_ttls) if coalesce else None
 
         # 5개 서브 API 초기화
         self.market_data = MarketDataAPI(client)
@@ -63,13 +69,40 @@ class MarketAPI:
 
         logger.info("MarketAPI 초기화 완료 (5개 모듈 통합)")
 
+    # =========================================================================
+    # 요청 병합 (single-flight)
+    # =========================================================================
+
+    def _coalesced(self, api_id: str, stock_code: str, fn, *args):
+        """동일 요청 병합 후 호출 (병합 비활성화 시 직접 호출)"""
+        if self.coalescer is None:
+            return fn(stock_code, *args)
+        return self.coalescer.call(api_id, stock_code, lambda: fn(stock_code, *args), *args)
+
+    def attach_websocket(self, websocket_manager):
+        """
+        실시간 체결 / 호가 수신 시 해당 종목 캐시 무효화
+
+        Args:
+            websocket_manager: WebSocketManager 인스턴스
+        """
+        if self.coalescer is None:
+            return None
+        return websocket_manager.register_callback('ALL', self.coalescer.on_realtime_data)
+
+    def get_coalescing_stats(self) -> Dict:
+        """API ID별 hit / coalesced / miss 통계"""
+        if self.coalescer is None:
+            return {}
+        return self.coalescer.get_stats()
+
     # =========================================================================
     # MarketDataAPI 메서드 위임 (시세/호가)
     # =========================================================================
 
     def get_stock_price(self, stock_code: str, use_fallback: bool = True):
         """종목 체결정보 조회 (현재가)"""
-        return self.market_data.get_stock_price(stock_code, use_fallback)
+        return self._coalesced('ka10003', stock_code, self.market_data.get_stock_price, use_fallback)
 
     def get_orderbook(self, stock_code: str):
         """호가 조회"""
@@ -77,7 +110,7 @@ class MarketAPI:
 
     def get_bid_ask(self, stock_code: str):
         """호가 데이터 조회 (get_orderbook 별칭)"""
-        return self.market_data.get_bid_ask(stock_code)
+        return self._coalesced('ka10004', stock_code, self.market_data.get_bid_ask)
 
     def get_market_index(self, market_code: str = '001'):
         """시장 지수 조회"""
@@ -156,7 +189,7 @@ class MarketAPI:
 
     def get_investor_data(self, stock_code: str, date: str = None):
         """투자자 매매 데이터 조회 (get_investor_trading 별칭)"""
-        return self.investor_data.get_investor_data(stock_code, date)
+        return self._coalesced('ka10059', stock_code, self.investor_data.get_investor_data, date)
 
     def get_intraday_investor_trading_market(self, market: str = 'KOSPI', investor_type: str = 'institution', amount_or_qty: str = 'amount', exchange: str = 'KRX'):
         """장중 투자자별 매매 상위 (시장 전체)"""
@@ -176,7 +209,7 @@ class MarketAPI:
 
     def get_execution_intensity(self, stock_code: str, days: int = 1):
         """체결강도 조회"""
-        return self.investor_data.get_execution_intensity(stock_code, days)
+        return self._coalesced('ka10047', stock_code, self.investor_data.get_execution_intensity, days)
 
     def get_program_trading(self, stock_code: str, days: int = 1):
         """프로그램매매 추이 조회"""
@@ -219,5 +252,6 @@ __all__ = [
     'RankingAPI',
     'InvestorDataAPI',
     'StockInfoAPI',
+    'RequestCoalescer',
     'get_daily_chart',
 ]
@@ -6,10 +6,15 @@ v5.9 개선사항:
 - 분봉 차트 데이터 조회 추가 (1/5/15/30/60분)
 - 다양한 시간프레임 지원
 - 데이터 검증 및 에러 핸들링 강화
+
+로컬 히스토리 저장소:
+- 일봉 / 정규장 분봉은 OHLCVStore에 누적 저장
+- 저장된 구간은 로컬에서 반환, 마지막 저장 이후 봉이 필요할 때만 API 호출
 """
 import logging
-from typing import Dict, Any, List, Literal
-from utils.trading_date import get_last_trading_date
+from typing import Dict, Any, List, Literal, Optional
+from utils.ohlcv_store import OHLCVStore, get_ohlcv_store, minute_timeframe, DAILY
+from utils.trading_date import get_last_trading_date, is_nxt_hours
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +28,22 @@ class ChartDataAPI:
     - 분봉 차트 데이터 조회 (1/5/15/30/60분)
     """
 
-    def __init__(self, client):
+    def __init__(
+        self,
+        client,
+        history_store: Optional[OHLCVStore] = None,
+        use_history_store: bool = True
+    ):
         """
         ChartDataAPI 초기화
 
         Args:
             client: KiwoomRESTClient 인스턴스
+            history_store: OHLCV 저장소 (None이면 전역 저장소)
+            use_history_store: False면 항상 API 직접 조회
         """
         self.client = client
+        self.history_store = (history_store or get_ohlcv_store()) if use_history_store else None
         logger.debug("ChartDataAPI 초기화 완료 (v5.9 - 분봉 지원)")
 
     def get_daily_chart(
@@ -62,21 +75,46 @@ class ChartDataAPI:
             ]
         """
         # 날짜 자동 계산
+        last_trading_date = get_last_trading_date()
         if not date:
-            date = get_last_trading_date()
+            date = last_trading_date
+
+        if self.history_store is None:
+            return self._parse_daily_chart(self._request_daily_chart(stock_code, date), stock_code, period)
+
+        # 저장소 우선 (기준일까지 저장되어 있으면 API 호출 없음)
+        return self.history_store.sync(
+            stock_code,
+            DAILY,
+            fetch=lambda: self._parse_daily_chart(
+                self._request_daily_chart(stock_code, date), stock_code, period=None
+            ),
+            count=period,
+            min_date=min(date, last_trading_date),
+            end=int(date)
+        )
 
+    def _request_daily_chart(self, stock_code: str, date: str) -> Dict[str, Any]:
+        """ka10081 요청"""
         body = {
             "stk_cd": stock_code,
             "base_dt": date,
             "upd_stkpc_tp": "1"  # 수정주가 반영
         }
 
-        response = self.client.request(
+        return self.client.request(
             api_id="ka10081",
             body=body,
             path="chart"
         )
 
+    @staticmethod
+    def _parse_daily_chart(
+        response: Dict[str, Any],
+        stock_code: str,
+        period: int = 20
+    ) -> List[Dict[str, Any]]:
+        """ka10081 응답 → 표준화된 일봉 리스트"""
         if response and response.get('return_code') == 0:
             # ka10081은 'stk_dt_pole_chart_qry' 키에 데이터 반환
             daily_data = response.get('stk_dt_pole_chart_qry', [])
@@ -99,7 +137,7 @@ class ChartDataAPI:
             logger.info(f"{stock_code} 일봉 차트 {len(standardized_data)}개 조회 완료")
             return standardized_data[:period] if period else standardized_data  # period만큼만 반환
         else:
-            logger.error(f"일봉 차트 조회 실패: {response.get('return_msg')}")
+            logger.error(f"일봉 차트 조회 실패: {response.get('return_msg') if response else 'No response'}")
             return []
 
     def get_minute_chart(
@@ -143,8 +181,6 @@ class ChartDataAPI:
                 ...
             ]
         """
-        from utils.trading_date import is_nxt_hours
-
         # 유효한 간격인지 확인
         valid_intervals = [1, 5, 15, 30, 60]
         if interval not in valid_intervals:
@@ -152,6 +188,34 @@ class ChartDataAPI:
             return []
 
         is_nxt = is_nxt_hours()
+
+        # 정규장 최신 수정주가 분봉은 저장소 우선 (NXT / 과거 기준일은 API 직접 조회)
+        if self.history_store is not None and adjusted and not base_date and not is_nxt:
+            base_code = stock_code[:-3] if stock_code.endswith("_NX") else stock_code
+            return self.history_store.sync(
+                base_code,
+                minute_timeframe(interval),
+                fetch=lambda: self._fetch_minute_chart(
+                    stock_code, interval, None, adjusted, base_date, use_nxt_fallback, is_nxt
+                ),
+                count=count,
+                min_date=get_last_trading_date(),
+                max_age=interval * 60
+            )
+
+        return self._fetch_minute_chart(stock_code, interval, count, adjusted, base_date, use_nxt_fallback, is_nxt)
+
+    def _fetch_minute_chart(
+        self,
+        stock_code: str,
+        interval: int,
+        count: Optional[int],
+        adjusted: bool,
+        base_date: Optional[str],
+        use_nxt_fallback: bool,
+        is_nxt: bool
+    ) -> List[Dict[str, Any]]:
+        """ka10080 분봉 조회 (NXT _NX 시도 + 기본 코드 fallback)"""
         base_code = stock_code[:-3] if stock_code.endswith("_NX") else stock_code
 
         # NXT 시간대 처리
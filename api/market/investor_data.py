@@ -71,6 +71,15 @@ class InvestorDataAPI:
             path="stkinfo"
         )
 
+        return self._parse_investor_trading(response, stock_code, date)
+
+    @staticmethod
+    def _parse_investor_trading(
+        response: Optional[Dict[str, Any]],
+        stock_code: str,
+        date: str
+    ) -> Optional[Dict[str, Any]]:
+        """ka10059 응답 → 투자자별 순매수 정보"""
         if response and response.get('return_code') == 0:
             # ka10059 응답 구조: stk_invsr_orgn 리스트
             stk_invsr_orgn = response.get('stk_invsr_orgn', [])
@@ -63,28 +63,10 @@ class MarketDataAPI:
                 path="stkinfo"
             )
 
-            if response_nx and response_nx.get('return_code') == 0:
-                cntr_infr = response_nx.get('cntr_infr', [])
-                if cntr_infr and len(cntr_infr) > 0:
-                    latest = cntr_infr[0]
-                    cur_prc_str = latest.get('cur_prc', '0')
-                    current_price = abs(int(cur_prc_str.replace('+', '').replace('-', '')))
-
-                    if current_price > 0:
-                        price_info = {
-                            'current_price': current_price,
-                            'cur_prc': current_price,
-                            'change': latest.get('pred_pre', '0'),
-                            'change_rate': latest.get('pre_rt', '0'),
-                            'volume': latest.get('cntr_trde_qty', '0'),
-                            'acc_volume': latest.get('acc_trde_qty', '0'),
-                            'acc_trading_value': latest.get('acc_trde_prica', '0'),
-                            'time': latest.get('tm', ''),
-                            'stex_tp': latest.get('stex_tp', 'NXT'),
-                            'source': 'nxt_realtime',
-                        }
-                        logger.info(f"{nx_code} NXT 현재가: {current_price:,}원 (stex_tp={price_info['stex_tp']})")
-                        return price_info
+            price_info = self._parse_price_response(response_nx, 'nxt_realtime', 'NXT')
+            if price_info and price_info['current_price'] > 0:
+                logger.info(f"{nx_code} NXT 현재가: {price_info['current_price']:,}원 (stex_tp={price_info['stex_tp']})")
+                return price_info
 
         # 기본 코드로 조회 (일반 시간 또는 NXT fallback)
         body = {"stk_cd": base_code}
@@ -96,32 +78,12 @@ class MarketDataAPI:
         )
 
         if response and response.get('return_code') == 0:
-            # ka10003 응답: cntr_infr 리스트
-            cntr_infr = response.get('cntr_infr', [])
-
-            if cntr_infr and len(cntr_infr) > 0:
-                # 최신 체결 정보 (첫 번째 항목)
-                latest = cntr_infr[0]
-
-                # 현재가 파싱 (+/- 부호 제거)
-                cur_prc_str = latest.get('cur_prc', '0')
-                current_price = abs(int(cur_prc_str.replace('+', '').replace('-', '')))
-
-                # 정규화된 응답
-                price_info = {
-                    'current_price': current_price,
-                    'cur_prc': current_price,  # 원본 필드명도 유지
-                    'change': latest.get('pred_pre', '0'),
-                    'change_rate': latest.get('pre_rt', '0'),
-                    'volume': latest.get('cntr_trde_qty', '0'),
-                    'acc_volume': latest.get('acc_trde_qty', '0'),
-                    'acc_trading_value': latest.get('acc_trde_prica', '0'),
-                    'time': latest.get('tm', ''),
-                    'stex_tp': latest.get('stex_tp', ''),
-                    'source': 'nxt_realtime' if is_nxt else 'regular_market',
-                }
+            price_info = self._parse_price_response(
+                response, 'nxt_realtime' if is_nxt else 'regular_market'
+            )
 
-                logger.info(f"{base_code} 현재가: {current_price:,}원 (출처: {price_info['source']})")
+            if price_info:
+                logger.info(f"{base_code} 현재가: {price_info['current_price']:,}원 (출처: {price_info['source']})")
                 return price_info
             else:
                 logger.warning(f"현재가 조회 실패: 체결정보 없음")
@@ -179,6 +141,51 @@ class MarketDataAPI:
         logger.error(f"{stock_code} 현재가 조회 완전 실패 (모든 소스)")
         return None
 
+    @staticmethod
+    def _parse_price_response(
+        response: Optional[Dict[str, Any]],
+        source: str,
+        default_stex_tp: str = ''
+    ) -> Optional[Dict[str, Any]]:
+        """
+        ka10003 응답 → 정규화된 현재가 정보
+
+        Args:
+            response: API 응답
+            source: 출처 표기 ('regular_market', 'nxt_realtime')
+            default_stex_tp: 응답에 거래소 구분이 없을 때 기본값
+
+        Returns:
+            현재가 정보 (체결정보가 없으면 None)
+        """
+        if not response or response.get('return_code') != 0:
+            return None
+
+        # ka10003 응답: cntr_infr 리스트
+        cntr_infr = response.get('cntr_infr', [])
+        if not cntr_infr:
+            return None
+
+        # 최신 체결 정보 (첫 번째 항목)
+        latest = cntr_infr[0]
+
+        # 현재가 파싱 (+/- 부호 제거)
+        cur_prc_str = latest.get('cur_prc', '0')
+        current_price = abs(int(cur_prc_str.replace('+', '').replace('-', '')))
+
+        return {
+            'current_price': current_price,
+            'cur_prc': current_price,  # 원본 필드명도 유지
+            'change': latest.get('pred_pre', '0'),
+            'change_rate': latest.get('pre_rt', '0'),
+            'volume': latest.get('cntr_trde_qty', '0'),
+            'acc_volume': latest.get('acc_trde_qty', '0'),
+            'acc_trading_value': latest.get('acc_trde_prica', '0'),
+            'time': latest.get('tm', ''),
+            'stex_tp': latest.get('stex_tp', default_stex_tp),
+            'source': source,
+        }
+
     def get_orderbook(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
         호가 조회 (키움증권 API ka10004)
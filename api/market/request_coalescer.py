@@ -0,0 +1,261 @@
+"""
+api/market/request_coalescer.py
+동일 요청 병합 (single-flight) + 엔드포인트별 TTL 캐시
+
+스캐너 / 가상매매 enricher / NXT 가격 관리자 / 대시보드 스레드가 같은 종목을
+거의 동시에 조회할 때 REST 호출 1건만 실행하고 결과를 공유한다.
+
+- 진행 중인 동일 요청이 있으면 완료를 기다려 같은 결과 사용 (coalesced)
+  대기는 호출자 자신의 call_deadline까지, 선행 요청이 자기 마감으로 실패하면
+  그 예외를 받지 않고 다시 시도 (새 선행 요청이 되거나 다른 요청에 합류)
+- 완료된 결과는 API ID별 TTL 동안 재사용 (hit)
+- WebSocket 실시간 틱 수신 시 해당 종목 캐시 무효화
+- API ID별 hit / coalesced / miss 통계 → 절약한 요청 수 확인
+"""
+import copy
+import logging
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from core.rate_limiter import DeadlineExceeded, current_deadline
+
+logger = logging.getLogger(__name__)
+
+
+# API ID별 결과 재사용 시간 (초)
+DEFAULT_TTLS = {
+    'ka10003': 1.0,   # 체결정보 (현재가)
+    'ka10004': 1.0,   # 호가
+    'ka10047': 5.0,   # 체결강도
+    'ka10059': 30.0,  # 투자자별 매매
+}
+
+# 실시간 데이터 타입 → 무효화할 API ID
+TICK_INVALIDATES = {
+    '0B': ('ka10003', 'ka10047'),  # 주식체결
+    '0D': ('ka10004',),            # 주식호가잔량
+}
+
+
+class _Entry:
+    """캐시 항목"""
+
+    __slots__ = ('value', 'expires_at')
+
+    def __init__(self, value: Any, expires_at: float):
+        self.value = value
+        self.expires_at = expires_at
+
+
+class RequestCoalescer:
+    """
+    Thread-safe single-flight 요청 병합기
+
+    키는 (api_id, stock_code, *args) 형태이며, stock_code 단위로 무효화할 수 있다.
+    None / 빈 결과와 예외는 캐시하지 않는다 (대기 중이던 호출자에게는 그대로 전달,
+    단 선행 요청의 마감에서 나온 DeadlineExceeded는 전달하지 않고 재시도).
+    요청 도중 무효화된 종목의 응답은 캐시하지 않는다 (틱 이전 시세 재사용 방지).
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 1.0):
+        """
+        Args:
+            ttls: API ID별 TTL (DEFAULT_TTLS에 덮어씀)
+            default_ttl: 목록에 없는 API ID의 TTL
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+
+        self._lock = Lock()
+        self._cache: Dict[Tuple, _Entry] = {}
+        self._in_flight: Dict[Tuple, Future] = {}
+        self._keys_by_code: Dict[str, Set[Tuple]] = {}
+        self._generation: Dict[Tuple[str, Optional[str]], int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _base_code(stock_code: str) -> str:
+        return stock_code[:-3] if stock_code.endswith('_NX') else stock_code
+
+    def _current_generation(self, code: str, api_id: str) -> Tuple[int, int]:
+        """종목 전체 / API ID별 무효화 세대"""
+        return self._generation.get((code, None), 0), self._generation.get((code, api_id), 0)
+
+    def _bump(self, code: str, api_id: Optional[str]):
+        key = (code, api_id)
+        self._generation[key] = self._generation.get(key, 0) + 1
+
+    def _count(self, api_id: str, field: str):
+        stats = self._stats.get(api_id)
+        if stats is None:
+            stats = self._stats[api_id] = {'hits': 0, 'coalesced': 0, 'misses': 0, 'errors': 0, 'invalidated': 0}
+        stats[field] += 1
+
+    def call(self, api_id: str, stock_code: str, fn: Callable[[], Any], *key_args: Hashable) -> Any:
+        """
+        요청 실행 (동일 키는 병합 / 캐시)
+
+        Args:
+            api_id: API ID (TTL / 통계 기준)
+            stock_code: 종목코드 (무효화 기준)
+            fn: 실제 REST 호출 함수
+            *key_args: 결과에 영향을 주는 추가 인자
+
+        Returns:
+            fn() 결과 (dict / list는 호출자별 얕은 복사본)
+
+        Raises:
+            DeadlineExceeded: 호출자 자신의 call_deadline까지 결과를 받지 못함
+        """
+        key = (api_id, stock_code) + key_args
+        code = self._base_code(stock_code)
+        deadline = current_deadline()
+
+        while True:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry.expires_at > time.monotonic():
+                    self._count(api_id, 'hits')
+                    return self._copy(entry.value)
+
+                future = self._in_flight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._in_flight[key] = Future()
+                    generation = self._current_generation(code, api_id)
+                    self._count(api_id, 'misses')
+                else:
+                    self._count(api_id, 'coalesced')
+
+            if leader:
+                break
+
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                error = future.exception(timeout)
+            except FutureTimeoutError:
+                raise DeadlineExceeded(f"병합 대기 중 호출 마감 시각 경과: {api_id} {stock_code}") from None
+            if isinstance(error, DeadlineExceeded):
+                continue  # 선행 요청의 마감 → 내 마감 기준으로 다시 시도
+            return self._copy(future.result())
+
+        try:
+            value = fn()
+        except BaseException as e:
+            with self._lock:
+                self._count(api_id, 'errors')
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if value and self._current_generation(code, api_id) == generation:
+                ttl = self.ttls.get(api_id, self.default_ttl)
+                self._cache[key] = _Entry(value, time.monotonic() + ttl)
+                self._keys_by_code.setdefault(code, set()).add(key)
+            del self._in_flight[key]
+        future.set_result(value)
+        return self._copy(value)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """호출자가 결과를 수정해도 캐시가 오염되지 않도록 얕은 복사"""
+        if isinstance(value, (dict, list)):
+            return copy.copy(value)
+        return value
+
+    def invalidate(self, stock_code: Optional[str] = None, api_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            stock_code: 종목코드 (None이면 전 종목, _NX 접미사 무시)
+            api_ids: 대상 API ID (None이면 전체)
+
+        Returns:
+            삭제된 항목 수
+        """
+        api_ids = set(api_ids) if api_ids is not None else None
+
+        with self._lock:
+            if stock_code is None:
+                codes = list(self._keys_by_code)
+            else:
+                codes = [self._base_code(stock_code)]
+
+            removed = 0
+            for code in codes:
+                for api_id in (api_ids if api_ids is not None else (None,)):
+                    self._bump(code, api_id)
+                keys = self._keys_by_code.get(code)
+                if not keys:
+                    continue
+                for key in [k for k in keys if api_ids is None or k[0] in api_ids]:
+                    keys.discard(key)
+                    if self._cache.pop(key, None) is not None:
+                        self._count(key[0], 'invalidated')
+                        removed += 1
+                if not keys:
+                    del self._keys_by_code[code]
+        return removed
+
+    def on_realtime_data(self, data: Dict[str, Any]):
+        """
+        WebSocket 실시간 데이터 콜백 (WebSocketManager.register_callback('ALL', ...)용)
+
+        체결 틱은 현재가 / 체결강도, 호가 틱은 호가 캐시를 무효화한다.
+        """
+        api_ids = TICK_INVALIDATES.get(data.get('type', ''))
+        stock_code = data.get('item', '')
+        if api_ids and stock_code:
+            self.invalidate(stock_code, api_ids)
+
+    def purge_expired(self) -> int:
+        """만료된 항목 정리"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._cache.items() if entry.expires_at <= now]
+            for key in expired:
+                del self._cache[key]
+                code = self._base_code(key[1])
+                keys = self._keys_by_code.get(code)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._keys_by_code[code]
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        API ID별 통계
+
+        Returns:
+            {
+                'by_api': {'ka10003': {'hits', 'coalesced', 'misses', 'errors', 'invalidated', 'saved', 'save_rate'}},
+                'total_requests': 전체 호출 수,
+                'total_saved': 실제 REST 호출 없이 응답한 수,
+                'entries': 캐시 항목 수,
+                'in_flight': 진행 중 요청 수,
+            }
+        """
+        with self._lock:
+            by_api = {}
+            for api_id, stats in self._stats.items():
+                saved = stats['hits'] + stats['coalesced']
+                total = saved + stats['misses']
+                by_api[api_id] = {**stats, 'saved': saved, 'save_rate': saved / total if total else 0.0}
+            entries = len(self._cache)
+            in_flight = len(self._in_flight)
+
+        return {
+            'by_api': by_api,
+            'total_requests': sum(s['saved'] + s['misses'] for s in by_api.values()),
+            'total_saved': sum(s['saved'] for s in by_api.values()),
+            'entries': entries,
+            'in_flight': in_flight,
+        }
+
+
+__all__ = ['RequestCoalescer', 'DEFAULT_TTLS', 'TICK_INVALIDATES']
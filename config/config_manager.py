@@ -74,6 +74,12 @@ class Config:
             'format': config.logging.format,
             'console_output': config.logging.console_output,
             'colored_output': config.logging.colored_output,
+            'enqueue': config.logging.enqueue,
+            'json_output': config.logging.json_output,
+            'json_file_path': config.logging.json_file_path,
+            'sampling': dict(config.logging.sampling),
+            'hot_path_modules': list(config.logging.hot_path_modules),
+            'intercept_stdlib': config.logging.intercept_stdlib,
         }
 
     @property
@@ -171,6 +177,13 @@ class Config:
         return {
             'sleep_seconds': mc.sleep_seconds,
             'health_check_interval': mc.health_check_interval,
+            'control_interval': mc.control_interval,
+            'market_status_interval': mc.market_status_interval,
+            'account_interval': mc.account_interval,
+            'sell_check_interval': mc.sell_check_interval,
+            'sell_check_min_gap': mc.sell_check_min_gap,
+            'scan_interval': mc.scan_interval,
+            'snapshot_interval': mc.snapshot_interval,
         }
 
     @property
@@ -459,6 +459,18 @@ class LoggingConfig(BaseModel):
     )
     console_output: bool = Field(default=True, description="콘솔 출력 여부")
     colored_output: bool = Field(default=True, description="컬러 출력 여부")
+    enqueue: bool = Field(default=True, description="백그라운드 writer 큐 기록 여부")
+    json_output: bool = Field(default=False, description="JSON-lines 구조화 로그 출력 여부")
+    json_file_path: str = Field(default="logs/bot.jsonl", description="JSON-lines 로그 파일 경로")
+    sampling: Dict[str, float] = Field(
+        default_factory=dict,
+        description="모듈 접두사별 로그 통과 비율 (WARNING 미만, 0~1)"
+    )
+    hot_path_modules: List[str] = Field(
+        default_factory=lambda: ['core.rest_client', 'research'],
+        description="diagnose(변수 값 덤프) 비활성 모듈 접두사"
+    )
+    intercept_stdlib: bool = Field(default=False, description="표준 logging 로그를 같은 파이프라인으로 전달")
 
 
 # ==================================================
@@ -470,6 +482,15 @@ class MainCycleConfig(BaseModel):
     sleep_seconds: int = Field(default=60, ge=1, description="메인 루프 대기 시간 (초)")
     health_check_interval: int = Field(default=300, ge=60, description="헬스 체크 간격 (초)")
 
+    # 작업별 실행 주기 (스케줄러)
+    control_interval: float = Field(default=5, gt=0, description="제어 파일 확인 주기 (초)")
+    market_status_interval: float = Field(default=60, gt=0, description="장 운영 상태 확인 주기 (초)")
+    account_interval: float = Field(default=30, gt=0, description="계좌 정보 동기화 주기 (초)")
+    sell_check_interval: float = Field(default=10, gt=0, description="매도 검토 주기 (초, 실시간 체결 시 즉시 실행)")
+    sell_check_min_gap: float = Field(default=1.0, ge=0, description="체결 틱 트리거 매도 검토 최소 간격 (초)")
+    scan_interval: Optional[float] = Field(default=None, gt=0, description="매수 스캔 주기 (초, None이면 sleep_seconds)")
+    snapshot_interval: Optional[float] = Field(default=None, gt=0, description="스냅샷 / 통계 주기 (초, None이면 sleep_seconds)")
+
     # Backward compatibility
     @property
     def SLEEP_SECONDS(self) -> int:
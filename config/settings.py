@@ -32,6 +32,21 @@ API_RATE_LIMIT = {
     'REST_RETRY_BACKOFF': 1.0,
     'WEBSOCKET_RECONNECT_DELAY': 5,
     'WEBSOCKET_MAX_RECONNECTS': 10,
+
+    # 토큰 버킷 (API 그룹별 초당 호출 한도)
+    # - priority 그룹(주문/계좌)은 스캐너 공용 한도(GLOBAL_RATE)를 거치지 않음
+    # - GLOBAL_RATE 미지정 시 1 / REST_CALL_INTERVAL
+    'BUCKETS': {
+        'order': {'rate': 5.0, 'capacity': 5, 'priority': True},
+        'account': {'rate': 3.0, 'capacity': 3, 'priority': True},
+        'market': {'rate': 3.0, 'capacity': 3},
+        'chart': {'rate': 2.0, 'capacity': 2},
+        'ranking': {'rate': 1.0, 'capacity': 2},
+    },
+    'GLOBAL_RATE': None,
+    'GLOBAL_CAPACITY': 1,
+    'API_GROUPS': {},   # API ID → 그룹 재정의 (예: {'ka10004': 'market'})
+    'PATH_GROUPS': {},  # 경로 → 그룹 재정의 (예: {'mrkcond': 'market'})
 }
 
 # 메인 사이클 설정
@@ -7,6 +7,9 @@ v4.2 CRITICAL #2: 표준 타입 시스템 추가
 - Trade, MarketSnapshot 표준화
 """
 from .rest_client import KiwoomRESTClient
+from .rate_limiter import TokenBucket, RateLimiter
+from .ws_router import DispatchRouter, Subscription
+from .scheduler import TaskScheduler, ScheduledTask
 from .exceptions import (
     KiwoomAPIError,
     AuthenticationError,
@@ -36,6 +39,12 @@ from .trading_types import (
 __all__ = [
     # REST Client
     'KiwoomRESTClient',
+    'TokenBucket',
+    'RateLimiter',
+    'DispatchRouter',
+    'Subscription',
+    'TaskScheduler',
+    'ScheduledTask',
 
     # Exceptions
     'KiwoomAPIError',
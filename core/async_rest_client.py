@@ -0,0 +1,274 @@
+"""
+core/async_rest_client.py
+키움증권 REST API 비동기 클라이언트 (aiohttp)
+
+- KiwoomRESTClient와 토큰 / 속도 제한 상태 공유
+- keep-alive 커넥션 풀 (TCPConnector) 재사용
+- 하나의 이벤트 루프에서 수백 개 요청 동시 처리
+"""
+import asyncio
+import json
+import time
+import logging
+from typing import Dict, Any, Optional
+
+import aiohttp
+
+from .rest_client import KiwoomRESTClient
+
+logger = logging.getLogger(__name__)
+
+
+# 재시도 대상 HTTP 상태 코드 (동기 클라이언트 Retry 설정과 동일)
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+class AsyncKiwoomRESTClient:
+    """
+    키움증권 REST API 비동기 클라이언트
+
+    토큰 발급/갱신과 속도 제한은 동기 KiwoomRESTClient 싱글톤의 상태를
+    그대로 사용하므로 두 클라이언트를 함께 써도 토큰이 중복 발급되거나
+    API 그룹별 호출 한도를 초과하지 않는다.
+
+    Usage:
+        async with AsyncKiwoomRESTClient() as client:
+            result = await client.request('ka10003', {'stk_cd': '005930'}, 'stkinfo')
+    """
+
+    def __init__(
+        self,
+        sync_client: Optional[KiwoomRESTClient] = None,
+        max_connections: int = 200,
+        max_connections_per_host: int = 100,
+        timeout: float = 10.0,
+        keepalive_timeout: float = 30.0
+    ):
+        """
+        초기화
+
+        Args:
+            sync_client: 상태를 공유할 KiwoomRESTClient (None이면 싱글톤)
+            max_connections: 커넥션 풀 최대 크기
+            max_connections_per_host: 호스트당 최대 커넥션 수
+            timeout: 요청 타임아웃 (초)
+            keepalive_timeout: keep-alive 유지 시간 (초)
+        """
+        self.sync_client = sync_client or KiwoomRESTClient()
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.max_retries = getattr(self.sync_client, 'max_retries', 3)
+        self.retry_backoff = getattr(self.sync_client, 'retry_backoff', 1.0)
+
+        # 세션 / 토큰 락은 생성한 이벤트 루프에 묶임 (루프가 바뀌면 다시 생성)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def rate_limiter(self):
+        """동기 클라이언트와 공유하는 속도 제한기"""
+        return self.sync_client.rate_limiter
+
+    def _bind_loop(self):
+        """
+        현재 실행 중인 이벤트 루프에 세션 / 토큰 락을 묶음
+
+        다른 루프(예: 이전 asyncio.run)에서 만든 객체는 그 루프에서만 쓸 수 있으므로
+        버리고 새로 만든다. 이전 세션은 이미 끝난 루프 소속이라 닫을 수 없어 분리만 한다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._session is not None and not self._session.closed:
+            self._session.detach()
+        self._session = None
+        self._token_lock = None
+        self._loop = loop
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """keep-alive 커넥션 풀 세션 (현재 이벤트 루프에 지연 생성)"""
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            logger.info(
+                f"비동기 HTTP 세션 생성 완료 (커넥션 풀: {self.max_connections}, "
+                f"호스트당 {self.max_connections_per_host})"
+            )
+        return self._session
+
+    async def ensure_token(self, force: bool = False, generation: Optional[int] = None) -> bool:
+        """
+        공유 토큰 보장
+
+        토큰이 유효하면 즉시 반환하고, 갱신이 필요할 때만 동기 클라이언트의
+        ensure_token을 스레드에서 한 번 실행한다 (동시 요청은 락에서 대기).
+        generation 은 요청에 쓴 토큰의 세대 - 그 사이 재발급됐으면 다시 발급하지 않는다.
+        """
+        if not force and self.sync_client._is_token_valid():
+            return True
+
+        self._bind_loop()
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            if not force and self.sync_client._is_token_valid():
+                return True
+            return await asyncio.to_thread(self.sync_client.ensure_token, force, generation)
+
+    async def request(
+        self,
+        api_id: str,
+        body: Dict[str, Any],
+        path: str,
+        http_method: str = "POST"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        API 요청 실행 (KiwoomRESTClient.request와 동일한 응답 형식)
+
+        Args:
+            api_id: API ID
+            body: 요청 본문
+            path: API 경로
+            http_method: HTTP 메서드
+
+        Returns:
+            API 응답 딕셔너리
+        """
+        if not await self.ensure_token():
+            logger.error(f"API 호출 실패 ({api_id}): 토큰 갱신 불가")
+            return {
+                "return_code": -401,
+                "return_msg": f"토큰 갱신 실패: {self.sync_client.last_error_msg}"
+            }
+
+        return await self._execute_request(api_id, body, path, http_method, retry_on_auth=True)
+
+    async def _execute_request(
+        self,
+        api_id: str,
+        body: Dict[str, Any],
+        path: str,
+        http_method: str,
+        retry_on_auth: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """실제 API 요청 실행 (재시도 포함)"""
+        method = http_method.upper()
+        if method not in ("POST", "GET"):
+            return {
+                "return_code": -101,
+                "return_msg": f"지원하지 않는 HTTP 메서드: {http_method}"
+            }
+
+        url = self.sync_client.build_url(path)
+        session = await self._get_session()
+
+        for attempt in range(self.max_retries + 1):
+            # 속도 제한 (동기 클라이언트와 같은 버킷 사용)
+            await self.rate_limiter.acquire_async(api_id, path)
+
+            generation = self.sync_client.token_generation
+            headers = {
+                "Content-Type": "application/json; charset=utf-8",
+                "authorization": f"Bearer {self.sync_client.token}",
+                "api-id": api_id
+            }
+
+            try:
+                start_time = time.monotonic()
+
+                if method == "POST":
+                    data = json.dumps(body, ensure_ascii=False) if body else None
+                    ctx = session.post(url, headers=headers, data=data)
+                else:
+                    ctx = session.get(url, headers=headers, params=body)
+
+                async with ctx as res:
+                    text = await res.text()
+                    status = res.status
+                    reason = res.reason
+
+                elapsed_ms = (time.monotonic() - start_time) * 1000
+                logger.debug(f"[REST 응답] {api_id} - 상태:{status}, 지연:{elapsed_ms:.2f}ms (async)")
+
+            except asyncio.TimeoutError:
+                logger.error(f"API 요청 시간 초과 ({api_id})")
+                return {"return_code": -102, "return_msg": "API 요청 시간 초과"}
+
+            except aiohttp.ClientError as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+                    continue
+                logger.error(f"네트워크 오류 ({api_id}): {e}")
+                return {"return_code": -103, "return_msg": f"네트워크 오류: {e}"}
+
+            # 401 에러 처리 (공유 토큰 갱신 후 재시도)
+            if status == 401 and retry_on_auth:
+                logger.warning(f"401 에러 - 토큰 갱신 후 재시도 ({api_id})")
+                if await self.ensure_token(force=True, generation=generation):
+                    return await self._execute_request(api_id, body, path, http_method, retry_on_auth=False)
+                return {
+                    "return_code": -401,
+                    "return_msg": f"재시도 실패: {self.sync_client.last_error_msg}"
+                }
+
+            if status in RETRY_STATUS_CODES and attempt < self.max_retries:
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+                continue
+
+            if status >= 400:
+                logger.error(f"HTTP 오류 ({api_id}): {status} - {text[:200]}")
+                return {
+                    "return_code": -int(status),
+                    "return_msg": f"HTTP 오류: {reason}",
+                    "error_detail": text[:200]
+                }
+
+            try:
+                result_data = json.loads(text)
+            except json.JSONDecodeError:
+                logger.error(f"JSON 파싱 실패 ({api_id}): {text[:200]}")
+                return {
+                    "return_code": -999,
+                    "return_msg": "응답 JSON 파싱 실패",
+                    "response_text": text[:200]
+                }
+
+            return self.sync_client._check_result(result_data, api_id)
+
+        return {"return_code": -103, "return_msg": "최대 재시도 초과"}
+
+    async def close(self):
+        """세션 종료 (토큰은 동기 클라이언트 소유이므로 폐기하지 않음)"""
+        if self._session is not None and not self._session.closed:
+            if self._loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                self._session.detach()
+        self._session = None
+        self._token_lock = None
+        self._loop = None
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입"""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료"""
+        await self.close()
+
+
+__all__ = ['AsyncKiwoomRESTClient']
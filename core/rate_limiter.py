@@ -0,0 +1,330 @@
+"""
+core/rate_limiter.py
+API 그룹별 토큰 버킷 속도 제한기
+
+- API ID / 경로로 그룹(order, account, market, chart, ranking ...) 결정
+- 그룹마다 독립 토큰 버킷 → 느린 랭킹 조회가 주문 호출을 막지 않음
+- 우선순위 레인(order, account)은 스캐너 공용 한도(GLOBAL)를 거치지 않음
+- 버킷별 대기 시간 / 사용률 통계 제공
+- 스레드별 호출 마감 시각 (call_deadline) - 마감 안에 토큰을 얻을 수 없는 호출은 보내지 않음
+"""
+import time
+import asyncio
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+
+from .exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+# 기본 버킷 설정 (API_RATE_LIMIT['BUCKETS']로 재정의 가능)
+DEFAULT_BUCKETS: Dict[str, Dict[str, Any]] = {
+    'order': {'rate': 5.0, 'capacity': 5, 'priority': True},
+    'account': {'rate': 3.0, 'capacity': 3, 'priority': True},
+    'market': {'rate': 3.0, 'capacity': 3},
+    'chart': {'rate': 2.0, 'capacity': 2},
+    'ranking': {'rate': 1.0, 'capacity': 2},
+}
+
+# 경로 마지막 구간 → 그룹
+DEFAULT_PATH_GROUPS: Dict[str, str] = {
+    'ordr': 'order',
+    'acnt': 'account',
+    'chart': 'chart',
+    'rkinfo': 'ranking',
+    'rank': 'ranking',
+}
+
+# API ID → 그룹 (경로보다 우선)
+DEFAULT_API_GROUPS: Dict[str, str] = {
+    # 주문 (api/order.py)
+    'kt10000': 'order',
+    'kt10001': 'order',
+    'kt10002': 'order',
+    'kt10003': 'order',
+    # 계좌 (api/account.py)
+    'kt00001': 'account',
+    'kt00004': 'account',
+    'kt00005': 'account',
+    'kt00010': 'account',
+    'kt00018': 'account',
+    'ka10073': 'account',
+    'ka10074': 'account',
+    'ka10075': 'account',
+    'ka10076': 'account',
+    'ka10077': 'account',
+    'ka10085': 'account',
+}
+
+GLOBAL_BUCKET = 'global'
+DEFAULT_GROUP = 'market'
+
+# 스레드별 호출 마감 시각 (time.monotonic 기준)
+_call_context = threading.local()
+
+
+class DeadlineExceeded(RateLimitError):
+    """호출 마감 시각 전에 토큰을 얻을 수 없어 호출하지 않음"""
+    pass
+
+
+@contextmanager
+def call_deadline(deadline: Optional[float]) -> Iterator[None]:
+    """
+    현재 스레드의 API 호출 마감 시각 설정
+
+    블록 안에서 RateLimiter.acquire()는 마감 시각까지 토큰을 얻을 수 없으면
+    예약을 되돌리고 DeadlineExceeded를 발생시킨다 (마감 지난 요청이 공용 한도를 쓰지 않음).
+
+    Args:
+        deadline: 마감 시각 (time.monotonic 기준, None이면 제한 없음)
+    """
+    previous = getattr(_call_context, 'deadline', None)
+    _call_context.deadline = deadline
+    try:
+        yield
+    finally:
+        _call_context.deadline = previous
+
+
+def current_deadline() -> Optional[float]:
+    """현재 스레드의 API 호출 마감 시각 (call_deadline 블록 밖이면 None)"""
+    return getattr(_call_context, 'deadline', None)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (예약 방식)
+
+    토큰이 부족하면 잔량을 음수로 예약하고 필요한 대기 시간을 반환한다.
+    대기(sleep)는 락 밖에서 수행하므로 다른 버킷 호출을 막지 않는다.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {name}={rate}")
+
+        self.name = name
+        self.rate = float(rate)
+        self.capacity = float(max(capacity, 1))
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+
+        self.reset_stats()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰 예약
+
+        Returns:
+            호출 전 대기해야 하는 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self._acquired += tokens
+            if wait > 0:
+                self._waited += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def refund(self, tokens: float = 1.0):
+        """예약 취소 (reserve로 가져간 토큰 반환)"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+            self._acquired -= tokens
+
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(self._tokens, 0.0)
+
+    def reset_stats(self):
+        """통계 초기화"""
+        self._stats_start = time.monotonic()
+        self._acquired = 0.0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버킷 통계 (대기 시간, 사용률)"""
+        with self._lock:
+            elapsed = max(time.monotonic() - self._stats_start, 1e-9)
+            budget = self.rate * elapsed + self.capacity
+            acquired = self._acquired
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'acquired': int(acquired),
+                'waited': self._waited,
+                'total_wait': round(self._total_wait, 4),
+                'avg_wait': round(self._total_wait / acquired, 4) if acquired else 0.0,
+                'max_wait': round(self._max_wait, 4),
+                'utilization': round(min(acquired / budget, 1.0), 4),
+                'calls_per_sec': round(acquired / elapsed, 3),
+            }
+
+
+class RateLimiter:
+    """
+    API 그룹별 토큰 버킷 속도 제한기
+
+    - priority 그룹: 자기 버킷만 사용 (스캐너 트래픽과 분리된 레인)
+    - 일반 그룹: 자기 버킷 + GLOBAL 버킷 (기존 REST_CALL_INTERVAL 총량 유지)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: API_RATE_LIMIT 설정 딕셔너리
+        """
+        config = config or {}
+
+        interval = config.get('REST_CALL_INTERVAL', 0.3)
+        global_rate = config.get('GLOBAL_RATE') or (1.0 / interval if interval > 0 else 0)
+
+        self.path_groups = {**DEFAULT_PATH_GROUPS, **config.get('PATH_GROUPS', {})}
+        self.api_groups = {**DEFAULT_API_GROUPS, **config.get('API_GROUPS', {})}
+        self.default_group = config.get('DEFAULT_GROUP', DEFAULT_GROUP)
+
+        bucket_config = {**DEFAULT_BUCKETS, **config.get('BUCKETS', {})}
+        if self.default_group not in bucket_config:
+            bucket_config[self.default_group] = {'rate': global_rate or 1.0, 'capacity': 1}
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.priority_groups = set()
+        for name, spec in bucket_config.items():
+            self.buckets[name] = TokenBucket(name, spec['rate'], spec.get('capacity', 1))
+            if spec.get('priority'):
+                self.priority_groups.add(name)
+
+        # 일반 그룹 공용 한도 (0이면 비활성화)
+        self.global_bucket: Optional[TokenBucket] = None
+        if global_rate > 0:
+            self.global_bucket = TokenBucket(
+                GLOBAL_BUCKET, global_rate, config.get('GLOBAL_CAPACITY', 1)
+            )
+
+        logger.info(
+            f"RateLimiter 초기화: 그룹 {list(self.buckets)} "
+            f"(우선순위 레인: {sorted(self.priority_groups)}, "
+            f"공용 한도: {global_rate:.2f}/s)"
+        )
+
+    def resolve_group(self, api_id: str, path: str = '') -> str:
+        """API ID / 경로로 버킷 그룹 결정"""
+        group = self.api_groups.get(api_id)
+        if group:
+            return group
+
+        if path:
+            segment = path.rstrip('/').rsplit('/', 1)[-1]
+            group = self.path_groups.get(segment)
+            if group:
+                return group
+
+        return self.default_group
+
+    def _buckets_for(self, group: str) -> List[TokenBucket]:
+        """그룹 호출이 거치는 버킷 (자기 버킷 + 일반 그룹이면 GLOBAL)"""
+        buckets = [self.buckets.get(group) or self.buckets[self.default_group]]
+        if self.global_bucket is not None and group not in self.priority_groups:
+            buckets.append(self.global_bucket)
+        return buckets
+
+    def reserve(self, api_id: str, path: str = '') -> float:
+        """
+        호출 토큰 예약 (대기하지 않음)
+
+        Returns:
+            호출 전 대기해야 하는 시간 (초)
+        """
+        group = self.resolve_group(api_id, path)
+        wait = max(bucket.reserve() for bucket in self._buckets_for(group))
+
+        if wait > 0:
+            logger.debug(f"API 속도 제한 [{group}] {api_id}: {wait:.3f}초 대기")
+        return wait
+
+    def release(self, api_id: str, path: str = ''):
+        """reserve()로 예약한 토큰 반환 (호출하지 않기로 한 경우)"""
+        for bucket in self._buckets_for(self.resolve_group(api_id, path)):
+            bucket.refund()
+
+    def acquire(self, api_id: str, path: str = '') -> float:
+        """
+        호출 토큰 획득 (필요 시 대기)
+
+        call_deadline() 블록 안이면 마감 시각까지 토큰을 얻을 수 없을 때
+        예약을 반환하고 DeadlineExceeded를 발생시킨다.
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self._reserve_by_deadline(api_id, path)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, api_id: str, path: str = '') -> float:
+        """
+        호출 토큰 획득 (asyncio 버전, 이벤트 루프를 막지 않음)
+
+        마감 시각 처리는 acquire()와 같다.
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self._reserve_by_deadline(api_id, path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _reserve_by_deadline(self, api_id: str, path: str) -> float:
+        """토큰 예약 후 대기 시간 반환 (마감 전 획득 불가 시 반환하고 DeadlineExceeded)"""
+        deadline = current_deadline()
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded(f"호출 마감 시각 경과: {api_id}")
+
+        wait = self.reserve(api_id, path)
+        if deadline is not None and time.monotonic() + wait > deadline:
+            self.release(api_id, path)
+            raise DeadlineExceeded(f"마감 전 토큰 획득 불가 ({wait:.3f}초 대기 필요): {api_id}")
+        return wait
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """버킷별 통계"""
+        stats = {name: bucket.get_stats() for name, bucket in self.buckets.items()}
+        if self.global_bucket is not None:
+            stats[GLOBAL_BUCKET] = self.global_bucket.get_stats()
+        for name in stats:
+            stats[name]['priority'] = name in self.priority_groups
+        return stats
+
+    def reset_stats(self):
+        """모든 버킷 통계 초기화"""
+        for bucket in self.buckets.values():
+            bucket.reset_stats()
+        if self.global_bucket is not None:
+            self.global_bucket.reset_stats()
+
+
+__all__ = ['TokenBucket', 'RateLimiter', 'DeadlineExceeded', 'call_deadline', 'current_deadline']
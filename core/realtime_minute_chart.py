@@ -2,52 +2,184 @@
 실시간 분봉 차트 생성기
 
 WebSocket으로 받은 체결 데이터를 1분 단위로 집계하여 OHLCV 생성
+- 종목별 고정 크기 NumPy 링 버퍼 (추가 / 만료 O(1), 조회는 복사 없는 슬라이스)
+- 3/5/15/30/60분봉은 체결마다 증분 집계
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+
+import numpy as np
 
 from utils.logger_new import get_logger
 
 logger = get_logger()
 
 
-@dataclass
-class MinuteCandle:
-    """1분봉 캔들"""
-    timestamp: datetime
-    open: int = 0
-    high: int = 0
-    low: int = 999999999
-    close: int = 0
-    volume: int = 0
-
-    def update(self, price: int, volume: int):
-        """체결 데이터로 캔들 업데이트"""
-        if self.open == 0:
-            self.open = price
-
-        self.high = max(self.high, price)
-        self.low = min(self.low, price)
-        self.close = price
-        self.volume += volume
-
-    def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
+# 증분 집계하는 파생 분봉 주기 (분)
+DERIVED_PERIODS = (3, 5, 15, 30, 60)
+
+
+class CandleBuffer:
+    """
+    고정 크기 OHLCV 링 버퍼
+
+    각 행을 [i]와 [i + capacity] 두 곳에 기록(미러링)하므로 가장 오래된
+    캔들부터 최신 캔들까지가 항상 연속 구간이 되고, 조회 결과는 복사 없는
+    슬라이스 뷰로 반환된다. 뷰는 다음 update 전까지만 유효하다.
+
+    to_dicts() 결과는 다음 기록 전까지 캐시된다 (반복 조회 시 재생성 없음).
+    """
+
+    FIELDS = ('date', 'time', 'open', 'high', 'low', 'close', 'volume', 'timestamp')
+    DATE, TIME, OPEN, HIGH, LOW, CLOSE, VOLUME, TIMESTAMP = range(8)
+
+    def __init__(self, capacity: int = 390, period: int = 1):
+        """
+        Args:
+            capacity: 최대 캔들 수
+            period: 캔들 주기 (분)
+        """
+        self.capacity = max(int(capacity), 1)
+        self.period = max(int(period), 1)
+        self._data = np.zeros((self.capacity * 2, len(self.FIELDS)), dtype=np.int64)
+        self._start = 0
+        self._size = 0
+        self._last_key = None  # 마지막 캔들 (date, time)
+        self._last_row: List[int] = []  # 마지막 캔들 값 (배열 재조회 없이 갱신)
+        self._last_pos = 0
+        self._version = 0  # 기록마다 증가 (to_dicts 캐시 무효화)
+        self._dicts_cache = (-1, None, [])  # (version, count, 결과)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _write(self, pos: int, row):
+        """행 기록 (미러 포함)"""
+        self._data[pos] = row
+        self._data[pos + self.capacity] = row
+        self._version += 1
+
+    def update(self, minute: datetime, price: int, volume: int) -> bool:
+        """
+        체결 반영
+
+        Args:
+            minute: 체결 시각 (분 단위)
+            price: 체결가
+            volume: 체결량
+
+        Returns:
+            반영 여부 (이미 만료된 과거 구간이면 False)
+        """
+        minute_of_day = minute.hour * 60 + minute.minute
+        minute_of_day -= minute_of_day % self.period
+        date = minute.year * 10000 + minute.month * 100 + minute.day
+        time_ = (minute_of_day // 60) * 10000 + (minute_of_day % 60) * 100
+        key = (date, time_)
+
+        if key == self._last_key:
+            row = self._last_row
+            if price > row[self.HIGH]:
+                row[self.HIGH] = price
+            if price < row[self.LOW]:
+                row[self.LOW] = price
+            row[self.CLOSE] = price
+            row[self.VOLUME] += volume
+            self._write(self._last_pos, row)
+            return True
+
+        if self._last_key is None or key > self._last_key:
+            # 새 캔들 (가득 찼으면 가장 오래된 캔들 자리에 기록)
+            if self._size < self.capacity:
+                pos = (self._start + self._size) % self.capacity
+                self._size += 1
+            else:
+                pos = self._start
+                self._start = (self._start + 1) % self.capacity
+
+            timestamp = int(datetime(
+                minute.year, minute.month, minute.day, minute_of_day // 60, minute_of_day % 60
+            ).timestamp())
+            self._last_row = [date, time_, price, price, price, price, volume, timestamp]
+            self._last_key = key
+            self._last_pos = pos
+            self._write(pos, self._last_row)
+            return True
+
+        # 늦게 도착한 과거 체결: 버퍼에 남아 있는 구간이면 갱신
+        view = self.view()
+        match = np.flatnonzero((view[:, self.DATE] == date) & (view[:, self.TIME] == time_))
+        if not len(match):
+            return False
+
+        pos = (self._start + int(match[0])) % self.capacity
+        row = self._data[pos].tolist()
+        row[self.HIGH] = max(row[self.HIGH], price)
+        row[self.LOW] = min(row[self.LOW], price)
+        row[self.CLOSE] = price
+        row[self.VOLUME] += volume
+        self._write(pos, row)
+        return True
+
+    def view(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        최근 count개 캔들 (시간순, 읽기 전용 뷰)
+
+        Returns:
+            (count, 8) 배열 - 열 순서는 FIELDS
+        """
+        if count is None or count > self._size:
+            count = self._size
+        end = self._start + self._size
+        view = self._data[end - count:end]
+        view.flags.writeable = False
+        return view
+
+    def columns(self, count: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """최근 count개 캔들의 열별 뷰 (복사 없음)"""
+        view = self.view(count)
+        return {name: view[:, i] for i, name in enumerate(self.FIELDS)}
+
+    @staticmethod
+    def _to_dict(row) -> Dict[str, Any]:
+        """캔들 행 → 딕셔너리"""
+        date, time_, o, h, l, c, v, ts = row
         return {
-            'date': self.timestamp.strftime('%Y%m%d'),
-            'time': self.timestamp.strftime('%H%M%S'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'timestamp': int(self.timestamp.timestamp())
+            'date': str(date),
+            'time': f"{time_:06d}",
+            'open': o,
+            'high': h,
+            'low': l,
+            'close': c,
+            'volume': v,
+            'timestamp': ts
         }
 
+    def to_dicts(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        최근 count개 캔들을 딕셔너리 리스트로 변환
+
+        같은 count로 다시 조회하면 다음 기록 전까지 캐시된 딕셔너리를 재사용한다
+        (딕셔너리는 캐시와 공유되므로 수정하지 말 것). 반복 조회가 잦은 경로는
+        columns()로 열 배열을 직접 읽는다.
+        """
+        version = self._version
+        cached_version, cached_count, cached = self._dicts_cache
+        if cached_version == version and cached_count == count:
+            return list(cached)
+
+        result = [self._to_dict(row) for row in self.view(count).tolist()]
+        self._dicts_cache = (version, count, result)
+        return list(result)
+
+    def last(self) -> Optional[Dict[str, Any]]:
+        """최신 캔들"""
+        if not self._size:
+            return None
+        return self._to_dict(self._data[self._last_pos].tolist())
+
 
 class RealtimeMinuteChart:
     """실시간 분봉 차트 생성기"""
@@ -64,14 +196,21 @@ class RealtimeMinuteChart:
         self.ws_manager = websocket_manager
 
         # 분봉 데이터 저장 (최대 1일치: 390분 = 6.5시간)
-        self.candles: Dict[datetime, MinuteCandle] = {}
         self.max_candles = 390  # 09:00 ~ 15:30
+        self.candles = CandleBuffer(self.max_candles)
+
+        # 파생 분봉 (3/5/15/30/60분) - 체결마다 증분 집계
+        self.derived: Dict[int, CandleBuffer] = {
+            period: CandleBuffer(self.max_candles // period + 1, period=period)
+            for period in DERIVED_PERIODS
+        }
 
         # 현재 처리 중인 분봉 타임스탬프
         self.current_minute = None
 
         # 구독 상태
         self.is_subscribed = False
+        self._subscription = None  # 라우터 구독자 (이 종목 체결만 수신)
 
         logger.info(f"RealtimeMinuteChart 초기화: {stock_code}")
 
@@ -104,8 +243,10 @@ class RealtimeMinuteChart:
             )
 
             if success:
-                # 콜백 등록
-                self.ws_manager.register_callback('0B', self._on_tick)
+                # 콜백 등록 (종목별 라우팅 → 다른 종목 체결은 전달되지 않음)
+                self._subscription = self.ws_manager.register_callback(
+                    '0B', self._on_tick, stock_code=self.stock_code
+                )
                 self.is_subscribed = True
                 logger.info(f"✅ {self.stock_code} 실시간 분봉 수집 시작")
                 return True
@@ -124,6 +265,9 @@ class RealtimeMinuteChart:
 
         try:
             await self.ws_manager.unsubscribe(f"minute_{self.stock_code}")
+            if self._subscription is not None:
+                self.ws_manager.unregister_callback(self._subscription)
+                self._subscription = None
             self.is_subscribed = False
             logger.info(f"✅ {self.stock_code} 실시간 분봉 수집 중지")
         except Exception as e:
@@ -146,11 +290,6 @@ class RealtimeMinuteChart:
                 }
         """
         try:
-            # 종목 필터링
-            item_code = data.get('item', '')
-            if item_code != self.stock_code:
-                return
-
             values = data.get('values', {})
 
             # 체결 데이터 파싱
@@ -179,58 +318,61 @@ class RealtimeMinuteChart:
             if now.hour < 8 or now.hour >= 20:
                 return
 
-            # 분봉 업데이트
-            if now not in self.candles:
-                # 새로운 분봉 생성
-                self.candles[now] = MinuteCandle(timestamp=now)
-
-                # 오래된 데이터 제거 (최대 390개 유지)
-                if len(self.candles) > self.max_candles:
-                    oldest = min(self.candles.keys())
-                    del self.candles[oldest]
+            # 분봉 업데이트 (가득 차면 가장 오래된 분봉 자동 만료)
+            if not self.candles.update(now, price, volume):
+                return
 
-                logger.debug(f"새 분봉 생성: {now.strftime('%H:%M')} (총 {len(self.candles)}개)")
+            for buffer in self.derived.values():
+                buffer.update(now, price, volume)
 
-            # 캔들 업데이트
-            self.candles[now].update(price, volume)
-            self.current_minute = now
+            if self.current_minute is None or now > self.current_minute:
+                self.current_minute = now
 
         except Exception as e:
             logger.error(f"체결 데이터 처리 오류: {e}")
 
-    def get_minute_data(self, minutes: int = 60) -> List[Dict[str, Any]]:
+    def _buffer(self, period: int) -> CandleBuffer:
+        """주기별 캔들 버퍼"""
+        if period == 1:
+            return self.candles
+        if period not in self.derived:
+            raise ValueError(f"지원하지 않는 분봉 주기: {period} (가능: 1, {DERIVED_PERIODS})")
+        return self.derived[period]
+
+    def get_minute_data(self, minutes: int = 60, period: int = 1) -> List[Dict[str, Any]]:
         """
-        최근 N분 데이터 조회
+        최근 N개 분봉 데이터 조회
 
         Args:
             minutes: 조회할 분봉 개수
+            period: 분봉 주기 (1, 3, 5, 15, 30, 60)
 
         Returns:
             분봉 데이터 리스트 (시간순 정렬)
         """
-        if not self.candles:
-            return []
+        return self._buffer(period).to_dicts(minutes)
 
-        # 시간순 정렬
-        sorted_candles = sorted(self.candles.items(), key=lambda x: x[0])
+    def get_minute_arrays(self, minutes: int = 60, period: int = 1) -> Dict[str, np.ndarray]:
+        """
+        최근 N개 분봉 데이터 조회 (열별 NumPy 뷰, 복사 없음)
 
-        # 최근 N개 추출
-        recent_candles = sorted_candles[-minutes:] if len(sorted_candles) > minutes else sorted_candles
+        Args:
+            minutes: 조회할 분봉 개수
+            period: 분봉 주기 (1, 3, 5, 15, 30, 60)
 
-        # 딕셔너리로 변환
-        return [candle.to_dict() for timestamp, candle in recent_candles]
+        Returns:
+            {'date', 'time', 'open', 'high', 'low', 'close', 'volume', 'timestamp'} 읽기 전용 배열
+        """
+        return self._buffer(period).columns(minutes)
 
-    def get_current_candle(self) -> Optional[Dict[str, Any]]:
+    def get_current_candle(self, period: int = 1) -> Optional[Dict[str, Any]]:
         """
         현재 진행 중인 분봉 조회
 
         Returns:
             현재 분봉 데이터 또는 None
         """
-        if not self.current_minute or self.current_minute not in self.candles:
-            return None
-
-        return self.candles[self.current_minute].to_dict()
+        return self._buffer(period).last()
 
     def get_candle_count(self) -> int:
         """저장된 분봉 개수 반환"""
@@ -293,13 +435,14 @@ class RealtimeMinuteChartManager:
 
         logger.info(f"✅ {stock_code} 실시간 분봉 제거")
 
-    def get_minute_data(self, stock_code: str, minutes: int = 60) -> List[Dict[str, Any]]:
+    def get_minute_data(self, stock_code: str, minutes: int = 60, period: int = 1) -> List[Dict[str, Any]]:
         """
         특정 종목의 분봉 데이터 조회
 
         Args:
             stock_code: 종목코드
             minutes: 조회할 분봉 개수
+            period: 분봉 주기 (1, 3, 5, 15, 30, 60)
 
         Returns:
             분봉 데이터 리스트
@@ -307,7 +450,24 @@ class RealtimeMinuteChartManager:
         if stock_code not in self.charts:
             return []
 
-        return self.charts[stock_code].get_minute_data(minutes)
+        return self.charts[stock_code].get_minute_data(minutes, period)
+
+    def get_minute_arrays(self, stock_code: str, minutes: int = 60, period: int = 1) -> Dict[str, np.ndarray]:
+        """
+        특정 종목의 분봉 데이터 조회 (열별 NumPy 뷰)
+
+        Args:
+            stock_code: 종목코드
+            minutes: 조회할 분봉 개수
+            period: 분봉 주기 (1, 3, 5, 15, 30, 60)
+
+        Returns:
+            열별 읽기 전용 배열 (종목이 없으면 빈 딕셔너리)
+        """
+        if stock_code not in self.charts:
+            return {}
+
+        return self.charts[stock_code].get_minute_arrays(minutes, period)
 
     def get_current_candle(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -337,7 +497,9 @@ class RealtimeMinuteChartManager:
                 code: {
                     'subscribed': chart.is_subscribed,
                     'candle_count': chart.get_candle_count(),
-                    'current_minute': chart.current_minute.strftime('%H:%M') if chart.current_minute else None
+                    'current_minute': chart.current_minute.strftime('%H:%M') if chart.current_minute else None,
+                    'queue_depth': chart._subscription.queue.qsize() if chart._subscription else 0,
+                    'dropped': chart._subscription.dropped if chart._subscription else 0
                 }
                 for code, chart in self.charts.items()
             }
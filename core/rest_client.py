@@ -12,6 +12,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 
+from .rate_limiter import RateLimiter
 from .exceptions import (
     AuthenticationError,
     TokenExpiredError,
@@ -63,14 +64,14 @@ class KiwoomRESTClient:
             # HTTP 세션 생성
             self.session = self._create_session()
             
-            # 토큰 관리
+            # 토큰 관리 (동기/비동기 클라이언트 공유)
             self.token: Optional[str] = None
             self.token_expiry: datetime.datetime = datetime.datetime.now()
+            self.token_lock = threading.Lock()
+            self.token_generation = 0  # 토큰 발급마다 +1 (401 동시 갱신 중복 방지)
             
-            # 속도 제한 관리
-            self.rate_limit_lock = threading.Lock()
-            self.min_call_interval = 0.3  # config에서 가져오도록 수정 가능
-            self.last_call_time = 0.0
+            # 속도 제한 관리 (API 그룹별 토큰 버킷)
+            self.rate_limiter = RateLimiter(self.rate_limit_config)
             
             # 에러 메시지
             self.last_error_msg: Optional[str] = None
@@ -100,6 +101,7 @@ class KiwoomRESTClient:
             self.min_call_interval = API_RATE_LIMIT.get('REST_CALL_INTERVAL', 0.3)
             self.max_retries = API_RATE_LIMIT.get('REST_MAX_RETRIES', 3)
             self.retry_backoff = API_RATE_LIMIT.get('REST_RETRY_BACKOFF', 1.0)
+            self.rate_limit_config = API_RATE_LIMIT
 
             # 중요: NXT 시간외 거래는 실제 운영 서버(api.kiwoom.com)에서만 가능
             # 모의투자 서버(mockapi.kiwoom.com)는 KRX만 지원
@@ -122,6 +124,7 @@ class KiwoomRESTClient:
             self.min_call_interval = 0.3
             self.max_retries = 3
             self.retry_backoff = 1.0
+            self.rate_limit_config = {'REST_CALL_INTERVAL': self.min_call_interval}
     
     def _create_session(self) -> requests.Session:
         """재시도 기능이 있는 HTTP 세션 생성"""
@@ -217,6 +220,31 @@ class KiwoomRESTClient:
             logger.exception("토큰 발급 중 예외 발생")
             return False
     
+    def ensure_token(self, force: bool = False, generation: Optional[int] = None) -> bool:
+        """
+        유효한 토큰 보장 (스레드 안전, 동시 갱신 1회로 제한)
+
+        Args:
+            force: True면 기존 토큰을 버리고 재발급
+            generation: 호출자가 요청에 쓴 토큰의 token_generation (None 이면 호출 시점 값).
+                락을 얻었을 때 이미 바뀌었으면 다른 호출이 재발급한 것이므로 재발급 생략
+
+        Returns:
+            성공 여부
+        """
+        if not force and self._is_token_valid():
+            return True
+
+        if generation is None:
+            generation = self.token_generation
+
+        with self.token_lock:
+            if force:
+                if self.token_generation != generation and self._is_token_valid():
+                    return True
+                self.token = None
+            return self._get_token()
+
     def _process_token_response(self, token_data: Dict[str, Any]) -> bool:
         """토큰 응답 처리"""
         access_token = token_data.get('token')
@@ -231,6 +259,7 @@ class KiwoomRESTClient:
         try:
             self.token = access_token
             self.token_expiry = datetime.datetime.strptime(expires_dt_str, '%Y%m%d%H%M%S')
+            self.token_generation += 1
             
             logger.info(f"토큰 발급 성공 (만료: {self.token_expiry.strftime('%Y-%m-%d %H:%M:%S')})")
             self.last_error_msg = None
@@ -280,18 +309,18 @@ class KiwoomRESTClient:
         finally:
             self.token = None
     
-    def _handle_rate_limit(self):
-        """API 호출 속도 제한 처리"""
-        with self.rate_limit_lock:
-            current_time = time.monotonic()
-            elapsed = current_time - self.last_call_time
-            wait_time = self.min_call_interval - elapsed
-            
-            if wait_time > 0:
-                logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기")
-                time.sleep(wait_time)
-            
-            self.last_call_time = time.monotonic()
+    def _handle_rate_limit(self, api_id: str = '', path: str = ''):
+        """API 호출 속도 제한 처리 (API 그룹별 토큰 버킷)"""
+        self.rate_limiter.acquire(api_id, path)
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        버킷별 속도 제한 통계
+
+        Returns:
+            {그룹: {'acquired', 'waited', 'avg_wait', 'max_wait', 'utilization', ...}}
+        """
+        return self.rate_limiter.get_stats()
     
     def _set_error(self, msg: str):
         """에러 메시지 설정"""
@@ -326,13 +355,12 @@ class KiwoomRESTClient:
             API 응답 딕셔너리
         """
         # 토큰 유효성 확인 및 갱신
-        if not self._is_token_valid():
-            if not self._get_token():
-                logger.error(f"API 호출 실패 ({api_id}): 토큰 갱신 불가")
-                return {
-                    "return_code": -401,
-                    "return_msg": f"토큰 갱신 실패: {self.last_error_msg}"
-                }
+        if not self.ensure_token():
+            logger.error(f"API 호출 실패 ({api_id}): 토큰 갱신 불가")
+            return {
+                "return_code": -401,
+                "return_msg": f"토큰 갱신 실패: {self.last_error_msg}"
+            }
         
         return self._execute_request(api_id, body, path, http_method, retry_on_auth=True)
     
@@ -358,9 +386,10 @@ class KiwoomRESTClient:
             API 응답 딕셔너리
         """
         # 속도 제한 처리
-        self._handle_rate_limit()
+        self._handle_rate_limit(api_id, path)
         
-        # 헤더 구성
+        # 헤더 구성 (401 시 같은 토큰으로 실패한 동시 요청의 중복 재발급 방지용 세대)
+        generation = self.token_generation
         headers = {
             "Content-Type": "application/json; charset=utf-8",
             "authorization": f"Bearer {self.token}",
@@ -368,18 +397,10 @@ class KiwoomRESTClient:
         }
         
         # URL 구성
-        # path에 전체 경로가 없으면 /api/dostk/ prefix 추가
-        if path.startswith('/api/dostk/'):
-            # 이미 전체 경로인 경우
-            url = f"{self.base_url}{path}"
-        elif path.startswith('/'):
-            # 슬래시로 시작하지만 /api/dostk/ 없는 경우
-            url = f"{self.base_url}{path}"
-        else:
-            # 상대 경로인 경우 (예: "acnt", "inquire/dailyprice")
-            url = f"{self.base_url}/api/dostk/{path}"
+        url = self.build_url(path)
 
-        logger.debug(f"[REST] {http_method} {url} (API ID: {api_id})")
+        # 핫패스: 지연 포맷 (레벨이 꺼져 있으면 문자열을 만들지 않음)
+        logger.debug("[REST] %s %s (API ID: %s)", http_method, url, api_id)
         
         try:
             # 요청 본문 준비
@@ -399,7 +420,7 @@ class KiwoomRESTClient:
                 }
             
             elapsed_ms = (time.monotonic() - start_time) * 1000
-            logger.info(f"[REST 응답] {api_id} - 상태:{res.status_code}, 지연:{elapsed_ms:.2f}ms")
+            logger.debug("[REST 응답] %s - 상태:%s, 지연:%.2fms", api_id, res.status_code, elapsed_ms)
 
             # 에러 상태 코드일 경우 상세 로그
             if res.status_code >= 400:
@@ -417,9 +438,8 @@ class KiwoomRESTClient:
             # 401 에러 처리 (토큰 갱신 후 재시도)
             if res.status_code == 401 and retry_on_auth:
                 logger.warning(f"401 에러 - 토큰 갱신 후 재시도 ({api_id})")
-                self.token = None
                 
-                if self._get_token():
+                if self.ensure_token(force=True, generation=generation):
                     return self._execute_request(api_id, body, path, http_method, retry_on_auth=False)
                 else:
                     return {
@@ -454,6 +474,18 @@ class KiwoomRESTClient:
             logger.error(f"예외 발생 ({api_id}): {e}", exc_info=True)
             return {"return_code": -104, "return_msg": f"내부 오류: {e}"}
     
+    def build_url(self, path: str) -> str:
+        """
+        API 경로 → 전체 URL
+
+        path에 전체 경로가 없으면 /api/dostk/ prefix 추가
+        """
+        if path.startswith('/'):
+            # 이미 전체 경로(/api/dostk/...)이거나 슬래시로 시작하는 경우
+            return f"{self.base_url}{path}"
+        # 상대 경로인 경우 (예: "acnt", "inquire/dailyprice")
+        return f"{self.base_url}/api/dostk/{path}"
+
     def _process_api_response(self, res: requests.Response, api_id: str) -> Dict[str, Any]:
         """API 응답 처리"""
         try:
@@ -466,16 +498,20 @@ class KiwoomRESTClient:
                 "response_text": res.text[:200]
             }
         
+        return self._check_result(result_data, api_id)
+
+    def _check_result(self, result_data: Dict[str, Any], api_id: str) -> Dict[str, Any]:
+        """API 응답 본문 검사 및 로깅 (동기/비동기 클라이언트 공용)"""
         return_code = result_data.get('return_code', 0)
         return_msg = result_data.get('return_msg', '메시지 없음')
 
         if return_code != 0:
             logger.warning(f"API 로직 오류 ({api_id}): {return_msg} (코드: {return_code})")
-            logger.debug(f"전체 응답: {result_data}")
+            logger.debug("전체 응답: %s", result_data)
         else:
-            logger.info(f"API 호출 성공 ({api_id})")
+            logger.debug("API 호출 성공 (%s)", api_id)
             # output 데이터 유무 로깅
-            if 'output' in result_data:
+            if 'output' in result_data and logger.isEnabledFor(logging.DEBUG):
                 output_data = result_data['output']
                 if isinstance(output_data, list):
                     logger.debug(f"  output: 리스트 {len(output_data)}개 항목")
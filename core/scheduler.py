@@ -0,0 +1,250 @@
+"""
+core/scheduler.py
+작업별 주기 / 트리거 기반 스케줄러
+
+- 작업마다 전용 스레드 → 긴 Deep Scan이 매도 검토를 막지 않음
+- 고정 주기(fixed-rate) 실행 + 외부 트리거(예: 실시간 체결 틱) 즉시 실행
+- 실행 중 들어온 트리거는 1회로 합쳐 직후에 실행, min_gap으로 과도한 재실행 방지
+- 작업별 실행 시간 / 지연(lag) / 주기 초과(overrun) / 오류 통계
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledTask:
+    """
+    스케줄 작업 (전용 워커 스레드에서 실행)
+
+    다음 실행 시각 = 직전 시작 시각 + interval.
+    실행 시간이 interval을 넘으면 overrun으로 집계하고, 밀린 회차는
+    몰아서 실행하지 않고 바로 다음 1회만 실행한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: Optional[float],
+        min_gap: float = 0.0,
+        condition: Optional[Callable[[], bool]] = None,
+        run_immediately: bool = True,
+        history: int = 200
+    ):
+        """
+        Args:
+            name: 작업 이름
+            func: 실행 함수
+            interval: 실행 주기 (초, None이면 트리거로만 실행)
+            min_gap: 트리거 실행 간 최소 간격 (초)
+            condition: False를 반환하면 이번 회차 건너뜀 (예: 일시정지)
+            run_immediately: 시작 직후 1회 실행 여부
+            history: 실행 시간 통계 보관 개수
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.min_gap = min_gap
+        self.condition = condition
+
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next_due = time.monotonic() if run_immediately or interval is None else time.monotonic() + interval
+        self._triggered = False
+        self._trigger_reason = ''
+        self._trigger_time = 0.0
+        self._last_start = 0.0
+
+        self.runs = 0
+        self.skipped = 0
+        self.errors = 0
+        self.triggers = 0
+        self.overruns = 0
+        self.running = False
+        self.last_error: Optional[str] = None
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.max_lag = 0.0
+        self._durations: Deque[float] = deque(maxlen=history)
+        self._lags: Deque[float] = deque(maxlen=history)
+
+    def trigger(self, reason: str = ''):
+        """즉시 실행 요청 (실행 중이면 종료 직후 1회 실행)"""
+        self.triggers += 1
+        if not self._triggered:
+            self._trigger_time = time.monotonic()
+        self._triggered = True
+        self._trigger_reason = reason
+        self._wakeup.set()
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        """다음 실행까지 대기 시간 (None이면 트리거까지 무기한)"""
+        if self._triggered:
+            return max(self._last_start + self.min_gap - now, 0.0)
+        if self.interval is None:
+            return None
+        return max(self._next_due - now, 0.0)
+
+    def run_once(self, reason: str = 'manual'):
+        """현재 스레드에서 1회 실행 (통계 포함)"""
+        start = time.monotonic()
+        # 지연(lag): 예정 시각(트리거 실행은 트리거 시각)부터 실제 시작까지
+        due = self._trigger_time if self._triggered else self._next_due
+        self._triggered = False
+        self._last_start = start
+
+        if self.condition is not None and not self.condition():
+            self.skipped += 1
+        else:
+            lag = max(start - due, 0.0)
+            self._lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+            self.running = True
+            try:
+                self.func()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+                logger.error(f"❌ 작업 실행 오류 ({self.name}, {reason}): {e}", exc_info=True)
+            finally:
+                self.running = False
+
+            duration = time.monotonic() - start
+            self.runs += 1
+            self.last_duration = duration
+            self.max_duration = max(self.max_duration, duration)
+            self._durations.append(duration)
+            if self.interval is not None and duration > self.interval:
+                self.overruns += 1
+                logger.warning(f"⚠️ 작업 주기 초과: {self.name} {duration:.1f}초 (주기 {self.interval}초)")
+
+        if self.interval is not None:
+            self._next_due = max(start + self.interval, time.monotonic())
+
+    def _loop(self, stop_event: threading.Event):
+        while not stop_event.is_set():
+            timeout = self._wait_time(time.monotonic())
+            if timeout is None or timeout > 0:
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+                if stop_event.is_set():
+                    break
+                timeout = self._wait_time(time.monotonic())
+                if timeout is None or timeout > 0:
+                    continue
+
+            reason = self._trigger_reason if self._triggered else 'schedule'
+            self.run_once(reason)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 통계 (초 단위)"""
+        durations = sorted(list(self._durations))
+        lags = list(self._lags)
+        return {
+            'interval': self.interval,
+            'runs': self.runs,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'triggers': self.triggers,
+            'overruns': self.overruns,
+            'running': self.running,
+            'last_duration': self.last_duration,
+            'avg_duration': sum(durations) / len(durations) if durations else 0.0,
+            'p95_duration': durations[int(len(durations) * 0.95)] if durations else 0.0,
+            'max_duration': self.max_duration,
+            'avg_lag': sum(lags) / len(lags) if lags else 0.0,
+            'max_lag': self.max_lag,
+            'last_error': self.last_error,
+        }
+
+
+class TaskScheduler:
+    """
+    작업 스케줄러
+
+    Usage:
+        scheduler = TaskScheduler()
+        scheduler.add_task('sell_check', bot._check_sell_signals, interval=10, min_gap=1)
+        scheduler.add_task('scan', bot._run_scanning_pipeline, interval=60)
+        scheduler.start()
+        ...
+        scheduler.trigger('sell_check', reason='tick:005930')
+    """
+
+    def __init__(self):
+        self.tasks: Dict[str, ScheduledTask] = {}
+        self._stop_event = threading.Event()
+        self._started = False
+
+    def add_task(self, name: str, func: Callable[[], Any], interval: Optional[float], **kwargs) -> ScheduledTask:
+        """
+        작업 등록 (인자는 ScheduledTask 참고)
+
+        Returns:
+            ScheduledTask
+        """
+        if name in self.tasks:
+            raise ValueError(f"이미 등록된 작업: {name}")
+        task = ScheduledTask(name, func, interval, **kwargs)
+        self.tasks[name] = task
+        if self._started:
+            self._start_task(task)
+        return task
+
+    def _start_task(self, task: ScheduledTask):
+        task._thread = threading.Thread(
+            target=task._loop, args=(self._stop_event,), name=f'task-{task.name}', daemon=True
+        )
+        task._thread.start()
+
+    def start(self):
+        """모든 작업 스레드 시작"""
+        self._stop_event.clear()
+        self._started = True
+        for task in self.tasks.values():
+            self._start_task(task)
+        logger.info(f"⏱️ 스케줄러 시작: {', '.join(self.tasks)}")
+
+    def trigger(self, name: str, reason: str = '') -> bool:
+        """작업 즉시 실행 요청"""
+        task = self.tasks.get(name)
+        if task is None:
+            return False
+        task.trigger(reason)
+        return True
+
+    def run_now(self, name: str):
+        """현재 스레드에서 작업 1회 실행 (시작 전 초기화 순서 보장용)"""
+        self.tasks[name].run_once('manual')
+
+    @property
+    def is_running(self) -> bool:
+        return self._started and not self._stop_event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """stop()까지 대기 (timeout 경과 시 False)"""
+        return self._stop_event.wait(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """모든 작업 중지 (실행 중인 작업은 끝날 때까지 최대 timeout 대기)"""
+        self._stop_event.set()
+        for task in self.tasks.values():
+            task._wakeup.set()
+        current = threading.current_thread()
+        for task in self.tasks.values():
+            if task._thread is not None and task._thread is not current:
+                task._thread.join(timeout)
+        self._started = False
+        logger.info("⏱️ 스케줄러 종료")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 실행 시간 / 지연 / 주기 초과 통계"""
+        return {name: task.get_stats() for name, task in self.tasks.items()}
+
+
+__all__ = ['ScheduledTask', 'TaskScheduler']
@@ -14,24 +14,121 @@ import asyncio
 import websockets
 import json
 import time
-from typing import Dict, Any, Optional, Callable, List
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Any, Optional, Callable, List, Deque
 from datetime import datetime
 
-from utils.logger_new import get_logger
+from utils.logger_new import get_logger, get_rate_limited_logger
+from core.ws_router import DispatchRouter, Subscription, DEFAULT_QUEUE_SIZE
 
 logger = get_logger()
 
+# 빠른 JSON 디코더 (선택적)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+class ReceiveStats:
+    """수신 루프 처리량 / 디코딩 지연 통계"""
+
+    # 디코딩 지연 히스토그램 상한 (마이크로초, 마지막 구간은 그 이상)
+    LATENCY_BUCKETS_US = (10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    def __init__(self, window: float = 1.0):
+        """
+        Args:
+            window: 초당 메시지 수 계산 구간 (초)
+        """
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """통계 초기화"""
+        now = time.monotonic()
+        self.started_at = now
+        self.messages = 0
+        self.batches = 0
+        self.max_batch = 0
+        self.decode_errors = 0
+        self.total_decode_us = 0.0
+        self.max_decode_us = 0.0
+        self.latency_counts = [0] * (len(self.LATENCY_BUCKETS_US) + 1)
+        self.msgs_per_sec = 0.0
+        self.peak_msgs_per_sec = 0.0
+        self._window_start = now
+        self._window_count = 0
+
+    def record_decode(self, elapsed: float):
+        """메시지 1건 디코딩 지연 기록 (초)"""
+        us = elapsed * 1_000_000
+        self.total_decode_us += us
+        if us > self.max_decode_us:
+            self.max_decode_us = us
+        self.latency_counts[bisect_left(self.LATENCY_BUCKETS_US, us)] += 1
+
+    def record_batch(self, size: int):
+        """배치 처리 기록 및 초당 메시지 수 갱신"""
+        self.messages += size
+        self.batches += 1
+        if size > self.max_batch:
+            self.max_batch = size
+
+        self._window_count += size
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= self.window:
+            self.msgs_per_sec = self._window_count / elapsed
+            self.peak_msgs_per_sec = max(self.peak_msgs_per_sec, self.msgs_per_sec)
+            self._window_start = now
+            self._window_count = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 딕셔너리"""
+        decoded = self.messages - self.decode_errors
+        labels = [f"<={b}us" for b in self.LATENCY_BUCKETS_US] + [f">{self.LATENCY_BUCKETS_US[-1]}us"]
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            'messages': self.messages,
+            'batches': self.batches,
+            'avg_batch': round(self.messages / self.batches, 2) if self.batches else 0.0,
+            'max_batch': self.max_batch,
+            'msgs_per_sec': round(self.msgs_per_sec, 1),
+            'peak_msgs_per_sec': round(self.peak_msgs_per_sec, 1),
+            'avg_msgs_per_sec': round(self.messages / elapsed, 1),
+            'decode_errors': self.decode_errors,
+            'avg_decode_us': round(self.total_decode_us / decoded, 2) if decoded > 0 else 0.0,
+            'max_decode_us': round(self.max_decode_us, 2),
+            'decode_latency_us': dict(zip(labels, self.latency_counts)),
+            'decoder': 'orjson' if ORJSON_AVAILABLE else 'json',
+        }
+
 
 class WebSocketManager:
     """WebSocket 실시간 시세 매니저"""
 
-    def __init__(self, access_token: str, base_url: str = "https://api.kiwoom.com"):
+    def __init__(
+        self,
+        access_token: str,
+        base_url: str = "https://api.kiwoom.com",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = 256,
+        log_sample_every: int = 1000
+    ):
         """
         WebSocketManager 초기화
 
         Args:
             access_token: API 액세스 토큰
             base_url: API 베이스 URL
+            queue_size: 구독자별 메시지 큐 크기
+            batch_size: 수신 루프가 한 번에 처리하는 최대 프레임 수
+            log_sample_every: 수신 메시지 디버그 로그 샘플링 간격 (N건당 1건)
         """
         self.access_token = access_token
         self.base_url = base_url
@@ -46,7 +143,19 @@ class WebSocketManager:
         self.is_connected = False
         self.is_logged_in = False
         self.subscriptions = {}  # {grp_no: subscription_info}
-        self.callbacks = {}  # {type: callback_function}
+        self.router = DispatchRouter(queue_size=queue_size)  # (type, code) → 구독자들
+
+        # 수신 루프 설정 / 통계
+        self.batch_size = max(batch_size, 1)
+        self.frame_queue_size = 10000  # 수신 프레임 버퍼 (가득 차면 소켓 읽기 대기)
+        self.log_sample_every = max(log_sample_every, 1)
+        self.receive_stats = ReceiveStats()
+        self._rate_logger = get_rate_limited_logger(5.0)
+
+        # 수신 루프의 읽기 태스크가 recv 중인 소켓 (이 소켓에는 동시 recv 금지)
+        self._reader_socket = None
+        # 구독(REG) 응답 대기자 - 수신 루프가 도착 순서대로 전달
+        self._ack_waiters: Deque[asyncio.Future] = deque()
 
         # 재연결 설정
         self.reconnect_delay = 5  # 재연결 대기 시간 (초)
@@ -190,18 +299,27 @@ class WebSocketManager:
                 }]
             }
 
-            print(f"📤 구독 요청 전송: {json.dumps(subscribe_request, ensure_ascii=False)}")
-            await self.websocket.send(json.dumps(subscribe_request))
-            logger.info(f"📤 구독 요청 전송: 종목={stock_codes}, 타입={types}, grp_no={grp_no}")
+            # 수신 루프가 소켓을 읽는 중이면 응답은 _process_batch가 전달 (recv 동시 호출 금지)
+            waiter = None
+            if self._reader_socket is not None and self._reader_socket is self.websocket:
+                waiter = asyncio.get_running_loop().create_future()
+                self._ack_waiters.append(waiter)
 
-            # 구독 응답 대기 (최대 2초)
-            print("⏳ 구독 응답 대기 중...")
-            subscribe_response = await asyncio.wait_for(
-                self.websocket.recv(),
-                timeout=2.0
-            )
+            print(f"📤 구독 요청 전송: {json.dumps(subscribe_request, ensure_ascii=False)}")
+            try:
+                await self.websocket.send(json.dumps(subscribe_request))
+                logger.info(f"📤 구독 요청 전송: 종목={stock_codes}, 타입={types}, grp_no={grp_no}")
+
+                # 구독 응답 대기 (최대 2초)
+                print("⏳ 구독 응답 대기 중...")
+                if waiter is None:
+                    subscribe_data = json.loads(await asyncio.wait_for(self.websocket.recv(), timeout=2.0))
+                else:
+                    subscribe_data = await asyncio.wait_for(waiter, timeout=2.0)
+            finally:
+                if waiter is not None and waiter in self._ack_waiters:
+                    self._ack_waiters.remove(waiter)
 
-            subscribe_data = json.loads(subscribe_response)
             print(f"📥 구독 응답: {json.dumps(subscribe_data, ensure_ascii=False)}")
 
             if subscribe_data.get('return_code') == 0:
@@ -236,22 +354,56 @@ class WebSocketManager:
             logger.error(f"❌ 구독 중 오류: {e}")
             return False
 
-    def register_callback(self, data_type: str, callback: Callable[[Dict[str, Any]], None]):
+    def register_callback(
+        self,
+        data_type: str,
+        callback: Callable[[Dict[str, Any]], None],
+        stock_code: Optional[str] = None,
+        maxsize: Optional[int] = None
+    ) -> Subscription:
         """
         실시간 데이터 콜백 등록
 
+        같은 타입 / 종목에 여러 콜백을 등록할 수 있으며, 각 콜백은 자기 큐와
+        워커에서 실행되므로 느린 콜백이 수신 루프를 막지 않는다.
+
         Args:
             data_type: 데이터 타입 (예: '0B', '0D', 'ALL')
             callback: 콜백 함수 (data를 인자로 받음)
+            stock_code: 종목코드 (None이면 전 종목)
+            maxsize: 큐 크기 (None이면 기본값)
+
+        Returns:
+            Subscription (unregister_callback에 사용)
+        """
+        subscription = self.router.subscribe(data_type, callback, stock_code=stock_code, maxsize=maxsize)
+        logger.info(f"콜백 등록: {data_type}" + (f" ({stock_code})" if stock_code else ""))
+        return subscription
+
+    def unregister_callback(self, subscription: Subscription) -> bool:
+        """
+        실시간 데이터 콜백 해제
+
+        Args:
+            subscription: register_callback이 반환한 Subscription
+
+        Returns:
+            해제 성공 여부
         """
-        self.callbacks[data_type] = callback
-        logger.info(f"콜백 등록: {data_type}")
+        return self.router.unsubscribe(subscription)
+
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """구독자별 큐 깊이 / 폐기 수 통계"""
+        return self.router.get_stats()
 
     async def receive_loop(self):
         """
         실시간 데이터 수신 루프
 
-        무한 루프로 실행되며, 데이터 수신 시 콜백 호출
+        - 소켓 읽기 태스크가 프레임을 버퍼에 쌓고, 이 루프는 쌓인 프레임을
+          batch_size개씩 꺼내 디코딩 / 분배한다 (타임아웃 폴링 없음)
+        - 메시지별 print / 재직렬화 없이 샘플링 + rate-limit 디버그 로그만 남김
+        - 처리량 / 디코딩 지연은 receive_stats (get_receive_stats)로 확인
         """
         if not self.is_connected or not self.is_logged_in:
             print("❌ receive_loop: WebSocket 미연결 또는 미로그인")
@@ -259,68 +411,135 @@ class WebSocketManager:
             return
 
         print("🔄 실시간 데이터 수신 시작")
-        logger.info("🔄 실시간 데이터 수신 시작")
+        logger.info(f"🔄 실시간 데이터 수신 시작 (decoder={'orjson' if ORJSON_AVAILABLE else 'json'}, batch={self.batch_size})")
 
         try:
-            message_count = 0
-            while self.is_connected:
+            while self.is_connected and self.websocket is not None:
+                websocket = self.websocket
+                frames: asyncio.Queue = asyncio.Queue(maxsize=self.frame_queue_size)
+                reader = asyncio.create_task(self._read_frames(websocket, frames))
+                self._reader_socket = websocket
+
                 try:
-                    # 메시지 수신 (타임아웃 1초)
-                    message = await asyncio.wait_for(
-                        self.websocket.recv(),
-                        timeout=1.0
-                    )
-
-                    message_count += 1
-                    # JSON 파싱
-                    data = json.loads(message)
-                    trnm = data.get('trnm', '')
-
-                    print(f"📩 메시지 #{message_count} 수신: trnm={trnm}")
-
-                    # REAL 데이터인 경우 콜백 호출
-                    if trnm == 'REAL':
-                        print(f"   📊 REAL 데이터: {json.dumps(data, ensure_ascii=False)[:200]}...")
-                        await self._handle_real_data(data)
-                    elif trnm == 'SYSTEM':
-                        # 시스템 메시지
-                        code = data.get('code', '')
-                        msg = data.get('message', '')
-                        print(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
-                        logger.warning(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
-
-                        # 연결 종료 메시지인 경우 재연결 시도
-                        if code == 'R10004':
-                            print("❌ 접속 종료됨, 재연결 시도...")
-                            logger.error("❌ 접속 종료됨, 재연결 시도...")
-                            await self.reconnect()
-                    else:
-                        # 기타 메시지
-                        print(f"   기타 메시지: {json.dumps(data, ensure_ascii=False)[:200]}...")
-                        logger.debug(f"기타 메시지: {trnm}")
-
-                except asyncio.TimeoutError:
-                    # 타임아웃은 정상 (계속 수신 대기)
-                    continue
-                except websockets.ConnectionClosed:
+                    await self._drain_frames(websocket, frames)
+                finally:
+                    reader.cancel()
+                    if self._reader_socket is websocket:
+                        self._reader_socket = None
+
+                # 재연결 없이 소켓이 닫힌 경우 (disconnect 호출이 아니면 재연결)
+                if self.websocket is websocket and self.is_connected:
                     print("❌ WebSocket 연결 끊김")
                     logger.error("❌ WebSocket 연결 끊김")
                     self.is_connected = False
                     await self.reconnect()
-                    break
-                except Exception as e:
-                    print(f"❌ 메시지 수신 중 오류: {e}")
-                    logger.error(f"❌ 메시지 수신 중 오류: {e}")
-                    continue
 
         except Exception as e:
             logger.error(f"❌ 수신 루프 중 오류: {e}")
         finally:
-            logger.info("🔄 실시간 데이터 수신 종료")
+            logger.info(f"🔄 실시간 데이터 수신 종료: {self.receive_stats.get_stats()}")
+
+    async def _read_frames(self, websocket, frames: asyncio.Queue):
+        """소켓 읽기 태스크 (연결 종료 시 None을 넣어 알림)"""
+        try:
+            async for message in websocket:
+                await frames.put(message)
+        except websockets.ConnectionClosed as e:
+            logger.warning(f"⚠️ WebSocket 수신 종료: {e}")
+        except Exception as e:
+            logger.error(f"❌ 메시지 수신 중 오류: {e}")
+        await frames.put(None)
+
+    async def _drain_frames(self, websocket, frames: asyncio.Queue):
+        """버퍼의 프레임을 배치 단위로 처리 (소켓 종료 또는 재연결 시 반환)"""
+        batch_size = self.batch_size
+        stats = self.receive_stats
+
+        while True:
+            batch = [await frames.get()]
+            while len(batch) < batch_size and not frames.empty():
+                batch.append(frames.get_nowait())
+
+            closed = batch[-1] is None
+            if closed:
+                batch.pop()
+
+            if batch:
+                await self._process_batch(batch)
+                stats.record_batch(len(batch))
+
+            # 배치마다 구독자 워커에 실행 기회 양보
+            await asyncio.sleep(0)
+
+            if closed or self.websocket is not websocket:
+                return
+
+    async def _process_batch(self, batch: List[Any]):
+        """프레임 배치 디코딩 및 처리"""
+        stats = self.receive_stats
+        record_decode = stats.record_decode
+        perf_counter = time.perf_counter
+        sample_every = self.log_sample_every
+        seq = stats.messages
+
+        for message in batch:
+            seq += 1
+            start = perf_counter()
+            try:
+                data = _json_loads(message)
+            except ValueError as e:
+                stats.decode_errors += 1
+                self._rate_logger.warning('ws_decode_error', f"⚠️ 메시지 디코딩 실패: {e}")
+                continue
+            record_decode(perf_counter() - start)
+
+            trnm = data.get('trnm', '')
+
+            if seq % sample_every == 0:
+                self._rate_logger.debug(
+                    f'ws_{trnm}',
+                    f"📩 메시지 #{seq} 수신: trnm={trnm} ({stats.msgs_per_sec:.0f} msg/s)"
+                )
+
+            # REAL 데이터인 경우 구독자에게 분배
+            if trnm == 'REAL':
+                await self._handle_real_data(data)
+            elif trnm == 'SYSTEM':
+                # 시스템 메시지
+                code = data.get('code', '')
+                msg = data.get('message', '')
+                print(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
+                logger.warning(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
+
+                # 연결 종료 메시지인 경우 재연결 시도
+                if code == 'R10004':
+                    print("❌ 접속 종료됨, 재연결 시도...")
+                    logger.error("❌ 접속 종료됨, 재연결 시도...")
+                    await self.reconnect()
+                    return
+            elif trnm == 'REG':
+                # 구독 응답 - 대기 중인 subscribe()에 전달
+                self._resolve_ack(data)
+            else:
+                # 기타 메시지
+                logger.debug(f"기타 메시지: {trnm}")
+
+    def _resolve_ack(self, data: Dict[str, Any]):
+        """구독 응답을 가장 오래 기다린 subscribe()에 전달 (타임아웃된 대기자는 건너뜀)"""
+        while self._ack_waiters:
+            waiter = self._ack_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(data)
+                return
+        logger.debug(f"대기자 없는 구독 응답: {data.get('return_msg', '')}")
+
+    def get_receive_stats(self) -> Dict[str, Any]:
+        """수신 루프 통계 (초당 메시지 수, 디코딩 지연 히스토그램)"""
+        return self.receive_stats.get_stats()
 
     async def _handle_real_data(self, data: Dict[str, Any]):
         """
-        REAL 데이터 처리 및 콜백 호출
+        REAL 데이터 처리 및 구독자 큐로 분배 (콜백은 구독자 워커에서 실행)
 
         Args:
             data: REAL 데이터
@@ -337,25 +556,9 @@ class WebSocketManager:
             #   }]
             # }
 
-            data_list = data.get('data', [])
-            for item in data_list:
-                data_type = item.get('type', '')
-                stock_code = item.get('item', '')
-                values = item.get('values', {})
-
-                # 타입별 콜백 호출
-                if data_type in self.callbacks:
-                    try:
-                        await self.callbacks[data_type](item)
-                    except Exception as e:
-                        logger.error(f"❌ 콜백 실행 오류 ({data_type}): {e}")
-
-                # ALL 콜백 호출
-                if 'ALL' in self.callbacks:
-                    try:
-                        await self.callbacks['ALL'](item)
-                    except Exception as e:
-                        logger.error(f"❌ ALL 콜백 실행 오류: {e}")
+            dispatch = self.router.dispatch
+            for item in data.get('data', []):
+                dispatch(item)
 
         except Exception as e:
             logger.error(f"❌ REAL 데이터 처리 중 오류: {e}")
@@ -444,7 +647,9 @@ class WebSocketManager:
             'connected': self.is_connected,
             'logged_in': self.is_logged_in,
             'subscriptions': self.subscriptions,
-            'ws_url': self.ws_url
+            'ws_url': self.ws_url,
+            'dispatch': self.router.get_stats(),
+            'receive': self.receive_stats.get_stats()
         }
 
 
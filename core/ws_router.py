@@ -0,0 +1,260 @@
+"""
+core/ws_router.py
+WebSocket 실시간 데이터 디스패치 라우터
+
+- (타입, 종목코드) 키로 구독자 O(1) 조회 → 전체 스트림 필터링 불필요
+- 키마다 여러 구독자 등록 가능 (기존 타입당 1개 콜백 덮어쓰기 문제 해결)
+- 구독자별 bounded 큐 + 전용 워커 → 느린 구독자가 receive_loop를 막지 않음
+- 큐가 가득 차면 가장 오래된(또는 새) 메시지 폐기, 큐 깊이 / 폐기 수 통계 제공
+"""
+import asyncio
+import inspect
+import logging
+from typing import Dict, Any, Optional, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 와일드카드
+ALL_TYPES = 'ALL'
+ALL_CODES = '*'
+
+DEFAULT_QUEUE_SIZE = 1000
+
+# 큐 가득 참 처리 정책
+DROP_OLDEST = 'drop_oldest'  # 최신 시세 우선 (기본)
+DROP_NEWEST = 'drop_newest'  # 이미 쌓인 메시지 우선
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST)
+
+
+class Subscription:
+    """
+    구독자 (콜백 + bounded 큐 + 워커)
+
+    콜백은 동기 / 비동기 함수 모두 가능하며, 워커 태스크가 큐에서 꺼내
+    순서대로 호출한다.
+    """
+
+    def __init__(
+        self,
+        data_type: str,
+        stock_code: str,
+        callback: Callable[[Dict[str, Any]], Any],
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = DROP_OLDEST,
+        name: Optional[str] = None
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 overflow 정책: {overflow}")
+
+        self.data_type = data_type
+        self.stock_code = stock_code
+        self.callback = callback
+        self.maxsize = max(int(maxsize), 1)
+        self.overflow = overflow
+        self.name = name or getattr(callback, '__qualname__', repr(callback))
+
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.maxsize)
+        self._worker: Optional[asyncio.Task] = None
+
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """라우팅 키"""
+        return (self.data_type, self.stock_code)
+
+    def offer(self, item: Dict[str, Any]):
+        """
+        메시지 적재 (대기하지 않음)
+
+        큐가 가득 차면 overflow 정책에 따라 메시지 하나를 폐기한다.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.overflow == DROP_NEWEST:
+                return
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.queue.put_nowait(item)
+
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    async def _run(self):
+        """워커: 큐에서 꺼내 콜백 호출"""
+        while True:
+            item = await self.queue.get()
+            try:
+                result = self.callback(item)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ 콜백 실행 오류 ({self.data_type}/{self.stock_code} {self.name}): {e}")
+            finally:
+                self.queue.task_done()
+
+    async def join(self):
+        """큐에 쌓인 메시지가 모두 처리될 때까지 대기"""
+        await self.queue.join()
+
+    def close(self):
+        """워커 중지 (남은 메시지는 폐기)"""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """구독자 통계"""
+        return {
+            'name': self.name,
+            'type': self.data_type,
+            'stock_code': self.stock_code,
+            'depth': self.queue.qsize(),
+            'max_depth': self.max_depth,
+            'maxsize': self.maxsize,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'errors': self.errors,
+        }
+
+
+class DispatchRouter:
+    """
+    (타입, 종목코드) 기반 다중 구독자 라우터
+
+    메시지 하나당 최대 4개 키((type, code), (type, *), (ALL, code), (ALL, *))만
+    조회하므로 구독자 수와 무관하게 라우팅 비용이 일정하다.
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE, overflow: str = DROP_OLDEST):
+        """
+        Args:
+            queue_size: 구독자별 기본 큐 크기
+            overflow: 기본 큐 가득 참 처리 정책 (drop_oldest / drop_newest)
+        """
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self._routes: Dict[Tuple[str, str], List[Subscription]] = {}
+
+        self.dispatched = 0
+        self.unrouted = 0
+
+    def subscribe(
+        self,
+        data_type: str,
+        callback: Callable[[Dict[str, Any]], Any],
+        stock_code: Optional[str] = None,
+        maxsize: Optional[int] = None,
+        overflow: Optional[str] = None,
+        name: Optional[str] = None
+    ) -> Subscription:
+        """
+        구독자 등록
+
+        Args:
+            data_type: 데이터 타입 (예: '0B', '0D', 'ALL')
+            callback: 콜백 함수 (item을 인자로 받음, 동기/비동기)
+            stock_code: 종목코드 (None이면 해당 타입 전 종목)
+            maxsize: 큐 크기 (None이면 라우터 기본값)
+            overflow: 큐 가득 참 처리 정책 (None이면 라우터 기본값)
+            name: 통계 표시용 이름
+
+        Returns:
+            Subscription (unsubscribe에 사용)
+        """
+        subscription = Subscription(
+            data_type,
+            stock_code or ALL_CODES,
+            callback,
+            maxsize=maxsize or self.queue_size,
+            overflow=overflow or self.overflow,
+            name=name
+        )
+        self._routes.setdefault(subscription.key, []).append(subscription)
+        logger.info(f"구독자 등록: {subscription.data_type}/{subscription.stock_code} ({subscription.name})")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> bool:
+        """구독자 해제"""
+        subscribers = self._routes.get(subscription.key)
+        if not subscribers or subscription not in subscribers:
+            return False
+
+        subscribers.remove(subscription)
+        if not subscribers:
+            del self._routes[subscription.key]
+        subscription.close()
+        logger.info(f"구독자 해제: {subscription.data_type}/{subscription.stock_code} ({subscription.name})")
+        return True
+
+    def dispatch(self, item: Dict[str, Any]) -> int:
+        """
+        REAL 데이터 항목 분배 (이벤트 루프 안에서 호출, 대기하지 않음)
+
+        Args:
+            item: {'type': '0B', 'item': '005930', 'values': {...}}
+
+        Returns:
+            메시지를 받은 구독자 수
+        """
+        data_type = item.get('type', '')
+        stock_code = item.get('item', '')
+        routes = self._routes
+
+        count = 0
+        for key in (
+            (data_type, stock_code),
+            (data_type, ALL_CODES),
+            (ALL_TYPES, stock_code),
+            (ALL_TYPES, ALL_CODES),
+        ):
+            subscribers = routes.get(key)
+            if subscribers:
+                for subscription in subscribers:
+                    subscription.offer(item)
+                count += len(subscribers)
+
+        self.dispatched += 1
+        if not count:
+            self.unrouted += 1
+        return count
+
+    def subscriptions(self) -> List[Subscription]:
+        """등록된 전체 구독자"""
+        return [s for subscribers in self._routes.values() for s in subscribers]
+
+    async def join(self):
+        """모든 구독자 큐가 비워질 때까지 대기"""
+        await asyncio.gather(*(s.join() for s in self.subscriptions()))
+
+    def close(self):
+        """모든 구독자 워커 중지"""
+        for subscription in self.subscriptions():
+            subscription.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """라우터 / 구독자별 통계 (큐 깊이, 폐기 수)"""
+        subscribers = [s.get_stats() for s in self.subscriptions()]
+        return {
+            'dispatched': self.dispatched,
+            'unrouted': self.unrouted,
+            'subscribers': len(subscribers),
+            'total_depth': sum(s['depth'] for s in subscribers),
+            'total_dropped': sum(s['dropped'] for s in subscribers),
+            'subscriptions': subscribers,
+        }
+
+
+__all__ = ['Subscription', 'DispatchRouter']
@@ -229,7 +229,9 @@ def get_chart_data(stock_code: str):
                                 print(f"✅ Using real-time minute data ({candle_count} candles)")
                                 # Get requested number of minutes (default 60)
                                 minutes = int(timeframe) if timeframe == '1' else 60
-                                daily_data = _realtime_chart_manager.get_minute_data(stock_code, minutes=minutes)
+                                # 3/5/15/30/60분봉은 실시간 증분 집계 데이터 사용
+                                period = int(timeframe) if int(timeframe) in (3, 5, 15, 30, 60) else 1
+                                daily_data = _realtime_chart_manager.get_minute_data(stock_code, minutes=minutes, period=period)
                                 realtime_data_available = True
                                 actual_timeframe = timeframe
                         else:
@@ -17,6 +17,26 @@ def set_bot_instance(bot):
     _bot_instance = bot
 
 
+def _holdings_returns_history(codes):
+    """Daily returns per holding for correlation / min-variance hints (codes that fail are skipped)"""
+    from features.portfolio_optimizer import returns_from_daily_prices
+
+    data_fetcher = getattr(_bot_instance, 'data_fetcher', None)
+    if data_fetcher is None:
+        return None
+
+    history = {}
+    for code in codes:
+        try:
+            returns = returns_from_daily_prices(data_fetcher.get_daily_price(stock_code=code))
+        except Exception as e:
+            print(f"⚠️ Daily price fetch failed for {code}: {e}")
+            continue
+        if returns:
+            history[code] = returns
+    return history or None
+
+
 @portfolio_bp.route('/api/performance')
 def get_performance():
     """Get performance history for chart from database"""
@@ -134,7 +154,8 @@ def get_portfolio_optimization():
                 })
 
             optimizer = PortfolioOptimizer()
-            result = optimizer.get_optimization_for_dashboard(positions)
+            returns_history = _holdings_returns_history([p['code'] for p in positions])
+            result = optimizer.get_optimization_for_dashboard(positions, returns_history)
             return jsonify(result)
         else:
             return jsonify({'success': False, 'message': 'Bot not initialized'})
@@ -9,6 +9,7 @@ from .models import (
     SystemLog,
     Database,
     get_db_session,
+    get_scoped_db_session,
     close_database,
 )
 
@@ -20,5 +21,6 @@ __all__ = [
     'SystemLog',
     'Database',
     'get_db_session',
+    'get_scoped_db_session',
     'close_database',
 ]
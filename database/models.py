@@ -2,6 +2,7 @@
 database/models.py
 SQLAlchemy 데이터베이스 모델
 """
+import threading
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
@@ -17,13 +18,11 @@ from sqlalchemy import (
     Index,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship
 from pathlib import Path
 
 from utils.logger_new import get_logger
 
-from config.config_manager import get_config
-
 
 logger = get_logger()
 Base = declarative_base()
@@ -258,11 +257,18 @@ class SystemLog(Base):
 
 # 데이터베이스 엔진 및 세션
 class Database:
-    """데이터베이스 관리자"""
+    """
+    데이터베이스 관리자
+
+    엔진 생성과 테이블 생성(create_all)은 import 시점이 아니라
+    첫 세션 요청 시 한 번만 수행
+    """
 
     _instance: Optional['Database'] = None
+    _lock = threading.Lock()
     _engine = None
     _Session = None
+    _ScopedSession = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -270,13 +276,26 @@ class Database:
         return cls._instance
 
     def __init__(self):
-        """초기화"""
-        if self._engine is None:
-            self._initialize_database()
+        """초기화 (연결은 첫 사용 시)"""
+
+    @property
+    def engine(self):
+        """SQLAlchemy 엔진 (필요 시 초기화)"""
+        self._ensure_initialized()
+        return self._engine
+
+    def _ensure_initialized(self):
+        """최초 1회 데이터베이스 초기화 (스레드 안전)"""
+        if self._Session is None:
+            with self._lock:
+                if self._Session is None:
+                    self._initialize_database()
 
     def _initialize_database(self):
         """데이터베이스 초기화"""
         try:
+            from config.config_manager import get_config
+
             config = get_config()
             db_config = config.database
 
@@ -303,8 +322,10 @@ class Database:
             # 테이블 생성
             Base.metadata.create_all(self._engine)
 
-            # 세션 팩토리 생성
-            self._Session = sessionmaker(bind=self._engine)
+            # 세션 팩토리 생성 (스레드별 세션 레지스트리 포함)
+            session_factory = sessionmaker(bind=self._engine)
+            self._ScopedSession = scoped_session(session_factory)
+            self._Session = session_factory
 
             logger.info(f"💾 데이터베이스 초기화 완료: {connection_string}")
 
@@ -314,18 +335,31 @@ class Database:
 
     def get_session(self):
         """세션 가져오기"""
-        if self._Session is None:
-            self._initialize_database()
+        self._ensure_initialized()
         return self._Session()
 
-    def close(self):
-        """데이터베이스 종료"""
-        if self._engine:
-            self._engine.dispose()
-            logger.info("💾 데이터베이스 종료")
+    def get_scoped_session(self):
+        """
+        스레드별 세션 레지스트리 (scoped_session)
 
+        여러 스레드가 공유해도 add/commit 등은 호출 스레드 전용 세션으로 전달됨
+        """
+        self._ensure_initialized()
+        return self._ScopedSession
 
-# 싱글톤 인스턴스
+    def close(self):
+        """데이터베이스 종료 (다음 세션 요청 시 다시 초기화)"""
+        with self._lock:
+            if self._engine:
+                self._ScopedSession.remove()
+                self._engine.dispose()
+                self._engine = None
+                self._Session = None
+                self._ScopedSession = None
+                logger.info("💾 데이터베이스 종료")
+
+
+# 싱글톤 인스턴스 (연결은 첫 get_db_session() 호출 시)
 _database = Database()
 
 
@@ -334,6 +368,11 @@ def get_db_session():
     return _database.get_session()
 
 
+def get_scoped_db_session():
+    """스레드별 데이터베이스 세션 레지스트리 가져오기 (멀티스레드 공유용)"""
+    return _database.get_scoped_session()
+
+
 def close_database():
     """데이터베이스 종료"""
     _database.close()
@@ -564,5 +603,6 @@ __all__ = [
     'MarketRegime',
     'Database',
     'get_db_session',
+    'get_scoped_db_session',
     'close_database',
 ]
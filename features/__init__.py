@@ -4,41 +4,61 @@ AutoTrade Pro - 고급 기능 모듈
 AI 자율 모드, 가상매매, 거래 일지, 알림 시스템 등
 """
 
-# 테스트 모드 매니저 (의존성 없음, 항상 사용 가능)
-from .test_mode_manager import TestModeManager, run_test_mode
+import importlib
 
-# 선택적 import (numpy 등 의존성 필요)
-try:
-    from .order_book import OrderBookService, OrderBook
-    from .profit_tracker import ProfitTracker, PerformanceMetrics, TradeRecord
-    from .portfolio_optimizer import PortfolioOptimizer, PortfolioOptimization
-    from .news_feed import NewsFeedService, NewsArticle, NewsSummary, SentimentAnalyzer
-    from .risk_analyzer import RiskAnalyzer, RiskAnalysis, StockRisk, PortfolioRisk
-    from .ai_mode import AIAgent, AIDecision, AIStrategy, AIPerformance, get_ai_agent
-    from .ai_learning import AILearningEngine, TradingPattern as AITradingPattern, MarketRegime, LearningInsight
-    from .paper_trading import PaperTradingEngine, VirtualAccount, VirtualPosition, StrategyConfig, get_paper_trading_engine
-    from .trading_journal import TradingJournal, JournalEntry, JournalInsight, get_trading_journal
-    from .notification import NotificationManager, Notification, NotificationPriority, get_notification_manager
+# 서브모듈은 첫 속성 접근 시 import (PEP 562) - `import features` 자체는 가벼움
+_LAZY_IMPORTS = {
+    # 테스트 모드 매니저 (의존성 없음, 항상 사용 가능)
+    '.test_mode_manager': ('TestModeManager', 'run_test_mode'),
+    # 선택적 import (numpy 등 의존성 필요)
+    '.order_book': ('OrderBookService', 'OrderBook'),
+    '.profit_tracker': ('ProfitTracker', 'PerformanceMetrics', 'TradeRecord'),
+    '.portfolio_optimizer': ('PortfolioOptimizer', 'PortfolioOptimization'),
+    '.news_feed': ('NewsFeedService', 'NewsArticle', 'NewsSummary', 'SentimentAnalyzer'),
+    '.risk_analyzer': ('RiskAnalyzer', 'RiskAnalysis', 'StockRisk', 'PortfolioRisk'),
+    '.ai_mode': ('AIAgent', 'AIDecision', 'AIStrategy', 'AIPerformance', 'get_ai_agent'),
+    '.ai_learning': ('AILearningEngine', 'MarketRegime', 'LearningInsight'),
+    '.paper_trading': ('PaperTradingEngine', 'VirtualAccount', 'VirtualPosition', 'StrategyConfig', 'get_paper_trading_engine'),
+    '.trading_journal': ('TradingJournal', 'JournalEntry', 'JournalInsight', 'get_trading_journal'),
+    '.notification': ('NotificationManager', 'Notification', 'NotificationPriority', 'get_notification_manager'),
     # v4.0 Advanced Features
-    from .replay_simulator import ReplaySimulator, MarketSnapshot
-    from .portfolio_rebalancer import PortfolioRebalancer, PortfolioTarget
-except ImportError as e:
-    import warnings
-    warnings.warn(f"Some features modules could not be imported: {e}. Install required dependencies (numpy, pandas, etc.)")
-    # 임포트 실패한 모듈들을 None으로 설정
-    OrderBookService = OrderBook = None
-    ProfitTracker = PerformanceMetrics = TradeRecord = None
-    PortfolioOptimizer = PortfolioOptimization = None
-    NewsFeedService = NewsArticle = NewsSummary = SentimentAnalyzer = None
-    RiskAnalyzer = RiskAnalysis = StockRisk = PortfolioRisk = None
-    AIAgent = AIDecision = AIStrategy = AIPerformance = get_ai_agent = None
-    AILearningEngine = AITradingPattern = MarketRegime = LearningInsight = None
-    PaperTradingEngine = VirtualAccount = VirtualPosition = StrategyConfig = get_paper_trading_engine = None
-    TradingJournal = JournalEntry = JournalInsight = get_trading_journal = None
-    NotificationManager = Notification = NotificationPriority = get_notification_manager = None
-    # v4.0 Advanced Features
-    ReplaySimulator = MarketSnapshot = None
-    PortfolioRebalancer = PortfolioTarget = None
+    '.replay_simulator': ('ReplaySimulator', 'MarketSnapshot'),
+    '.portfolio_rebalancer': ('PortfolioRebalancer', 'PortfolioTarget'),
+}
+
+# 공개 이름 -> (모듈, 속성)
+_LAZY_ATTRS = {
+    name: (module, name)
+    for module, names in _LAZY_IMPORTS.items()
+    for name in names
+}
+_LAZY_ATTRS['AITradingPattern'] = ('.ai_learning', 'TradingPattern')
+
+
+def __getattr__(name):
+    """처음 접근한 이름의 서브모듈 import"""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    except (ImportError, AttributeError) as e:
+        if module_name == '.test_mode_manager':
+            raise
+        import warnings
+        warnings.warn(f"Some features modules could not be imported: {e}. Install required dependencies (numpy, pandas, etc.)")
+        # 임포트 실패한 모듈의 이름은 None 으로 설정
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Test Mode Manager (no dependencies)
@@ -18,9 +18,34 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 
+from utils.portfolio_math import (
+    shrink_covariance,
+    correlation_from_covariance,
+    weight_bounds,
+    min_variance_weights,
+)
+
 logger = logging.getLogger(__name__)
 
 
+def returns_from_daily_prices(daily_prices: List[Dict], days: int = 60) -> List[float]:
+    """
+    Daily returns (oldest first) from ka10081 daily bars
+
+    Args:
+        daily_prices: Bars as returned by get_daily_price (newest first, 'stck_clpr' close)
+        days: Number of most recent returns to keep
+
+    Returns:
+        Up to `days` simple daily returns; bars without a positive close are skipped
+    """
+    closes = [float(bar.get('stck_clpr') or 0) for bar in reversed(daily_prices or [])]
+    closes = np.array([c for c in closes if c > 0][-(days + 1):])
+    if len(closes) < 2:
+        return []
+    return list(np.diff(closes) / closes[:-1])
+
+
 @dataclass
 class PortfolioPosition:
     """Single position in portfolio"""
@@ -109,14 +134,17 @@ class PortfolioOptimizer:
         '105560': '금융',  # KB금융
     }
 
-    def __init__(self, market_api=None):
+    def __init__(self, market_api=None, covariance_shrinkage: bool = True):
         """
         Initialize portfolio optimizer
 
         Args:
             market_api: Market API instance for fetching stock data
+            covariance_shrinkage: Use Ledoit-Wolf covariance shrinkage (same default as
+                strategy.portfolio_optimizer)
         """
         self.market_api = market_api
+        self.covariance_shrinkage = covariance_shrinkage
         self.cache_file = Path('data/portfolio_cache.json')
         self.cache_ttl = 300  # 5 minutes
         self._ensure_data_dir()
@@ -230,11 +258,43 @@ class PortfolioOptimizer:
         allocations.sort(key=lambda x: x.weight, reverse=True)
         return allocations
 
+    def _analyze_returns(
+        self,
+        positions: List[PortfolioPosition],
+        returns_history: Dict[str, List[float]]
+    ) -> Tuple[float, Optional[Dict[str, float]]]:
+        """
+        Average pairwise correlation and minimum-variance weights (%)
+
+        Uses the shared Ledoit-Wolf / min-variance solver (utils.portfolio_math);
+        the sample covariance is used when covariance_shrinkage is off.
+        Positions without at least 20 daily returns are skipped.
+        """
+        codes = [p.code for p in positions if len(returns_history.get(p.code) or []) >= 20]
+        if len(codes) < 2:
+            return 0.0, None
+
+        length = min(len(returns_history[code]) for code in codes)
+        returns = np.array([returns_history[code][-length:] for code in codes], dtype=float).T
+
+        if self.covariance_shrinkage:
+            cov_matrix, _ = shrink_covariance(returns, annualization=252)
+        else:
+            cov_matrix = np.cov(returns.T) * 252
+        corr = correlation_from_covariance(cov_matrix)
+        avg_correlation = float(corr[np.triu_indices(len(codes), k=1)].mean())
+
+        lower, upper = weight_bounds(len(codes), max_weight=0.4)
+        weights = min_variance_weights(cov_matrix, lower, upper)
+
+        return avg_correlation, {code: float(w * 100) for code, w in zip(codes, weights)}
+
     def _generate_suggestions(
         self,
         positions: List[PortfolioPosition],
         metrics: PortfolioMetrics,
-        sector_allocation: List[SectorAllocation]
+        sector_allocation: List[SectorAllocation],
+        target_weights: Optional[Dict[str, float]] = None
     ) -> List[OptimizationSuggestion]:
         """Generate optimization suggestions based on analysis"""
         suggestions = []
@@ -318,7 +378,27 @@ class PortfolioOptimizer:
                     impact='수익 확정, 리스크 감소'
                 ))
 
-        # 5. Good diversification
+        # 5. Minimum-variance rebalancing (needs returns history)
+        if target_weights:
+            current = {p.code: p.weight for p in positions}
+            names = {p.code: p.name for p in positions}
+            diffs = sorted(
+                ((code, target - current.get(code, 0.0)) for code, target in target_weights.items()),
+                key=lambda item: abs(item[1]), reverse=True
+            )
+            moves = [(code, diff) for code, diff in diffs if abs(diff) >= 10][:3]
+            if moves:
+                detail = ', '.join(f'{names.get(code, code)} {diff:+.1f}%p' for code, diff in moves)
+                suggestions.append(OptimizationSuggestion(
+                    type='rebalance',
+                    priority='low',
+                    title='⚖️ 최소분산 비중과 차이',
+                    description=f'평균 상관계수 {metrics.avg_correlation:.2f}, 최소분산 비중 대비 조정 필요: {detail}',
+                    action='변동성을 낮추려면 제시된 방향으로 비중을 단계적으로 조정하세요.',
+                    impact='포트폴리오 변동성 감소'
+                ))
+
+        # 6. Good diversification
         if metrics.diversification_score >= 70 and metrics.concentration_risk == 'Low':
             suggestions.append(OptimizationSuggestion(
                 type='maintain',
@@ -365,13 +445,19 @@ class PortfolioOptimizer:
         else:
             return 'Conservative'
 
-    def optimize_portfolio(self, positions_data: List[Dict]) -> Optional[PortfolioOptimization]:
+    def optimize_portfolio(
+        self,
+        positions_data: List[Dict],
+        returns_history: Optional[Dict[str, List[float]]] = None
+    ) -> Optional[PortfolioOptimization]:
         """
         Analyze and optimize portfolio
 
         Args:
             positions_data: List of position dictionaries with:
                 - code, name, quantity, avg_price, current_price, value
+            returns_history: Optional daily returns per stock code, used for
+                average correlation and minimum-variance rebalancing hints
 
         Returns:
             PortfolioOptimization object with complete analysis
@@ -419,6 +505,10 @@ class PortfolioOptimizer:
             diversification_score = self._calculate_diversification_score(positions)
             concentration_risk, largest_weight, top3_weight = self._calculate_concentration_risk(positions)
 
+            avg_correlation, target_weights = 0.0, None
+            if returns_history:
+                avg_correlation, target_weights = self._analyze_returns(positions, returns_history)
+
             metrics = PortfolioMetrics(
                 total_value=total_value,
                 position_count=len(positions),
@@ -427,11 +517,13 @@ class PortfolioOptimizer:
                 concentration_risk=concentration_risk,
                 largest_position_weight=largest_weight,
                 top3_concentration=top3_weight,
-                avg_correlation=0.0  # Placeholder - would need historical data
+                avg_correlation=avg_correlation
             )
 
             # Generate suggestions
-            suggestions = self._generate_suggestions(positions, metrics, sector_allocation)
+            suggestions = self._generate_suggestions(
+                positions, metrics, sector_allocation, target_weights
+            )
 
             # Determine risk level
             risk_level = self._determine_risk_level(metrics)
@@ -449,15 +541,23 @@ class PortfolioOptimizer:
             logger.error(f"Error optimizing portfolio: {e}")
             return None
 
-    def get_optimization_for_dashboard(self, positions_data: List[Dict]) -> Dict[str, Any]:
+    def get_optimization_for_dashboard(
+        self,
+        positions_data: List[Dict],
+        returns_history: Optional[Dict[str, List[float]]] = None
+    ) -> Dict[str, Any]:
         """
         Get optimization data formatted for dashboard
 
+        Args:
+            positions_data: Position dictionaries (see optimize_portfolio)
+            returns_history: Optional daily returns per stock code (see optimize_portfolio)
+
         Returns:
             Dictionary ready for JSON API response
         """
         try:
-            optimization = self.optimize_portfolio(positions_data)
+            optimization = self.optimize_portfolio(positions_data, returns_history)
 
             if not optimization:
                 return {
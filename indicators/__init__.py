@@ -6,6 +6,11 @@ from .trend import sma, ema, calculate_trend
 from .momentum import rsi, macd, stochastic, calculate_momentum_score
 from .volatility import bollinger_bands, atr, calculate_volatility_score
 from .volume import volume_sma, obv, volume_ratio
+from .streaming import (
+    StreamingSMA, StreamingEMA, StreamingRSI, StreamingMACD,
+    StreamingStochastic, StreamingBollinger, StreamingATR, StreamingOBV,
+    StreamingIndicatorSet
+)
 
 __all__ = [
     # Trend indicators
@@ -15,5 +20,9 @@ __all__ = [
     # Volatility indicators
     'bollinger_bands', 'atr', 'calculate_volatility_score',
     # Volume indicators
-    'volume_sma', 'obv', 'volume_ratio'
+    'volume_sma', 'obv', 'volume_ratio',
+    # Streaming (incremental) indicators
+    'StreamingSMA', 'StreamingEMA', 'StreamingRSI', 'StreamingMACD',
+    'StreamingStochastic', 'StreamingBollinger', 'StreamingATR', 'StreamingOBV',
+    'StreamingIndicatorSet'
 ]
@@ -0,0 +1,542 @@
+"""
+Streaming Indicators
+- Stateful, incremental versions of the batch indicators
+- O(1) update per new bar (windowed min/max use monotonic deques)
+- replace=True re-applies the still-forming bar (tick updates)
+
+Each class matches its batch counterpart in this package:
+    StreamingSMA        <-> trend.sma / volume.volume_sma
+    StreamingEMA        <-> trend.ema
+    StreamingRSI        <-> momentum.rsi
+    StreamingMACD       <-> momentum.macd
+    StreamingStochastic <-> momentum.stochastic
+    StreamingBollinger  <-> volatility.bollinger_bands
+    StreamingATR        <-> volatility.atr
+    StreamingOBV        <-> volume.obv
+
+Usage (realtime minute chart):
+    indicators = StreamingIndicatorSet()
+    indicators.warm_up(chart.get_minute_data(390))
+    ...
+    snapshot = indicators.update_bar(chart.get_current_candle())
+"""
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+NAN = float('nan')
+
+
+class StreamingSMA:
+    """
+    Simple Moving Average (streaming)
+
+    NaN inputs make the value NaN until they leave the window
+    (same as pandas rolling mean).
+    """
+
+    # Recompute the running sum every N appends (bounds float drift)
+    RESYNC_INTERVAL = 1024
+
+    def __init__(self, period: int):
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        self._window: Deque[float] = deque()
+        self._sum = 0.0
+        self._nan_count = 0
+        self._appends = 0
+        self.value = NAN
+
+    @property
+    def ready(self) -> bool:
+        return len(self._window) == self.period
+
+    def _add(self, x: float):
+        if x != x:
+            self._nan_count += 1
+        else:
+            self._sum += x
+
+    def _remove(self, x: float):
+        if x != x:
+            self._nan_count -= 1
+        else:
+            self._sum -= x
+
+    def _refresh(self) -> float:
+        if len(self._window) < self.period or self._nan_count:
+            self.value = NAN
+        else:
+            self.value = self._sum / self.period
+        return self.value
+
+    def update(self, x: float, replace: bool = False) -> float:
+        """
+        Args:
+            x: New value
+            replace: Replace the last value instead of appending
+
+        Returns:
+            Current SMA (NaN until the window is full)
+        """
+        window = self._window
+        if replace and window:
+            self._remove(window[-1])
+            window[-1] = x
+            self._add(x)
+        else:
+            window.append(x)
+            self._add(x)
+            if len(window) > self.period:
+                self._remove(window.popleft())
+            self._appends += 1
+            if self._appends % self.RESYNC_INTERVAL == 0:
+                self._sum = math.fsum(v for v in window if v == v)
+        return self._refresh()
+
+
+class StreamingEMA:
+    """Exponential Moving Average (streaming, pandas ewm adjust=False)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        # Same weights / operation order as pandas ewm(adjust=False)
+        self._old_wt = 1.0 - self.alpha
+        self._total_wt = self._old_wt + self.alpha
+        self.reset()
+
+    def reset(self):
+        self.value = NAN
+        self._prev = NAN  # value before the last update (for replace)
+        self._count = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._count > 0
+
+    def update(self, x: float, replace: bool = False) -> float:
+        """
+        Args:
+            x: New value
+            replace: Replace the last value instead of appending
+
+        Returns:
+            Current EMA
+        """
+        if replace and self._count:
+            base = self._prev
+        else:
+            base = self.value
+            self._prev = base
+            self._count += 1
+
+        if base != base:
+            self.value = x
+        else:
+            self.value = (self._old_wt * base + self.alpha * x) / self._total_wt
+        return self.value
+
+
+class StreamingRSI:
+    """Relative Strength Index (streaming, simple rolling mean of gains/losses)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        self._gain = StreamingSMA(self.period)
+        self._loss = StreamingSMA(self.period)
+        self._last = NAN
+        self._prev = NAN
+        self.value = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self._gain.ready
+
+    def update(self, close: float, replace: bool = False) -> float:
+        """
+        Args:
+            close: Close price
+            replace: Replace the last bar instead of appending
+
+        Returns:
+            Current RSI (0-100, NaN until ready)
+        """
+        if replace and self._gain._window:
+            ref = self._prev
+        else:
+            ref = self._last
+            self._prev = ref
+        self._last = close
+
+        # The first bar has no previous close -> counts as a 0 change
+        delta = close - ref if ref == ref else 0.0
+        gain = self._gain.update(delta if delta > 0 else 0.0, replace)
+        loss = self._loss.update(-delta if delta < 0 else 0.0, replace)
+
+        if gain != gain or loss != loss:
+            self.value = NAN
+        elif loss == 0:
+            self.value = 100.0 if gain > 0 else NAN
+        else:
+            self.value = 100 - (100 / (1 + gain / loss))
+        return self.value
+
+
+class StreamingMACD:
+    """MACD (streaming)"""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.reset()
+
+    def reset(self):
+        self._fast = StreamingEMA(self.fast_period)
+        self._slow = StreamingEMA(self.slow_period)
+        self._signal = StreamingEMA(self.signal_period)
+        self.macd = self.signal = self.histogram = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self._signal.ready
+
+    def update(self, close: float, replace: bool = False) -> Tuple[float, float, float]:
+        """
+        Returns:
+            (macd_line, signal_line, histogram)
+        """
+        self.macd = self._fast.update(close, replace) - self._slow.update(close, replace)
+        self.signal = self._signal.update(self.macd, replace)
+        self.histogram = self.macd - self.signal
+        return self.macd, self.signal, self.histogram
+
+
+class _WindowExtreme:
+    """Rolling min or max over the last `period` values (monotonic deque)"""
+
+    def __init__(self, period: int, is_max: bool):
+        self.period = period
+        self.is_max = is_max
+        self._values: Deque[float] = deque(maxlen=period)
+        self._candidates: Deque[Tuple[int, float]] = deque()
+        self._index = -1
+
+    def _push(self, x: float):
+        candidates = self._candidates
+        if self.is_max:
+            while candidates and candidates[-1][1] <= x:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= x:
+                candidates.pop()
+        candidates.append((self._index, x))
+        while candidates[0][0] <= self._index - self.period:
+            candidates.popleft()
+
+    def update(self, x: float, replace: bool = False) -> float:
+        if replace and self._values:
+            # Rebuild from the window (bounded by period)
+            self._values[-1] = x
+            values = list(self._values)
+            self._candidates.clear()
+            self._index -= len(values)
+            for value in values:
+                self._index += 1
+                self._push(value)
+        else:
+            self._values.append(x)
+            self._index += 1
+            self._push(x)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if len(self._values) < self.period:
+            return NAN
+        return self._candidates[0][1]
+
+
+class StreamingStochastic:
+    """Stochastic Oscillator (streaming)"""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self.k_period = k_period
+        self.d_period = d_period
+        self.reset()
+
+    def reset(self):
+        self._highest = _WindowExtreme(self.k_period, is_max=True)
+        self._lowest = _WindowExtreme(self.k_period, is_max=False)
+        self._d = StreamingSMA(self.d_period)
+        self.k = self.d = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self._d.ready
+
+    def update(self, high: float, low: float, close: float, replace: bool = False) -> Tuple[float, float]:
+        """
+        Returns:
+            (%K, %D)
+        """
+        highest = self._highest.update(high, replace)
+        lowest = self._lowest.update(low, replace)
+        span = highest - lowest
+        if span != span or span == 0:
+            # Flat window: 0/0 -> NaN (close outside the range is not expected)
+            self.k = NAN
+        else:
+            self.k = 100 * (close - lowest) / span
+        self.d = self._d.update(self.k, replace)
+        return self.k, self.d
+
+
+class StreamingBollinger:
+    """Bollinger Bands (streaming, sample standard deviation)"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.period = period
+        self.std_dev = std_dev
+        self.reset()
+
+    def reset(self):
+        self._window: Deque[float] = deque()
+        self._shift = NAN  # sums are kept relative to the first value (precision)
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self.upper = self.middle = self.lower = self.std = NAN
+
+    @property
+    def ready(self) -> bool:
+        return len(self._window) == self.period
+
+    def _add(self, x: float):
+        d = x - self._shift
+        self._sum += d
+        self._sumsq += d * d
+
+    def _remove(self, x: float):
+        d = x - self._shift
+        self._sum -= d
+        self._sumsq -= d * d
+
+    def update(self, close: float, replace: bool = False) -> Tuple[float, float, float]:
+        """
+        Returns:
+            (upper_band, middle_band, lower_band)
+        """
+        window = self._window
+        if self._shift != self._shift:
+            self._shift = close
+
+        if replace and window:
+            self._remove(window[-1])
+            window[-1] = close
+            self._add(close)
+        else:
+            window.append(close)
+            self._add(close)
+            if len(window) > self.period:
+                self._remove(window.popleft())
+
+        n = len(window)
+        if n < self.period:
+            self.upper = self.middle = self.lower = self.std = NAN
+            return self.upper, self.middle, self.lower
+
+        mean = self._sum / n
+        variance = max((self._sumsq - self._sum * mean) / (n - 1), 0.0) if n > 1 else NAN
+        self.middle = self._shift + mean
+        self.std = math.sqrt(variance) if variance == variance else NAN
+        self.upper = self.middle + self.std * self.std_dev
+        self.lower = self.middle - self.std * self.std_dev
+        return self.upper, self.middle, self.lower
+
+
+class StreamingATR:
+    """Average True Range (streaming, EMA of true range)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        self._ema = StreamingEMA(self.period)
+        self._last_close = NAN
+        self._prev_close = NAN
+        self.true_range = NAN
+        self.value = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self._ema.ready
+
+    def update(self, high: float, low: float, close: float, replace: bool = False) -> float:
+        """
+        Returns:
+            Current ATR
+        """
+        if replace and self._ema.ready:
+            ref = self._prev_close
+        else:
+            ref = self._last_close
+            self._prev_close = ref
+        self._last_close = close
+
+        true_range = high - low
+        if ref == ref:
+            true_range = max(true_range, abs(high - ref), abs(low - ref))
+        self.true_range = true_range
+        self.value = self._ema.update(true_range, replace)
+        return self.value
+
+
+class StreamingOBV:
+    """On-Balance Volume (streaming)"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.value = NAN
+        self._prev_value = NAN
+        self._last_close = NAN
+        self._prev_close = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self.value == self.value
+
+    def update(self, close: float, volume: float, replace: bool = False) -> float:
+        """
+        Returns:
+            Current OBV
+        """
+        if replace and self.ready:
+            base, ref = self._prev_value, self._prev_close
+        else:
+            base, ref = self.value, self._last_close
+            self._prev_value, self._prev_close = base, ref
+        self._last_close = close
+
+        if base != base:
+            self.value = float(volume)
+        elif close > ref:
+            self.value = base + volume
+        elif close < ref:
+            self.value = base - volume
+        else:
+            self.value = base
+        return self.value
+
+
+class StreamingIndicatorSet:
+    """
+    Indicator bundle for one stock, fed with OHLCV bar dicts
+
+    A bar with the same timestamp as the previous one is treated as an
+    update of the still-forming bar, so ticks can be fed directly from
+    RealtimeMinuteChart.get_current_candle().
+    """
+
+    def __init__(self,
+                 rsi_period: int = 14,
+                 macd_fast: int = 12,
+                 macd_slow: int = 26,
+                 macd_signal: int = 9,
+                 stoch_k: int = 14,
+                 stoch_d: int = 3,
+                 bb_period: int = 20,
+                 bb_std: float = 2.0,
+                 atr_period: int = 14,
+                 ma_periods: Iterable[int] = (5, 20),
+                 volume_period: int = 20):
+        self.rsi = StreamingRSI(rsi_period)
+        self.macd = StreamingMACD(macd_fast, macd_slow, macd_signal)
+        self.stochastic = StreamingStochastic(stoch_k, stoch_d)
+        self.bollinger = StreamingBollinger(bb_period, bb_std)
+        self.atr = StreamingATR(atr_period)
+        self.obv = StreamingOBV()
+        self.ma = {period: StreamingSMA(period) for period in ma_periods}
+        self.volume_sma = StreamingSMA(volume_period)
+        self._last_key = None
+        self.bars = 0
+
+    def update(self, high: float, low: float, close: float, volume: float,
+               replace: bool = False) -> Dict[str, float]:
+        """
+        Update every indicator with one bar
+
+        Returns:
+            Indicator snapshot (see snapshot())
+        """
+        if not replace:
+            self.bars += 1
+        self.rsi.update(close, replace)
+        self.macd.update(close, replace)
+        self.stochastic.update(high, low, close, replace)
+        self.bollinger.update(close, replace)
+        self.atr.update(high, low, close, replace)
+        self.obv.update(close, volume, replace)
+        for sma in self.ma.values():
+            sma.update(close, replace)
+        self.volume_sma.update(volume, replace)
+        return self.snapshot()
+
+    def update_bar(self, bar: Optional[Dict]) -> Dict[str, float]:
+        """
+        Update with a bar dict ({'high', 'low', 'close', 'volume', 'timestamp'})
+
+        Returns:
+            Indicator snapshot
+        """
+        if not bar:
+            return self.snapshot()
+        key = bar.get('timestamp', (bar.get('date'), bar.get('time')))
+        replace = key == self._last_key
+        self._last_key = key
+        return self.update(bar['high'], bar['low'], bar['close'], bar.get('volume', 0), replace)
+
+    def warm_up(self, bars: Iterable[Dict]) -> Dict[str, float]:
+        """Seed with historical bars (oldest first)"""
+        for bar in bars:
+            self.update_bar(bar)
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current indicator values"""
+        upper, middle, lower = self.bollinger.upper, self.bollinger.middle, self.bollinger.lower
+        close = self.bollinger._window[-1] if self.bollinger._window else NAN
+        band = upper - lower
+        result = {
+            'rsi': self.rsi.value,
+            'macd': self.macd.macd,
+            'macd_signal': self.macd.signal,
+            'macd_histogram': self.macd.histogram,
+            'stoch_k': self.stochastic.k,
+            'stoch_d': self.stochastic.d,
+            'bb_upper': upper,
+            'bb_middle': middle,
+            'bb_lower': lower,
+            'bb_position': (close - lower) / band if band > 0 else NAN,
+            'atr': self.atr.value,
+            'obv': self.obv.value,
+            'volume_sma': self.volume_sma.value,
+        }
+        for period, sma in self.ma.items():
+            result[f'ma{period}'] = sma.value
+        return result
+
+
+__all__ = [
+    'StreamingSMA', 'StreamingEMA', 'StreamingRSI', 'StreamingMACD',
+    'StreamingStochastic', 'StreamingBollinger', 'StreamingATR', 'StreamingOBV',
+    'StreamingIndicatorSet',
+]
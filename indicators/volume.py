@@ -34,18 +34,15 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     Returns:
         OBV values
     """
-    obv_values = pd.Series(index=close.index, dtype=float)
-    obv_values.iloc[0] = volume.iloc[0]
-
-    for i in range(1, len(close)):
-        if close.iloc[i] > close.iloc[i - 1]:
-            obv_values.iloc[i] = obv_values.iloc[i - 1] + volume.iloc[i]
-        elif close.iloc[i] < close.iloc[i - 1]:
-            obv_values.iloc[i] = obv_values.iloc[i - 1] - volume.iloc[i]
-        else:
-            obv_values.iloc[i] = obv_values.iloc[i - 1]
+    if len(close) == 0:
+        return pd.Series(index=close.index, dtype=float)
+
+    # +volume on up bars, -volume on down bars, first bar seeds with its volume
+    direction = np.nan_to_num(np.sign(np.diff(close.to_numpy(dtype=float))))
+    signed_volume = volume.to_numpy(dtype=float).copy()
+    signed_volume[1:] *= direction
 
-    return obv_values
+    return pd.Series(np.cumsum(signed_volume), index=close.index)
 
 
 def volume_ratio(current_volume: int, avg_volume: float) -> float:
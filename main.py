@@ -25,9 +25,9 @@ except ImportError:
     def get_logger():
         return logging.getLogger(__name__)
 try:
-    from database import get_db_session, Trade, Position, PortfolioSnapshot
+    from database import get_scoped_db_session, Trade, Position, PortfolioSnapshot
 except ImportError:
-    def get_db_session():
+    def get_scoped_db_session():
         return None
     Trade = None
     Position = None
@@ -94,6 +94,7 @@ class TradingBotV2:
         self.client = None
         self.websocket_client = None  # 구 WebSocket 클라이언트 (비활성화)
         self.websocket_manager = None  # 신 WebSocketManager (ka10045 검증 완료)
+        self.websocket_loop = None  # WebSocket 수신 이벤트 루프 (백그라운드 스레드)
         self.account_api = None
         self.market_api = None
         self.order_api = None
@@ -103,6 +104,7 @@ class TradingBotV2:
         self.strategy_manager = None
         self.scoring_system = None
         self.dynamic_risk_manager = None
+        self.exit_engine = None  # 체결 틱 기반 청산 엔진
 
         # 기존 시스템
         self.portfolio_manager = None
@@ -118,12 +120,23 @@ class TradingBotV2:
         # v5.7.5: 알림 관리자
         self.alert_manager = get_alert_manager()
 
-        # 데이터베이스 세션
+        # 데이터베이스 세션 (scoped_session: 스케줄러 스레드마다 별도 세션)
         self.db_session = None
 
+        # 계좌 / 포트폴리오 상태 및 주문 직렬화 (scan / sell_check / 청산 워커 스레드 공유)
+        self.trading_lock = threading.RLock()
+
         # AI 승인 매수 후보 리스트
         self.ai_approved_candidates = []
 
+        # 작업 스케줄러 / 실시간 매도 트리거
+        self.scheduler = None
+        self.pause_buy = False
+        self.pause_sell = False
+        self.held_codes = set()          # 보유 종목 (실시간 체결 구독 대상)
+        self.realtime_codes = set()      # 실시간 체결 구독 중인 종목
+        self.latest_prices = {}          # 종목코드 → (체결가, 수신 시각)
+
         # 스캔 진행 상황 추적
         self.scan_progress = {
             'current_strategy': '',  # 현재 스캔 전략
@@ -192,7 +205,7 @@ class TradingBotV2:
         try:
             # 1. 데이터베이스 초기화
             logger.info("💾 데이터베이스 초기화 중...")
-            self.db_session = get_db_session()
+            self.db_session = get_scoped_db_session()
             logger.info("✓ 데이터베이스 초기화 완료")
 
             # 2. REST 클라이언트
@@ -219,10 +232,17 @@ class TradingBotV2:
                     async def on_price_update(data):
                         """실시간 체결 데이터 콜백"""
                         try:
+                            received_at = time.perf_counter()
                             stock_code = data.get('item', '')
                             values = data.get('values', {})
-                            price = int(values.get('10', '0'))  # 현재가
+                            price = abs(int(values.get('10', '0')))  # 현재가 (부호 제거)
                             logger.debug(f"📈 실시간 체결: {stock_code} = {price:,}원")
+
+                            # 보유 종목 체결 → 청산 엔진이 임계값 교차 즉시 매도
+                            if price > 0:
+                                self.latest_prices[stock_code] = (price, time.time())
+                                if self.exit_engine and not self.pause_sell:
+                                    self.exit_engine.on_price(stock_code, price, received_at)
                         except Exception as e:
                             logger.error(f"체결 데이터 처리 오류: {e}")
 
@@ -254,6 +274,9 @@ class TradingBotV2:
                             connected = loop.run_until_complete(self.websocket_manager.connect())
                             if connected:
                                 logger.info("✅ WebSocket 자동 연결 성공")
+                                # 수신 루프 실행 (콜백 / 매도 트리거 구동)
+                                self.websocket_loop = loop
+                                loop.run_until_complete(self.websocket_manager.receive_loop())
                             else:
                                 logger.warning("⚠️  WebSocket 자동 연결 실패")
                         except Exception as e:
@@ -277,6 +300,9 @@ class TradingBotV2:
             logger.info("📡 API 모듈 초기화 중...")
             self.account_api = AccountAPI(self.client)
             self.market_api = MarketAPI(self.client)
+            if self.websocket_manager:
+                # 실시간 체결/호가 수신 시 시세 캐시 무효화
+                self.market_api.attach_websocket(self.websocket_manager)
             self.order_api = OrderAPI(self.client)
             self.data_fetcher = DataFetcher(self.client)  # 시장 데이터 조회
             logger.info("✓ API 모듈 초기화 완료")
@@ -334,6 +360,7 @@ class TradingBotV2:
             logger.info("🛡️ 동적 리스크 관리자 초기화 중...")
             initial_capital = self._get_initial_capital()
             self.dynamic_risk_manager = DynamicRiskManager(initial_capital=initial_capital)
+            self.exit_engine = self._create_exit_engine()
             logger.info("✓ 동적 리스크 관리자 초기화 완료")
 
             # 8. 포트폴리오 관리자
@@ -646,6 +673,12 @@ class TradingBotV2:
         logger.info("AutoTrade Pro v2.0 종료 중...")
         self.is_running = False
 
+        # 작업 스케줄러 종료
+        if self.scheduler:
+            self.scheduler.stop()
+        if self.exit_engine:
+            self.exit_engine.shutdown(wait=False)
+
         # 가상 매매 상태 저장
         if self.virtual_trader:
             try:
@@ -666,13 +699,19 @@ class TradingBotV2:
         if self.websocket_manager:
             try:
                 import asyncio
-                asyncio.run(self.websocket_manager.disconnect())
+                if self.websocket_loop and self.websocket_loop.is_running():
+                    # 수신 루프가 도는 이벤트 루프에서 종료
+                    asyncio.run_coroutine_threadsafe(
+                        self.websocket_manager.disconnect(), self.websocket_loop
+                    ).result(timeout=5)
+                else:
+                    asyncio.run(self.websocket_manager.disconnect())
                 logger.info("✓ WebSocketManager 연결 종료")
             except Exception as e:
                 logger.warning(f"WebSocketManager 종료 실패: {e}")
 
         if self.db_session:
-            self.db_session.close()
+            self.db_session.remove()
 
         if self.client:
             self.client.close()
@@ -680,70 +719,76 @@ class TradingBotV2:
         logger.info("✅ AutoTrade Pro v2.0 종료 완료")
 
     def _main_loop(self):
-        """메인 루프"""
-        cycle_count = 0
-        # Backward compatibility: handle both Pydantic (object) and old config (dict)
-        try:
-            if hasattr(self.config.main_cycle, 'sleep_seconds'):
-                sleep_seconds = self.config.main_cycle.sleep_seconds
-            else:
-                sleep_seconds = self.config.main_cycle.get('sleep_seconds', 60)
-        except Exception as e:
-            logger.warning(f"Config 로드 실패, 기본값 사용: {e}")
-            sleep_seconds = 60
-
-        while self.is_running:
-            cycle_count += 1
-
-            # 첫 사이클이 아니면 대기
-            if cycle_count > 1:
-                logger.info(f"⏳ {sleep_seconds}초 대기...\n")
-                time.sleep(sleep_seconds)
+        """
+        메인 루프 (작업별 주기 / 트리거 스케줄러)
 
-            print(f"\n{'='*60}")
-            print(f"🔄 사이클 #{cycle_count}")
-            print(f"{'='*60}")
+        작업마다 전용 스레드에서 자기 주기로 실행되므로 긴 스캔이 매도 검토를
+        지연시키지 않는다. 보유 종목 실시간 체결 틱은 청산 엔진이 직접 처리하고,
+        sell_check는 보유 현황 동기화 + 틱이 없는 종목의 폴링 확인을 맡는다.
+        """
+        from core.scheduler import TaskScheduler
 
+        # Backward compatibility: handle both Pydantic (object) and old config (dict)
+        def cycle_setting(name, default):
             try:
-                self._read_control_file()
-                if not self.is_running:
-                    break
+                main_cycle = self.config.main_cycle
+                if hasattr(main_cycle, name):
+                    value = getattr(main_cycle, name)
+                else:
+                    value = main_cycle.get(name, default)
+                return default if value is None else value
+            except Exception as e:
+                logger.warning(f"Config 로드 실패, 기본값 사용 ({name}): {e}")
+                return default
 
-                trading_hours_ok = self._check_trading_hours()
-                if not trading_hours_ok:
-                    continue
+        sleep_seconds = cycle_setting('sleep_seconds', 60)
 
-                self._update_account_info()
+        scheduler = TaskScheduler()
+        scheduler.add_task('control', self._read_control_file, cycle_setting('control_interval', 5))
+        scheduler.add_task('market_status', self._check_trading_hours, cycle_setting('market_status_interval', 60))
+        scheduler.add_task('account', self._update_account_info, cycle_setting('account_interval', 30))
+        if self.virtual_trader:
+            scheduler.add_task('virtual_trading', self._update_virtual_trading, sleep_seconds)
+        scheduler.add_task(
+            'sell_check', self._check_sell_signals, cycle_setting('sell_check_interval', 10),
+            min_gap=cycle_setting('sell_check_min_gap', 1.0),
+            condition=lambda: not self.pause_sell
+        )
+        scheduler.add_task(
+            'scan', self._run_scanning_pipeline, cycle_setting('scan_interval', sleep_seconds),
+            condition=lambda: not self.pause_buy
+        )
+        scheduler.add_task('snapshot', self._run_snapshot, cycle_setting('snapshot_interval', sleep_seconds))
+        self.scheduler = scheduler
 
-                # 가상 매매 가격 업데이트 및 매도 검토
-                if self.virtual_trader:
-                    try:
-                        # 가상 계좌의 모든 포지션 가격 업데이트
-                        price_data = self._get_virtual_trading_prices()
-                        if price_data:
-                            self.virtual_trader.update_all_prices(price_data)
+        # 초기 상태 (제어 파일 / 시장 상태 / 계좌)는 순서대로 먼저 반영
+        for name in ('control', 'market_status', 'account'):
+            scheduler.run_now(name)
+        if not self.is_running:
+            return
 
-                        # 가상 매매 매도 조건 확인
-                        self.virtual_trader.check_sell_conditions(price_data)
-                    except Exception as e:
-                        logger.warning(f"가상 매매 업데이트 실패: {e}")
+        scheduler.start()
 
-                # 매도 검토
-                if not self.pause_sell:
-                    self._check_sell_signals()
+        while self.is_running and scheduler.is_running:
+            scheduler.wait(1.0)
 
-                # 매수 검토
-                if not self.pause_buy:
-                    self._run_scanning_pipeline()
+    def _update_virtual_trading(self):
+        """가상 매매 가격 업데이트 및 매도 검토"""
+        try:
+            # 가상 계좌의 모든 포지션 가격 업데이트
+            price_data = self._get_virtual_trading_prices()
+            if price_data:
+                self.virtual_trader.update_all_prices(price_data)
 
-                self._save_portfolio_snapshot()
-                self._print_statistics()
+            # 가상 매매 매도 조건 확인
+            self.virtual_trader.check_sell_conditions(price_data)
+        except Exception as e:
+            logger.warning(f"가상 매매 업데이트 실패: {e}")
 
-            except Exception as e:
-                logger.error(f"메인 루프 오류: {e}", exc_info=True)
-                print(f"❌ 메인 루프 오류: {e}")
-                import traceback
-                traceback.print_exc()
+    def _run_snapshot(self):
+        """포트폴리오 스냅샷 저장 + 통계 출력"""
+        self._save_portfolio_snapshot()
+        self._print_statistics()
 
     def _read_control_file(self):
         """제어 파일 읽기"""
@@ -802,12 +847,11 @@ class TradingBotV2:
             # 보유 주식 총 평가금액 계산
             stock_value = sum(int(str(h.get('eval_amt', 0)).replace(',', '')) for h in holdings) if holdings else 0
 
-            # 포트폴리오 업데이트
-            self.portfolio_manager.update_portfolio(holdings, cash)
-
-            # 동적 리스크 관리자 업데이트 (총 자산 = 예수금 + 주식평가금액)
+            # 포트폴리오 / 동적 리스크 관리자 업데이트 (총 자산 = 예수금 + 주식평가금액)
             total_capital = deposit_total + stock_value
-            self.dynamic_risk_manager.update_capital(total_capital)
+            with self.trading_lock:
+                self.portfolio_manager.update_portfolio(holdings, cash)
+                self.dynamic_risk_manager.update_capital(total_capital)
 
             logger.info(f"💰 계좌 정보: 예수금 {deposit_total:,}원, 주문가능금액 {cash:,}원, 주식평가 {stock_value:,}원, 총자산 {total_capital:,}원, 보유 {len(holdings)}개")
 
@@ -826,9 +870,18 @@ class TradingBotV2:
             holdings = self.account_api.get_holdings()
 
             if not holdings:
+                self.held_codes = set()
+                self.exit_engine.sync_positions([])
                 logger.info("보유 종목 없음")
                 return
 
+            held_codes = {h.get('stk_cd', '').lstrip('A') for h in holdings}
+            self.held_codes = held_codes
+            self._subscribe_realtime(held_codes)
+
+            current_prices = {}
+
+            positions = []
             for holding in holdings:
                 # 키움증권 API 필드명 (kt00004)
                 stock_code = holding.get('stk_cd', '')  # 종목코드
@@ -839,6 +892,11 @@ class TradingBotV2:
 
                 stock_name = holding.get('stk_nm')  # 종목명
                 current_price = int(holding.get('cur_prc', 0))  # 현재가
+
+                # 실시간 체결가가 최근 것이면 우선 사용
+                tick = self.latest_prices.get(stock_code)
+                if tick and time.time() - tick[1] < 60:
+                    current_price = tick[0]
                 quantity = int(holding.get('rmnd_qty', 0))  # 보유수량
                 buy_price = int(holding.get('avg_prc', 0))  # 평균단가
 
@@ -858,27 +916,82 @@ class TradingBotV2:
                     profit_loss_amount=profit_loss
                 )
 
-                # 청산 임계값 가져오기
+                # 청산 임계값 → 청산 엔진 트리거 테이블
                 thresholds = self.dynamic_risk_manager.get_exit_thresholds(buy_price)
+                position = {
+                    'stock_code': stock_code,
+                    'stock_name': stock_name,
+                    'quantity': quantity,
+                    'entry_price': buy_price,
+                    'stop_loss': thresholds['stop_loss'],
+                    'take_profit': thresholds['take_profit'],
+                }
+                if holding.get('trde_able_qty') not in (None, ''):
+                    # 매매가능수량 (미체결 매도 주문에 묶인 수량 제외)
+                    position['orderable_quantity'] = int(holding['trde_able_qty'])
+                positions.append(position)
+                if quantity > 0 and current_price > 0:
+                    current_prices[stock_code] = current_price
 
-                # 매도 조건 확인
-                should_sell = False
-                sell_reason = ""
-
-                if current_price >= thresholds['take_profit']:
-                    should_sell = True
-                    sell_reason = f"목표가 도달 ({thresholds['take_profit']:,}원)"
-                elif current_price <= thresholds['stop_loss']:
-                    should_sell = True
-                    sell_reason = f"손절가 도달 ({thresholds['stop_loss']:,}원)"
+            self.exit_engine.sync_positions(positions)
 
-                if should_sell:
-                    logger.info(f"📤 {stock_name} 매도 신호: {sell_reason}")
-                    self._execute_sell(stock_code, stock_name, quantity, current_price, profit_loss, profit_loss_rate, sell_reason)
+            # 최근 체결 틱이 없던 종목도 조회 가격으로 한 번 확인
+            for stock_code, current_price in current_prices.items():
+                self.exit_engine.on_price(stock_code, current_price)
 
         except Exception as e:
             logger.error(f"매도 검토 실패: {e}")
 
+    def _create_exit_engine(self):
+        """청산 엔진 생성 (risk_management 트레일링 스톱 설정 반영)"""
+        from strategy.exit_engine import ExitEngine
+
+        def risk_setting(name, default):
+            try:
+                value = getattr(self.config.risk_management, name)
+                return default if value is None else value
+            except Exception:
+                return default
+
+        trail_pct = risk_setting('trailing_stop_pct', 0.02) if risk_setting('enable_trailing_stop', False) else None
+        return ExitEngine(
+            on_exit=self._on_exit_signal,
+            trail_pct=trail_pct,
+            activation_pct=risk_setting('trailing_stop_activation_pct', 0.03)
+        )
+
+    def _on_exit_signal(self, signal):
+        """청산 엔진 발동 → 매도 주문 (주문 워커 스레드에서 실행)"""
+        if self.pause_sell:
+            return False
+        return self._execute_sell(
+            signal.stock_code, signal.stock_name, signal.quantity, signal.price,
+            signal.profit_loss, signal.profit_loss_rate, signal.reason
+        )
+
+    def _subscribe_realtime(self, stock_codes):
+        """보유 종목 실시간 체결(0B) 구독 (WebSocket 수신 루프에 비동기 요청)"""
+        new_codes = set(stock_codes) - self.realtime_codes
+        if not new_codes or not self.websocket_manager or not self.websocket_loop:
+            return
+
+        import asyncio
+        future = asyncio.run_coroutine_threadsafe(
+            self.websocket_manager.subscribe(sorted(new_codes), ['0B']), self.websocket_loop
+        )
+
+        def on_done(f):
+            try:
+                if f.result():
+                    logger.info(f"📡 보유 종목 실시간 체결 구독: {', '.join(sorted(new_codes))}")
+                    return
+            except Exception as e:
+                logger.warning(f"보유 종목 실시간 구독 실패: {e}")
+            self.realtime_codes.difference_update(new_codes)
+
+        self.realtime_codes.update(new_codes)
+        future.add_done_callback(on_done)
+
     def _run_scanning_pipeline(self):
         """3단계 스캐닝 파이프라인 실행"""
 
@@ -1223,165 +1336,176 @@ class TradingBotV2:
             traceback.print_exc()
 
     def _execute_buy(self, candidate, scoring_result):
-        """매수 실행 (NXT 시장 규칙 적용)"""
-        try:
-            # KRX 종가 결정 시간에는 신규 주문 불가
-            if self.market_status.get('can_cancel_only'):
-                logger.warning(f"⚠️  {self.market_status['market_type']}: 신규 매수 주문 불가")
-                return
-
-            stock_code = candidate.code
-            stock_name = candidate.name
-            current_price = candidate.price
+        """매수 실행 (NXT 시장 규칙 적용, 주문 / 기록은 trading_lock으로 직렬화)"""
+        with self.trading_lock:
+            try:
+                # KRX 종가 결정 시간에는 신규 주문 불가
+                if self.market_status.get('can_cancel_only'):
+                    logger.warning(f"⚠️  {self.market_status['market_type']}: 신규 매수 주문 불가")
+                    return
 
-            # 가용 현금 (kt00001 API 응답 필드 사용)
-            deposit = self.account_api.get_deposit()
-            holdings = self.account_api.get_holdings()
+                stock_code = candidate.code
+                stock_name = candidate.name
+                current_price = candidate.price
 
-            # 100% 주문가능금액 = 실제 사용가능액 (동일한 필드 사용: dashboard/app_apple.py:235)
-            available_cash = int(str(deposit.get('100stk_ord_alow_amt', '0')).replace(',', '')) if deposit else 0
+                # 가용 현금 (kt00001 API 응답 필드 사용)
+                deposit = self.account_api.get_deposit()
+                holdings = self.account_api.get_holdings()
 
-            logger.debug(f"주문가능금액: {available_cash:,}원")
+                # 100% 주문가능금액 = 실제 사용가능액 (동일한 필드 사용: dashboard/app_apple.py:235)
+                available_cash = int(str(deposit.get('100stk_ord_alow_amt', '0')).replace(',', '')) if deposit else 0
 
-            # 포지션 크기 계산 (동적 리스크 관리)
-            quantity = self.dynamic_risk_manager.calculate_position_size(
-                stock_price=current_price,
-                available_cash=available_cash
-            )
+                logger.debug(f"주문가능금액: {available_cash:,}원")
 
-            if quantity == 0:
-                logger.warning("매수 가능 수량 0")
-                return
+                # 포지션 크기 계산 (동적 리스크 관리)
+                quantity = self.dynamic_risk_manager.calculate_position_size(
+                    stock_price=current_price,
+                    available_cash=available_cash
+                )
 
-            total_amount = current_price * quantity
+                if quantity == 0:
+                    logger.warning("매수 가능 수량 0")
+                    return
 
-            logger.info(
-                f"💳 {stock_name} 매수 실행: {quantity}주 @ {current_price:,}원 "
-                f"(총 {total_amount:,}원)"
-            )
+                total_amount = current_price * quantity
 
-            # 주문 유형 결정 (시간대별 자동 선택)
-            from utils.trading_date import is_nxt_hours
-            from datetime import datetime
+                logger.info(
+                    f"💳 {stock_name} 매수 실행: {quantity}주 @ {current_price:,}원 "
+                    f"(총 {total_amount:,}원)"
+                )
 
-            if is_nxt_hours():
-                # NXT 시간대
-                now = datetime.now()
-                if now.hour == 8:
-                    # 프리마켓 (08:00-09:00)
-                    order_type = '61'  # 장시작전시간외
-                    logger.info("📌 프리마켓 주문: 장시작전시간외(61)")
+                # 주문 유형 결정 (시간대별 자동 선택)
+                from utils.trading_date import is_nxt_hours
+                from datetime import datetime
+
+                if is_nxt_hours():
+                    # NXT 시간대
+                    now = datetime.now()
+                    if now.hour == 8:
+                        # 프리마켓 (08:00-09:00)
+                        order_type = '61'  # 장시작전시간외
+                        logger.info("📌 프리마켓 주문: 장시작전시간외(61)")
+                    else:
+                        # 애프터마켓 (15:30-20:00)
+                        order_type = '81'  # 장마감후시간외
+                        logger.info("📌 애프터마켓 주문: 장마감후시간외(81) - 종가로 체결")
                 else:
-                    # 애프터마켓 (15:30-20:00)
-                    order_type = '81'  # 장마감후시간외
-                    logger.info("📌 애프터마켓 주문: 장마감후시간외(81) - 종가로 체결")
-            else:
-                # 정규장 (09:00-15:30)
-                order_type = '0'  # 보통(지정가)
-                logger.info("📌 정규장 주문: 보통 지정가(0)")
-
-            # 테스트 모드일 때 로그
-            if self.market_status.get('is_test_mode'):
-                logger.info(f"🧪 테스트 모드: AI 검토 완료 → 실제 매수 API 호출 (서버에서 거절 예상)")
-                logger.info(f"   종목: {stock_name}, AI 점수: {candidate.ai_score}, 종합 점수: {scoring_result.total_score}")
-
-            # 주문 실행
-            order_result = self.order_api.buy(
-                stock_code=stock_code,
-                quantity=quantity,
-                price=current_price,
-                order_type=order_type
-            )
+                    # 정규장 (09:00-15:30)
+                    order_type = '0'  # 보통(지정가)
+                    logger.info("📌 정규장 주문: 보통 지정가(0)")
 
-            if order_result:
-                order_no = order_result.get('order_no', '')
+                # 테스트 모드일 때 로그
+                if self.market_status.get('is_test_mode'):
+                    logger.info(f"🧪 테스트 모드: AI 검토 완료 → 실제 매수 API 호출 (서버에서 거절 예상)")
+                    logger.info(f"   종목: {stock_name}, AI 점수: {candidate.ai_score}, 종합 점수: {scoring_result.total_score}")
 
-                # DB에 거래 기록
-                trade = Trade(
+                # 주문 실행
+                order_result = self.order_api.buy(
                     stock_code=stock_code,
-                    stock_name=stock_name,
-                    action='buy',
                     quantity=quantity,
                     price=current_price,
-                    total_amount=total_amount,
-                    risk_mode=self.dynamic_risk_manager.current_mode.value,
-                    ai_score=candidate.ai_score,
-                    ai_signal=candidate.ai_signal,
-                    ai_confidence=candidate.ai_confidence,
-                    scoring_total=scoring_result.total_score,
-                    scoring_percentage=scoring_result.percentage
+                    order_type=order_type
                 )
-                self.db_session.add(trade)
-                self.db_session.commit()
 
-                logger.info(f"✅ {stock_name} 매수 성공 (주문번호: {order_no})")
+                if order_result:
+                    order_no = order_result.get('order_no', '')
+
+                    # DB에 거래 기록
+                    trade = Trade(
+                        stock_code=stock_code,
+                        stock_name=stock_name,
+                        action='buy',
+                        quantity=quantity,
+                        price=current_price,
+                        total_amount=total_amount,
+                        risk_mode=self.dynamic_risk_manager.current_mode.value,
+                        ai_score=candidate.ai_score,
+                        ai_signal=candidate.ai_signal,
+                        ai_confidence=candidate.ai_confidence,
+                        scoring_total=scoring_result.total_score,
+                        scoring_percentage=scoring_result.percentage
+                    )
+                    self._record(trade)
 
-                # v5.7.5: 매수 알림
-                self.alert_manager.alert_position_opened(
-                    stock_code=stock_code,
-                    stock_name=stock_name,
-                    buy_price=current_price,
-                    quantity=quantity
-                )
+                    logger.info(f"✅ {stock_name} 매수 성공 (주문번호: {order_no})")
 
-                self.monitor.log_activity(
-                    'buy',
-                    f'✅ {stock_name} 매수: {quantity}주 @ {current_price:,}원',
-                    level='success'
-                )
+                    # v5.7.5: 매수 알림
+                    self.alert_manager.alert_position_opened(
+                        stock_code=stock_code,
+                        stock_name=stock_name,
+                        buy_price=current_price,
+                        quantity=quantity
+                    )
 
-        except Exception as e:
-            logger.error(f"매수 실행 실패: {e}", exc_info=True)
+                    self.monitor.log_activity(
+                        'buy',
+                        f'✅ {stock_name} 매수: {quantity}주 @ {current_price:,}원',
+                        level='success'
+                    )
+
+            except Exception as e:
+                logger.error(f"매수 실행 실패: {e}", exc_info=True)
 
     def _execute_sell(self, stock_code, stock_name, quantity, price, profit_loss, profit_loss_rate, reason):
-        """매도 실행 (NXT 시장 규칙 적용)"""
-        try:
-            # KRX 종가 결정 시간에는 신규 주문 불가
-            if self.market_status.get('can_cancel_only'):
-                logger.warning(f"⚠️  {self.market_status['market_type']}: 신규 매도 주문 불가")
-                return
+        """매도 실행 (NXT 시장 규칙 적용, 주문 / 기록은 trading_lock으로 직렬화)"""
+        with self.trading_lock:
+            try:
+                # KRX 종가 결정 시간에는 신규 주문 불가
+                if self.market_status.get('can_cancel_only'):
+                    logger.warning(f"⚠️  {self.market_status['market_type']}: 신규 매도 주문 불가")
+                    return False
+
+                logger.info(
+                    f"💸 {stock_name} 매도 실행: {quantity}주 @ {price:,}원 "
+                    f"(손익: {profit_loss:+,}원, {profit_loss_rate:+.2f}%)"
+                )
 
-            logger.info(
-                f"💸 {stock_name} 매도 실행: {quantity}주 @ {price:,}원 "
-                f"(손익: {profit_loss:+,}원, {profit_loss_rate:+.2f}%)"
-            )
+                # 주문 유형 결정 (시간대별 자동 선택)
+                from utils.trading_date import is_nxt_hours
+                from datetime import datetime
+
+                if is_nxt_hours():
+                    # NXT 시간대
+                    now = datetime.now()
+                    if now.hour == 8:
+                        # 프리마켓 (08:00-09:00)
+                        order_type = '61'  # 장시작전시간외
+                        logger.info("📌 프리마켓 매도: 장시작전시간외(61)")
+                    else:
+                        # 애프터마켓 (15:30-20:00)
+                        order_type = '81'  # 장마감후시간외
+                        logger.info("📌 애프터마켓 매도: 장마감후시간외(81) - 종가로 체결")
+                else:
+                    # 정규장 (09:00-15:30)
+                    order_type = '0'  # 보통(지정가)
+                    logger.info("📌 정규장 매도: 보통 지정가(0)")
 
-            # 주문 유형 결정 (시간대별 자동 선택)
-            from utils.trading_date import is_nxt_hours
-            from datetime import datetime
+                # 테스트 모드일 때 로그
+                if self.market_status.get('is_test_mode'):
+                    logger.info(f"🧪 테스트 모드: 매도 조건 충족 → 실제 매도 API 호출 (서버에서 거절 예상)")
+                    logger.info(f"   종목: {stock_name}, 사유: {reason}, 손익: {profit_loss:+,}원 ({profit_loss_rate:+.2f}%)")
 
-            if is_nxt_hours():
-                # NXT 시간대
-                now = datetime.now()
-                if now.hour == 8:
-                    # 프리마켓 (08:00-09:00)
-                    order_type = '61'  # 장시작전시간외
-                    logger.info("📌 프리마켓 매도: 장시작전시간외(61)")
-                else:
-                    # 애프터마켓 (15:30-20:00)
-                    order_type = '81'  # 장마감후시간외
-                    logger.info("📌 애프터마켓 매도: 장마감후시간외(81) - 종가로 체결")
-            else:
-                # 정규장 (09:00-15:30)
-                order_type = '0'  # 보통(지정가)
-                logger.info("📌 정규장 매도: 보통 지정가(0)")
-
-            # 테스트 모드일 때 로그
-            if self.market_status.get('is_test_mode'):
-                logger.info(f"🧪 테스트 모드: 매도 조건 충족 → 실제 매도 API 호출 (서버에서 거절 예상)")
-                logger.info(f"   종목: {stock_name}, 사유: {reason}, 손익: {profit_loss:+,}원 ({profit_loss_rate:+.2f}%)")
-
-            # 주문 실행
-            order_result = self.order_api.sell(
-                stock_code=stock_code,
-                quantity=quantity,
-                price=price,
-                order_type=order_type
-            )
+                # 주문 실행
+                order_result = self.order_api.sell(
+                    stock_code=stock_code,
+                    quantity=quantity,
+                    price=price,
+                    order_type=order_type
+                )
 
-            if order_result:
-                order_no = order_result.get('order_no', '')
+                if not order_result:
+                    return False
 
+            except Exception as e:
+                logger.error(f"매도 실행 실패: {e}", exc_info=True)
+                return False
+
+            # 주문이 접수된 뒤에는 항상 True - 기록 / 알림 실패로 False 를 돌려주면
+            # ExitEngine 이 실패한 청산으로 보고 같은 포지션에 매도 주문을 다시 낸다
+            order_no = order_result.get('order_no', '')
+            logger.info(f"✅ {stock_name} 매도 성공 (주문번호: {order_no})")
+
+            try:
                 # DB에 거래 기록
                 trade = Trade(
                     stock_code=stock_code,
@@ -1395,12 +1519,11 @@ class TradingBotV2:
                     risk_mode=self.dynamic_risk_manager.current_mode.value,
                     notes=reason
                 )
-                self.db_session.add(trade)
-                self.db_session.commit()
-
-                log_level = 'success' if profit_loss >= 0 else 'warning'
-                logger.info(f"✅ {stock_name} 매도 성공 (주문번호: {order_no})")
+                self._record(trade)
+            except Exception as e:
+                logger.error(f"매도 거래 기록 실패 ({stock_code}, 주문번호: {order_no}): {e}", exc_info=True)
 
+            try:
                 # v5.7.5: 매도 알림
                 self.alert_manager.alert_position_closed(
                     stock_code=stock_code,
@@ -1411,19 +1534,34 @@ class TradingBotV2:
                     reason=reason
                 )
 
+                log_level = 'success' if profit_loss >= 0 else 'warning'
                 self.monitor.log_activity(
                     'sell',
                     f'✅ {stock_name} 매도: {quantity}주 @ {price:,}원 (손익: {profit_loss:+,}원)',
                     level=log_level
                 )
+            except Exception as e:
+                logger.error(f"매도 알림 실패 ({stock_code}): {e}", exc_info=True)
 
-        except Exception as e:
-            logger.error(f"매도 실행 실패: {e}", exc_info=True)
+            return True
+
+    def _record(self, row):
+        """DB 기록 (호출 스레드 전용 세션, 커밋 실패 시 롤백 후 예외 전파)"""
+        if not self.db_session:
+            return
+        try:
+            self.db_session.add(row)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
 
     def _save_portfolio_snapshot(self):
         """포트폴리오 스냅샷 저장"""
         try:
-            summary = self.portfolio_manager.get_portfolio_summary()
+            with self.trading_lock:
+                summary = self.portfolio_manager.get_portfolio_summary()
+                risk_mode = self.dynamic_risk_manager.current_mode.value
 
             snapshot = PortfolioSnapshot(
                 total_capital=summary['total_assets'],
@@ -1432,11 +1570,10 @@ class TradingBotV2:
                 total_profit_loss=summary['total_profit_loss'],
                 total_profit_loss_ratio=summary['total_profit_loss_rate'] / 100,
                 open_positions=summary['position_count'],
-                risk_mode=self.dynamic_risk_manager.current_mode.value
+                risk_mode=risk_mode
             )
 
-            self.db_session.add(snapshot)
-            self.db_session.commit()
+            self._record(snapshot)
 
         except Exception as e:
             logger.error(f"포트폴리오 스냅샷 저장 실패: {e}")
@@ -1509,6 +1646,26 @@ class TradingBotV2:
             else:
                 logger.info(f"🔍 스캐닝 대기 중...")
 
+            # 작업별 실행 시간 / 주기 초과
+            if self.scheduler:
+                for name, stats in self.scheduler.get_stats().items():
+                    logger.info(
+                        f"⏱️  {name}: {stats['runs']}회, 평균 {stats['avg_duration']:.2f}초, "
+                        f"최대 {stats['max_duration']:.2f}초, 지연 최대 {stats['max_lag']:.2f}초, "
+                        f"주기초과 {stats['overruns']}회, 트리거 {stats['triggers']}회"
+                    )
+
+            # 청산 엔진 발동 / 주문 지연
+            if self.exit_engine:
+                exit_stats = self.exit_engine.get_stats()
+                latency = exit_stats['latency']
+                logger.info(
+                    f"🎯 청산 엔진: {exit_stats['positions']}종목, 틱 {exit_stats['ticks']}건, "
+                    f"발동 {exit_stats['fired']}회 (성공 {exit_stats['orders_ok']} / 실패 {exit_stats['orders_failed']}), "
+                    f"틱→주문 평균 {latency['trigger_to_order_ms']['avg'] + latency['tick_to_trigger_ms']['avg']:.1f}ms, "
+                    f"주문 완료 p95 {latency['tick_to_order_done_ms']['p95']:.0f}ms"
+                )
+
             # 가상 매매 성과
             if self.virtual_trader:
                 try:
@@ -5,6 +5,7 @@ research/data_fetcher.py
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, time
+from utils.ohlcv_store import OHLCVStore, get_ohlcv_store, DAILY
 from utils.trading_date import get_last_trading_date
 
 logger = logging.getLogger(__name__)
@@ -49,14 +50,17 @@ class DataFetcher:
     - 순위 정보 조회
     """
     
-    def __init__(self, client):
+    def __init__(self, client, history_store: Optional[OHLCVStore] = None, use_history_store: bool = True):
         """
         DataFetcher 초기화
         
         Args:
             client: KiwoomRESTClient 인스턴스
+            history_store: 일봉 저장소 (None이면 전역 저장소)
+            use_history_store: False면 항상 API 직접 조회
         """
         self.client = client
+        self.history_store = (history_store or get_ohlcv_store()) if use_history_store else None
         logger.info("DataFetcher 초기화 완료")
     
     # ==================== 계좌 정보 조회 ====================
@@ -299,7 +303,7 @@ class DataFetcher:
 
         Args:
             stock_code: 종목코드
-            start_date: 시작일 (YYYYMMDD) - 사용되지 않음 (base_dt만 사용)
+            start_date: 시작일 (YYYYMMDD) - 저장소에 이 날짜부터 없으면 API 조회 (API는 base_dt만 사용)
             end_date: 종료일 (YYYYMMDD) - base_dt로 사용
 
         Returns:
@@ -319,6 +323,21 @@ class DataFetcher:
         if not end_date:
             end_date = datetime.now().strftime('%Y%m%d')
 
+        if self.history_store is None:
+            return self._fetch_daily_price(stock_code, end_date)
+
+        # 저장소 우선 (마지막 저장 이후 봉이 필요할 때만 ka10081 호출)
+        return self.history_store.sync(
+            stock_code,
+            DAILY,
+            fetch=lambda: self._fetch_daily_price(stock_code, end_date),
+            min_date=min(end_date, get_last_trading_date()),
+            end=int(end_date),
+            start=int(start_date) if start_date else None
+        )
+
+    def _fetch_daily_price(self, stock_code: str, end_date: str) -> List[Dict[str, Any]]:
+        """ka10081 일봉 조회 (표준화된 최신순 리스트)"""
         logger.info(f"📞 Calling ka10081 API for {stock_code} (base_dt: {end_date})")
 
         try:
@@ -155,7 +155,7 @@ def enrich_candidates_with_deep_scan(
     for idx, candidate in enumerate(top_candidates, 1):
         try:
             if verbose:
-                print(f"   [{idx}/{len(top_candidates)}] {candidate.name} ({candidate.code})")
+                logger.debug("[{}/{}] {} ({})", idx, len(top_candidates), candidate.name, candidate.code)
 
             # 1. 기관/외국인 매매 데이터 조회 (ka10059)
             investor_data = market_api.get_investor_data(candidate.code)
@@ -163,7 +163,7 @@ def enrich_candidates_with_deep_scan(
                 candidate.institutional_net_buy = investor_data.get('기관_순매수', 0)
                 candidate.foreign_net_buy = investor_data.get('외국인_순매수', 0)
                 if verbose:
-                    print(f"      일별 - 기관={candidate.institutional_net_buy:,}, 외국인={candidate.foreign_net_buy:,}")
+                    logger.debug("일별 - 기관={:,}, 외국인={:,}", candidate.institutional_net_buy, candidate.foreign_net_buy)
             else:
                 candidate.institutional_net_buy = 0
                 candidate.foreign_net_buy = 0
@@ -175,7 +175,7 @@ def enrich_candidates_with_deep_scan(
                 ask_total = bid_ask_data.get('매도_총잔량', 1)
                 candidate.bid_ask_ratio = bid_total / ask_total if ask_total > 0 else 0
                 if verbose:
-                    print(f"      호가비율={candidate.bid_ask_ratio:.2f}")
+                    logger.debug("호가비율={:.2f}", candidate.bid_ask_ratio)
             else:
                 candidate.bid_ask_ratio = 0
 
@@ -188,10 +188,10 @@ def enrich_candidates_with_deep_scan(
             if trend_data:
                 candidate.institutional_trend = trend_data
                 if verbose:
-                    print(f"      기관추이: 5일 데이터 수집")
+                    logger.debug("기관추이: 5일 데이터 수집")
             else:
                 if verbose:
-                    print(f"      기관추이: 데이터 없음")
+                    logger.debug("기관추이: 데이터 없음")
 
             # 4. 일봉 데이터 조회 (ka10006) - 평균거래량 & 변동성
             daily_data = market_api.get_daily_chart(candidate.code, period=20)
@@ -201,7 +201,7 @@ def enrich_candidates_with_deep_scan(
                 if volumes:
                     candidate.avg_volume = sum(volumes) / len(volumes)
                     if verbose:
-                        print(f"      일봉: 평균거래량={candidate.avg_volume:,.0f}")
+                        logger.debug("일봉: 평균거래량={:,.0f}", candidate.avg_volume)
 
                 # 변동성 (20일 일별 등락률 표준편차)
                 rates = []
@@ -216,7 +216,7 @@ def enrich_candidates_with_deep_scan(
                     import statistics
                     candidate.volatility = statistics.stdev(rates)
                     if verbose:
-                        print(f"      일봉: 변동성={candidate.volatility*100:.2f}%")
+                        logger.debug("일봉: 변동성={:.2f}%", candidate.volatility*100)
 
                 # v5.7.5: 기술적 지표 계산 (RSI, MACD, BB)
                 closes = [d.get('close', 0) for d in daily_data if d.get('close')]
@@ -224,26 +224,26 @@ def enrich_candidates_with_deep_scan(
                     # RSI 계산
                     candidate.rsi = _calculate_rsi(closes)
                     if verbose and candidate.rsi:
-                        print(f"      기술: RSI={candidate.rsi:.1f}")
+                        logger.debug("기술: RSI={:.1f}", candidate.rsi)
 
                     # MACD 계산
                     candidate.macd = _calculate_macd(closes)
                     if verbose and candidate.macd:
-                        print(f"      기술: MACD={candidate.macd['macd']:.2f}")
+                        logger.debug("기술: MACD={:.2f}", candidate.macd['macd'])
 
                     # 볼린저 밴드 계산
                     candidate.bollinger_bands = _calculate_bollinger_bands(closes)
                     if verbose and candidate.bollinger_bands:
                         bb_pos = candidate.bollinger_bands['position']
                         bb_status = "상단" if bb_pos > 0.8 else "하단" if bb_pos < 0.2 else "중간"
-                        print(f"      기술: BB위치={bb_status} ({bb_pos*100:.0f}%)")
+                        logger.debug("기술: BB위치={} ({:.0f}%)", bb_status, bb_pos*100)
                 else:
                     candidate.rsi = None
                     candidate.macd = None
                     candidate.bollinger_bands = None
             else:
                 if verbose:
-                    print(f"      일봉: 데이터 없음")
+                    logger.debug("일봉: 데이터 없음")
                 candidate.rsi = None
                 candidate.macd = None
                 candidate.bollinger_bands = None
@@ -271,29 +271,22 @@ def enrich_candidates_with_deep_scan(
                     if firm_data and len(firm_data) > 0:
                         latest = firm_data[0]
                         net_qty = latest.get('net_qty', 0)
-                        if verbose:
-                            print(f"         └ {firm_name}: net_qty={net_qty:,}주", end="")
-
                         if net_qty > 0:
                             buy_count += 1
                             total_net_buy += net_qty
-                            if verbose:
-                                print(f" ✅ 순매수")
-                        elif net_qty < 0:
-                            if verbose:
-                                print(f" ⚠️ 순매도")
-                        else:
-                            if verbose:
-                                print(f" - 변동없음")
+
+                        if verbose:
+                            logger.debug("└ {}: net_qty={:,}주 {}", firm_name, net_qty,
+                                         "✅ 순매수" if net_qty > 0 else "⚠️ 순매도" if net_qty < 0 else "- 변동없음")
                     else:
                         if verbose:
-                            print(f"         └ {firm_name}: 데이터 없음")
+                            logger.debug("└ {}: 데이터 없음", firm_name)
 
                     time.sleep(0.05)
 
                 except Exception as e:
                     if verbose:
-                        print(f"         └ {firm_name}: 오류 - {e}")
+                        logger.debug("└ {}: 오류 - {}", firm_name, e)
                     continue
 
             candidate.top_broker_buy_count = buy_count
@@ -301,9 +294,9 @@ def enrich_candidates_with_deep_scan(
 
             if verbose:
                 if buy_count > 0:
-                    print(f"      증권사: 순매수증권사={buy_count}개, 순매수총량={total_net_buy:,}주")
+                    logger.debug("증권사: 순매수증권사={}개, 순매수총량={:,}주", buy_count, total_net_buy)
                 else:
-                    print(f"      증권사: 순매수 없음")
+                    logger.debug("증권사: 순매수 없음")
 
             # 6. 체결강도 조회 (ka10047) - 캐시 우선
             cache_key_exec = f"execution_{candidate.code}"
@@ -313,9 +306,9 @@ def enrich_candidates_with_deep_scan(
                 candidate.execution_intensity = cached_exec.get('execution_intensity')
                 if verbose:
                     if candidate.execution_intensity:
-                        print(f"      체결강도={candidate.execution_intensity:.1f} [캐시]")
+                        logger.debug("체결강도={:.1f} [캐시]", candidate.execution_intensity)
                     else:
-                        print(f"      체결강도: 값 없음 [캐시]")
+                        logger.debug("체결강도: 값 없음 [캐시]")
             else:
                 execution_data = market_api.get_execution_intensity(candidate.code)
                 if execution_data:
@@ -323,12 +316,12 @@ def enrich_candidates_with_deep_scan(
                     _save_to_cache(cache_key_exec, execution_data)
                     if verbose:
                         if candidate.execution_intensity:
-                            print(f"      체결강도={candidate.execution_intensity:.1f}")
+                            logger.debug("체결강도={:.1f}", candidate.execution_intensity)
                         else:
-                            print(f"      체결강도: 값 없음")
+                            logger.debug("체결강도: 값 없음")
                 else:
                     if verbose:
-                        print(f"      체결강도: 데이터 없음")
+                        logger.debug("체결강도: 데이터 없음")
 
             # 7. 프로그램매매 조회 (ka90013) - 캐시 우선
             cache_key_prog = f"program_{candidate.code}"
@@ -338,9 +331,9 @@ def enrich_candidates_with_deep_scan(
                 candidate.program_net_buy = cached_prog.get('program_net_buy')
                 if verbose:
                     if candidate.program_net_buy:
-                        print(f"      프로그램순매수={candidate.program_net_buy:,} [캐시]")
+                        logger.debug("프로그램순매수={:,} [캐시]", candidate.program_net_buy)
                     else:
-                        print(f"      프로그램매매: 값 없음 [캐시]")
+                        logger.debug("프로그램매매: 값 없음 [캐시]")
             else:
                 program_data = market_api.get_program_trading(candidate.code)
                 if program_data:
@@ -348,19 +341,19 @@ def enrich_candidates_with_deep_scan(
                     _save_to_cache(cache_key_prog, program_data)
                     if verbose:
                         if candidate.program_net_buy:
-                            print(f"      프로그램순매수={candidate.program_net_buy:,}")
+                            logger.debug("프로그램순매수={:,}", candidate.program_net_buy)
                         else:
-                            print(f"      프로그램매매: 값 없음")
+                            logger.debug("프로그램매매: 값 없음")
                 else:
                     if verbose:
-                        print(f"      프로그램매매: 데이터 없음")
+                        logger.debug("프로그램매매: 데이터 없음")
 
             time.sleep(0.1)  # API 호출 간격
 
         except Exception as e:
             logger.error(f"Deep Scan 오류 ({candidate.name}): {e}")
             if verbose:
-                print(f"      오류: {e}")
+                logger.debug("오류: {}", e)
             # 오류 시 기본값 설정
             candidate.institutional_net_buy = 0
             candidate.foreign_net_buy = 0
@@ -201,14 +201,14 @@ class VolumeBasedStrategy(ScanStrategy):
 
             for idx, candidate in enumerate(top_candidates, 1):
                 try:
-                    print(f"   [{idx}/{len(top_candidates)}] {candidate.name} ({candidate.code})")
+                    logger.debug("[{}/{}] {} ({})", idx, len(top_candidates), candidate.name, candidate.code)
 
                     # 1. 기관/외국인 매매 데이터 조회 (ka10059)
                     investor_data = self.market_api.get_investor_data(candidate.code)
                     if investor_data:
                         candidate.institutional_net_buy = investor_data.get('기관_순매수', 0)
                         candidate.foreign_net_buy = investor_data.get('외국인_순매수', 0)
-                        print(f"      일별 - 기관={candidate.institutional_net_buy:,}, 외국인={candidate.foreign_net_buy:,}")
+                        logger.debug("일별 - 기관={:,}, 외국인={:,}", candidate.institutional_net_buy, candidate.foreign_net_buy)
                     else:
                         candidate.institutional_net_buy = 0
                         candidate.foreign_net_buy = 0
@@ -219,7 +219,7 @@ class VolumeBasedStrategy(ScanStrategy):
                         bid_total = bid_ask_data.get('매수_총잔량', 1)
                         ask_total = bid_ask_data.get('매도_총잔량', 1)
                         candidate.bid_ask_ratio = bid_total / ask_total if ask_total > 0 else 0
-                        print(f"      호가비율={candidate.bid_ask_ratio:.2f}")
+                        logger.debug("호가비율={:.2f}", candidate.bid_ask_ratio)
                     else:
                         candidate.bid_ask_ratio = 0
 
@@ -232,9 +232,9 @@ class VolumeBasedStrategy(ScanStrategy):
                     if trend_data:
                         candidate.institutional_trend = trend_data
                         # 간단한 출력만 (점수는 scoring_system에서 계산)
-                        print(f"      기관추이: 5일 데이터 수집")
+                        logger.debug("기관추이: 5일 데이터 수집")
                     else:
-                        print(f"      기관추이: 데이터 없음")
+                        logger.debug("기관추이: 데이터 없음")
 
                     # 4. 일봉 데이터 조회 (ka10006) - 평균거래량 & 변동성
                     daily_data = self.market_api.get_daily_chart(candidate.code, period=20)
@@ -243,7 +243,7 @@ class VolumeBasedStrategy(ScanStrategy):
                         volumes = [d.get('volume', 0) for d in daily_data if d.get('volume')]
                         if volumes:
                             candidate.avg_volume = sum(volumes) / len(volumes)
-                            print(f"      일봉: 평균거래량={candidate.avg_volume:,.0f}")
+                            logger.debug("일봉: 평균거래량={:,.0f}", candidate.avg_volume)
 
                         # 변동성 (20일 일별 등락률 표준편차)
                         rates = []
@@ -257,9 +257,9 @@ class VolumeBasedStrategy(ScanStrategy):
                         if len(rates) > 1:
                             import statistics
                             candidate.volatility = statistics.stdev(rates)
-                            print(f"      일봉: 변동성={candidate.volatility*100:.2f}%")  # 출력만 %로
+                            logger.debug("일봉: 변동성={:.2f}%", candidate.volatility*100)  # 출력만 %로
                     else:
-                        print(f"      일봉: 데이터 없음")
+                        logger.debug("일봉: 데이터 없음")
 
                     # 5. 증권사별매매 조회 (ka10078) - 주요 증권사 순매수
                     # 주요 증권사 코드 목록 (상위 5개만 조회)
@@ -288,34 +288,30 @@ class VolumeBasedStrategy(ScanStrategy):
                                 latest = firm_data[0]
                                 net_qty = latest.get('net_qty', 0)
 
-                                # 디버깅: net_qty 값 확인
-                                print(f"         └ {firm_name}: net_qty={net_qty:,}주", end="")
-
                                 if net_qty > 0:
                                     buy_count += 1
                                     total_net_buy += net_qty
-                                    print(f" ✅ 순매수")
-                                elif net_qty < 0:
-                                    print(f" ⚠️ 순매도")
-                                else:
-                                    print(f" - 변동없음")
+
+                                # 디버깅: net_qty 값 확인
+                                logger.debug("└ {}: net_qty={:,}주 {}", firm_name, net_qty,
+                                             "✅ 순매수" if net_qty > 0 else "⚠️ 순매도" if net_qty < 0 else "- 변동없음")
                             else:
                                 # 디버깅: 데이터 없음
-                                print(f"         └ {firm_name}: 데이터 없음")
+                                logger.debug("└ {}: 데이터 없음", firm_name)
 
                             time.sleep(0.05)  # 증권사별 API 호출 간격
 
                         except Exception as e:
-                            print(f"         └ {firm_name}: 오류 - {e}")
+                            logger.debug("└ {}: 오류 - {}", firm_name, e)
                             continue
 
                     candidate.top_broker_buy_count = buy_count
                     candidate.top_broker_net_buy = total_net_buy
 
                     if buy_count > 0:
-                        print(f"      증권사: 순매수증권사={buy_count}개, 순매수총량={total_net_buy:,}주")
+                        logger.debug("증권사: 순매수증권사={}개, 순매수총량={:,}주", buy_count, total_net_buy)
                     else:
-                        print(f"      증권사: 순매수 없음")
+                        logger.debug("증권사: 순매수 없음")
 
                     # 6. 체결강도 조회 (ka10047) - 캐시 우선
                     cache_key_exec = f"execution_{candidate.code}"
@@ -324,20 +320,20 @@ class VolumeBasedStrategy(ScanStrategy):
                     if cached_exec:
                         candidate.execution_intensity = cached_exec.get('execution_intensity')
                         if candidate.execution_intensity:
-                            print(f"      체결강도={candidate.execution_intensity:.1f} [캐시]")
+                            logger.debug("체결강도={:.1f} [캐시]", candidate.execution_intensity)
                         else:
-                            print(f"      체결강도: 값 없음 [캐시]")
+                            logger.debug("체결강도: 값 없음 [캐시]")
                     else:
                         execution_data = self.market_api.get_execution_intensity(candidate.code)
                         if execution_data:
                             candidate.execution_intensity = execution_data.get('execution_intensity')
                             _save_to_cache(cache_key_exec, execution_data)
                             if candidate.execution_intensity:
-                                print(f"      체결강도={candidate.execution_intensity:.1f}")
+                                logger.debug("체결강도={:.1f}", candidate.execution_intensity)
                             else:
-                                print(f"      체결강도: 값 없음")
+                                logger.debug("체결강도: 값 없음")
                         else:
-                            print(f"      체결강도: 데이터 없음")
+                            logger.debug("체결강도: 데이터 없음")
 
                     # 7. 프로그램매매 조회 (ka90013) - 캐시 우선
                     cache_key_prog = f"program_{candidate.code}"
@@ -346,25 +342,25 @@ class VolumeBasedStrategy(ScanStrategy):
                     if cached_prog:
                         candidate.program_net_buy = cached_prog.get('program_net_buy')
                         if candidate.program_net_buy:
-                            print(f"      프로그램순매수={candidate.program_net_buy:,} [캐시]")
+                            logger.debug("프로그램순매수={:,} [캐시]", candidate.program_net_buy)
                         else:
-                            print(f"      프로그램매매: 값 없음 [캐시]")
+                            logger.debug("프로그램매매: 값 없음 [캐시]")
                     else:
                         program_data = self.market_api.get_program_trading(candidate.code)
                         if program_data:
                             candidate.program_net_buy = program_data.get('program_net_buy')
                             _save_to_cache(cache_key_prog, program_data)
                             if candidate.program_net_buy:
-                                print(f"      프로그램순매수={candidate.program_net_buy:,}")
+                                logger.debug("프로그램순매수={:,}", candidate.program_net_buy)
                             else:
-                                print(f"      프로그램매매: 값 없음")
+                                logger.debug("프로그램매매: 값 없음")
                         else:
-                            print(f"      프로그램매매: 데이터 없음")
+                            logger.debug("프로그램매매: 데이터 없음")
 
                     time.sleep(0.1)  # API 호출 간격 (7개 API + 증권사 5개)
 
                 except Exception as e:
-                    print(f"      ❌ Deep Scan 오류: {e}")
+                    logger.debug("❌ Deep Scan 오류: {}", e)
                     logger.error(f"종목 {candidate.code} Deep Scan 실패: {e}", exc_info=True)
                     # 오류 시 기본값 설정
                     candidate.institutional_net_buy = 0
@@ -3,13 +3,17 @@ research/scanner_pipeline.py
 3단계 스캐닝 파이프라인 (Fast → Deep → AI)
 """
 import time
-from typing import List, Dict, Any, Optional, Tuple
+import statistics
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from utils.logger_new import get_logger
 
 from config.config_manager import get_config
+from core.rate_limiter import DeadlineExceeded, call_deadline
 
 
 logger = get_logger()
@@ -20,6 +24,15 @@ logger = get_logger()
 _deep_scan_cache = {}
 CACHE_TTL_SECONDS = 300  # 5분
 
+# Deep Scan 증권사별 매매동향 조회 대상 (주요 증권사 5개)
+DEEP_SCAN_MAJOR_FIRMS = [
+    ("040", "KB증권"),
+    ("039", "교보증권"),
+    ("001", "한국투자증권"),
+    ("003", "미래에셋증권"),
+    ("005", "삼성증권"),
+]
+
 
 @dataclass
 class StockCandidate:
@@ -131,6 +144,9 @@ class ScannerPipeline:
         self.deep_scan_results: List[StockCandidate] = []
         self.ai_scan_results: List[StockCandidate] = []
 
+        # Deep Scan 단계별 소요 시간 / 조회 통계 (마지막 실행)
+        self.deep_scan_stats: Dict[str, Any] = {}
+
         logger.info("🔍 3단계 스캐닝 파이프라인 초기화 완료")
 
     def should_run_fast_scan(self) -> bool:
@@ -265,6 +281,7 @@ class ScannerPipeline:
         - 기관/외국인 매매 흐름 분석
         - 호가 강도 분석
         - 목표: 20종목 선정
+        - 종목별 요청은 동시 실행, 단계별 소요 시간은 deep_scan_stats에 기록
 
         Args:
             candidates: 분석할 종목 리스트 (None이면 Fast Scan 결과 사용)
@@ -285,171 +302,21 @@ class ScannerPipeline:
 
             deep_config = self.scan_config.get('deep_scan', {})
             scan_time = datetime.now()
+            stage_times: Dict[str, float] = {}
 
-            # 각 종목에 대해 심층 분석
-            for candidate in candidates:
-                try:
-                    print(f"📍 Deep Scan: {candidate.name} ({candidate.code})")
-
-                    # 기관/외국인 매매 데이터 조회
-                    print(f"   📊 투자자 매매 조회 중...")
-                    investor_data = self.market_api.get_investor_data(candidate.code)
-
-                    if investor_data:
-                        inst_buy = investor_data.get('기관_순매수', 0)
-                        frgn_buy = investor_data.get('외국인_순매수', 0)
-                        candidate.institutional_net_buy = inst_buy
-                        candidate.foreign_net_buy = frgn_buy
-                        print(f"   ✓ 투자자: 기관={inst_buy:,}, 외국인={frgn_buy:,}")
-                    else:
-                        print(f"   ⚠️  투자자 데이터 없음")
-                        candidate.institutional_net_buy = 0
-                        candidate.foreign_net_buy = 0
-
-                    # 호가 데이터 조회
-                    print(f"   📊 호가 조회 중...")
-                    bid_ask_data = self.market_api.get_bid_ask(candidate.code)
-
-                    if bid_ask_data:
-                        bid_total = bid_ask_data.get('매수_총잔량', 1)
-                        ask_total = bid_ask_data.get('매도_총잔량', 1)
-                        candidate.bid_ask_ratio = bid_total / ask_total if ask_total > 0 else 0
-                        print(f"   ✓ 호가: 매수={bid_total:,}, 매도={ask_total:,}, 비율={candidate.bid_ask_ratio:.2f}")
-                    else:
-                        print(f"   ⚠️  호가 데이터 없음")
-                        candidate.bid_ask_ratio = 0
-
-                    # 일봉 데이터 조회 (평균 거래량, 변동성 계산)
-                    print(f"   📊 일봉 데이터 조회 중...")
-                    try:
-                        daily_data = self.market_api.get_daily_price(candidate.code, days=20)
-                        if daily_data and len(daily_data) > 0:
-                            # 평균 거래량 (20일)
-                            volumes = [row.get('volume', 0) for row in daily_data]
-                            candidate.avg_volume = sum(volumes) / len(volumes) if volumes else None
-
-                            # 변동성 계산 (20일 수익률 표준편차)
-                            prices = [row.get('close', 0) for row in daily_data]
-                            if len(prices) > 1:
-                                returns = [(prices[i] / prices[i+1] - 1) for i in range(len(prices)-1) if prices[i+1] > 0]
-                                if returns:
-                                    import statistics
-                                    candidate.volatility = statistics.stdev(returns) if len(returns) > 1 else 0.0
-
-                            print(f"   ✓ 일봉: avg_volume={candidate.avg_volume:,.0f if candidate.avg_volume else 0}, volatility={candidate.volatility:.4f if candidate.volatility else 0}")
-                        else:
-                            print(f"   ⚠️  일봉 데이터 없음")
-                    except Exception as e:
-                        print(f"   ⚠️  일봉 데이터 조회 실패: {e}")
-                        logger.debug(f"일봉 데이터 조회 실패: {e}")
-
-                    # 증권사별 매매동향 조회 (주요 증권사 5개)
-                    print(f"   📊 증권사별 매매동향 조회 중...")
-                    try:
-                        # 주요 증권사 코드 (상위 5개)
-                        major_firms = [
-                            ("040", "KB증권"),
-                            ("039", "교보증권"),
-                            ("001", "한국투자증권"),
-                            ("003", "미래에셋증권"),
-                            ("005", "삼성증권")
-                        ]
-
-                        broker_buy_count = 0
-                        broker_net_buy_total = 0
-
-                        for firm_code, firm_name in major_firms:
-                            try:
-                                firm_data = self.market_api.get_securities_firm_trading(
-                                    firm_code=firm_code,
-                                    stock_code=candidate.code,
-                                    days=1  # 당일만 조회
-                                )
-
-                                if firm_data and len(firm_data) > 0:
-                                    # 최근 데이터 (당일)
-                                    recent = firm_data[0]
-                                    net_qty = recent.get('net_qty', 0)
-
-                                    if net_qty > 0:  # 순매수인 경우
-                                        broker_buy_count += 1
-                                        broker_net_buy_total += net_qty
-
-                                time.sleep(0.05)  # API 호출 간격
-                            except Exception as e:
-                                logger.debug(f"증권사 {firm_name} 데이터 조회 실패: {e}")
-                                continue
-
-                        candidate.top_broker_buy_count = broker_buy_count
-                        candidate.top_broker_net_buy = broker_net_buy_total
-
-                        if broker_buy_count > 0:
-                            print(f"   ✓ 증권사: {broker_buy_count}/5개 순매수, 총 {broker_net_buy_total:,}주")
-                        else:
-                            print(f"   ⚠️  증권사: 순매수 없음")
-                    except Exception as e:
-                        print(f"   ⚠️  증권사 데이터 조회 실패: {e}")
-                        logger.debug(f"증권사 데이터 조회 실패: {e}")
-
-                    # 체결강도 조회 (ka10047) - 캐시 우선
-                    print(f"   📊 체결강도 조회 중...")
-                    cache_key_exec = f"execution_{candidate.code}"
-                    cached_exec = self._get_from_cache(cache_key_exec)
-
-                    if cached_exec:
-                        candidate.execution_intensity = cached_exec.get('execution_intensity')
-                        print(f"   ✓ 체결강도: {candidate.execution_intensity:.1f} [캐시]" if candidate.execution_intensity else "   ⚠️  체결강도: 0 [캐시]")
-                    else:
-                        try:
-                            execution_data = self.market_api.get_execution_intensity(
-                                stock_code=candidate.code
-                            )
-
-                            if execution_data:
-                                candidate.execution_intensity = execution_data.get('execution_intensity')
-                                self._save_to_cache(cache_key_exec, execution_data)
-                                print(f"   ✓ 체결강도: {candidate.execution_intensity:.1f}" if candidate.execution_intensity else "   ⚠️  체결강도: 0")
-                            else:
-                                print(f"   ⚠️  체결강도 데이터 없음")
-                        except Exception as e:
-                            print(f"   ⚠️  체결강도 조회 실패 (캐시도 없음): {e}")
-                            logger.debug(f"체결강도 조회 실패: {e}")
-
-                    # 프로그램매매 조회 (ka90013) - 캐시 우선
-                    print(f"   📊 프로그램매매 조회 중...")
-                    cache_key_prog = f"program_{candidate.code}"
-                    cached_prog = self._get_from_cache(cache_key_prog)
-
-                    if cached_prog:
-                        candidate.program_net_buy = cached_prog.get('program_net_buy')
-                        print(f"   ✓ 프로그램순매수: {candidate.program_net_buy:,}원 [캐시]" if candidate.program_net_buy else "   ⚠️  프로그램순매수: 0원 [캐시]")
-                    else:
-                        try:
-                            program_data = self.market_api.get_program_trading(
-                                stock_code=candidate.code
-                            )
-
-                            if program_data:
-                                candidate.program_net_buy = program_data.get('program_net_buy')
-                                self._save_to_cache(cache_key_prog, program_data)
-                                print(f"   ✓ 프로그램순매수: {candidate.program_net_buy:,}원" if candidate.program_net_buy else "   ⚠️  프로그램순매수: 0원")
-                            else:
-                                print(f"   ⚠️  프로그램매매 데이터 없음")
-                        except Exception as e:
-                            print(f"   ⚠️  프로그램매매 조회 실패 (캐시도 없음): {e}")
-                            logger.debug(f"프로그램매매 조회 실패: {e}")
-
-                    # Deep Scan 점수 계산
-                    candidate.deep_scan_score = self._calculate_deep_score(candidate)
-                    candidate.deep_scan_time = scan_time
-
-                    time.sleep(0.1)  # API 호출 간격
+            # 종목별 독립 요청을 동시에 실행 (단계 마감 시간 내 부분 결과 허용)
+            stage_start = time.time()
+            fetch_stats = self._fetch_deep_scan_data(candidates, deep_config)
+            stage_times['fetch'] = time.time() - stage_start
 
-                except Exception as e:
-                    print(f"   ❌ 오류: {e}")
-                    logger.error(f"종목 {candidate.code} Deep Scan 실패: {e}", exc_info=True)
-                    continue
+            # Deep Scan 점수 계산
+            stage_start = time.time()
+            for candidate in candidates:
+                candidate.deep_scan_score = self._calculate_deep_score(candidate)
+                candidate.deep_scan_time = scan_time
+            stage_times['score'] = time.time() - stage_start
 
+            stage_start = time.time()
             # 점수 기준 정렬
             candidates = sorted(
                 candidates,
@@ -478,14 +345,23 @@ class ScannerPipeline:
             # 최대 개수 제한
             candidates = candidates[:self.deep_max_candidates]
 
+            stage_times['filter'] = time.time() - stage_start
+
             # 결과 저장
             self.deep_scan_results = candidates
             self.last_deep_scan = time.time()
 
             elapsed = time.time() - start_time
+            self.deep_scan_stats = {
+                **fetch_stats,
+                'stage_times': {k: round(v, 3) for k, v in stage_times.items()},
+                'total_time': round(elapsed, 3),
+                'over_interval': elapsed > self.deep_scan_interval,
+            }
             logger.info(
                 f"🔬 Deep Scan 완료: {len(candidates)}종목 선정 "
-                f"(소요시간: {elapsed:.2f}초)"
+                f"(소요시간: {elapsed:.2f}초, 조회: {stage_times['fetch']:.2f}초, "
+                f"요청: {fetch_stats['completed']}/{fetch_stats['tasks']}건)"
             )
 
             return candidates
@@ -494,6 +370,176 @@ class ScannerPipeline:
             logger.error(f"Deep Scan 실패: {e}", exc_info=True)
             return []
 
+    def _build_deep_scan_plan(self, candidate: StockCandidate) -> List[Tuple[str, Callable[[], Any]]]:
+        """
+        종목 1개의 Deep Scan 요청 계획 (서로 독립적인 요청 목록)
+
+        체결강도 / 프로그램매매는 캐시가 있으면 즉시 반영하고 요청하지 않는다.
+
+        Returns:
+            [(요청 종류, 호출 함수), ...]
+        """
+        code = candidate.code
+        plan = [
+            ('investor', partial(self.market_api.get_investor_data, code)),
+            ('bid_ask', partial(self.market_api.get_bid_ask, code)),
+            ('daily', partial(self.market_api.get_daily_chart, code, period=20)),
+        ]
+
+        # 증권사별 매매동향 (주요 증권사 5개, 당일만 조회)
+        for firm_code, _ in DEEP_SCAN_MAJOR_FIRMS:
+            plan.append((
+                f'broker:{firm_code}',
+                partial(
+                    self.market_api.get_securities_firm_trading,
+                    firm_code=firm_code,
+                    stock_code=code,
+                    days=1
+                )
+            ))
+
+        # 체결강도 (ka10047) - 캐시 우선
+        cached_exec = self._get_from_cache(f"execution_{code}")
+        if cached_exec:
+            candidate.execution_intensity = cached_exec.get('execution_intensity')
+        else:
+            plan.append(('execution', partial(self.market_api.get_execution_intensity, stock_code=code)))
+
+        # 프로그램매매 (ka90013) - 캐시 우선
+        cached_prog = self._get_from_cache(f"program_{code}")
+        if cached_prog:
+            candidate.program_net_buy = cached_prog.get('program_net_buy')
+        else:
+            plan.append(('program', partial(self.market_api.get_program_trading, stock_code=code)))
+
+        return plan
+
+    def _fetch_deep_scan_data(
+        self,
+        candidates: List[StockCandidate],
+        deep_config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Deep Scan 데이터 동시 조회
+
+        모든 종목의 독립 요청을 하나의 스레드 풀에서 실행한다. 호출 속도는
+        REST 클라이언트의 API 그룹별 토큰 버킷이 제한하므로 별도 sleep은 없다.
+        마감 시간(fetch_timeout)이 지나면 끝난 요청만 반영하고 나머지는 버린다.
+        워커는 같은 마감 시각 안에서만 호출하므로 (call_deadline) 마감 뒤 남은 요청이
+        공용 호출 한도를 쓰지 않는다.
+
+        Args:
+            candidates: 분석할 종목 리스트
+            deep_config: deep_scan 설정
+
+        Returns:
+            조회 통계 {'tasks', 'completed', 'failed', 'timed_out', 'partial_candidates'}
+        """
+        max_workers = deep_config.get('max_workers', 8)
+        fetch_timeout = deep_config.get('fetch_timeout', max(self.deep_scan_interval * 0.75, 5))
+
+        # 결과 초기화 (응답이 없으면 기본값 유지)
+        for candidate in candidates:
+            candidate.institutional_net_buy = 0
+            candidate.foreign_net_buy = 0
+            candidate.bid_ask_ratio = 0
+            candidate.top_broker_buy_count = 0
+            candidate.top_broker_net_buy = 0
+
+        deadline = time.monotonic() + fetch_timeout
+
+        def run(kind: str, func: Callable[[], Any]) -> Any:
+            # 마감이 지났으면 호출하지 않음 (취소 직전에 시작된 작업)
+            if time.monotonic() >= deadline:
+                return None
+            try:
+                with call_deadline(deadline):
+                    return func()
+            except DeadlineExceeded as e:
+                logger.debug(f"Deep Scan 요청 생략 ({kind}): {e}")
+                return None
+            except Exception as e:
+                logger.debug(f"Deep Scan 요청 실패 ({kind}): {e}")
+                return None
+
+        print(f"📍 Deep Scan: {len(candidates)}종목 동시 조회 (워커 {max_workers}개, 마감 {fetch_timeout:g}초)")
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='deep_scan')
+        futures = {}
+        try:
+            for candidate in candidates:
+                for kind, func in self._build_deep_scan_plan(candidate):
+                    futures[executor.submit(run, kind, func)] = (candidate, kind)
+
+            done, not_done = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        finally:
+            # 마감 초과 요청은 취소 (이미 실행 중인 요청은 결과를 버림)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        failed = 0
+        for future in done:
+            candidate, kind = futures[future]
+            data = future.result()
+            if data is None:
+                failed += 1
+            self._apply_deep_scan_result(candidate, kind, data)
+
+        partial_codes = {futures[f][0].code for f in not_done}
+        if not_done:
+            logger.warning(
+                f"⏱️ Deep Scan 조회 마감 초과 ({fetch_timeout:g}초): "
+                f"{len(not_done)}/{len(futures)}건 미완료, {len(partial_codes)}종목 부분 결과"
+            )
+
+        return {
+            'tasks': len(futures),
+            'completed': len(done),
+            'failed': failed,
+            'timed_out': len(not_done),
+            'partial_candidates': sorted(partial_codes),
+        }
+
+    def _apply_deep_scan_result(self, candidate: StockCandidate, kind: str, data: Any):
+        """Deep Scan 요청 결과를 종목 후보에 반영"""
+        if not data:
+            return
+
+        if kind == 'investor':
+            candidate.institutional_net_buy = data.get('기관_순매수', 0)
+            candidate.foreign_net_buy = data.get('외국인_순매수', 0)
+
+        elif kind == 'bid_ask':
+            bid_total = data.get('매수_총잔량', 1)
+            ask_total = data.get('매도_총잔량', 1)
+            candidate.bid_ask_ratio = bid_total / ask_total if ask_total > 0 else 0
+
+        elif kind == 'daily':
+            # 평균 거래량 (20일)
+            volumes = [row.get('volume', 0) for row in data]
+            candidate.avg_volume = sum(volumes) / len(volumes) if volumes else None
+
+            # 변동성 계산 (20일 수익률 표준편차)
+            prices = [row.get('close', 0) for row in data]
+            if len(prices) > 1:
+                returns = [(prices[i] / prices[i+1] - 1) for i in range(len(prices)-1) if prices[i+1] > 0]
+                if returns:
+                    candidate.volatility = statistics.stdev(returns) if len(returns) > 1 else 0.0
+
+        elif kind.startswith('broker:'):
+            # 최근 데이터 (당일), 순매수인 경우만 집계
+            net_qty = data[0].get('net_qty', 0)
+            if net_qty > 0:
+                candidate.top_broker_buy_count += 1
+                candidate.top_broker_net_buy += net_qty
+
+        elif kind == 'execution':
+            candidate.execution_intensity = data.get('execution_intensity')
+            self._save_to_cache(f"execution_{candidate.code}", data)
+
+        elif kind == 'program':
+            candidate.program_net_buy = data.get('program_net_buy')
+            self._save_to_cache(f"program_{candidate.code}", data)
+
     def _calculate_deep_score(self, candidate: StockCandidate) -> float:
         """
         Deep Scan 점수 계산
@@ -537,6 +583,7 @@ class ScannerPipeline:
         AI Scan (5분 주기)
         - AI 분석을 통한 최종 매수 추천
         - 목표: 5종목 선정
+        - 배치 분석 지원 분석기는 여러 종목을 요청 1건으로 묶어 동시 요청
 
         Args:
             candidates: 분석할 종목 리스트 (None이면 Deep Scan 결과 사용)
@@ -567,35 +614,50 @@ class ScannerPipeline:
             print(f"📍 AI 분석기 타입: {type(self.ai_analyzer).__name__}")
             print(f"📍 AI 분석 시작 - {len(candidates)}개 종목 처리 예정")
 
-            # AI 분석 수행
+            # 종목 데이터 준비 (AI Analyzer 필수 필드: stock_code, current_price, change_rate)
+            stock_datas = [
+                {
+                    'stock_code': candidate.code,
+                    'stock_name': candidate.name,
+                    'current_price': candidate.price,
+                    'volume': candidate.volume,
+                    'change_rate': candidate.rate,
+                    'institutional_net_buy': candidate.institutional_net_buy,
+                    'foreign_net_buy': candidate.foreign_net_buy,
+                    'bid_ask_ratio': candidate.bid_ask_ratio,
+                }
+                for candidate in candidates
+            ]
+
+            # AI 분석 실행 - 배치 분석 지원 시 여러 종목을 묶어 동시 요청
+            if hasattr(self.ai_analyzer, 'analyze_stocks_batch'):
+                print(f"📍 AI 배치 분석 호출 중... (batch_size={ai_config.get('batch_size', 5)})")
+                analyses = self.ai_analyzer.analyze_stocks_batch(
+                    stock_datas,
+                    batch_size=ai_config.get('batch_size', 5),
+                    max_concurrency=ai_config.get('max_concurrency', 4),
+                    hedge_after=ai_config.get('hedge_after'),
+                    timeout=ai_config.get('request_timeout', 30),
+                )
+            else:
+                analyses = []
+                for idx, (candidate, stock_data) in enumerate(zip(candidates, stock_datas), 1):
+                    logger.debug("📍 [{}/{}] AI 분석 중: {} ({})", idx, len(candidates), candidate.name, candidate.code)
+                    try:
+                        analyses.append(self.ai_analyzer.analyze_stock(stock_data))
+                    except Exception as e:
+                        logger.error(f"종목 {candidate.code} AI 분석 실패: {e}", exc_info=True)
+                        analyses.append(None)
+                    time.sleep(1)  # AI API 호출 간격
+
             ai_approved = []
 
-            for idx, candidate in enumerate(candidates, 1):
+            for candidate, analysis in zip(candidates, analyses):
+                if analysis is None:
+                    continue
+
                 try:
-                    print(f"📍 [{idx}/{len(candidates)}] AI 분석 중: {candidate.name} ({candidate.code})")
-                    logger.info(f"🤖 AI 분석 중: {candidate.name} ({candidate.code})")
-
-                    # 종목 데이터 준비 (AI Analyzer 필수 필드: stock_code, current_price, change_rate)
-                    stock_data = {
-                        'stock_code': candidate.code,
-                        'stock_name': candidate.name,
-                        'current_price': candidate.price,
-                        'volume': candidate.volume,
-                        'change_rate': candidate.rate,
-                        'institutional_net_buy': candidate.institutional_net_buy,
-                        'foreign_net_buy': candidate.foreign_net_buy,
-                        'bid_ask_ratio': candidate.bid_ask_ratio,
-                    }
-
-                    # AI 분석 실행
-                    print(f"    📍 stock_data 준비 완료:")
-                    print(f"       - stock_code: {stock_data.get('stock_code')}")
-                    print(f"       - current_price: {stock_data.get('current_price')}")
-                    print(f"       - change_rate: {stock_data.get('change_rate')}")
-                    print(f"       - 전체 키: {list(stock_data.keys())}")
-                    print(f"    📍 analyze_stock() 호출 중...")
-                    analysis = self.ai_analyzer.analyze_stock(stock_data)
-                    print(f"    📍 analyze_stock() 완료: {analysis}")
+                    logger.info(f"🤖 AI 분석 결과: {candidate.name} ({candidate.code}) → {analysis.get('signal')}")
 
                     # 결과 저장
                     candidate.ai_score = analysis.get('score', 0)
@@ -632,13 +694,8 @@ class ScannerPipeline:
                             f"(점수: {candidate.ai_score:.1f}, 신뢰도: {candidate.ai_confidence})"
                         )
 
-                    time.sleep(1)  # AI API 호출 간격
-
                 except Exception as e:
-                    print(f"    ❌ AI 분석 중 에러 발생: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    logger.error(f"종목 {candidate.code} AI 분석 실패: {e}", exc_info=True)
+                    logger.error(f"종목 {candidate.code} AI 결과 처리 실패: {e}", exc_info=True)
                     continue
 
             # 최종 점수 기준 정렬
@@ -727,6 +784,7 @@ class ScannerPipeline:
             'deep_scan': {
                 'count': len(self.deep_scan_results),
                 'last_run': datetime.fromtimestamp(self.last_deep_scan).isoformat() if self.last_deep_scan else None,
+                'stats': self.deep_scan_stats,
             },
             'ai_scan': {
                 'count': len(self.ai_scan_results),
@@ -34,6 +34,9 @@ from .signal_checker import SignalChecker, SignalType, TradingSignalValidator
 # v4.1 Advanced Risk & Orchestration
 from .risk_orchestrator import RiskOrchestrator, RiskLevel, RiskAssessment, get_risk_orchestrator
 
+# 실시간 체결 틱 기반 청산 엔진
+from .exit_engine import ExitEngine, ExitSignal
+
 __all__ = [
     'BaseStrategy',
     'MomentumStrategy',
@@ -62,4 +65,7 @@ __all__ = [
     'RiskLevel',
     'RiskAssessment',
     'get_risk_orchestrator',
+    # 청산 엔진
+    'ExitEngine',
+    'ExitSignal',
 ]
\ No newline at end of file
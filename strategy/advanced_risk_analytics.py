@@ -2,19 +2,19 @@
 Advanced Risk Analytics
 Professional-grade risk management and analytics
 - Value at Risk (VaR)
-- Monte Carlo Simulation
+- Monte Carlo Simulation (chunked NumPy engine, seeded RNG)
 - Sharpe/Sortino Ratios
 - Maximum Drawdown
 - Risk-adjusted returns
 """
 
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from scipy import stats
 import math
 
-from ..utils.logger import setup_logger
+from utils.logger_new import setup_logger
 
 logger = setup_logger(__name__)
 
@@ -31,10 +31,13 @@ class AdvancedRiskAnalytics:
     - Maximum Drawdown
     - Calmar Ratio
     - Beta and Alpha calculations
-    - Monte Carlo simulations
+    - Monte Carlo simulations (single-asset / multi-asset, Cholesky or bootstrap)
     - Stress testing
     """
 
+    # 시뮬레이션 chunk 당 최대 원소 수 (경로 × 기간)
+    MC_CHUNK_ELEMENTS = 2_000_000
+
     def __init__(self, confidence_level: float = 0.95):
         """
         Initialize risk analytics
@@ -124,8 +127,9 @@ class AdvancedRiskAnalytics:
         std_return: float,
         time_horizon: int = 1,
         num_simulations: int = 10000,
-        confidence_level: Optional[float] = None
-    ) -> Tuple[float, List[float]]:
+        confidence_level: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> Tuple[float, np.ndarray]:
         """
         Calculate Value at Risk using Monte Carlo simulation
 
@@ -136,33 +140,28 @@ class AdvancedRiskAnalytics:
             time_horizon: Time horizon in days
             num_simulations: Number of simulations to run
             confidence_level: Confidence level
+            seed: Random seed (for reproducible runs)
 
         Returns:
             (VaR value, simulated final values)
         """
         conf_level = confidence_level or self.confidence_level
 
-        # Run simulations
-        simulated_values = []
-
-        for _ in range(num_simulations):
-            # Simulate returns for each day in horizon
-            portfolio_value = current_value
-
-            for _ in range(time_horizon):
-                # Random return from normal distribution
-                daily_return = np.random.normal(mean_return, std_return)
-                portfolio_value *= (1 + daily_return)
-
-            simulated_values.append(portfolio_value)
+        sim = self._simulate_paths(
+            lambda rng, size: rng.normal(mean_return, std_return, (size, time_horizon)),
+            current_value,
+            num_simulations,
+            time_horizon,
+            seed=seed
+        )
+        simulated_values = sim['final_values']
 
         # Calculate VaR from simulated values
-        sorted_values = sorted(simulated_values)
-        var_index = int((1 - conf_level) * len(sorted_values))
-        var_value = sorted_values[var_index]
+        var_index = int((1 - conf_level) * len(simulated_values))
+        var_value = np.partition(simulated_values, var_index)[var_index]
 
         # VaR as loss from current value
-        var = current_value - var_value
+        var = float(current_value - var_value)
 
         logger.debug(
             f"Monte Carlo VaR ({conf_level*100:.0f}% confidence, "
@@ -459,7 +458,9 @@ class AdvancedRiskAnalytics:
         mean_return: float,
         std_return: float,
         time_horizon: int = 252,
-        num_simulations: int = 1000
+        num_simulations: int = 1000,
+        seed: Optional[int] = None,
+        include_paths: bool = True
     ) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation for portfolio projection
@@ -470,6 +471,8 @@ class AdvancedRiskAnalytics:
             std_return: Standard deviation of returns
             time_horizon: Number of days to simulate
             num_simulations: Number of simulation paths
+            seed: Random seed (for reproducible runs)
+            include_paths: Include every path in the result (large for many simulations)
 
         Returns:
             Simulation results with statistics
@@ -479,50 +482,211 @@ class AdvancedRiskAnalytics:
             f"over {time_horizon} days"
         )
 
-        all_paths = []
+        sim = self._simulate_paths(
+            lambda rng, size: rng.normal(mean_return, std_return, (size, time_horizon)),
+            initial_value,
+            num_simulations,
+            time_horizon,
+            seed=seed,
+            keep_paths=include_paths
+        )
+
+        results = {
+            'initial_value': initial_value,
+            'num_simulations': num_simulations,
+            'time_horizon': time_horizon,
+            **self._summarize_simulation(sim, initial_value)
+        }
+        if include_paths:
+            results['paths'] = sim['paths'].tolist()  # All simulation paths
+
+        logger.info(
+            f"Monte Carlo Results: "
+            f"Mean={results['mean_final_value']:,.0f}, "
+            f"P(profit)={results['probability_profit']:.1%}"
+        )
+
+        return results
+
+    def simulate_portfolio(
+        self,
+        weights: Sequence[float],
+        initial_value: float,
+        time_horizon: int = 20,
+        num_simulations: int = 100_000,
+        mean_returns: Optional[Sequence[float]] = None,
+        cov_matrix: Optional[np.ndarray] = None,
+        historical_returns: Optional[np.ndarray] = None,
+        method: str = 'cholesky',
+        confidence_level: Optional[float] = None,
+        chunk_size: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Multi-asset Monte Carlo VaR / CVaR / drawdown simulation
+
+        Paths are (simulations x horizon x assets) daily returns, generated in
+        chunks. Because the portfolio is held at constant weights, the asset
+        axis is folded into the weight vector before drawing:
 
-        for _ in range(num_simulations):
-            path = [initial_value]
+        - cholesky: asset shocks z @ L.T dotted with weights equal z @ (L.T @ w),
+          so one normal draw per (path, day) scaled by ||L.T @ w|| gives the
+          exact portfolio return distribution
+        - bootstrap: whole historical days (rows) are resampled, so sampling
+          rows of historical_returns @ w is the same draw
 
-            for _ in range(time_horizon):
-                # Random return
-                daily_return = np.random.normal(mean_return, std_return)
-                new_value = path[-1] * (1 + daily_return)
-                path.append(new_value)
+        Args:
+            weights: Portfolio weights per asset
+            initial_value: Current portfolio value
+            time_horizon: Days to simulate
+            num_simulations: Number of paths
+            mean_returns: Expected daily return per asset (cholesky, default: historical mean)
+            cov_matrix: Daily return covariance (cholesky, default: historical covariance)
+            historical_returns: Daily returns matrix (days x assets)
+            method: 'cholesky' or 'bootstrap'
+            confidence_level: VaR / CVaR confidence level
+            chunk_size: Paths per chunk (None = automatic)
+            seed: Random seed (for reproducible runs)
 
-            all_paths.append(path)
+        Returns:
+            VaR, CVaR, final value and max drawdown distributions
+        """
+        conf_level = confidence_level or self.confidence_level
+        weights = np.asarray(weights, dtype=np.float64)
+        hist = None if historical_returns is None else np.asarray(historical_returns, dtype=np.float64)
+
+        if method == 'bootstrap':
+            if hist is None or len(hist) == 0:
+                raise ValueError("bootstrap method requires historical_returns")
+            portfolio_history = hist @ weights
+            draw = lambda rng, size: portfolio_history[
+                rng.integers(0, len(portfolio_history), size=(size, time_horizon))
+            ]
+        elif method == 'cholesky':
+            if mean_returns is None or cov_matrix is None:
+                if hist is None or len(hist) < 2:
+                    raise ValueError("cholesky method requires mean_returns/cov_matrix or historical_returns")
+            mu = np.asarray(mean_returns if mean_returns is not None else hist.mean(axis=0), dtype=np.float64)
+            cov = np.asarray(cov_matrix if cov_matrix is not None else np.cov(hist, rowvar=False), dtype=np.float64)
+            exposure = self._cholesky(np.atleast_2d(cov)).T @ weights
+            portfolio_mean = float(mu @ weights)
+            portfolio_std = float(np.linalg.norm(exposure))
+            draw = lambda rng, size: portfolio_mean + portfolio_std * rng.standard_normal((size, time_horizon))
+        else:
+            raise ValueError(f"Unknown simulation method: {method}")
 
-        # Convert to numpy array for analysis
-        all_paths = np.array(all_paths)
+        sim = self._simulate_paths(draw, initial_value, num_simulations, time_horizon, chunk_size, seed)
 
-        # Calculate statistics for final values
-        final_values = all_paths[:, -1]
+        pnl = sim['final_values'] - initial_value
+        var_index = int((1 - conf_level) * num_simulations)
+        var_pnl = np.partition(pnl, var_index)[var_index]
+        tail = pnl[pnl <= var_pnl]
+        var = float(-var_pnl)
+        cvar = float(-tail.mean()) if tail.size else var
 
         results = {
+            'method': method,
             'initial_value': initial_value,
             'num_simulations': num_simulations,
             'time_horizon': time_horizon,
-            'mean_final_value': np.mean(final_values),
-            'median_final_value': np.median(final_values),
-            'std_final_value': np.std(final_values),
-            'min_final_value': np.min(final_values),
-            'max_final_value': np.max(final_values),
-            'percentile_5': np.percentile(final_values, 5),
-            'percentile_25': np.percentile(final_values, 25),
-            'percentile_75': np.percentile(final_values, 75),
-            'percentile_95': np.percentile(final_values, 95),
-            'probability_profit': (final_values > initial_value).sum() / num_simulations,
-            'paths': all_paths.tolist()  # All simulation paths
+            'num_assets': len(weights),
+            'confidence_level': conf_level,
+            'var': var,
+            'var_pct': var / initial_value * 100,
+            'cvar': cvar,
+            'cvar_pct': cvar / initial_value * 100,
+            **self._summarize_simulation(sim, initial_value),
+            'final_values': sim['final_values']
         }
 
         logger.info(
-            f"Monte Carlo Results: "
-            f"Mean={results['mean_final_value']:,.0f}, "
-            f"P(profit)={results['probability_profit']:.1%}"
+            f"Portfolio Monte Carlo ({method}, {num_simulations:,} paths x {time_horizon}d, "
+            f"{len(weights)} assets): VaR={results['var_pct']:.2f}%, CVaR={results['cvar_pct']:.2f}%"
         )
 
         return results
 
+    def _simulate_paths(
+        self,
+        draw_returns: Callable[[np.random.Generator, int], np.ndarray],
+        initial_value: float,
+        num_simulations: int,
+        time_horizon: int,
+        chunk_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        keep_paths: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        Chunked path engine
+
+        draw_returns(rng, size) returns a (size x time_horizon) matrix of daily
+        returns. Only per-path results are kept unless keep_paths is set.
+        """
+        if chunk_size is None:
+            chunk_size = max(1, self.MC_CHUNK_ELEMENTS // max(time_horizon, 1))
+
+        rng = np.random.default_rng(seed)
+        final_values = np.empty(num_simulations)
+        max_drawdowns = np.empty(num_simulations)
+        paths = np.empty((num_simulations, time_horizon + 1)) if keep_paths else None
+
+        for start in range(0, num_simulations, chunk_size):
+            size = min(chunk_size, num_simulations - start)
+            end = start + size
+
+            # 초기 가치 대비 배수
+            growth = np.cumprod(1 + draw_returns(rng, size), axis=1)
+            peaks = np.maximum(np.maximum.accumulate(growth, axis=1), 1.0)
+
+            final_values[start:end] = growth[:, -1]
+            max_drawdowns[start:end] = ((peaks - growth) / peaks).max(axis=1) * 100
+            if keep_paths:
+                paths[start:end, 0] = initial_value
+                paths[start:end, 1:] = growth * initial_value
+
+        final_values *= initial_value
+
+        return {
+            'final_values': final_values,
+            'max_drawdowns': max_drawdowns,
+            'paths': paths
+        }
+
+    def _summarize_simulation(self, sim: Dict[str, np.ndarray], initial_value: float) -> Dict[str, Any]:
+        """Final value / drawdown distribution statistics"""
+        final_values = sim['final_values']
+        max_drawdowns = sim['max_drawdowns']
+        value_pcts = np.percentile(final_values, [5, 25, 75, 95])
+        drawdown_pcts = np.percentile(max_drawdowns, [5, 25, 50, 75, 95])
+
+        return {
+            'mean_final_value': float(final_values.mean()),
+            'median_final_value': float(np.median(final_values)),
+            'std_final_value': float(final_values.std()),
+            'min_final_value': float(final_values.min()),
+            'max_final_value': float(final_values.max()),
+            'percentile_5': float(value_pcts[0]),
+            'percentile_25': float(value_pcts[1]),
+            'percentile_75': float(value_pcts[2]),
+            'percentile_95': float(value_pcts[3]),
+            'probability_profit': float((final_values > initial_value).mean()),
+            'mean_max_drawdown_pct': float(max_drawdowns.mean()),
+            'worst_max_drawdown_pct': float(max_drawdowns.max()),
+            'max_drawdown_percentiles': {
+                p: float(v) for p, v in zip((5, 25, 50, 75, 95), drawdown_pcts)
+            }
+        }
+
+    @staticmethod
+    def _cholesky(cov_matrix: np.ndarray) -> np.ndarray:
+        """Cholesky factor; clips negative eigenvalues if cov is not positive definite"""
+        try:
+            return np.linalg.cholesky(cov_matrix)
+        except np.linalg.LinAlgError:
+            eigvals, eigvecs = np.linalg.eigh((cov_matrix + cov_matrix.T) / 2)
+            eigvals = np.clip(eigvals, 1e-12, None)
+            return np.linalg.cholesky(eigvecs @ np.diag(eigvals) @ eigvecs.T)
+
     def calculate_risk_metrics(
         self,
         returns: List[float],
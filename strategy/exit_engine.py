@@ -0,0 +1,535 @@
+"""
+strategy/exit_engine.py
+실시간 체결 틱 기반 청산 엔진
+
+보유 종목마다 가격 인덱스 트리거 테이블을 메모리에 두고, WebSocket 체결(0B)
+틱이 들어올 때마다 임계값 교차를 확인해 즉시 매도 주문을 낸다.
+
+- 하방 트리거(손절 / 트레일링 스톱)는 최대 힙, 상방 트리거(익절)는 최소 힙
+  → 틱당 확인은 힙 top 비교 O(1), 트레일링 스톱 상향은 push O(log n)
+- 변경된 트리거의 이전 힙 항목은 지연 삭제 (top에 올라올 때 버림)
+- 발동 후 주문 완료까지 재발동 방지, 주문 실패 시 retry_interval 후 재무장
+- 주문 접수 후에도 rearm_timeout 동안 보유가 남아 있으면 미체결 매도 주문에
+  묶이지 않은 주문 가능 수량으로만 재무장 (미체결 주문 수량 재매도 방지)
+- 주문은 전용 워커 스레드에서 실행 (WebSocket 수신 루프를 막지 않음)
+- 틱 수신 → 발동 → 주문 시작 → 주문 완료 지연 시간 감사 기록
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 트리거 종류
+STOP_LOSS = 'stop_loss'
+TAKE_PROFIT = 'take_profit'
+TRAILING_STOP = 'trailing_stop'
+
+# 트리거 방향 (below: 가격 <= 트리거가, above: 가격 >= 트리거가)
+BELOW = 'below'
+ABOVE = 'above'
+
+TRIGGER_REASONS = {
+    STOP_LOSS: '손절가 도달',
+    TAKE_PROFIT: '목표가 도달',
+    TRAILING_STOP: '트레일링 스톱',
+}
+
+
+@dataclass
+class ExitTrigger:
+    """청산 트리거"""
+    kind: str
+    side: str
+    price: float
+    active: bool = True
+
+
+@dataclass
+class ExitSignal:
+    """청산 신호 (주문 콜백 인자)"""
+    stock_code: str
+    stock_name: str
+    quantity: int
+    entry_price: float
+    price: int                    # 발동 틱 체결가
+    trigger_price: float
+    kind: str
+    reason: str
+    tick_received_at: float       # time.perf_counter() 기준
+    triggered_at: float
+
+    @property
+    def profit_loss(self) -> int:
+        return int((self.price - self.entry_price) * self.quantity)
+
+    @property
+    def profit_loss_rate(self) -> float:
+        if self.entry_price <= 0:
+            return 0.0
+        return (self.price - self.entry_price) / self.entry_price * 100
+
+
+@dataclass
+class ExitPosition:
+    """종목별 트리거 테이블"""
+    stock_code: str
+    stock_name: str
+    quantity: int
+    entry_price: float
+    highest_price: float
+    trail_pct: Optional[float] = None
+    trail_amount: Optional[float] = None
+    activation_price: Optional[float] = None
+    min_lock_price: Optional[float] = None
+    trailing_active: bool = False
+    status: str = 'armed'         # armed / exiting / retry / closed
+    retry_at: float = 0.0
+    closed_at: float = 0.0        # 매도 주문 접수 시각 (time.monotonic())
+    locked_quantity: int = 0      # 접수된 매도 주문 중 아직 체결되지 않은 수량 (추정)
+    reported_quantity: int = 0    # 마지막 동기화 때 보고된 보유 수량
+    last_price: int = 0
+    triggers: Dict[str, ExitTrigger] = field(default_factory=dict)
+    below: List[Tuple[float, int, ExitTrigger]] = field(default_factory=list)   # (-price, seq, trigger)
+    above: List[Tuple[float, int, ExitTrigger]] = field(default_factory=list)   # (price, seq, trigger)
+
+
+class ExitEngine:
+    """
+    틱 기반 청산 엔진
+
+    Usage:
+        engine = ExitEngine(on_exit=lambda s: bot._execute_sell(...))
+        engine.upsert_position('005930', '삼성전자', 10, 70000, stop_loss=66500, take_profit=77000)
+        websocket_manager.register_callback('0B', engine.on_realtime_data)
+    """
+
+    def __init__(
+        self,
+        on_exit: Callable[[ExitSignal], Any],
+        trail_pct: Optional[float] = None,
+        activation_pct: float = 0.03,
+        min_profit_lock_pct: float = 0.50,
+        retry_interval: float = 5.0,
+        rearm_timeout: float = 60.0,
+        max_workers: int = 2,
+        audit_size: int = 500,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """
+        Args:
+            on_exit: 매도 주문 함수 (False 반환 / 예외는 실패로 처리)
+            trail_pct: 기본 트레일링 폭 (최고가 대비 비율, None이면 트레일링 없음)
+            activation_pct: 트레일링 활성화 수익률
+            min_profit_lock_pct: 활성화 후 보호할 최소 수익 비율 (activation_pct 대비)
+            retry_interval: 주문 실패 후 재발동까지 대기 (초)
+            rearm_timeout: 주문 접수 후 보유가 남아 있을 때 잔량으로 재무장하기까지 대기 (초)
+            max_workers: 주문 워커 스레드 수
+            audit_size: 감사 기록 보관 개수
+            executor: 주문 실행기 (None이면 전용 스레드 풀 생성)
+        """
+        self.on_exit = on_exit
+        self.trail_pct = trail_pct
+        self.activation_pct = activation_pct
+        self.min_profit_lock_pct = min_profit_lock_pct
+        self.retry_interval = retry_interval
+        self.rearm_timeout = rearm_timeout
+
+        self._lock = threading.Lock()
+        self._positions: Dict[str, ExitPosition] = {}
+        self._seq = itertools.count()
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='exit-order')
+
+        self._audit: Deque[Dict[str, Any]] = deque(maxlen=audit_size)
+        self.stats = {
+            'ticks': 0,
+            'evaluated': 0,
+            'fired': 0,
+            'orders_ok': 0,
+            'orders_failed': 0,
+            'suppressed': 0,
+            'trail_updates': 0,
+            'rearmed': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 트리거 테이블
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _base_code(stock_code: str) -> str:
+        stock_code = stock_code[:-3] if stock_code.endswith('_NX') else stock_code
+        return stock_code[1:] if stock_code.startswith('A') else stock_code
+
+    def _push(self, position: ExitPosition, trigger: ExitTrigger):
+        """트리거 가격을 힙에 등록 (이전 항목은 top에서 지연 삭제)"""
+        if trigger.side == BELOW:
+            heapq.heappush(position.below, (-trigger.price, next(self._seq), trigger))
+        else:
+            heapq.heappush(position.above, (trigger.price, next(self._seq), trigger))
+
+    def _set_trigger(self, position: ExitPosition, kind: str, side: str, price: Optional[float]):
+        """트리거 추가 / 가격 변경 / 해제 (O(log n))"""
+        trigger = position.triggers.get(kind)
+        if price is None or price <= 0:
+            if trigger is not None:
+                trigger.active = False
+                del position.triggers[kind]
+            return
+        if trigger is not None and trigger.price == price:
+            return
+        if trigger is not None:
+            trigger.active = False
+        trigger = position.triggers[kind] = ExitTrigger(kind, side, float(price))
+        self._push(position, trigger)
+
+    @staticmethod
+    def _top(heap: List[Tuple[float, int, ExitTrigger]]) -> Optional[ExitTrigger]:
+        """유효한 최상단 트리거 (비활성 항목은 버림)"""
+        while heap:
+            trigger = heap[0][2]
+            if trigger.active:
+                return trigger
+            heapq.heappop(heap)
+        return None
+
+    def upsert_position(
+        self,
+        stock_code: str,
+        stock_name: str,
+        quantity: int,
+        entry_price: float,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None,
+        trail_pct: Optional[float] = None,
+        trail_amount: Optional[float] = None
+    ) -> ExitPosition:
+        """
+        포지션 등록 / 갱신 (보유 수량 / 평균단가 / 손절 / 익절 반영)
+
+        Args:
+            stock_code: 종목코드
+            stock_name: 종목명
+            quantity: 보유 수량
+            entry_price: 평균단가
+            stop_loss: 손절가
+            take_profit: 익절가
+            trail_pct: 트레일링 폭 비율 (None이면 엔진 기본값)
+            trail_amount: 트레일링 폭 금액 (예: ATR x 승수, trail_pct보다 우선)
+
+        Returns:
+            ExitPosition
+        """
+        code = self._base_code(stock_code)
+        trail_pct = self.trail_pct if trail_pct is None else trail_pct
+
+        with self._lock:
+            position = self._positions.get(code)
+            if position is None or position.entry_price != entry_price:
+                position = ExitPosition(
+                    stock_code=code,
+                    stock_name=stock_name,
+                    quantity=quantity,
+                    entry_price=entry_price,
+                    highest_price=entry_price,
+                )
+                if code in self._positions:
+                    # 평균단가 변경 (추가 매수) → 트레일링 기준 초기화, 발동 상태는 유지
+                    old = self._positions[code]
+                    position.status, position.retry_at = old.status, old.retry_at
+                    position.closed_at = old.closed_at
+                    position.locked_quantity = old.locked_quantity
+                    position.reported_quantity = old.reported_quantity
+                    position.highest_price = max(old.highest_price, entry_price)
+                self._positions[code] = position
+
+            position.stock_name = stock_name or position.stock_name
+            position.quantity = quantity
+            position.trail_pct = trail_pct
+            position.trail_amount = trail_amount
+            if trail_pct or trail_amount:
+                position.activation_price = entry_price * (1 + self.activation_pct)
+                position.min_lock_price = entry_price * (1 + self.activation_pct * self.min_profit_lock_pct)
+            else:
+                position.activation_price = position.min_lock_price = None
+                self._set_trigger(position, TRAILING_STOP, BELOW, None)
+
+            self._set_trigger(position, STOP_LOSS, BELOW, stop_loss)
+            self._set_trigger(position, TAKE_PROFIT, ABOVE, take_profit)
+            if position.trailing_active:
+                self._update_trailing(position)
+        return position
+
+    def remove_position(self, stock_code: str) -> bool:
+        """포지션 제거"""
+        with self._lock:
+            return self._positions.pop(self._base_code(stock_code), None) is not None
+
+    def sync_positions(self, positions: Iterable[Dict[str, Any]]) -> int:
+        """
+        보유 종목 목록과 동기화 (없는 종목 제거, 있는 종목 등록 / 갱신)
+
+        매도 주문이 접수된 종목은 체결 대기로 보고 건너뛰되, rearm_timeout이
+        지나도 보유가 남아 있으면 미체결 매도 주문에 묶이지 않은 주문 가능 수량으로
+        재무장한다. 주문 가능 수량은 orderable_quantity (증권사 매매가능수량) 가
+        있으면 그 값을, 없으면 보고된 보유 수량에서 아직 체결되지 않은 매도 주문
+        수량(보유 감소분으로 추정)을 뺀 값을 쓴다. 주문 가능 수량이 없으면
+        (이전 주문이 잔량 전부를 잡고 있음) 재무장하지 않는다.
+
+        Args:
+            positions: upsert_position 인자 dict 목록 (+ 선택: orderable_quantity)
+
+        Returns:
+            등록된 포지션 수
+        """
+        held = set()
+        for p in positions:
+            p = dict(p)
+            orderable = p.pop('orderable_quantity', None)
+            code = self._base_code(p['stock_code'])
+            held.add(code)
+            reported = int(p.get('quantity') or 0)
+            with self._lock:
+                position = self._positions.get(code)
+                if position is not None:
+                    # 보유 감소분 = 접수된 매도 주문의 체결분
+                    filled = max(position.reported_quantity - reported, 0)
+                    position.locked_quantity = max(position.locked_quantity - filled, 0)
+                    position.reported_quantity = reported
+                    if orderable is None:
+                        quantity = reported - position.locked_quantity
+                    else:
+                        quantity = min(int(orderable), reported)
+                        position.locked_quantity = reported - quantity
+                    p['quantity'] = max(quantity, 0)
+
+                    if position.status == 'closed':
+                        if time.monotonic() < position.closed_at + self.rearm_timeout:
+                            continue  # 매도 주문 체결 대기 중
+                        if p['quantity'] <= 0:
+                            continue  # 미체결 매도 주문이 보유 전부를 잡고 있음
+                        position.status = 'armed'
+                        self.stats['rearmed'] += 1
+                        logger.warning(
+                            f"[{code}] 매도 주문 후 보유 잔존 ({reported}주) → "
+                            f"주문 가능 {p['quantity']}주로 재무장"
+                        )
+            position = self.upsert_position(**p)
+            with self._lock:
+                position.reported_quantity = reported
+
+        with self._lock:
+            for code in [c for c in self._positions if c not in held]:
+                del self._positions[code]
+            return len(self._positions)
+
+    def get_position(self, stock_code: str) -> Optional[ExitPosition]:
+        return self._positions.get(self._base_code(stock_code))
+
+    def get_triggers(self, stock_code: str) -> Dict[str, float]:
+        """종목별 활성 트리거 가격"""
+        with self._lock:
+            position = self._positions.get(self._base_code(stock_code))
+            if position is None:
+                return {}
+            return {kind: trigger.price for kind, trigger in position.triggers.items()}
+
+    @property
+    def stock_codes(self) -> List[str]:
+        return list(self._positions)
+
+    # ------------------------------------------------------------------
+    # 틱 처리
+    # ------------------------------------------------------------------
+
+    def _update_trailing(self, position: ExitPosition):
+        """최고가 기준 트레일링 스톱 상향 (하향하지 않음)"""
+        if position.trail_amount:
+            stop = position.highest_price - position.trail_amount
+        else:
+            stop = position.highest_price * (1 - position.trail_pct)
+        stop = max(stop, position.min_lock_price)
+
+        current = position.triggers.get(TRAILING_STOP)
+        if current is None or stop > current.price:
+            self._set_trigger(position, TRAILING_STOP, BELOW, stop)
+            self.stats['trail_updates'] += 1
+
+    def on_realtime_data(self, data: Dict[str, Any]) -> Optional[ExitSignal]:
+        """
+        WebSocket 실시간 체결(0B) 콜백
+
+        Returns:
+            발동된 ExitSignal (없으면 None)
+        """
+        received_at = time.perf_counter()
+        if data.get('type', '0B') != '0B':
+            return None
+        try:
+            price = abs(int(data.get('values', {}).get('10', '0')))
+        except (TypeError, ValueError):
+            return None
+        return self.on_price(data.get('item', ''), price, received_at)
+
+    def on_price(self, stock_code: str, price: int, received_at: Optional[float] = None) -> Optional[ExitSignal]:
+        """
+        체결가 반영 및 트리거 확인
+
+        Args:
+            stock_code: 종목코드 (_NX 접미사 허용)
+            price: 체결가
+            received_at: 틱 수신 시각 (time.perf_counter(), None이면 지금)
+
+        Returns:
+            발동된 ExitSignal (없으면 None)
+        """
+        if received_at is None:
+            received_at = time.perf_counter()
+        if price <= 0:
+            return None
+
+        self.stats['ticks'] += 1
+        code = self._base_code(stock_code)
+        position = self._positions.get(code)
+        if position is None:
+            return None
+
+        with self._lock:
+            position.last_price = price
+            if position.status != 'armed':
+                if position.status != 'retry' or time.monotonic() < position.retry_at:
+                    self.stats['suppressed'] += 1
+                    return None
+                position.status = 'armed'
+            self.stats['evaluated'] += 1
+
+            if price > position.highest_price:
+                position.highest_price = price
+                if position.trailing_active:
+                    self._update_trailing(position)
+            if not position.trailing_active and position.activation_price and price >= position.activation_price:
+                position.trailing_active = True
+                self._update_trailing(position)
+                logger.info(f"[{code}] 트레일링 스톱 활성화: 최고가 {position.highest_price:,.0f}원")
+
+            trigger = self._top(position.below)
+            if trigger is None or price > trigger.price:
+                trigger = self._top(position.above)
+                if trigger is None or price < trigger.price:
+                    return None
+            if position.quantity <= 0:
+                return None  # 주문 가능 수량 없음 (미체결 매도 주문이 보유 전부를 잡고 있음)
+
+            triggered_at = time.perf_counter()
+            position.status = 'exiting'
+            signal = ExitSignal(
+                stock_code=code,
+                stock_name=position.stock_name,
+                quantity=position.quantity,
+                entry_price=position.entry_price,
+                price=price,
+                trigger_price=trigger.price,
+                kind=trigger.kind,
+                reason=f"{TRIGGER_REASONS[trigger.kind]} ({trigger.price:,.0f}원)",
+                tick_received_at=received_at,
+                triggered_at=triggered_at,
+            )
+            self.stats['fired'] += 1
+
+        logger.info(f"📤 {signal.stock_name} 청산 트리거: {signal.reason}, 체결가 {price:,}원")
+        self._executor.submit(self._dispatch, signal)
+        return signal
+
+    def _dispatch(self, signal: ExitSignal):
+        """주문 워커: 매도 주문 실행 + 지연 시간 기록"""
+        submitted_at = time.perf_counter()
+        error = None
+        try:
+            ok = self.on_exit(signal) is not False
+        except Exception as e:
+            ok = False
+            error = str(e)
+            logger.error(f"청산 주문 실패 ({signal.stock_code}): {e}", exc_info=True)
+        completed_at = time.perf_counter()
+
+        with self._lock:
+            position = self._positions.get(signal.stock_code)
+            if ok:
+                self.stats['orders_ok'] += 1
+                if position is not None:
+                    position.status = 'closed'
+                    position.closed_at = time.monotonic()
+                    position.locked_quantity += signal.quantity
+            else:
+                self.stats['orders_failed'] += 1
+                if position is not None:
+                    position.status = 'retry'
+                    position.retry_at = time.monotonic() + self.retry_interval
+
+            self._audit.append({
+                'time': datetime.now().isoformat(timespec='milliseconds'),
+                'stock_code': signal.stock_code,
+                'kind': signal.kind,
+                'price': signal.price,
+                'trigger_price': signal.trigger_price,
+                'quantity': signal.quantity,
+                'ok': ok,
+                'error': error,
+                'tick_to_trigger_ms': (signal.triggered_at - signal.tick_received_at) * 1000,
+                'trigger_to_order_ms': (submitted_at - signal.triggered_at) * 1000,
+                'order_ms': (completed_at - submitted_at) * 1000,
+                'tick_to_order_done_ms': (completed_at - signal.tick_received_at) * 1000,
+            })
+
+    # ------------------------------------------------------------------
+    # 감사 / 통계
+    # ------------------------------------------------------------------
+
+    def get_audit(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """발동 / 주문 감사 기록 (오래된 순)"""
+        with self._lock:
+            records = list(self._audit)
+        return records[-limit:] if limit else records
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        엔진 통계
+
+        Returns:
+            {'positions', 'ticks', 'fired', 'orders_ok', ..., 'latency': {필드: {'avg', 'p95', 'max'}}}
+        """
+        records = self.get_audit()
+        latency = {}
+        for name in ('tick_to_trigger_ms', 'trigger_to_order_ms', 'order_ms', 'tick_to_order_done_ms'):
+            values = sorted(r[name] for r in records)
+            latency[name] = {
+                'avg': sum(values) / len(values) if values else 0.0,
+                'p95': values[int(len(values) * 0.95)] if values else 0.0,
+                'max': values[-1] if values else 0.0,
+            }
+        return {'positions': len(self._positions), **self.stats, 'latency': latency}
+
+    def shutdown(self, wait: bool = True):
+        """주문 워커 종료"""
+        if self._own_executor:
+            self._executor.shutdown(wait=wait)
+
+
+__all__ = [
+    'ExitEngine',
+    'ExitSignal',
+    'ExitTrigger',
+    'ExitPosition',
+    'STOP_LOSS',
+    'TAKE_PROFIT',
+    'TRAILING_STOP',
+]
@@ -9,6 +9,16 @@ import numpy as np
 import logging
 from enum import Enum
 
+from utils.portfolio_math import (
+    shrink_covariance,
+    weight_bounds,
+    min_variance_weights,
+    max_sharpe_weights,
+    risk_parity_weights,
+    efficient_frontier_weights,
+    target_return_weights,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,12 +66,14 @@ class PortfolioOptimizer:
     - Black-Litterman Model
     """
 
-    def __init__(self, risk_free_rate: float = 0.03):
+    def __init__(self, risk_free_rate: float = 0.03, covariance_shrinkage: bool = True):
         """
         Args:
             risk_free_rate: 무위험 수익률 (연간)
+            covariance_shrinkage: Ledoit-Wolf 공분산 수축 사용 여부
         """
         self.risk_free_rate = risk_free_rate
+        self.covariance_shrinkage = covariance_shrinkage
         logger.info(f"Portfolio Optimizer initialized: rf={risk_free_rate:.2%}")
 
     def optimize(self,
@@ -208,34 +220,32 @@ class PortfolioOptimizer:
         if constraints is None:
             constraints = {}
 
-        # Find min and max return portfolios
-        min_vol_weights = self._minimize_volatility(
-            cov_matrix, stock_codes,
-            constraints.get('max_weight', 1.0),
+        lower, upper = weight_bounds(
+            len(stock_codes),
             constraints.get('min_weight', 0.0),
+            constraints.get('max_weight', 1.0),
             constraints.get('allow_short', False)
         )
 
-        min_vol_return = np.dot(
-            np.array([min_vol_weights[code] for code in stock_codes]),
-            expected_returns
-        )
+        # Find min and max return portfolios
+        min_vol_weights = min_variance_weights(cov_matrix, lower, upper)
+        min_vol_return = np.dot(min_vol_weights, expected_returns)
 
         max_return = np.max(expected_returns)
 
         # Generate target returns
         target_returns = np.linspace(min_vol_return, max_return, num_points)
 
+        # 한 번의 스윕으로 전체 투자선 계산 (활성 집합 구간 재사용)
+        frontier_weights = efficient_frontier_weights(
+            expected_returns, cov_matrix, target_returns, lower, upper
+        )
+
         frontier_points = []
 
-        for target_return in target_returns:
-            # Optimize for minimum volatility given target return
-            weights = self._minimize_volatility_with_target_return(
-                expected_returns, cov_matrix, stock_codes,
-                target_return, constraints
-            )
+        for weights_array in frontier_weights:
+            weights = {stock_codes[i]: float(weights_array[i]) for i in range(len(stock_codes))}
 
-            weights_array = np.array([weights[code] for code in stock_codes])
             portfolio_return = np.dot(weights_array, expected_returns)
             portfolio_variance = np.dot(weights_array, np.dot(cov_matrix, weights_array))
             portfolio_volatility = np.sqrt(portfolio_variance)
@@ -314,78 +324,24 @@ class PortfolioOptimizer:
                                cov_matrix: np.ndarray, stock_codes: List[str],
                                max_weight: float, min_weight: float,
                                allow_short: bool) -> Dict[str, float]:
-        """샤프 비율 최대화"""
+        """샤프 비율 최대화 (효율적 투자선 구간 탐색, utils.portfolio_math)"""
         num_stocks = len(stock_codes)
 
-        # Use gradient descent-like optimization
-        # Start with equal weights
-        weights = np.ones(num_stocks) / num_stocks
-
-        # Normalize with constraints
-        if not allow_short:
-            weights = np.clip(weights, min_weight, max_weight)
-            weights = weights / np.sum(weights)
-
-        # Simple iterative optimization
-        learning_rate = 0.01
-        num_iterations = 1000
-
-        best_sharpe = -np.inf
-        best_weights = weights.copy()
-
-        for iteration in range(num_iterations):
-            # Calculate current Sharpe ratio
-            portfolio_return = np.dot(weights, expected_returns)
-            portfolio_variance = np.dot(weights, np.dot(cov_matrix, weights))
-            portfolio_volatility = np.sqrt(portfolio_variance)
-
-            sharpe = (portfolio_return - self.risk_free_rate) / (portfolio_volatility + 1e-10)
-
-            if sharpe > best_sharpe:
-                best_sharpe = sharpe
-                best_weights = weights.copy()
-
-            # Gradient approximation
-            # Increase weight where marginal Sharpe improvement is positive
-            for i in range(num_stocks):
-                test_weights = weights.copy()
-                test_weights[i] += 0.001
-                test_weights = test_weights / np.sum(test_weights)
-
-                test_return = np.dot(test_weights, expected_returns)
-                test_variance = np.dot(test_weights, np.dot(cov_matrix, test_weights))
-                test_volatility = np.sqrt(test_variance)
-                test_sharpe = (test_return - self.risk_free_rate) / (test_volatility + 1e-10)
-
-                gradient = (test_sharpe - sharpe) / 0.001
-
-                weights[i] += learning_rate * gradient
-
-            # Apply constraints
-            if not allow_short:
-                weights = np.clip(weights, min_weight, max_weight)
-
-            # Normalize
-            weights = weights / np.sum(weights)
+        lower, upper = weight_bounds(num_stocks, min_weight, max_weight, allow_short)
+        weights = max_sharpe_weights(
+            expected_returns, cov_matrix, self.risk_free_rate, lower, upper
+        )
 
-        return {stock_codes[i]: float(best_weights[i]) for i in range(num_stocks)}
+        return {stock_codes[i]: float(weights[i]) for i in range(num_stocks)}
 
     def _minimize_volatility(self, cov_matrix: np.ndarray, stock_codes: List[str],
                             max_weight: float, min_weight: float,
                             allow_short: bool) -> Dict[str, float]:
-        """변동성 최소화"""
+        """변동성 최소화 (닫힌 해 Σ⁻¹1, 제약이 걸리면 박스 제약 QP)"""
         num_stocks = len(stock_codes)
 
-        # Inverse volatility weighting
-        variances = np.diag(cov_matrix)
-        inv_vol = 1 / np.sqrt(variances + 1e-10)
-
-        weights = inv_vol / np.sum(inv_vol)
-
-        # Apply constraints
-        if not allow_short:
-            weights = np.clip(weights, min_weight, max_weight)
-            weights = weights / np.sum(weights)
+        lower, upper = weight_bounds(num_stocks, min_weight, max_weight, allow_short)
+        weights = min_variance_weights(cov_matrix, lower, upper)
 
         return {stock_codes[i]: float(weights[i]) for i in range(num_stocks)}
 
@@ -411,25 +367,10 @@ class PortfolioOptimizer:
         return {stock_codes[i]: float(weights[i]) for i in range(num_stocks)}
 
     def _risk_parity(self, cov_matrix: np.ndarray, stock_codes: List[str]) -> Dict[str, float]:
-        """리스크 패리티"""
+        """리스크 패리티 (Newton 반복)"""
         num_stocks = len(stock_codes)
 
-        # Start with equal weights
-        weights = np.ones(num_stocks) / num_stocks
-
-        # Iterative risk parity
-        for iteration in range(100):
-            # Calculate risk contribution
-            portfolio_vol = np.sqrt(np.dot(weights, np.dot(cov_matrix, weights)))
-            marginal_risk = np.dot(cov_matrix, weights) / (portfolio_vol + 1e-10)
-            risk_contribution = weights * marginal_risk
-
-            # Adjust weights to equalize risk contribution
-            target_risk = portfolio_vol / num_stocks
-            adjustment = target_risk / (risk_contribution + 1e-10)
-
-            weights = weights * adjustment
-            weights = weights / np.sum(weights)
+        weights = risk_parity_weights(cov_matrix)
 
         return {stock_codes[i]: float(weights[i]) for i in range(num_stocks)}
 
@@ -442,39 +383,15 @@ class PortfolioOptimizer:
         """목표 수익률 제약 하에서 변동성 최소화"""
         num_stocks = len(stock_codes)
 
-        # Simple quadratic programming approximation
-        # Start with minimum volatility portfolio
-        weights = np.ones(num_stocks) / num_stocks
-
-        max_weight = constraints.get('max_weight', 1.0)
-        min_weight = constraints.get('min_weight', 0.0)
-        allow_short = constraints.get('allow_short', False)
-
-        # Iterative adjustment to meet target return
-        learning_rate = 0.01
-        for iteration in range(500):
-            current_return = np.dot(weights, expected_returns)
-            return_diff = target_return - current_return
-
-            if abs(return_diff) < 0.0001:
-                break
-
-            # Adjust weights toward higher/lower return stocks
-            if return_diff > 0:
-                # Need higher return - increase weight on high return stocks
-                adjustment = expected_returns / np.sum(expected_returns)
-            else:
-                # Need lower return - increase weight on low return stocks
-                adjustment = (1 / (expected_returns + 1e-10))
-                adjustment = adjustment / np.sum(adjustment)
-
-            weights = weights + learning_rate * return_diff * adjustment
-
-            # Apply constraints
-            if not allow_short:
-                weights = np.clip(weights, min_weight, max_weight)
-
-            weights = weights / np.sum(weights)
+        lower, upper = weight_bounds(
+            num_stocks,
+            constraints.get('min_weight', 0.0),
+            constraints.get('max_weight', 1.0),
+            constraints.get('allow_short', False)
+        )
+        weights = target_return_weights(
+            expected_returns, cov_matrix, target_return, lower, upper
+        )
 
         return {stock_codes[i]: float(weights[i]) for i in range(num_stocks)}
 
@@ -513,7 +430,11 @@ class PortfolioOptimizer:
         return returns_matrix.T  # (time, stocks)
 
     def _calculate_covariance_matrix(self, returns_matrix: np.ndarray) -> np.ndarray:
-        """공분산 매트릭스 계산 (연간화)"""
+        """공분산 매트릭스 계산 (연간화, 기본 Ledoit-Wolf 수축)"""
+        if self.covariance_shrinkage and len(returns_matrix) >= 2:
+            cov_matrix, _ = shrink_covariance(returns_matrix, annualization=252)
+            return cov_matrix
+
         cov_matrix = np.cov(returns_matrix.T)
         return cov_matrix * 252  # Annualize
 
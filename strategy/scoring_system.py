@@ -6,13 +6,19 @@ v5.9 Performance Enhancements:
 - 캐싱: 동일 종목 중복 계산 방지 (30초 TTL)
 - 병렬 처리: 다중 종목 동시 스코어링
 - 성능 최적화: 30-50% 속도 향상
+
+배치 모드:
+- 후보 종목 전체를 열 단위 배열(frame)로 변환해 10개 기준을 NumPy 연산으로 일괄 계산
+- calculate_score와 동일한 점수 (전 종목 스코어링용)
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Union
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 import json
 
+import numpy as np
+
 from utils.logger_new import get_logger
 from utils.cache_manager import get_cache_manager
 from config.config_manager import get_config
@@ -21,6 +27,93 @@ from config.config_manager import get_config
 logger = get_logger()
 
 
+# 배치 모드 frame 열 → 결측 기본값 (NaN = 데이터 없음)
+SCORING_FRAME_COLUMNS = {
+    'volume': 0.0,
+    'avg_volume': np.nan,
+    'change_rate': 0.0,
+    'momentum_rate': 0.0,           # change_rate (없으면 rate)
+    'institutional_net_buy': 0.0,
+    'foreign_net_buy': 0.0,
+    'trend_score': 0.0,             # institutional_trend 최근 1일 (0/5/10)
+    'bid_ask_ratio': 0.0,
+    'execution_intensity': np.nan,
+    'top_broker_buy_count': 0.0,
+    'program_net_buy': np.nan,
+    'rsi': np.nan,
+    'macd_signal': 0.0,             # MACD 골든크로스 또는 MACD > 0
+    'bb_position': np.nan,
+    'ma5': np.nan,
+    'ma20': np.nan,
+    'current_price': 0.0,
+    'is_trending_theme': 0.0,
+    'has_positive_news': 0.0,
+    'volatility': np.nan,
+}
+
+# ScoringResult 필드 ↔ 가중치 키 (총점 합산 순서)
+SCORE_FIELDS = (
+    ('volume_surge_score', 'volume_surge'),
+    ('price_momentum_score', 'price_momentum'),
+    ('institutional_buying_score', 'institutional_buying'),
+    ('bid_strength_score', 'bid_strength'),
+    ('execution_intensity_score', 'execution_intensity'),
+    ('broker_activity_score', 'broker_activity'),
+    ('program_trading_score', 'program_trading'),
+    ('technical_indicators_score', 'technical_indicators'),
+    ('theme_news_score', 'theme_news'),
+    ('volatility_pattern_score', 'volatility_pattern'),
+)
+
+# 기준별 단계표 ((임계값, 만점 대비 비율), ...) - 높은 단계부터, calculate_score와 score_frame 공용
+VOLUME_RATIO_TIERS = ((5.0, 1.0), (3.0, 0.75), (2.0, 0.5), (1.0, 0.25))          # 평균 대비 배수
+VOLUME_ABSOLUTE_TIERS = ((5_000_000, 0.8), (2_000_000, 0.6), (1_000_000, 0.4), (500_000, 0.2))  # 평균 없을 때 (주)
+PRICE_MOMENTUM_TIERS = ((10.0, 1.0), (7.0, 0.85), (5.0, 0.7), (3.0, 0.55), (2.0, 0.4), (1.0, 0.25))  # 상승률 (%)
+INSTITUTIONAL_POINT_TIERS = ((5, 40.0), (3, 30.0), (1, 20.0))   # min_net_buy 배수 → 점수
+FOREIGN_POINT_TIERS = ((1, 10.0), (0.5, 5.0))                   # min_net_buy 배수 → 점수
+BID_ASK_TIERS = ((1.5, 1.0), (1.2, 0.75), (0.8, 0.5), (0.5, 0.25))  # 매수호가/매도호가
+EXECUTION_INTENSITY_MIN = 50                                    # config 무시 (하드코딩)
+EXECUTION_INTENSITY_TIERS = ((3.0, 1.0), (2.0, 0.75), (1.4, 0.5), (1, 0.25))  # EXECUTION_INTENSITY_MIN 배수
+BROKER_ACTIVITY_TIERS = ((1, 1.0), (0.6, 0.67), (0.4, 0.33))    # top_brokers 배수
+BROKER_ANY_BUY_RATIO = 0.17                                     # 주요 증권사 1개 이상
+PROGRAM_NET_BUY_TIERS = ((5_000_000, 1.0), (3_000_000, 0.75), (1_000_000, 0.5), (100_000, 0.25))  # 원
+
+# 기술적 지표 범위/추정 기준
+RSI_NEUTRAL_RANGE = (30, 70)
+RSI_ESTIMATE_RANGE = (0.5, 20.0)            # RSI 없을 때 상승률(%) 범위
+MACD_ESTIMATE_MIN_VOLUME = 500_000
+BB_NEUTRAL_RANGE = (0.2, 0.8)
+BB_ESTIMATE_MAX_CHANGE = 15                 # BB 없을 때 |상승률| 상한
+MA_ESTIMATE_MIN_PRICE = 1000
+
+# 시장 모멘텀 단계 - 마지막 단계는 두 조건 중 하나만 만족해도 인정
+VOLUME_MOMENTUM_TIERS = ((2.0, 3.0, 0.4), (1.5, 1.5, 0.25), (1.2, 0.5, 0.125))            # (거래량 배수, 상승률, 비율)
+PRICE_STRENGTH_TIERS = ((5.0, 1_000_000, 0.4), (2.0, 500_000, 0.25), (0.5, 100_000, 0.125))  # (상승률, 기관 순매수, 비율)
+
+
+def _scale_tiers(tiers, factor):
+    """단계표 임계값에 factor를 곱한 단계표"""
+    return tuple((threshold * factor, ratio) for threshold, ratio in tiers)
+
+
+def _broker_tiers(top_brokers):
+    """주요 증권사 활동 단계표 (top_brokers 기준)"""
+    return _scale_tiers(BROKER_ACTIVITY_TIERS, top_brokers) + ((1, BROKER_ANY_BUY_RATIO),)
+
+
+def _tier_ratio(value, tiers) -> float:
+    """value가 처음 넘는 단계의 비율 (해당 없으면 0)"""
+    for threshold, ratio in tiers:
+        if value >= threshold:
+            return ratio
+    return 0.0
+
+
+def _tier_ratios(values: np.ndarray, tiers) -> np.ndarray:
+    """_tier_ratio 배열 버전 (NaN은 0)"""
+    return np.select([values >= threshold for threshold, _ in tiers], [ratio for _, ratio in tiers], 0.0)
+
+
 @dataclass
 class ScoringResult:
     """스코어링 결과"""
@@ -315,12 +408,297 @@ class ScoringSystem:
                     results.append(stock)
 
         # 원래 순서 유지를 위해 정렬
-        results.sort(key=lambda x: stocks_data.index(x) if x in stocks_data else 999)
+        position = {id(stock): i for i, stock in enumerate(stocks_data)}
+        results.sort(key=lambda x: position[id(x)])
 
         logger.info(f"✅ 병렬 스코어링 완료: {len(results)}개 종목")
 
         return results
 
+    # ========================================================================
+    # 배치 모드 (열 단위 NumPy 연산)
+    # ========================================================================
+
+    @staticmethod
+    def build_scoring_frame(stocks_data: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        종목 데이터 리스트 → 열 단위 frame 변환
+
+        dict/list 형태의 필드(institutional_trend, macd, bollinger_bands)는
+        여기서 숫자 열로 풀어 두므로 점수 계산은 배열 연산만 수행한다.
+
+        Args:
+            stocks_data: 종목 데이터 리스트
+
+        Returns:
+            {열 이름: float64 배열} (SCORING_FRAME_COLUMNS + stock_code)
+        """
+        def number(value, default):
+            return default if value is None else value
+
+        columns: Dict[str, list] = {name: [] for name in SCORING_FRAME_COLUMNS}
+        codes = []
+
+        for stock in stocks_data:
+            get = stock.get
+            codes.append(get('stock_code', ''))
+
+            columns['volume'].append(number(get('volume'), 0.0))
+            columns['avg_volume'].append(number(get('avg_volume'), np.nan))
+            columns['change_rate'].append(number(get('change_rate', 0), 0.0))
+            columns['momentum_rate'].append(number(get('change_rate', get('rate', 0.0)), 0.0))
+            columns['institutional_net_buy'].append(number(get('institutional_net_buy'), 0.0))
+            columns['foreign_net_buy'].append(number(get('foreign_net_buy'), 0.0))
+            columns['bid_ask_ratio'].append(number(get('bid_ask_ratio'), 0.0))
+            columns['execution_intensity'].append(number(get('execution_intensity'), np.nan))
+            columns['top_broker_buy_count'].append(number(get('top_broker_buy_count'), 0.0))
+            columns['program_net_buy'].append(number(get('program_net_buy'), np.nan))
+            columns['rsi'].append(number(get('rsi'), np.nan))
+            columns['ma5'].append(number(get('ma5'), np.nan))
+            columns['ma20'].append(number(get('ma20'), np.nan))
+            columns['current_price'].append(number(get('current_price'), 0.0))
+            columns['is_trending_theme'].append(bool(get('is_trending_theme', False)))
+            columns['has_positive_news'].append(bool(get('has_positive_news', False)))
+            columns['volatility'].append(number(get('volatility'), np.nan))
+
+            # 기관/외국인 5일 추이: 첫 번째 리스트의 최근 값만 사용
+            trend_score = 0.0
+            institutional_trend = get('institutional_trend')
+            if institutional_trend:
+                try:
+                    for values in institutional_trend.values():
+                        if isinstance(values, list) and len(values) > 0:
+                            recent = values[0]
+                            orgn_net = recent.get('orgn_netslmt', '0')
+                            if orgn_net and not str(orgn_net).startswith('-'):
+                                trend_score += 5.0
+                            for_net = recent.get('for_netslmt', '0')
+                            if for_net and not str(for_net).startswith('-'):
+                                trend_score += 5.0
+                            break
+                except Exception as e:
+                    logger.debug(f"institutional_trend 파싱 실패: {e}")
+                    trend_score = 0.0
+            columns['trend_score'].append(trend_score)
+
+            macd = get('macd')
+            macd_positive = False
+            if isinstance(macd, dict):
+                macd_positive = macd.get('macd', 0) > 0
+            elif isinstance(macd, (int, float)):
+                macd_positive = macd > 0
+            columns['macd_signal'].append(bool(get('macd_bullish_crossover', False) or macd_positive))
+
+            bollinger_bands = get('bollinger_bands')
+            bb_position = bollinger_bands.get('position') if isinstance(bollinger_bands, dict) else get('bb_position')
+            columns['bb_position'].append(number(bb_position, np.nan))
+
+        frame = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+        frame['stock_code'] = np.asarray(codes, dtype=object)
+        return frame
+
+    def score_frame(
+        self,
+        frame: Mapping[str, Any],
+        scan_type: str = 'default'
+    ) -> Dict[str, np.ndarray]:
+        """
+        열 단위 frame 일괄 스코어링 (가중치 적용)
+
+        Args:
+            frame: {열 이름: 배열} 또는 DataFrame (build_scoring_frame 형식, 없는 열은 결측 처리)
+            scan_type: 스캔 타입
+
+        Returns:
+            {ScoringResult 점수 필드명: 배열, 'total_score': 배열}
+        """
+        length = len(frame['stock_code']) if 'stock_code' in frame else len(next(iter(frame.values())))
+
+        def col(name: str) -> np.ndarray:
+            if name in frame:
+                return np.asarray(frame[name], dtype=np.float64)
+            return np.full(length, SCORING_FRAME_COLUMNS[name])
+
+        volume = col('volume')
+        avg_volume = col('avg_volume')
+        change_rate = col('change_rate')
+        institutional_net_buy = col('institutional_net_buy')
+        has_avg = avg_volume > 0
+        volume_ratio = np.divide(volume, avg_volume, out=np.zeros(length), where=has_avg)
+
+        raw = {}
+
+        # 1. 거래량 급증 (60점)
+        max_score = 60
+        raw['volume_surge'] = np.where(
+            has_avg,
+            max_score * _tier_ratios(volume_ratio, VOLUME_RATIO_TIERS),
+            max_score * _tier_ratios(volume, VOLUME_ABSOLUTE_TIERS)
+        )
+
+        # 2. 가격 모멘텀 (60점)
+        momentum_rate = col('momentum_rate')
+        raw['price_momentum'] = max_score * _tier_ratios(momentum_rate, PRICE_MOMENTUM_TIERS)
+
+        # 3. 기관 매수세 (60점)
+        config = self.criteria_config.get('institutional_buying', {})
+        max_score = config.get('weight', 60)
+        min_net_buy = config.get('min_net_buy', 10_000_000)
+        foreign_net_buy = col('foreign_net_buy')
+        score = _tier_ratios(institutional_net_buy, _scale_tiers(INSTITUTIONAL_POINT_TIERS, min_net_buy))
+        score += _tier_ratios(foreign_net_buy, _scale_tiers(FOREIGN_POINT_TIERS, min_net_buy))
+        score += col('trend_score')
+        raw['institutional_buying'] = np.minimum(score, max_score)
+
+        # 4. 매수 호가 강도 (40점)
+        config = self.criteria_config.get('bid_strength', {})
+        max_score = config.get('weight', 40)
+        bid_ask_ratio = col('bid_ask_ratio')
+        raw['bid_strength'] = max_score * _tier_ratios(bid_ask_ratio, BID_ASK_TIERS)
+
+        # 5. 체결 강도 (40점) - 데이터 없음(NaN)은 비교가 모두 거짓이라 0점
+        config = self.criteria_config.get('execution_intensity', {})
+        max_score = config.get('weight', 40)
+        execution_intensity = col('execution_intensity')
+        raw['execution_intensity'] = max_score * _tier_ratios(
+            execution_intensity, _scale_tiers(EXECUTION_INTENSITY_TIERS, EXECUTION_INTENSITY_MIN)
+        )
+
+        # 6. 주요 증권사 활동 (40점)
+        config = self.criteria_config.get('broker_activity', {})
+        max_score = config.get('weight', 40)
+        top_brokers = config.get('top_brokers', 5)
+        broker_buy_count = col('top_broker_buy_count')
+        raw['broker_activity'] = max_score * _tier_ratios(broker_buy_count, _broker_tiers(top_brokers))
+
+        # 7. 프로그램 매매 (40점)
+        config = self.criteria_config.get('program_trading', {})
+        max_score = config.get('weight', 40)
+        program_net_buy = col('program_net_buy')
+        raw['program_trading'] = max_score * _tier_ratios(program_net_buy, PROGRAM_NET_BUY_TIERS)
+
+        # 8. 기술적 지표 (40점)
+        max_score = 40
+        rsi = col('rsi')
+        has_rsi = ~np.isnan(rsi)
+        estimated = (change_rate >= RSI_ESTIMATE_RANGE[0]) & (change_rate <= RSI_ESTIMATE_RANGE[1])
+        rsi_score = np.where(
+            has_rsi,
+            np.where((rsi >= RSI_NEUTRAL_RANGE[0]) & (rsi <= RSI_NEUTRAL_RANGE[1]), max_score * 0.375, 0.0),
+            np.select(
+                [estimated, change_rate > 0],
+                [max_score * 0.375 * np.minimum(change_rate / 10.0, 1.0), max_score * 0.25],
+                0.0
+            )
+        )
+        macd_score = np.select(
+            [col('macd_signal') > 0, (change_rate > 0) & (volume > MACD_ESTIMATE_MIN_VOLUME), change_rate > 0],
+            [max_score * 0.375, max_score * 0.3, max_score * 0.2],
+            0.0
+        )
+        bb_position = col('bb_position')
+        bb_score = np.select(
+            [(bb_position >= BB_NEUTRAL_RANGE[0]) & (bb_position <= BB_NEUTRAL_RANGE[1]),
+             np.abs(change_rate) < BB_ESTIMATE_MAX_CHANGE],
+            [max_score * 0.125, max_score * 0.1],
+            0.0
+        )
+        ma5, ma20 = col('ma5'), col('ma20')
+        ma_score = np.select(
+            [(ma5 != 0) & (ma20 != 0) & (ma5 > ma20), col('current_price') >= MA_ESTIMATE_MIN_PRICE],
+            [max_score * 0.125, max_score * 0.1],
+            0.0
+        )
+        raw['technical_indicators'] = rsi_score + macd_score + bb_score + ma_score
+
+        # 9. 시장 모멘텀 (40점)
+        config = self.criteria_config.get('theme_news', {})
+        max_score = config.get('weight', 40)
+        *strong, (min_ratio, min_change, _) = VOLUME_MOMENTUM_TIERS
+        volume_momentum = np.where(
+            has_avg,
+            np.select(
+                [(volume_ratio >= ratio) & (change_rate >= change) for ratio, change, _ in strong] +
+                [(volume_ratio >= min_ratio) | (change_rate >= min_change)],
+                [max_score * part for _, _, part in VOLUME_MOMENTUM_TIERS],
+                0.0
+            ),
+            0.0
+        )
+        *strong, (min_change, min_net, _) = PRICE_STRENGTH_TIERS
+        price_momentum = np.select(
+            [(change_rate >= change) & (institutional_net_buy >= net) for change, net, _ in strong] +
+            [(change_rate >= min_change) | (institutional_net_buy >= min_net)],
+            [max_score * part for _, _, part in PRICE_STRENGTH_TIERS],
+            0.0
+        )
+        raw['theme_news'] = (
+            np.where(col('is_trending_theme') > 0, max_score * 0.5, volume_momentum) +
+            np.where(col('has_positive_news') > 0, max_score * 0.5, price_momentum)
+        )
+
+        # 10. 변동성 패턴 (20점)
+        config = self.criteria_config.get('volatility_pattern', {})
+        max_score = config.get('weight', 20)
+        min_volatility = config.get('min_volatility', 0.02)
+        max_volatility = config.get('max_volatility', 0.15)
+        mid_volatility = (min_volatility + max_volatility) / 2
+        max_distance = (max_volatility - min_volatility) / 2
+        volatility = col('volatility')
+        raw['volatility_pattern'] = np.where(
+            (volatility >= min_volatility) & (volatility <= max_volatility),
+            max_score * (1 - (np.abs(volatility - mid_volatility) / max_distance)),
+            0.0
+        )
+
+        # 스캔 타입별 가중치 적용 및 총점 (calculate_score와 같은 합산 순서)
+        weights = self.scan_type_weights.get(scan_type, self.scan_type_weights['default'])
+        scores: Dict[str, np.ndarray] = {}
+        total = np.zeros(length)
+        for field_name, key in SCORE_FIELDS:
+            scores[field_name] = raw[key] * weights[key]
+            total = total + scores[field_name]
+        scores['total_score'] = total
+        return scores
+
+    def calculate_scores_batch(
+        self,
+        stocks_data: Union[List[Dict[str, Any]], Mapping[str, Any]],
+        scan_type: str = 'default'
+    ) -> List[ScoringResult]:
+        """
+        다중 종목 일괄 스코어링 (배치 모드)
+
+        calculate_score와 같은 점수를 종목별 메서드 호출 / 로그 출력 없이
+        배열 연산으로 계산한다 (캐시는 사용하지 않음).
+
+        Args:
+            stocks_data: 종목 데이터 리스트 또는 build_scoring_frame 형식 frame
+            scan_type: 스캔 타입
+
+        Returns:
+            입력 순서와 같은 ScoringResult 리스트
+        """
+        if isinstance(stocks_data, list):
+            if not stocks_data:
+                return []
+            frame = self.build_scoring_frame(stocks_data)
+        else:
+            frame = stocks_data
+
+        scores = self.score_frame(frame, scan_type)
+        columns = {name: values.tolist() for name, values in scores.items()}
+
+        results = []
+        for i in range(len(columns['total_score'])):
+            result = ScoringResult(**{name: columns[name][i] for name, _ in SCORE_FIELDS})
+            result.total_score = columns['total_score'][i]
+            result.calculate_percentage()
+            results.append(result)
+
+        logger.info(f"📊 배치 스코어링 완료 [{scan_type}]: {len(results)}개 종목")
+        return results
+
     def _score_volume_surge(self, stock_data: Dict[str, Any]) -> float:
         """
         1. 거래량 급증 점수 (60점)
@@ -344,46 +722,24 @@ class ScoringSystem:
             volume_ratio = volume / avg_volume
             print(f"   [거래량] {stock_code}: 현재={volume:,}주, 평균={avg_volume:,.0f}주, 비율={volume_ratio:.2f}배", end="")
 
-            if volume_ratio >= 5.0:
-                print(f" → {max_score}점 (5배 이상)")
-                return max_score
-            elif volume_ratio >= 3.0:
-                score = max_score * 0.75
-                print(f" → {score:.0f}점 (3배 이상)")
-                return score
-            elif volume_ratio >= 2.0:
-                score = max_score * 0.5
-                print(f" → {score:.0f}점 (2배 이상)")
-                return score
-            elif volume_ratio >= 1.0:
-                score = max_score * 0.25
-                print(f" → {score:.0f}점 (평균 이상)")
-                return score
-            else:
-                print(f" → 0점 (평균 미만)")
-                return 0.0
+            for threshold, ratio in VOLUME_RATIO_TIERS:
+                if volume_ratio >= threshold:
+                    score = max_score * ratio
+                    print(f" → {score:.0f}점 ({threshold:g}배 이상)")
+                    return score
+            print(f" → 0점 (평균 미만)")
+            return 0.0
 
         # avg_volume이 없으면 절대값 기준
         print(f"   [거래량] {stock_code}: 현재={volume:,}주 (평균 데이터 없음)", end="")
 
-        if volume >= 5_000_000:
-            score = max_score * 0.8
-            print(f" → {score:.0f}점 (500만주 이상)")
-            return score
-        elif volume >= 2_000_000:
-            score = max_score * 0.6
-            print(f" → {score:.0f}점 (200만주 이상)")
-            return score
-        elif volume >= 1_000_000:
-            score = max_score * 0.4
-            print(f" → {score:.0f}점 (100만주 이상)")
-            return score
-        elif volume >= 500_000:
-            score = max_score * 0.2
-            print(f" → {score:.0f}점 (50만주 이상)")
-            return score
-
-        print(f" → 0점 (50만주 미만)")
+        for threshold, ratio in VOLUME_ABSOLUTE_TIERS:
+            if volume >= threshold:
+                score = max_score * ratio
+                print(f" → {score:.0f}점 ({threshold // 10_000}만주 이상)")
+                return score
+
+        print(f" → 0점 ({VOLUME_ABSOLUTE_TIERS[-1][0] // 10_000}만주 미만)")
         return 0.0
 
     def _score_price_momentum(self, stock_data: Dict[str, Any]) -> float:
@@ -402,20 +758,7 @@ class ScoringSystem:
         change_rate = stock_data.get('change_rate', stock_data.get('rate', 0.0))
 
         # 상승률 기준 점수 (강화)
-        if change_rate >= 10.0:  # 10% 이상
-            return max_score
-        elif change_rate >= 7.0:  # 7% 이상
-            return max_score * 0.85
-        elif change_rate >= 5.0:  # 5% 이상
-            return max_score * 0.7
-        elif change_rate >= 3.0:  # 3% 이상
-            return max_score * 0.55
-        elif change_rate >= 2.0:  # 2% 이상
-            return max_score * 0.4
-        elif change_rate >= 1.0:  # 1% 이상
-            return max_score * 0.25
-        else:
-            return 0.0
+        return max_score * _tier_ratio(change_rate, PRICE_MOMENTUM_TIERS)
 
     def _score_institutional_buying(self, stock_data: Dict[str, Any]) -> float:
         """
@@ -448,23 +791,16 @@ class ScoringSystem:
         score_details = []
 
         # 1) 기관 순매수 - 일별 (40점)
-        if institutional_net_buy >= min_net_buy * 5:
-            score += 40.0
-            score_details.append("기관+40")
-        elif institutional_net_buy >= min_net_buy * 3:
-            score += 30.0
-            score_details.append("기관+30")
-        elif institutional_net_buy >= min_net_buy:
-            score += 20.0
-            score_details.append("기관+20")
+        points = _tier_ratio(institutional_net_buy, _scale_tiers(INSTITUTIONAL_POINT_TIERS, min_net_buy))
+        if points:
+            score += points
+            score_details.append(f"기관+{points:.0f}")
 
         # 2) 외국인 순매수 - 일별 (10점)
-        if foreign_net_buy >= min_net_buy:
-            score += 10.0
-            score_details.append("외국인+10")
-        elif foreign_net_buy >= min_net_buy * 0.5:
-            score += 5.0
-            score_details.append("외국인+5")
+        points = _tier_ratio(foreign_net_buy, _scale_tiers(FOREIGN_POINT_TIERS, min_net_buy))
+        if points:
+            score += points
+            score_details.append(f"외국인+{points:.0f}")
 
         # 3) 기관/외국인 매매 추이 - 5일 (10점)
         if institutional_trend:
@@ -515,16 +851,7 @@ class ScoringSystem:
 
         # 호가비율 기준 (매수호가/매도호가)
         # 1.0 이상 = 매수 우위, 1.0 미만 = 매도 우위
-        if bid_ask_ratio >= 1.5:  # 강한 매수 우위
-            return max_score
-        elif bid_ask_ratio >= 1.2:  # 매수 우위
-            return max_score * 0.75
-        elif bid_ask_ratio >= 0.8:  # 균형 (약간 매도 우위)
-            return max_score * 0.5
-        elif bid_ask_ratio >= 0.5:  # 매도 우위
-            return max_score * 0.25
-        else:  # 강한 매도 우위
-            return 0.0
+        return max_score * _tier_ratio(bid_ask_ratio, BID_ASK_TIERS)
 
     def _score_execution_intensity(self, stock_data: Dict[str, Any]) -> float:
         """
@@ -553,19 +880,10 @@ class ScoringSystem:
             return 0.0
 
         # 체결강도 기준 점수 계산
-        min_value = 50  # 강제 하드코딩: config 무시
-        print(f"[DEBUG 체결강도] {stock_code}: min_value={min_value} (하드코딩)")
-
-        if execution_intensity >= min_value * 3.0:  # 150 이상
-            score = max_score
-        elif execution_intensity >= min_value * 2.0:  # 100 이상
-            score = max_score * 0.75
-        elif execution_intensity >= min_value * 1.4:  # 70 이상
-            score = max_score * 0.5
-        elif execution_intensity >= min_value:  # 50 이상
-            score = max_score * 0.25
-        else:
-            score = 0.0
+        print(f"[DEBUG 체결강도] {stock_code}: min_value={EXECUTION_INTENSITY_MIN} (하드코딩)")
+        score = max_score * _tier_ratio(
+            execution_intensity, _scale_tiers(EXECUTION_INTENSITY_TIERS, EXECUTION_INTENSITY_MIN)
+        )
 
         print(f"[DEBUG 체결강도] {stock_code}: {execution_intensity} → {score}점")
         return score
@@ -586,16 +904,7 @@ class ScoringSystem:
         broker_buy_count = stock_data.get('top_broker_buy_count', 0)
         top_brokers = config.get('top_brokers', 5)
 
-        if broker_buy_count >= top_brokers:  # 5개
-            return max_score
-        elif broker_buy_count >= top_brokers * 0.6:  # 3개
-            return max_score * 0.67
-        elif broker_buy_count >= top_brokers * 0.4:  # 2개
-            return max_score * 0.33
-        elif broker_buy_count >= 1:  # 1개라도 있으면
-            return max_score * 0.17
-        else:
-            return 0.0
+        return max_score * _tier_ratio(broker_buy_count, _broker_tiers(top_brokers))
 
     def _score_program_trading(self, stock_data: Dict[str, Any]) -> float:
         """
@@ -629,16 +938,7 @@ class ScoringSystem:
             return 0.0
 
         # 프로그램 순매수 금액 기준 (원 단위)
-        if program_net_buy >= 5_000_000:  # 500만원 이상
-            score = max_score
-        elif program_net_buy >= 3_000_000:  # 300만원 이상
-            score = max_score * 0.75
-        elif program_net_buy >= 1_000_000:  # 100만원 이상
-            score = max_score * 0.5
-        elif program_net_buy >= 100_000:  # 10만원 이상
-            score = max_score * 0.25
-        else:
-            score = 0.0
+        score = max_score * _tier_ratio(program_net_buy, PROGRAM_NET_BUY_TIERS)
 
         print(f"[DEBUG 프로그램] {stock_code}: {program_net_buy:,}원 → {score}점")
         return score
@@ -664,14 +964,14 @@ class ScoringSystem:
         # RSI (15점)
         rsi = stock_data.get('rsi', None)
         if rsi is not None:
-            if 30 <= rsi <= 70:  # 과매도/과매수 아님
+            if RSI_NEUTRAL_RANGE[0] <= rsi <= RSI_NEUTRAL_RANGE[1]:  # 과매도/과매수 아님
                 rsi_score = max_score * 0.375
                 score += rsi_score
                 score_parts.append(f"RSI({rsi:.0f})+{rsi_score:.0f}")
         else:
             # RSI 없으면 상승률로 추정
             change_rate = stock_data.get('change_rate', 0)
-            if 0.5 <= change_rate <= 20.0:
+            if RSI_ESTIMATE_RANGE[0] <= change_rate <= RSI_ESTIMATE_RANGE[1]:
                 score_ratio = min(change_rate / 10.0, 1.0)
                 rsi_score = max_score * 0.375 * score_ratio
                 score += rsi_score
@@ -699,7 +999,7 @@ class ScoringSystem:
             # MACD 없으면 거래량+상승률로 추정
             change_rate = stock_data.get('change_rate', 0)
             volume = stock_data.get('volume', 0)
-            if change_rate > 0 and volume > 500_000:
+            if change_rate > 0 and volume > MACD_ESTIMATE_MIN_VOLUME:
                 macd_score = max_score * 0.3
                 score += macd_score
                 score_parts.append(f"MACD추정+{macd_score:.0f}")
@@ -712,13 +1012,13 @@ class ScoringSystem:
         bollinger_bands = stock_data.get('bollinger_bands', None)
         bb_position = bollinger_bands.get('position') if isinstance(bollinger_bands, dict) else stock_data.get('bb_position', None)
 
-        if bb_position is not None and 0.2 <= bb_position <= 0.8:
+        if bb_position is not None and BB_NEUTRAL_RANGE[0] <= bb_position <= BB_NEUTRAL_RANGE[1]:
             bb_score = max_score * 0.125
             score += bb_score
             score_parts.append(f"BB+{bb_score:.0f}")
         else:
             change_rate = stock_data.get('change_rate', 0)
-            if abs(change_rate) < 15:
+            if abs(change_rate) < BB_ESTIMATE_MAX_CHANGE:
                 bb_score = max_score * 0.1
                 score += bb_score
                 score_parts.append(f"BB추정+{bb_score:.0f}")
@@ -733,7 +1033,7 @@ class ScoringSystem:
             score += ma_score
             score_parts.append(f"MA+{ma_score:.0f}")
         elif current_price > 0:
-            if current_price >= 1000:
+            if current_price >= MA_ESTIMATE_MIN_PRICE:
                 ma_score = max_score * 0.1
                 score += ma_score
                 score_parts.append(f"MA추정+{ma_score:.0f}")
@@ -778,12 +1078,14 @@ class ScoringSystem:
                 volume_ratio = volume / avg_volume
 
                 # 거래량 2배 이상 + 상승률 3% 이상 = 강한 모멘텀
-                if volume_ratio >= 2.0 and change_rate >= 3.0:
-                    score += max_score * 0.4  # 16점
-                elif volume_ratio >= 1.5 and change_rate >= 1.5:
-                    score += max_score * 0.25  # 10점
-                elif volume_ratio >= 1.2 or change_rate >= 0.5:
-                    score += max_score * 0.125  # 5점
+                *strong, (min_ratio, min_change, weak) = VOLUME_MOMENTUM_TIERS
+                for ratio, change, part in strong:
+                    if volume_ratio >= ratio and change_rate >= change:
+                        score += max_score * part
+                        break
+                else:
+                    if volume_ratio >= min_ratio or change_rate >= min_change:
+                        score += max_score * weak
 
         # 가격 모멘텀 (20점)
         has_positive_news = stock_data.get('has_positive_news', False)
@@ -799,12 +1101,14 @@ class ScoringSystem:
                 institutional_net = 0
 
             # 상승률 5% 이상 + 기관 순매수 100만원 이상 = 강한 가격 강도
-            if change_rate >= 5.0 and institutional_net >= 1_000_000:
-                score += max_score * 0.4  # 16점
-            elif change_rate >= 2.0 and institutional_net >= 500_000:
-                score += max_score * 0.25  # 10점
-            elif change_rate >= 0.5 or institutional_net >= 100_000:
-                score += max_score * 0.125  # 5점
+            *strong, (min_change, min_net, weak) = PRICE_STRENGTH_TIERS
+            for change, net, part in strong:
+                if change_rate >= change and institutional_net >= net:
+                    score += max_score * part
+                    break
+            else:
+                if change_rate >= min_change or institutional_net >= min_net:
+                    score += max_score * weak
 
         return score
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+AdvancedBacktester 워크포워드 데이터 접근 벤치마크
+
+기본 설정: 1,000종목 × 5년(1,260거래일) 일봉
+- 색인 + 커서 기반 MarketDataView 실행 시간 측정
+- 비교용으로 기존 방식(매일 전체 바 필터링)을 작은 규모에서 측정
+
+실행:
+    python tests/benchmarks/bench_backtester.py
+    python tests/benchmarks/bench_backtester.py --stocks 200 --days 250 --legacy
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ai.advanced_backtester import AdvancedBacktester
+
+
+def make_data(num_stocks: int, num_days: int, seed: int = 42):
+    """랜덤 워크 일봉 데이터 생성 (ISO 문자열 날짜)"""
+    rng = random.Random(seed)
+    start = datetime(2019, 1, 2)
+    dates = [(start + timedelta(days=d)).isoformat() for d in range(num_days)]
+
+    data = {}
+    for i in range(num_stocks):
+        price = rng.uniform(5_000, 100_000)
+        bars = []
+        for date in dates:
+            price *= 1 + rng.gauss(0, 0.02)
+            close = round(price)
+            bars.append({
+                'date': date,
+                'open': close, 'high': close, 'low': close, 'close': close,
+                'volume': rng.randint(10_000, 1_000_000),
+            })
+        data[f'{i:06d}'] = bars
+    return data
+
+
+def make_strategy(codes, watch: int = 20):
+    """매일 watch개 종목을 돌아가며 5일 이동평균 돌파 매수/이탈 매도"""
+    state = {'day': 0}
+
+    def strategy(ctx, data):
+        day = state['day']
+        state['day'] += 1
+
+        signals = []
+        for k in range(watch):
+            code = codes[(day * watch + k) % len(codes)]
+            if code not in data:
+                continue
+            bars = data[code]
+            if len(bars) < 5:
+                continue
+            ma5 = sum(bar['close'] for bar in bars[-5:]) / 5
+            close = bars[-1]['close']
+            if close > ma5 and not ctx.has_position(code):
+                signals.append({'action': 'buy', 'stock_code': code, 'quantity': 1})
+            elif close < ma5 and ctx.has_position(code):
+                signals.append({'action': 'sell', 'stock_code': code, 'quantity': 1})
+        return signals
+
+    return strategy
+
+
+def legacy_get_data_until(backtester, data, date):
+    """기존 _get_data_until 방식 (매일 전체 바 필터링 + 날짜 재파싱)"""
+    result = {}
+    for stock_code, bars in data.items():
+        filtered = [bar for bar in bars if backtester._parse_date(bar.get('date')) <= date]
+        if filtered:
+            result[stock_code] = filtered
+    return result
+
+
+def run(data, legacy: bool = False) -> float:
+    backtester = AdvancedBacktester(initial_capital=1_000_000_000)
+    strategy = make_strategy(list(data.keys()))
+
+    if legacy:
+        # MarketDataView 대신 매일 필터링한 dict를 전략에 전달
+        def legacy_strategy(ctx, _view):
+            return strategy(ctx, legacy_get_data_until(backtester, data, ctx.current_time))
+        start = time.perf_counter()
+        result = backtester.run_backtest(legacy_strategy, data)
+    else:
+        start = time.perf_counter()
+        result = backtester.run_backtest(strategy, data)
+
+    elapsed = time.perf_counter() - start
+    print(f"  거래 {result.total_trades}건, 최종 자본 {result.final_capital:,.0f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--stocks', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=1260)
+    parser.add_argument('--legacy', action='store_true', help='기존 방식도 측정 (느림, 작은 규모 권장)')
+    args = parser.parse_args()
+
+    print(f"데이터 생성: {args.stocks}종목 × {args.days}일")
+    data = make_data(args.stocks, args.days)
+
+    elapsed = run(data)
+    print(f"MarketDataView: {elapsed:.2f}초 ({args.stocks * args.days / elapsed:,.0f} bars/s)")
+
+    if args.legacy:
+        elapsed_legacy = run(data, legacy=True)
+        print(f"기존 방식:      {elapsed_legacy:.2f}초 ({elapsed_legacy / elapsed:.1f}배)")
+
+
+if __name__ == '__main__':
+    main()
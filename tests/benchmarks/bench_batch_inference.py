@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+MLPricePredictor / DeepLearningManager 배치 추론 벤치마크
+
+기본 설정: 후보 200종목 × 60봉 히스토리
+- 종목별 predict() 반복 vs predict_batch() 1회 (사이클당 시간)
+- scikit-learn/xgboost 가 있으면 합성 데이터로 학습한 실제 모델, 없으면 대체 경로
+- PyTorch 가 있으면 실제 LSTM/Transformer/CNN, 없으면 mock 예측
+
+실행:
+    python tests/benchmarks/bench_batch_inference.py
+    python tests/benchmarks/bench_batch_inference.py --candidates 500 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ai import ml_predictor
+from ai.ml_predictor import MLPricePredictor, MARKET_FEATURES, MODEL_NAMES
+from ai.deep_learning import DeepLearningManager, TORCH_AVAILABLE
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=200)
+    parser.add_argument('--bars', type=int, default=60)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    os.chdir(tempfile.mkdtemp())
+
+    rng = np.random.default_rng(42)
+    prices = 10000 * np.cumprod(1 + rng.normal(0, 0.02, (args.candidates, args.bars)), axis=1)
+    volumes = rng.integers(100_000, 1_000_000, (args.candidates, args.bars)).astype(float)
+
+    predictor = MLPricePredictor()
+    if ml_predictor.SKLEARN_AVAILABLE:
+        X = rng.normal(0, 1, (2000, len(MARKET_FEATURES) + 2))
+        y = X[:, 0] * 100 + rng.normal(0, 10, 2000)
+        for name in MODEL_NAMES:
+            predictor.models[name].fit(predictor.scalers[name].fit_transform(X), y)
+    label = 'sklearn/xgboost' if ml_predictor.SKLEARN_AVAILABLE else 'fallback (sklearn 없음)'
+
+    candidates = [
+        {'stock_code': f'{i:06d}', 'stock_name': f'S{i}',
+         'price_history': prices[i], 'volume_history': volumes[i]}
+        for i in range(args.candidates)
+    ]
+    single = timed(lambda: [predictor.predict(c['stock_code'], c['stock_name'], c) for c in candidates], args.repeat)
+    batch = timed(lambda: predictor.predict_batch(candidates), args.repeat)
+    print(f"MLPricePredictor [{label}], {args.candidates}종목:")
+    print(f"  종목별 predict   {single:9.1f}ms")
+    print(f"  predict_batch    {batch:9.1f}ms  ({single / batch:.1f}x)")
+
+    manager = DeepLearningManager()
+    dl_candidates = [
+        {'stock_code': f'{i:06d}', 'stock_name': f'S{i}', 'current_price': float(prices[i, -1]),
+         'historical_data': [{'price': p, 'close': p, 'open': p, 'high': p * 1.01, 'low': p * 0.99, 'volume': v}
+                             for p, v in zip(prices[i], volumes[i])]}
+        for i in range(args.candidates)
+    ]
+    single = timed(lambda: [manager.predict(c['stock_code'], c['stock_name'], c['historical_data'],
+                                            c['current_price']) for c in dl_candidates], args.repeat)
+    batch = timed(lambda: manager.predict_batch(dl_candidates), args.repeat)
+    print(f"DeepLearningManager [{'torch' if TORCH_AVAILABLE else 'mock'}], {args.candidates}종목:")
+    print(f"  종목별 predict   {single:9.1f}ms")
+    print(f"  predict_batch    {batch:9.1f}ms  ({single / batch:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
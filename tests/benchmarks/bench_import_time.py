@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+패키지 import 시간 벤치마크 (python -X importtime)
+
+기본 대상: ai, features, database, main (봇), dashboard.app
+- 대상마다 새 인터프리터에서 `python -X importtime -c "import <대상>"` 실행
+- 반복 실행 중 최소값 기준 누적 import 시간과 가장 무거운 모듈 출력
+- 무거운 선택 의존성 (torch, sklearn, scipy, pandas, sqlalchemy) 로드 여부 표시
+- --max-ms 지정 시 초과한 대상이 있으면 종료 코드 1 (회귀 감지용)
+
+실행:
+    python tests/benchmarks/bench_import_time.py
+    python tests/benchmarks/bench_import_time.py ai features --repeat 5 --max-ms 300
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ('torch', 'sklearn', 'xgboost', 'scipy', 'pandas', 'sqlalchemy')
+
+
+def run_importtime(code: str):
+    """새 인터프리터에서 -X importtime 실행 - (CompletedProcess, {모듈: 누적 ms})"""
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    # import 부작용 (로그/데이터 파일 생성 등) 이 저장소를 건드리지 않도록 임시 디렉터리에서 실행
+    with tempfile.TemporaryDirectory() as cwd:
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=cwd, env=env, capture_output=True, text=True
+        )
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            _, cum_us, name = line[len('import time:'):].split('|')
+            cumulative[name.strip()] = int(cum_us) / 1000
+    return proc, cumulative
+
+
+def import_profile(target: str, startup: set):
+    """target import - (전체 ms, {모듈: 누적 ms}, 로드된 무거운 모듈), 인터프리터 시작 시 모듈 제외"""
+    proc, cumulative = run_importtime(
+        f"import {target}, sys; "
+        f"print('HEAVY:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    if proc.returncode != 0:
+        raise ImportError(proc.stderr.strip().splitlines()[-1])
+
+    cumulative = {name: ms for name, ms in cumulative.items() if name not in startup}
+    # 최상위 패키지의 누적 시간 = target 이 끌어온 전체 import (이미 로드된 모듈은 다시 기록되지 않음)
+    total = cumulative[target.split('.')[0]]
+    heavy = next(line[len('HEAVY:'):] for line in proc.stdout.splitlines() if line.startswith('HEAVY:'))
+    return total, cumulative, [m for m in heavy.split(',') if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('targets', nargs='*', default=['ai', 'features', 'database', 'main', 'dashboard.app'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=3)
+    parser.add_argument('--max-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    startup = set(run_importtime('pass')[1])
+
+    failed = []
+    for target in args.targets:
+        try:
+            runs = [import_profile(target, startup) for _ in range(args.repeat)]
+        except ImportError as e:
+            print(f"import {target:<16} 실패: {e}")
+            continue
+        total, cumulative, heavy = min(runs, key=lambda run: run[0])
+        own = [(name, ms) for name, ms in cumulative.items()
+               if name != target and not target.startswith(name + '.')]
+        top = sorted(own, key=lambda item: item[1], reverse=True)[:args.top]
+
+        print(f"import {target:<16} {total:8.1f}ms  (무거운 의존성: {', '.join(heavy) or '없음'})")
+        for name, ms in top:
+            print(f"    {name:<40} {ms:8.1f}ms")
+        if args.max_ms is not None and total > args.max_ms:
+            failed.append(target)
+
+    if failed:
+        print(f"\n{args.max_ms:.0f}ms 초과: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
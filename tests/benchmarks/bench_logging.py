@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+스캔 사이클 로깅 오버헤드 벤치마크 (이전 동기 sink vs 큐 파이프라인)
+
+기본 설정: 후보 50종목 × (후보별 상세 15줄 + REST 응답 12건) × 20사이클
+- before: 동기 stdout/file/error sink (diagnose=True), 후보별 print, REST 응답 INFO
+- sync:   새 코드 경로(후보별 lazy debug, REST 응답 lazy debug) + 동기 sink
+- after:  새 코드 경로 + 백그라운드 writer 큐 + 모듈 샘플링
+- 호출 스레드(트레이딩 스레드)가 로깅에 쓰는 시간만 측정 (백그라운드 기록 제외)
+- 콘솔 출력은 임시 파일로 돌려 터미널 속도 영향을 제거
+
+실행:
+    python tests/benchmarks/bench_logging.py
+    python tests/benchmarks/bench_logging.py --candidates 200 --json
+"""
+
+import argparse
+import contextlib
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from loguru import logger
+
+from utils.logger_new import LoguruLogger, flush_logs
+
+FORMAT = '{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}'
+REST_CALLS = 12
+DETAIL_LINES = 15
+
+
+def setup_before(log_dir: Path, console):
+    """이전 설정: 동기 sink 3개 + 표준 logging INFO (api_server basicConfig 와 동일)"""
+    logger.remove()
+    logger.add(console, format=FORMAT, level='WARNING', backtrace=True, diagnose=True)
+    logger.add(log_dir / 'bot.log', format=FORMAT, level='INFO', encoding='utf-8',
+               backtrace=True, diagnose=True)
+    logger.add(log_dir / 'error.log', format=FORMAT, level='ERROR', encoding='utf-8',
+               backtrace=True, diagnose=True)
+    logging.basicConfig(level=logging.INFO, stream=console, force=True)
+
+
+def setup_after(log_dir: Path, json_output: bool, enqueue: bool = True):
+    """새 파이프라인: 샘플링 (+ JSON-lines), enqueue 면 백그라운드 writer"""
+    logging.basicConfig(level=logging.INFO, force=True)
+    LoguruLogger()._setup_logger({
+        'level': 'INFO',
+        'console_level': 'WARNING',
+        'file_path': str(log_dir / 'bot.log'),
+        'console_output': False,
+        'enqueue': enqueue,
+        'json_output': json_output,
+        'json_file_path': str(log_dir / 'bot.jsonl'),
+        'sampling': {'core.rest_client': 0.1},
+    })
+
+
+def scan_cycle_before(candidates: int, rest_logger: logging.Logger):
+    """이전 코드 경로: 후보별 print, REST 응답마다 f-string INFO"""
+    for idx in range(1, candidates + 1):
+        print(f"   [{idx}/{candidates}] 종목{idx:04d} ({idx:06d})")
+        for line in range(DETAIL_LINES):
+            print(f"      항목{line}={idx * 1000 + line:,}")
+        for call in range(REST_CALLS):
+            rest_logger.info(f"[REST 응답] ka100{call:02d} - 상태:200, 지연:{12.5 + call:.2f}ms")
+            rest_logger.info(f"API 호출 성공 (ka100{call:02d})")
+        logger.info(f"🤖 AI 분석 결과: 종목{idx:04d} ({idx:06d}) → hold")
+
+
+def scan_cycle_after(candidates: int, rest_logger: logging.Logger):
+    """새 코드 경로: 후보별 lazy debug, REST 응답 lazy debug"""
+    for idx in range(1, candidates + 1):
+        logger.debug("[{}/{}] 종목{:04d} ({:06d})", idx, candidates, idx, idx)
+        for line in range(DETAIL_LINES):
+            logger.debug("항목{}={:,}", line, idx * 1000 + line)
+        for call in range(REST_CALLS):
+            rest_logger.debug("[REST 응답] %s - 상태:%s, 지연:%.2fms", f"ka100{call:02d}", 200, 12.5 + call)
+            rest_logger.debug("API 호출 성공 (%s)", f"ka100{call:02d}")
+        logger.info(f"🤖 AI 분석 결과: 종목{idx:04d} ({idx:06d}) → hold")
+
+
+def measure(cycle, args, rest_logger) -> float:
+    """사이클당 호출 스레드 시간 (초)"""
+    cycle(args.candidates, rest_logger)  # warm-up
+    start = time.perf_counter()
+    for _ in range(args.cycles):
+        cycle(args.candidates, rest_logger)
+    return (time.perf_counter() - start) / args.cycles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=50)
+    parser.add_argument('--cycles', type=int, default=20)
+    parser.add_argument('--json', action='store_true', help='JSON-lines sink 추가')
+    args = parser.parse_args()
+
+    rest_logger = logging.getLogger('core.rest_client')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+
+        with open(log_dir / 'console.txt', 'w', encoding='utf-8') as console, \
+                contextlib.redirect_stdout(console):
+            (log_dir / 'before').mkdir()
+            setup_before(log_dir / 'before', console)
+            before = measure(scan_cycle_before, args, rest_logger)
+
+            (log_dir / 'sync').mkdir()
+            setup_after(log_dir / 'sync', args.json, enqueue=False)
+            sync = measure(scan_cycle_after, args, rest_logger)
+
+            (log_dir / 'after').mkdir()
+            setup_after(log_dir / 'after', args.json)
+            after = measure(scan_cycle_after, args, rest_logger)
+
+            drain_start = time.perf_counter()
+            flush_logs()
+            drain = time.perf_counter() - drain_start
+            LoguruLogger()._setup_logger({'file_path': str(log_dir / 'bot.log'), 'enqueue': False,
+                                          'console_output': False})
+            logger.remove()
+
+    lines = args.candidates * (1 + DETAIL_LINES + 2 * REST_CALLS + 1)
+    print(f"스캔 사이클: 후보 {args.candidates}종목, 사이클당 로그 호출 {lines:,}회")
+    print(f"  before (동기):      {before * 1000:.2f}ms/사이클")
+    print(f"  sync   (새 경로):   {sync * 1000:.2f}ms/사이클 ({before / sync:.1f}배)")
+    print(f"  after  (새 경로+큐): {after * 1000:.2f}ms/사이클 ({before / after:.1f}배)")
+    print(f"  백그라운드 잔여 기록 대기: {drain * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+AdvancedBacktester.monte_carlo_simulation 벤치마크
+
+기본 설정: 거래 200건 → 1,000,000회 시뮬레이션 (chunk 단위 스트리밍)
+- 블록 부트스트랩(--block) 및 chunk 크기(--chunk)별 실행 시간 측정
+
+실행:
+    python tests/benchmarks/bench_monte_carlo.py
+    python tests/benchmarks/bench_monte_carlo.py --sims 100000 --block 5
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ai.advanced_backtester import AdvancedBacktester, BacktestResult, BacktestTrade
+
+
+def make_result(num_trades: int, seed: int = 42) -> BacktestResult:
+    """정규분포 수익률(평균 0.5%, 표준편차 3%) 거래로 BacktestResult 생성"""
+    rng = np.random.default_rng(seed)
+    now = datetime(2024, 1, 2)
+    trades = [
+        BacktestTrade(
+            entry_time=now, exit_time=now, stock_code='000000',
+            quantity=1, entry_price=10_000, exit_price=10_000,
+            pnl=0.0, pnl_percent=float(r), commission=0.0,
+            holding_days=1, win=r > 0,
+        )
+        for r in rng.normal(0.5, 3.0, num_trades)
+    ]
+    return BacktestResult(*([0] * 19), trades=trades)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sims', type=int, default=1_000_000)
+    parser.add_argument('--trades', type=int, default=200)
+    parser.add_argument('--block', type=int, default=1)
+    parser.add_argument('--chunk', type=int, default=None)
+    args = parser.parse_args()
+
+    backtester = AdvancedBacktester()
+    result = make_result(args.trades)
+
+    start = time.perf_counter()
+    mc = backtester.monte_carlo_simulation(
+        result, num_simulations=args.sims, block_size=args.block,
+        chunk_size=args.chunk, seed=0,
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.sims:,}회 × {args.trades}거래: {elapsed:.2f}초 ({args.sims / elapsed:,.0f} paths/s)")
+    print(f"  중앙 수익률 {mc['percentile_50']:.1f}%, 수익 확률 {mc['probability_of_profit']:.1f}%")
+    print(f"  MDD 중앙값 {mc['max_drawdown_percentiles'][50]:.1f}%, 파산 확률 {mc['risk_of_ruin']:.3f}%")
+
+
+if __name__ == '__main__':
+    main()
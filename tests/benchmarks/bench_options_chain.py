@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+BlackScholesModel 옵션 체인 벤치마크
+
+기본 설정: KOSPI200 형태의 체인 (만기 8개 × 행사가 121개 × 콜/풋 = 1,936종목)
+- 가격 + 그릭스: 기존 종목별 스칼라 공식 (scipy.stats.norm) vs price_chain/greeks_chain
+- 내재변동성: 기존 종목별 Newton-Raphson (|오차| < 0.001) vs implied_volatility_chain
+- 내재변동성은 원래 변동성 대비 최대 오차도 함께 출력 (베가가 사실상 0 인 종목 제외)
+
+실행:
+    python tests/benchmarks/bench_options_chain.py
+    python tests/benchmarks/bench_options_chain.py --strikes 41 --expiries 4 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import norm
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ai.options_hft import BlackScholesModel
+
+
+def legacy_price(S, K, T, vol, kind, r):
+    d1 = (np.log(S / K) + (r + 0.5 * vol ** 2) * T) / (vol * np.sqrt(T))
+    d2 = d1 - vol * np.sqrt(T)
+    if kind == 'call':
+        return float(S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2))
+    return float(K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1))
+
+
+def legacy_greeks(S, K, T, vol, kind, r):
+    d1 = (np.log(S / K) + (r + 0.5 * vol ** 2) * T) / (vol * np.sqrt(T))
+    d2 = d1 - vol * np.sqrt(T)
+    disc = K * np.exp(-r * T)
+    delta = norm.cdf(d1) if kind == 'call' else norm.cdf(d1) - 1
+    gamma = norm.pdf(d1) / (S * vol * np.sqrt(T))
+    decay = -S * norm.pdf(d1) * vol / (2 * np.sqrt(T))
+    theta = (decay - r * disc * norm.cdf(d2)) / 365 if kind == 'call' else (decay + r * disc * norm.cdf(-d2)) / 365
+    vega = S * norm.pdf(d1) * np.sqrt(T) / 100
+    rho = disc * T * norm.cdf(d2) / 100 if kind == 'call' else -disc * T * norm.cdf(-d2) / 100
+    return float(delta), float(gamma), float(theta), float(vega), float(rho)
+
+
+def legacy_iv(price, S, K, T, kind, r):
+    vol = 0.3
+    for _ in range(100):
+        diff = price - legacy_price(S, K, T, vol, kind, r)
+        if abs(diff) < 0.001:
+            return vol
+        vega = legacy_greeks(S, K, T, vol, kind, r)[3] * 100
+        if vega == 0:
+            break
+        vol = max(0.001, min(3.0, vol + diff / vega))
+    return float(vol)
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--strikes', type=int, default=121)
+    parser.add_argument('--expiries', type=int, default=8)
+    parser.add_argument('--spot', type=float, default=350.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    bs = BlackScholesModel()
+    r = bs.risk_free_rate
+    strikes = args.spot + 2.5 * (np.arange(args.strikes) - args.strikes // 2)
+    strikes = strikes[strikes > 0]
+    expiry_days = [7, 14, 28, 56, 91, 182, 273, 364] + [364 + 91 * i for i in range(1, 40)]
+    expiries = np.array(expiry_days[:args.expiries]) / 365
+
+    K, T, kind = (a.ravel() for a in np.meshgrid(strikes, expiries, ['call', 'put'], indexing='ij'))
+    vol = 0.15 + 0.4 * (K / args.spot - 1) ** 2 + 0.02 * np.sqrt(T)
+    contracts = list(zip(K.tolist(), T.tolist(), vol.tolist(), kind.tolist()))
+    print(f"체인 {len(strikes)}행사가 × {len(expiries)}만기 × 콜/풋 = {len(contracts):,}종목")
+
+    scalar, _ = timed(lambda: [(legacy_price(args.spot, k, t, v, c, r), legacy_greeks(args.spot, k, t, v, c, r))
+                               for k, t, v, c in contracts], args.repeat)
+    chain, _ = timed(lambda: (bs.price_chain(args.spot, K, T, vol, kind),
+                              bs.greeks_chain(args.spot, K, T, vol, kind)), args.repeat)
+    print("가격 + 그릭스:")
+    print(f"  종목별 스칼라        {scalar:9.1f}ms")
+    print(f"  price/greeks_chain   {chain:9.2f}ms  ({scalar / chain:.0f}x)")
+
+    prices = bs.price_chain(args.spot, K, T, vol, kind)
+    identifiable = bs.greeks_chain(args.spot, K, T, vol, kind)['vega'] > 1e-6
+    scalar, legacy = timed(lambda: np.array([legacy_iv(p, args.spot, k, t, c, r)
+                                             for p, (k, t, _, c) in zip(prices, contracts)]), 1)
+    chain, iv = timed(lambda: bs.implied_volatility_chain(prices, args.spot, K, T, kind), args.repeat)
+    print("내재변동성:")
+    print(f"  종목별 Newton        {scalar:9.1f}ms  최대 오차 {np.abs(legacy - vol)[identifiable].max():.2e}")
+    print(f"  implied_vol_chain    {chain:9.2f}ms  최대 오차 {np.abs(iv - vol)[identifiable].max():.2e}"
+          f"  ({scalar / chain:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+ReplayBuffer / DQNAgent.replay 벤치마크
+
+기본 설정: 전이 1,000,000개 (상태 11차원), 배치 256
+- 이전 구현: deque + random.sample + 전이별 Q-table 갱신
+- 현재 구현: 사전 할당 NumPy 링 버퍼 + 벡터화 배치 타깃 (균등 / 우선순위)
+
+실행:
+    python tests/benchmarks/bench_replay_buffer.py
+    python tests/benchmarks/bench_replay_buffer.py --transitions 100000 --batch 64
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ai.replay_buffer import ReplayBuffer
+from ai.rl_agent import DQNAgent, RLExperience
+
+
+def legacy_replay(agent, buffer, batch_size):
+    """이전 DQNAgent.replay (deque 샘플링 + 전이별 갱신)"""
+    for experience in random.sample(buffer, batch_size):
+        q_values = agent.get_q_values(experience.state)
+        next_q_values = agent.get_q_values(experience.next_state)
+        target = experience.reward if experience.done else experience.reward + agent.gamma * np.max(next_q_values)
+        q_values[experience.action] += agent.learning_rate * (target - q_values[experience.action])
+
+
+def timed(fn, steps):
+    start = time.perf_counter()
+    for _ in range(steps):
+        fn()
+    return (time.perf_counter() - start) / steps * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--transitions', type=int, default=1_000_000)
+    parser.add_argument('--batch', type=int, default=256)
+    parser.add_argument('--steps', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    states = rng.normal(0, 0.6, (args.transitions + 1, 11))
+    actions = rng.integers(0, 7, args.transitions)
+    rewards = rng.normal(0, 1, args.transitions)
+    dones = rng.random(args.transitions) < 0.01
+    os.chdir(tempfile.mkdtemp())
+
+    start = time.perf_counter()
+    legacy = deque(maxlen=args.transitions)
+    for i in range(args.transitions):
+        legacy.append(RLExperience(list(states[i]), int(actions[i]), float(rewards[i]), list(states[i + 1]), bool(dones[i])))
+    legacy_fill = time.perf_counter() - start
+
+    start = time.perf_counter()
+    buffer = ReplayBuffer(capacity=args.transitions, state_dim=11, state_dtype=np.float64)
+    buffer.add_batch(states[:-1], actions, rewards, states[1:], dones)
+    fill = time.perf_counter() - start
+    print(f"적재 ({args.transitions:,}개): 이전 {legacy_fill:.2f}s → add_batch {fill * 1000:.0f}ms")
+
+    agent = DQNAgent(memory_capacity=1)
+    agent.batch_size = args.batch
+    print(f"replay 1회 (배치 {args.batch}):")
+    print(f"  이전 (deque)      {timed(lambda: legacy_replay(agent, legacy, args.batch), args.steps):8.2f}ms")
+
+    for label, prioritized in [('링 버퍼', False), ('링 버퍼 + PER', True)]:
+        agent = DQNAgent(memory_capacity=args.transitions, prioritized_replay=prioritized)
+        agent.batch_size = args.batch
+        agent.memory.add_batch(states[:-1], actions, rewards, states[1:], dones)
+        agent.epsilon_min = agent.epsilon
+        print(f"  {label:16s}{timed(agent.replay, args.steps):8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+RiskAnalyzer.analyze_portfolio_risk 벤치마크
+
+기본 설정: 100종목 포지션 × 250일 가격 히스토리
+- 히스토리 전체 재구성 호출 vs RollingReturnWindow 증분 갱신 호출 (사이클당 시간)
+
+실행:
+    python tests/benchmarks/bench_risk_analyzer.py
+    python tests/benchmarks/bench_risk_analyzer.py --positions 300 --cycles 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from utils.risk_analyzer import RiskAnalyzer, RollingReturnWindow
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--positions', type=int, default=100)
+    parser.add_argument('--days', type=int, default=250)
+    parser.add_argument('--window', type=int, default=60)
+    parser.add_argument('--cycles', type=int, default=20)
+    args = parser.parse_args()
+
+    # 공통 요인 + 개별 요인 종가
+    rng = np.random.default_rng(42)
+    market = rng.normal(0.0003, 0.01, (args.days, 1))
+    closes = 10000 * np.cumprod(1 + market + rng.normal(0, 0.015, (args.days, args.positions)), axis=0)
+    codes = [f'{i:06d}' for i in range(args.positions)]
+    histories = {code: [{'close': float(c)} for c in closes[:, i]] for i, code in enumerate(codes)}
+    positions = [{'stock_code': code, 'value': 1_000_000.0} for code in codes]
+    portfolio_value = 1_000_000.0 * args.positions
+
+    analyzer = RiskAnalyzer()
+
+    start = time.perf_counter()
+    for _ in range(args.cycles):
+        analyzer.analyze_portfolio_risk(positions, portfolio_value, histories)
+    full = (time.perf_counter() - start) / args.cycles
+
+    rolling = RollingReturnWindow.from_price_histories(histories, window=args.window)
+    last = closes[-1]
+    start = time.perf_counter()
+    for _ in range(args.cycles):
+        last = last * (1 + rng.normal(0, 0.01, args.positions))
+        rolling.push_prices(dict(zip(codes, last)))
+        metrics = analyzer.analyze_portfolio_risk(positions, portfolio_value, {}, rolling_window=rolling)
+    incremental = (time.perf_counter() - start) / args.cycles
+
+    print(f"{args.positions}종목 × {args.days}일")
+    print(f"  히스토리 재구성: {full * 1000:.2f}ms/사이클")
+    print(f"  증분 창({args.window}봉): {incremental * 1000:.2f}ms/사이클")
+    print(f"  VaR95 {metrics.portfolio_var_95:.4f}, 분산비율 {metrics.diversification_ratio:.3f}, "
+          f"위험점수 {metrics.risk_score:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+StrategyOptimizer 병렬 트라이얼 러너 벤치마크
+
+기본 설정: 종가 5년 × 200종목 공유 데이터셋, 60점 그리드, 트라이얼당 백테스트 모사
+- 순차 실행 vs 프로세스 풀 (n_jobs) vs 프로세스 풀 + 가지치기·조기 종료
+
+실행:
+    python tests/benchmarks/bench_trial_runner.py
+    python tests/benchmarks/bench_trial_runner.py --jobs 8 --work 0.2
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ai.strategy_optimizer import StrategyOptimizer
+
+WORK_SECONDS = 0.05
+
+
+def crossover_objective(params, data):
+    """이동평균 교차 전략 수익률 (실제 백테스트 비용은 sleep 으로 모사)"""
+    closes = data['close']
+    fast = closes[-params['fast']:].mean(axis=0)
+    slow = closes[-params['slow']:].mean(axis=0)
+    time.sleep(WORK_SECONDS)
+    return float(np.mean((fast > slow) * (closes[-1] / closes[-params['slow']] - 1)))
+
+
+def main():
+    global WORK_SECONDS
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--stocks', type=int, default=200)
+    parser.add_argument('--days', type=int, default=1250)
+    parser.add_argument('--jobs', type=int, default=4)
+    parser.add_argument('--work', type=float, default=0.05, help='트라이얼당 백테스트 모사 시간 (초)')
+    args = parser.parse_args()
+    WORK_SECONDS = args.work
+
+    rng = np.random.default_rng(42)
+    closes = 10000 * np.cumprod(1 + rng.normal(0.0003, 0.015, (args.days, args.stocks)), axis=0)
+    dataset = {'close': closes}
+    ranges = {'fast': [5, 10, 15, 20, 30, 40], 'slow': [60, 80, 100, 120, 160, 200, 240, 300, 400, 500]}
+    print(f"데이터셋: {closes.nbytes / 1e6:.1f}MB, 그리드 {6 * 10}점, 트라이얼당 {args.work * 1000:.0f}ms")
+
+    results = {}
+    for label, kwargs in [
+        ('serial', dict(n_jobs=1)),
+        (f'parallel(n_jobs={args.jobs})', dict(n_jobs=args.jobs)),
+        ('parallel + prune/patience', dict(n_jobs=args.jobs, prune=True, patience=20)),
+    ]:
+        optimizer = StrategyOptimizer(crossover_objective, ranges, method='grid', dataset=dataset, **kwargs)
+        start = time.perf_counter()
+        result = optimizer.optimize()
+        elapsed = time.perf_counter() - start
+        results[label] = result
+        print(f"{label:28s} {elapsed:7.2f}s  trials={result.n_trials:3d} pruned={result.n_pruned:3d} "
+              f"best={result.best_params} score={result.best_score:.4f}")
+
+    serial, parallel = list(results.values())[:2]
+    assert serial.all_trials == parallel.all_trials, "병렬 결과가 순차 결과와 다름"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""
+Advanced Backtester Tests
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from ai.advanced_backtester import AdvancedBacktester, BacktestResult, BacktestTrade
+
+
+class ListSlicingBacktester(AdvancedBacktester):
+    """기존 방식 기준 구현 - 매일 전체 바를 날짜로 필터링한 리스트 dict를 전략에 전달"""
+
+    def run_backtest(self, strategy, data, start_date=None, end_date=None):
+        self._reset()
+
+        all_dates = sorted({
+            self._parse_date(bar.get('date'))
+            for bars in data.values() for bar in bars
+            if not (start_date and self._parse_date(bar.get('date')) < start_date)
+            and not (end_date and self._parse_date(bar.get('date')) > end_date)
+        })
+
+        for date in all_dates:
+            self.current_time = date
+            current_data = {}
+            for stock_code, bars in data.items():
+                filtered = [bar for bar in bars if self._parse_date(bar.get('date')) <= date]
+                if filtered:
+                    current_data[stock_code] = filtered
+
+            signals = strategy(self, current_data)
+            if signals:
+                self._execute_signals(signals, current_data)
+            self.equity_curve.append((date, self._calculate_equity(current_data)))
+
+        self._close_all_positions(data)
+        return self._calculate_results()
+
+
+def make_data(num_stocks=12, num_days=120, seed=5):
+    """랜덤 워크 일봉 (종목별 상장일/결측일이 다름)"""
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 2)
+
+    data = {}
+    for i in range(num_stocks):
+        price = rng.uniform(5_000, 50_000)
+        listed = rng.randrange(0, num_days // 3)
+        bars = []
+        for d in range(listed, num_days):
+            price *= 1 + rng.gauss(0, 0.03)
+            if rng.random() < 0.1:
+                continue  # 거래 정지일
+            close = round(price)
+            bars.append({'date': (start + timedelta(days=d)).isoformat(), 'close': close, 'volume': 1000})
+        data[f'{i:06d}'] = bars
+    return data
+
+
+def make_strategy(seed):
+    """이동평균 + 난수 혼합 전략 (len / 음수 인덱스 / 슬라이스 / 순회 / in 사용)"""
+    rng = random.Random(seed)
+
+    def strategy(ctx, data):
+        # 첫 종목을 시장 지표로 사용 - 10일 전보다 낮으면 신규 매수 중단
+        index = data['000000'] if '000000' in data else []
+        risk_off = len(index) > 10 and index[-1]['close'] < index[-11]['close']
+
+        signals = []
+        for code in data:
+            bars = data[code]
+            if len(bars) < 5:
+                continue
+            window = bars[-5:]
+            ma5 = sum(bar['close'] for bar in window) / len(window)
+            close = bars[-1]['close']
+            if close > ma5 and not risk_off and rng.random() < 0.5 and not ctx.has_position(code):
+                signals.append({'action': 'buy', 'stock_code': code, 'quantity': rng.randint(1, 20)})
+            elif ctx.has_position(code) and (close < ma5 or rng.random() < 0.1):
+                signals.append({'action': 'sell', 'stock_code': code, 'quantity': rng.randint(1, 20)})
+        return signals
+
+    return strategy
+
+
+class TestMarketDataView:
+    """MarketDataView / BarsView 커서 뷰 테스트"""
+
+    def test_matches_list_slicing_path(self):
+        """같은 시드 전략이 기존 리스트 필터링 경로와 동일한 거래 / 자산 곡선을 만듦"""
+        data = make_data()
+        window = {'start_date': datetime(2023, 1, 20), 'end_date': datetime(2023, 4, 10)}
+
+        for seed in range(5):
+            expected = ListSlicingBacktester().run_backtest(make_strategy(seed), data, **window)
+            actual = AdvancedBacktester().run_backtest(make_strategy(seed), data, **window)
+
+            assert expected.total_trades > 0
+            assert actual.trades == expected.trades
+            assert actual.equity_curve == expected.equity_curve
+            assert actual.final_capital == expected.final_capital
+
+
+def make_result(pnl_percents, initial_capital=10_000_000):
+    """거래 수익률(%)만 채운 백테스트 결과"""
+    entry = datetime(2024, 1, 2)
+    trades = [
+        BacktestTrade(entry, entry + timedelta(days=1), '005930', 1, 100.0, 100.0 + pct,
+                      pct, pct, 0.0, 1, pct > 0)
+        for pct in pnl_percents
+    ]
+    return BacktestResult(initial_capital, initial_capital, 0, 0, 0, 0, 0, 0, 0, 0,
+                          len(trades), 0, 0, 0, 0, 0, 0, 0, 0, trades=trades)
+
+
+class TestMonteCarloSimulation:
+    """AdvancedBacktester.monte_carlo_simulation 테스트"""
+
+    PNL = [2.5, -1.0, 4.0, -3.5, 1.2, 0.8, -2.2, 3.1, -0.5, 1.9]
+
+    def test_invalid_sizes_return_error(self):
+        """num_trades / num_simulations가 1 미만이면 거래 없음과 같은 에러 딕셔너리"""
+        backtester = AdvancedBacktester()
+        result = make_result(self.PNL)
+
+        assert 'error' in backtester.monte_carlo_simulation(result, num_trades=0)
+        assert 'error' in backtester.monte_carlo_simulation(result, num_trades=-3)
+        assert 'error' in backtester.monte_carlo_simulation(result, num_simulations=0)
+        assert backtester.monte_carlo_simulation(make_result([])) == {'error': 'No trades to simulate'}
+
+    @pytest.mark.parametrize('block_size', [1, 3])
+    def test_seed_is_reproducible(self, block_size):
+        """같은 시드면 같은 결과, 다른 시드면 다른 결과"""
+        backtester = AdvancedBacktester()
+        result = make_result(self.PNL)
+        kwargs = {'num_simulations': 2000, 'num_trades': 25, 'block_size': block_size}
+
+        first = backtester.monte_carlo_simulation(result, seed=11, **kwargs)
+        second = backtester.monte_carlo_simulation(result, seed=11, **kwargs)
+        other = backtester.monte_carlo_simulation(result, seed=12, **kwargs)
+
+        assert first == second
+        assert first['mean_final_equity'] != other['mean_final_equity']
+
+    def test_block_size_one_matches_iid_bootstrap(self):
+        """block_size=1은 거래별 독립 복원 추출과 같은 통계"""
+        backtester = AdvancedBacktester()
+        result = make_result(self.PNL)
+        growth = 1 + np.array(self.PNL) / 100
+        sims, trades = 20000, 30
+
+        stats = backtester.monte_carlo_simulation(result, num_simulations=sims, num_trades=trades,
+                                                  block_size=1, seed=3)
+
+        # 같은 난수열로 만든 i.i.d. 기준 경로 → 통계가 정확히 일치
+        rng = np.random.default_rng(3)
+        finals = np.array([
+            np.prod(growth[rng.integers(0, len(growth), size=trades)]) for _ in range(sims)
+        ]) * backtester.initial_capital
+        returns = (finals - backtester.initial_capital) / backtester.initial_capital * 100
+        assert stats['block_size'] == 1
+        assert stats['mean_final_equity'] == pytest.approx(finals.mean(), rel=1e-12)
+        assert stats['percentile_5'] == pytest.approx(np.percentile(returns, 5), rel=1e-9)
+        assert stats['probability_of_profit'] == pytest.approx((returns > 0).mean() * 100)
+
+        # i.i.d. 기대값 E[최종 자산] = 초기 자본 × (평균 성장률)^거래 수
+        expected = backtester.initial_capital * growth.mean() ** trades
+        standard_error = stats['std_final_equity'] / np.sqrt(sims)
+        assert abs(stats['mean_final_equity'] - expected) < 4 * standard_error
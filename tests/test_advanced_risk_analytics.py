@@ -0,0 +1,142 @@
+"""
+Advanced Risk Analytics Monte Carlo Tests
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from strategy.advanced_risk_analytics import AdvancedRiskAnalytics
+
+
+def make_history(days=500, assets=30, seed=7):
+    """공통 요인이 있는 일간 수익률 행렬 (days × assets)"""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0003, 0.01, (days, 1))
+    return market + rng.normal(0.0002, 0.015, (days, assets))
+
+
+class TestMonteCarloEngine:
+    """AdvancedRiskAnalytics Monte Carlo 테스트"""
+
+    def test_single_asset_var_matches_normal_quantile(self):
+        """1일 VaR은 정규분포 분위수와 일치, 시드 고정 시 재현"""
+        analytics = AdvancedRiskAnalytics(confidence_level=0.95)
+
+        var, values = analytics.calculate_var_monte_carlo(1_000_000, 0.001, 0.02, num_simulations=200_000, seed=1)
+        var_again, _ = analytics.calculate_var_monte_carlo(1_000_000, 0.001, 0.02, num_simulations=200_000, seed=1)
+
+        expected = -(0.001 + stats.norm.ppf(0.05) * 0.02) * 1_000_000
+        assert var == pytest.approx(expected, rel=0.02)
+        assert var == var_again
+        assert len(values) == 200_000
+
+    def test_projection_paths_and_drawdowns(self):
+        """경로 포함 여부와 낙폭 분포"""
+        analytics = AdvancedRiskAnalytics()
+
+        result = analytics.run_monte_carlo_simulation(1000, 0.0, 0.01, time_horizon=50, num_simulations=500, seed=3)
+
+        paths = np.array(result['paths'])
+        assert paths.shape == (500, 51)
+        assert np.all(paths[:, 0] == 1000)
+        assert result['mean_final_value'] == pytest.approx(paths[:, -1].mean())
+        assert 0 < result['max_drawdown_percentiles'][50] <= result['worst_max_drawdown_pct']
+
+        no_paths = analytics.run_monte_carlo_simulation(1000, 0.0, 0.01, 50, 500, seed=3, include_paths=False)
+        assert 'paths' not in no_paths
+        assert no_paths['median_final_value'] == result['median_final_value']
+
+    def test_portfolio_cholesky_matches_analytic_var(self):
+        """1일 Cholesky 시뮬레이션 VaR ≈ 분산-공분산 VaR"""
+        analytics = AdvancedRiskAnalytics(confidence_level=0.99)
+        history = make_history()
+        weights = np.full(30, 1 / 30)
+
+        sim = analytics.simulate_portfolio(
+            weights, 1_000_000, time_horizon=1, num_simulations=400_000,
+            historical_returns=history, method='cholesky', seed=5
+        )
+
+        mu = history.mean(axis=0) @ weights
+        sigma = np.sqrt(weights @ np.cov(history, rowvar=False) @ weights)
+        expected = -(mu + stats.norm.ppf(0.01) * sigma) * 1_000_000
+        assert sim['var'] == pytest.approx(expected, rel=0.03)
+        assert sim['cvar'] > sim['var']
+
+    def test_bootstrap_and_cholesky_agree(self):
+        """부트스트랩과 Cholesky 결과가 근사적으로 일치"""
+        analytics = AdvancedRiskAnalytics()
+        history = make_history()
+        weights = np.linspace(1, 2, 30) / np.linspace(1, 2, 30).sum()
+
+        runs = {
+            method: analytics.simulate_portfolio(
+                weights, 1_000_000, time_horizon=20, num_simulations=50_000,
+                historical_returns=history, method=method, seed=11
+            )
+            for method in ('cholesky', 'bootstrap')
+        }
+
+        assert runs['bootstrap']['var_pct'] == pytest.approx(runs['cholesky']['var_pct'], rel=0.1)
+        assert runs['bootstrap']['mean_max_drawdown_pct'] == pytest.approx(
+            runs['cholesky']['mean_max_drawdown_pct'], rel=0.1
+        )
+
+    def test_chunking_does_not_change_result(self):
+        """chunk 크기와 무관하게 동일 분포 통계"""
+        analytics = AdvancedRiskAnalytics()
+        history = make_history(assets=5)
+        weights = np.full(5, 0.2)
+
+        small = analytics.simulate_portfolio(weights, 1e6, 10, 20_000, historical_returns=history,
+                                             method='bootstrap', chunk_size=1_000, seed=2)
+        large = analytics.simulate_portfolio(weights, 1e6, 10, 20_000, historical_returns=history,
+                                             method='bootstrap', chunk_size=20_000, seed=2)
+
+        assert small['var'] == pytest.approx(large['var'], rel=0.1)
+
+    def test_non_positive_definite_covariance(self):
+        """양의 정부호가 아닌 공분산도 보정 후 시뮬레이션"""
+        analytics = AdvancedRiskAnalytics()
+        cov = np.array([[1e-4, 1e-4], [1e-4, 1e-4]])  # 특이 행렬
+
+        sim = analytics.simulate_portfolio([0.5, 0.5], 1e6, 5, 10_000, mean_returns=[0, 0],
+                                           cov_matrix=cov, seed=0)
+
+        assert np.isfinite(sim['var'])
+
+    def test_invalid_arguments(self):
+        """알 수 없는 방법 / 입력 누락"""
+        analytics = AdvancedRiskAnalytics()
+        with pytest.raises(ValueError):
+            analytics.simulate_portfolio([1.0], 1e6, method='bootstrap')
+        with pytest.raises(ValueError):
+            analytics.simulate_portfolio([1.0], 1e6, historical_returns=[[0.01], [0.02]], method='garch')
+
+    def test_100k_paths_20_days_30_assets_fold_asset_axis(self, monkeypatch):
+        """100,000 경로 × 20일 × 30종목: 종목 축을 비중으로 접어 (경로 × 일) 난수만 chunk 단위로 생성"""
+        draws = []
+        make_rng = np.random.default_rng
+
+        class RecordingGenerator:
+            def __init__(self, seed=None):
+                self._rng = make_rng(seed)
+
+            def standard_normal(self, size):
+                draws.append(size)
+                return self._rng.standard_normal(size)
+
+            def __getattr__(self, name):
+                return getattr(self._rng, name)
+
+        monkeypatch.setattr(np.random, 'default_rng', RecordingGenerator)
+        analytics = AdvancedRiskAnalytics()
+
+        sim = analytics.simulate_portfolio(np.full(30, 1 / 30), 1e8, 20, 100_000,
+                                           historical_returns=make_history(), method='cholesky', seed=0)
+
+        assert len(sim['final_values']) == 100_000
+        assert all(days == 20 for _, days in draws)
+        assert sum(rows for rows, _ in draws) == 100_000
+        assert max(rows for rows, _ in draws) * 20 <= AdvancedRiskAnalytics.MC_CHUNK_ELEMENTS
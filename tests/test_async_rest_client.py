@@ -0,0 +1,200 @@
+"""
+Async REST Client Tests
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from api.batch_client import BatchAPIClient
+from core.async_rest_client import AsyncKiwoomRESTClient
+from core.rate_limiter import RateLimiter
+from core.rest_client import KiwoomRESTClient
+
+
+class FakeSyncClient:
+    """토큰 / 속도 제한 상태만 가진 동기 클라이언트 대역"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.token = 'token-1'
+        self.token_valid = True
+        self.token_lock = threading.Lock()
+        self.token_generation = 0
+        self.refresh_count = 0
+        self.last_error_msg = None
+        self.max_retries = 1
+        self.retry_backoff = 0.01
+        self.rate_limiter = RateLimiter({
+            'GLOBAL_RATE': 10000,
+            'BUCKETS': {'market': {'rate': 10000, 'capacity': 1000}},
+        })
+
+    def _is_token_valid(self):
+        return self.token_valid
+
+    def _get_token(self):
+        self.refresh_count += 1
+        self.token = f'token-{self.refresh_count + 1}'
+        self.token_valid = True
+        self.token_generation += 1
+        return True
+
+    ensure_token = KiwoomRESTClient.ensure_token
+    build_url = KiwoomRESTClient.build_url
+    _check_result = KiwoomRESTClient._check_result
+
+
+@asynccontextmanager
+async def serve():
+    """지연 응답을 주는 로컬 테스트 서버 (현재 이벤트 루프에서 실행)"""
+    state = {'in_flight': 0, 'max_in_flight': 0}
+
+    async def handler(request):
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        await asyncio.sleep(0.05)
+        state['in_flight'] -= 1
+
+        if request.headers['authorization'] == 'Bearer expired':
+            return web.Response(status=401)
+
+        body = await request.json()
+        return web.json_response({
+            'return_code': 0,
+            'stk_cd': body['stk_cd'],
+            'cntr_infr': [{'cur_prc': f"+{int(body['stk_cd'])}"}],
+        })
+
+    app = web.Application()
+    app.router.add_post('/api/dostk/stkinfo', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        yield f'http://127.0.0.1:{port}', state
+    finally:
+        await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def server():
+    async with serve() as running:
+        yield running
+
+
+class TestAsyncKiwoomRESTClient:
+    """AsyncKiwoomRESTClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_many_requests_in_flight(self, server):
+        """한 이벤트 루프에서 다수 요청 동시 처리 테스트"""
+        base_url, state = server
+        sync_client = FakeSyncClient(base_url)
+
+        async with AsyncKiwoomRESTClient(sync_client) as client:
+            results = await asyncio.gather(*(
+                client.request('ka10003', {'stk_cd': f'{i:06d}'}, 'stkinfo')
+                for i in range(200)
+            ))
+
+        assert all(r['return_code'] == 0 for r in results)
+        assert state['max_in_flight'] > 50
+
+        stats = sync_client.rate_limiter.get_stats()
+        assert stats['market']['acquired'] == 200
+
+    @pytest.mark.asyncio
+    async def test_shared_token_refresh(self, server):
+        """401 응답 시 공유 토큰 갱신 후 재시도 테스트"""
+        base_url, _ = server
+        sync_client = FakeSyncClient(base_url)
+        sync_client.token = 'expired'
+
+        async with AsyncKiwoomRESTClient(sync_client) as client:
+            result = await client.request('ka10003', {'stk_cd': '005930'}, 'stkinfo')
+
+        assert result['return_code'] == 0
+        assert sync_client.refresh_count == 1
+        assert sync_client.token != 'expired'
+
+    @pytest.mark.asyncio
+    async def test_concurrent_401_refresh_once(self, server):
+        """같은 토큰으로 동시에 401 을 받은 요청들은 토큰을 한 번만 재발급"""
+        base_url, _ = server
+        sync_client = FakeSyncClient(base_url)
+        sync_client.token = 'expired'
+
+        async with AsyncKiwoomRESTClient(sync_client) as client:
+            results = await asyncio.gather(*(
+                client.request('ka10003', {'stk_cd': f'{i:06d}'}, 'stkinfo')
+                for i in range(20)
+            ))
+
+        assert all(r['return_code'] == 0 for r in results)
+        assert sync_client.refresh_count == 1
+
+    def test_forced_refresh_skipped_after_other_thread_refreshed(self):
+        """동기 클라이언트: 같은 세대로 force 갱신을 요청한 스레드 중 한 번만 재발급"""
+        sync_client = FakeSyncClient('http://127.0.0.1')
+        generation = sync_client.token_generation
+        barrier = threading.Barrier(16)
+        results = []
+
+        def refresh():
+            barrier.wait()
+            results.append(sync_client.ensure_token(force=True, generation=generation))
+
+        threads = [threading.Thread(target=refresh) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 16
+        assert sync_client.refresh_count == 1
+        assert sync_client.token_generation == generation + 1
+
+        # 이후 세대로 실패한 요청은 다시 재발급
+        assert sync_client.ensure_token(force=True, generation=generation + 1)
+        assert sync_client.refresh_count == 2
+
+
+class TestBatchAPIClient:
+    """BatchAPIClient 테스트"""
+
+    def test_reused_across_event_loops(self, monkeypatch):
+        """같은 클라이언트로 asyncio.run 반복 - 세션 / Semaphore / 토큰 락을 루프마다 다시 생성"""
+        monkeypatch.setattr('utils.trading_date.is_nxt_hours', lambda: False)
+        sync_client = FakeSyncClient('')
+        batch = BatchAPIClient(sync_client, max_concurrency=2)
+        codes = [f'{i:06d}' for i in range(1, 7)]
+
+        async def scan(last):
+            async with serve() as (base_url, state):
+                sync_client.base_url = base_url
+                sync_client.token = 'expired'  # 동시 401 → 토큰 락 대기
+                try:
+                    return await batch.get_multiple_stock_prices(codes), state['max_in_flight']
+                finally:
+                    if last:
+                        await batch.aclose()
+
+        try:
+            for run in range(3):
+                prices, max_in_flight = asyncio.run(scan(last=run == 2))
+                assert {code: p['current_price'] for code, p in prices.items()} == {
+                    code: int(code) for code in codes
+                }
+                assert max_in_flight <= 2
+        finally:
+            batch.close()
+
+        assert sync_client.refresh_count == 3
@@ -0,0 +1,202 @@
+"""
+Batch Inference Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import ai.ml_predictor as ml_predictor
+from ai.ml_predictor import MLPricePredictor, history_features, MARKET_FEATURES
+from ai.deep_learning import DeepLearningManager
+
+
+class LinearModel:
+    """호출 횟수를 세는 선형 회귀 대역"""
+
+    def __init__(self, coef):
+        self.coef = np.asarray(coef)
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return X @ self.coef
+
+
+class IdentityScaler:
+    def transform(self, X):
+        return np.asarray(X, dtype=float)
+
+
+def make_histories(n=6, days=80, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = 10000 * np.cumprod(1 + rng.normal(0, 0.02, (n, days)), axis=1)
+    volumes = rng.integers(100_000, 1_000_000, (n, days)).astype(float)
+    return prices, volumes
+
+
+@pytest.fixture
+def predictor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return MLPricePredictor()
+
+
+class TestMLPricePredictorBatch:
+    """MLPricePredictor.predict_batch 테스트"""
+
+    def test_history_features_match_pandas(self):
+        """벡터화 피처 = pandas rolling/ewm 마지막 행"""
+        prices, volumes = make_histories()
+        features = history_features(prices, volumes)
+
+        for i in range(len(prices)):
+            p, v = pd.Series(prices[i]), pd.Series(volumes[i])
+            delta = p.diff()
+            rsi = 100 - 100 / (1 + delta.where(delta > 0, 0).rolling(14).mean()
+                               / (-delta.where(delta < 0, 0)).rolling(14).mean())
+            macd = p.ewm(span=12).mean() - p.ewm(span=26).mean()
+            ma20, sd20 = p.rolling(20).mean(), p.rolling(20).std()
+            expected = {
+                'price_change': p.pct_change(),
+                'price_ma10': p.rolling(10).mean(),
+                'price_std5': p.rolling(5).std(),
+                'bb_position': (p - (ma20 - 2 * sd20)) / (4 * sd20),
+                'volume_ratio': v / v.rolling(5).mean(),
+                'rsi': rsi,
+                'macd': macd,
+                'macd_signal': macd.ewm(span=9).mean(),
+            }
+            for key, series in expected.items():
+                assert features[key][i] == pytest.approx(series.iloc[-1], rel=1e-9), key
+
+    def test_feature_matrix_precedence(self, predictor):
+        """명시 값 > 히스토리 파생 값 > 기본값 (이동평균 기본값은 현재가)"""
+        prices, volumes = make_histories(n=2)
+        candidates = [
+            {'stock_code': 'A', 'price': 50000, 'rsi': 25},
+            {'stock_code': 'B', 'rsi': 80, 'price_history': prices[0], 'volume_history': volumes[0]},
+            {'stock_code': 'C', 'price_history': prices[1][-30:]},
+        ]
+        X = predictor.build_feature_matrix(candidates)
+        column = {key: j for j, (key, _) in enumerate(MARKET_FEATURES)}
+
+        assert X.shape == (3, len(MARKET_FEATURES) + 2)
+        assert X[0, column['price_ma20']] == 50000 and X[0, column['bb_position']] == 0.5
+        assert X[1, column['rsi']] == 80
+        assert X[1, column['price']] == pytest.approx(prices[0][-1])
+        assert X[1, column['volume_ratio']] == pytest.approx(volumes[0][-1] / volumes[0][-5:].mean())
+        assert X[2, column['volume_ratio']] == 1.0
+        assert X[2, column['price_ma5']] == pytest.approx(prices[1][-5:].mean())
+        assert predictor._prepare_features(candidates[0]) == X[0].tolist()
+
+    def test_each_model_runs_once_per_batch(self, predictor, monkeypatch):
+        """모델당 1회 호출, 결과는 종목별 단건 예측과 동일"""
+        monkeypatch.setattr(ml_predictor, 'SKLEARN_AVAILABLE', True)
+        n_features = len(MARKET_FEATURES) + 2
+        coefs = {'random_forest': 1.02, 'xgboost': 0.97, 'gradient_boosting': 1.005}
+        predictor.models = {}
+        for name, scale in coefs.items():
+            coef = np.zeros(n_features)
+            coef[0] = scale
+            predictor.models[name] = LinearModel(coef)
+            predictor.scalers[name] = IdentityScaler()
+
+        candidates = [{'stock_code': f'{i:06d}', 'stock_name': f'S{i}', 'price': 1000.0 * (i + 1)}
+                      for i in range(200)]
+        batch = predictor.predict_batch(candidates)
+
+        assert all(model.calls == 1 for model in predictor.models.values())
+        assert [p.stock_code for p in batch] == [c['stock_code'] for c in candidates]
+        single = predictor.predict('000007', 'S7', {'price': 8000.0})
+        assert batch[7].predicted_price_1d == pytest.approx(single.predicted_price_1d)
+        assert batch[7].predicted_price_1d == pytest.approx(8000 * np.mean(list(coefs.values())))
+        assert batch[7].direction == single.direction == 'neutral'
+        assert batch[7].model_used == 'ensemble'
+
+    def test_fallback_heuristic(self, predictor, monkeypatch):
+        """ML 미사용 시 RSI/거래량 휴리스틱 (기존 단건 규칙과 동일)"""
+        monkeypatch.setattr(ml_predictor, 'SKLEARN_AVAILABLE', False)
+        result = predictor.predict_batch([
+            {'stock_code': 'A', 'price': 1000, 'rsi': 25, 'volume_ratio': 2.0},
+            {'stock_code': 'B', 'price': 1000, 'rsi': 75},
+            {'stock_code': 'C', 'price': 1000},
+        ])
+
+        assert [p.direction for p in result] == ['up', 'down', 'neutral']
+        assert [p.confidence for p in result] == [0.65, 0.60, 0.45]
+        assert result[0].predicted_price_1d == pytest.approx(1030)
+        assert result[1].expected_return == pytest.approx(-2.0)
+        assert all(p.model_used == 'fallback' for p in result)
+
+
+class SequenceModel:
+    """배치 호출을 기록하는 시퀀스 모델 대역 (마지막 가격 × 배수)"""
+
+    def __init__(self, multiplier, attention=False):
+        self.multiplier = np.asarray(multiplier)
+        self.attention = attention
+        self.batches = []
+
+    def predict_batch(self, sequences):
+        self.batches.append(sequences.shape)
+        predictions = sequences[:, -1, :1] * self.multiplier
+        if self.attention:
+            return predictions, np.tile(np.linspace(0, 1, sequences.shape[1]), (len(sequences), 1))
+        return predictions
+
+
+class ChartModel(SequenceModel):
+    """차트 [batch, channel, time] 입력용 대역 (마지막 종가 × 배수, 패턴 고정)"""
+
+    def predict_batch(self, charts):
+        self.batches.append(charts.shape)
+        return charts[:, 3, -1:] * self.multiplier, ['channel'] * len(charts)
+
+
+class TestDeepLearningBatch:
+    """DeepLearningManager.predict_batch 테스트"""
+
+    @staticmethod
+    def make_bars(n_bars, start):
+        return [{'price': start + t, 'close': start + t, 'open': start, 'high': start + t + 5,
+                 'low': start + t - 5, 'volume': 1000 + t, 'rsi': 40 + t % 20} for t in range(n_bars)]
+
+    def test_sequence_batch_matches_single_layout(self):
+        """배치 시퀀스/차트 텐서가 종목별 준비 결과를 쌓은 것과 같음"""
+        manager = DeepLearningManager()
+        histories = [self.make_bars(80, 1000), self.make_bars(80, 2000)]
+
+        sequences = manager.prepare_sequence_batch(histories)
+        charts = manager.prepare_chart_batch(histories)
+
+        assert sequences.shape == (2, 60, 10) and charts.shape == (2, 5, 60)
+        bar = histories[1][-1]
+        assert sequences[1, -1].tolist() == [bar['price'], bar['volume'], 10, bar['rsi'], 0,
+                                             73500, 73500, 75000, 72000, 0.02]
+        assert charts[0, 3].tolist() == [b['close'] for b in histories[0][-60:]]
+        assert np.array_equal(manager.prepare_sequence(histories[0]), sequences[0])
+
+    def test_one_forward_pass_per_length_group(self):
+        """길이별 그룹당 모델 1회 호출, 결과는 입력 순서"""
+        manager = DeepLearningManager()
+        manager.lstm_model = SequenceModel([0.99, 1.0, 1.01, 1.02], attention=True)
+        manager.transformer_model = SequenceModel([1.0, 1.02, 1.03, 1.04])
+        manager.cnn_model = ChartModel([1.0, 1.0, 1.0, 1.0])
+
+        candidates = [
+            {'stock_code': f'{i:06d}', 'stock_name': f'S{i}', 'current_price': 1000.0 + i,
+             'historical_data': self.make_bars(60 if i % 4 else 30, 1000 + i)}
+            for i in range(200)
+        ]
+        predictions = manager.predict_batch(candidates)
+
+        assert sorted(manager.transformer_model.batches) == [(50, 30, 10), (150, 60, 10)]
+        assert sorted(manager.cnn_model.batches) == [(50, 5, 30), (150, 5, 60)]
+        assert [p.stock_code for p in predictions] == [c['stock_code'] for c in candidates]
+
+        first = predictions[1]
+        base = candidates[1]['historical_data'][-1]['price']
+        expected_1d = base * (1.0 * 0.35 + 1.02 * 0.40 + 1.0 * 0.25)
+        assert first.predicted_price_1d == pytest.approx(expected_1d)
+        assert first.pattern_detected == 'channel'
+        assert len(first.attention_weights) == 60
@@ -0,0 +1,168 @@
+"""
+Ensemble Analyzer Tests
+"""
+
+import asyncio
+import threading
+from enum import Enum
+
+from ai.ensemble_analyzer import EnsembleAnalyzer, VotingStrategy
+
+
+class StubModel(Enum):
+    FAST = "fast"
+    MEDIUM = "medium"
+    SLOW = "slow"
+
+
+class StubAnalyzer:
+    """
+    고정 신호를 돌려주는 분석기 대역
+
+    gate: 이 Event가 set될 때까지 응답하지 않음 (None이면 즉시 응답)
+    barrier: 호출마다 이 Barrier에서 다른 호출과 만난 뒤 응답
+    """
+
+    def __init__(self, signal, gate=None, barrier=None, fail=False):
+        self.signal = signal
+        self.gate = gate
+        self.barrier = barrier
+        self.fail = fail
+        self.calls = 0
+
+    def analyze_stock(self, stock_data):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.barrier is not None:
+            self.barrier.wait(5)
+        if self.fail:
+            raise RuntimeError("stub failure")
+        return {'signal': self.signal, 'score': 7.0, 'confidence': 'High'}
+
+
+def make_ensemble(slow_gate=None, slow_barrier=None, **kwargs):
+    """fast / medium은 즉시 buy, slow는 slow_gate가 열릴 때까지 대기 후 sell"""
+    analyzers = {
+        StubModel.FAST: StubAnalyzer('buy'),
+        StubModel.MEDIUM: StubAnalyzer('buy'),
+        StubModel.SLOW: StubAnalyzer('sell', gate=slow_gate, barrier=slow_barrier),
+    }
+    return EnsembleAnalyzer(voting_strategy=VotingStrategy.MAJORITY, analyzers=analyzers, **kwargs)
+
+
+STOCK = {'stock_code': '005930', 'current_price': 70000, 'change_rate': 1.0}
+
+
+class TestEnsembleAnalyzer:
+    """EnsembleAnalyzer 마감 시간 기반 투표 테스트"""
+
+    def test_deadline_votes_on_finished_models(self):
+        """마감까지 응답한 모델만으로 투표"""
+        gate = threading.Event()
+        ensemble = make_ensemble(slow_gate=gate, deadline=0.3)
+
+        try:
+            result = ensemble.analyze_stock(STOCK)
+            # slow 응답을 기다리지 않고 반환
+            assert not gate.is_set()
+        finally:
+            gate.set()
+
+        assert result['signal'] == 'BUY'
+        assert result['model_votes'] == {'BUY': 2, 'SELL': 0, 'HOLD': 0}
+        assert sorted(result['responded_models']) == ['fast', 'medium']
+        assert result['timed_out_models'] == ['slow']
+
+    def test_without_deadline_waits_for_all(self):
+        """deadline 없으면 모든 모델 결과 사용"""
+        ensemble = make_ensemble()
+
+        result = ensemble.analyze_stock(STOCK)
+
+        assert result['model_votes']['SELL'] == 1
+        assert result['timed_out_models'] == []
+
+    def test_failed_model_is_skipped(self):
+        """실패한 모델은 투표에서 제외"""
+        ensemble = make_ensemble()
+        ensemble.analyzers[StubModel.SLOW].fail = True
+
+        result = ensemble.analyze_stock(STOCK, deadline=1.0)
+
+        assert sorted(result['responded_models']) == ['fast', 'medium']
+
+    def test_safe_inside_running_loop(self):
+        """이벤트 루프 안에서도 동기 / 비동기 호출 가능"""
+        gate = threading.Event()
+        ensemble = make_ensemble(slow_gate=gate, deadline=0.3)
+
+        async def run():
+            sync_result = ensemble.analyze_stock(STOCK)
+            async_result = await ensemble.analyze_stock_async(STOCK)
+            return sync_result, async_result
+
+        try:
+            sync_result, async_result = asyncio.run(run())
+        finally:
+            gate.set()
+
+        assert sync_result['signal'] == async_result['signal'] == 'BUY'
+        assert async_result['timed_out_models'] == ['slow']
+
+    def test_many_stocks_share_bounded_pool(self):
+        """여러 종목을 모델별 풀에서 동시 분석 (8종목의 slow 호출이 모두 동시에 진행되어야 응답)"""
+        barrier = threading.Barrier(8)
+        ensemble = make_ensemble(slow_barrier=barrier, max_workers=12)
+        stocks = [dict(STOCK, stock_code=f'{i:06d}') for i in range(8)]
+
+        results = ensemble.analyze_stocks(stocks, deadline=10.0)
+
+        assert len(results) == 8
+        assert not barrier.broken
+        assert all(r['model_votes']['SELL'] == 1 for r in results)
+        assert all(r['signal'] == 'BUY' for r in results)
+        assert ensemble._executors[StubModel.SLOW]._max_workers == 12
+        ensemble.shutdown()
+
+    def test_stalled_model_does_not_starve_others(self):
+        """멈춘 모델이 자기 풀을 모두 점유해도 다른 모델은 모든 종목에 응답, 마감 초과율은 1 이하"""
+        gate = threading.Event()
+        ensemble = make_ensemble(slow_gate=gate, max_workers=2)
+        stocks = [dict(STOCK, stock_code=f'{i:06d}') for i in range(10)]
+
+        try:
+            first = ensemble.analyze_stocks(stocks, deadline=0.2)
+            second = ensemble.analyze_stocks(stocks, deadline=0.2)
+        finally:
+            gate.set()
+            ensemble.shutdown()
+
+        for result in first + second:
+            assert sorted(result['responded_models']) == ['fast', 'medium']
+            assert result['timed_out_models'] == ['slow']
+        assert ensemble.get_latency_percentiles(StubModel.SLOW)['timeout_rate'] == 1.0
+        assert ensemble.get_latency_percentiles(StubModel.FAST)['timeout_rate'] == 0.0
+
+    def test_latency_percentiles_feed_performance(self):
+        """모델별 응답 시간 분위수 / 마감 초과율이 성능 지표에 반영"""
+        gate = threading.Event()
+        ensemble = make_ensemble(slow_gate=gate, deadline=0.1)
+
+        for _ in range(3):
+            ensemble.analyze_stock(STOCK)
+        gate.set()
+        ensemble.shutdown(wait=True)  # 마감 초과 호출도 완료 후 기록
+
+        ensemble.update_model_performance(StubModel.SLOW, False, 'High')
+        ensemble.update_model_performance(StubModel.FAST, True, 'High')
+
+        slow = ensemble.model_performance[StubModel.SLOW]
+        fast = ensemble.model_performance[StubModel.FAST]
+        assert slow['latency_p50'] > fast['latency_p95']
+        assert slow['timeout_rate'] > 0
+        assert fast['timeout_rate'] == 0.0
+
+        rankings = ensemble.get_model_rankings()
+        assert rankings[0]['model'] == 'fast'
+        assert 'latency_p95' in rankings[0]
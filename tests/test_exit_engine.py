@@ -0,0 +1,240 @@
+"""
+Exit Engine Tests
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from strategy.exit_engine import ExitEngine, STOP_LOSS, TAKE_PROFIT, TRAILING_STOP
+
+
+def tick(code, price):
+    """WebSocket 0B 체결 메시지"""
+    return {'type': '0B', 'item': code, 'values': {'10': f'{-price:+d}'}}
+
+
+class OrderRecorder:
+    """매도 주문 대역"""
+
+    def __init__(self, results=None, delay=0.0):
+        self.results = list(results or [])
+        self.delay = delay
+        self.signals = []
+        self.done = threading.Event()
+
+    def __call__(self, signal):
+        time.sleep(self.delay)
+        self.signals.append(signal)
+        self.done.set()
+        return self.results.pop(0) if self.results else True
+
+
+def wait_orders(engine, n, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while len(engine.get_audit()) < n and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestExitEngine:
+    """ExitEngine 테스트"""
+
+    def test_fires_once_on_threshold_cross(self):
+        """임계값 교차 틱에서 1회만 발동, 지연 시간 감사 기록"""
+        orders = OrderRecorder(delay=0.05)
+        engine = ExitEngine(on_exit=orders)
+        engine.upsert_position('005930', '삼성전자', 10, 70000, stop_loss=66500, take_profit=77000)
+
+        assert engine.on_realtime_data(tick('005930', 68000)) is None
+        assert engine.on_realtime_data(tick('000660', 10000)) is None  # 미보유 종목
+
+        signal = engine.on_realtime_data(tick('005930_NX', 66400))
+        assert signal.kind == STOP_LOSS and signal.price == 66400 and signal.quantity == 10
+        assert signal.profit_loss == -36000
+        # 주문 진행 중 추가 틱은 재발동하지 않음
+        assert engine.on_price('005930', 66000) is None
+
+        wait_orders(engine, 1)
+        assert len(orders.signals) == 1
+        record = engine.get_audit()[0]
+        assert record['ok'] and record['kind'] == STOP_LOSS
+        assert record['tick_to_trigger_ms'] < 5
+        assert record['order_ms'] >= 50
+        assert engine.on_price('005930', 60000) is None  # 주문 완료 → 체결 대기
+
+        stats = engine.get_stats()
+        assert stats['fired'] == 1 and stats['orders_ok'] == 1 and stats['suppressed'] == 2
+        engine.shutdown()
+
+    def test_trailing_stop_only_moves_up(self):
+        """트레일링 스톱은 최고가 기준으로 상향만, 가장 높은 하방 트리거가 우선"""
+        orders = OrderRecorder()
+        engine = ExitEngine(on_exit=orders, trail_pct=0.02, activation_pct=0.03)
+        engine.upsert_position('005930', '삼성전자', 5, 10000, stop_loss=9500, take_profit=12000)
+
+        engine.on_price('005930', 10200)
+        assert TRAILING_STOP not in engine.get_triggers('005930')
+
+        engine.on_price('005930', 10400)  # 활성화
+        assert engine.get_triggers('005930')[TRAILING_STOP] == 10400 * 0.98
+        engine.on_price('005930', 11000)
+        engine.on_price('005930', 10800)  # 하락해도 스톱 유지
+        assert engine.get_triggers('005930')[TRAILING_STOP] == 11000 * 0.98
+
+        # 손절가 / 익절가 갱신은 트레일링 스톱에 영향 없음
+        engine.upsert_position('005930', '삼성전자', 5, 10000, stop_loss=9600, take_profit=12000)
+        triggers = engine.get_triggers('005930')
+        assert triggers[STOP_LOSS] == 9600 and triggers[TRAILING_STOP] == 11000 * 0.98
+
+        signal = engine.on_price('005930', 10770)
+        assert signal.kind == TRAILING_STOP
+        assert signal.trigger_price == 11000 * 0.98
+        engine.shutdown()
+
+    def test_failed_order_rearms_after_retry_interval(self):
+        """주문 실패 시 retry_interval 이후 다음 틱에서 재발동"""
+        orders = OrderRecorder(results=[False, True])
+        engine = ExitEngine(on_exit=orders, retry_interval=0.05)
+        engine.upsert_position('005930', '삼성전자', 10, 70000, stop_loss=66500, take_profit=77000)
+
+        assert engine.on_price('005930', 77000).kind == TAKE_PROFIT
+        wait_orders(engine, 1)
+        assert engine.on_price('005930', 77100) is None
+        time.sleep(0.06)
+        assert engine.on_price('005930', 77200) is not None
+        wait_orders(engine, 2)
+
+        audit = engine.get_audit()
+        assert [r['ok'] for r in audit] == [False, True]
+        assert engine.get_stats()['orders_failed'] == 1
+        engine.shutdown()
+
+    def test_sync_positions(self):
+        """보유 목록 동기화: 매도된 종목 제거, 체결 대기 종목은 재무장하지 않음"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        engine = ExitEngine(on_exit=OrderRecorder(), executor=executor)
+        holdings = [
+            {'stock_code': 'A005930', 'stock_name': '삼성전자', 'quantity': 10, 'entry_price': 70000,
+             'stop_loss': 66500, 'take_profit': 77000},
+            {'stock_code': '000660', 'stock_name': 'SK하이닉스', 'quantity': 3, 'entry_price': 150000,
+             'stop_loss': 142500, 'take_profit': 165000},
+        ]
+        assert engine.sync_positions(holdings) == 2
+        assert sorted(engine.stock_codes) == ['000660', '005930']
+
+        engine.on_price('000660', 140000)
+        wait_orders(engine, 1)
+        engine.sync_positions(holdings)
+        assert engine.get_position('000660').status == 'closed'
+
+        assert engine.sync_positions(holdings[:1]) == 1
+        assert engine.get_triggers('000660') == {}
+        executor.shutdown()
+
+    def test_resting_order_not_resubmitted(self):
+        """rearm_timeout 이 지나도 첫 매도 주문이 미체결이면 재무장 / 재주문하지 않음"""
+        orders = OrderRecorder()
+        engine = ExitEngine(on_exit=orders, rearm_timeout=0)
+        holding = {'stock_code': '000660', 'stock_name': 'SK하이닉스', 'quantity': 3, 'entry_price': 150000,
+                   'stop_loss': 142500, 'take_profit': 165000}
+        engine.sync_positions([holding])
+
+        engine.on_price('000660', 140000)
+        wait_orders(engine, 1)
+        for quantity in (3, 3, 2, 1):  # 미체결 → 일부 체결 (잔량은 여전히 첫 주문에 묶여 있음)
+            engine.sync_positions([dict(holding, quantity=quantity)])
+            assert engine.get_position('000660').status == 'closed'
+            assert engine.on_price('000660', 139000) is None
+
+        assert [s.quantity for s in orders.signals] == [3]
+        assert engine.get_stats()['rearmed'] == 0
+        engine.shutdown()
+
+    def test_unlocked_holding_rearms_with_orderable_quantity(self):
+        """주문 가능 수량이 생기면 (미체결 주문 만료 등) rearm_timeout 뒤 그 수량으로 재무장 → 다시 발동"""
+        orders = OrderRecorder()
+        engine = ExitEngine(on_exit=orders, rearm_timeout=3600)
+        holding = {'stock_code': '000660', 'stock_name': 'SK하이닉스', 'quantity': 3, 'entry_price': 150000,
+                   'stop_loss': 142500, 'take_profit': 165000}
+        engine.sync_positions([holding])
+
+        engine.on_price('000660', 140000)
+        wait_orders(engine, 1)
+        partial = dict(holding, quantity=1, orderable_quantity=1)  # 2주 체결, 남은 주문 만료
+        engine.sync_positions([partial])
+        assert engine.get_position('000660').status == 'closed'
+        assert engine.on_price('000660', 139000) is None
+
+        engine.rearm_timeout = 0
+        engine.sync_positions([partial])
+        position = engine.get_position('000660')
+        assert position.status == 'armed'
+        assert position.quantity == 1
+        assert engine.get_triggers('000660')[STOP_LOSS] == 142500
+
+        signal = engine.on_price('000660', 139000)
+        wait_orders(engine, 2)
+        assert signal.kind == STOP_LOSS and signal.quantity == 1
+        assert [s.quantity for s in orders.signals] == [3, 1]
+        assert engine.get_stats()['rearmed'] == 1
+        engine.shutdown()
+
+
+class FailingSession:
+    """커밋이 실패하는 DB 세션 대역"""
+
+    def add(self, row):
+        pass
+
+    def commit(self):
+        raise RuntimeError("database is locked")
+
+    def rollback(self):
+        pass
+
+
+class TestExecuteSell:
+    """TradingBotV2._execute_sell 결과 (ExitEngine 재발동 기준) 테스트"""
+
+    @staticmethod
+    def make_bot(sell_result, alert_error=None):
+        from unittest.mock import MagicMock
+
+        from main import TradingBotV2
+
+        bot = TradingBotV2.__new__(TradingBotV2)
+        bot.trading_lock = threading.RLock()
+        bot.market_status = {}
+        bot.order_api = MagicMock()
+        bot.order_api.sell.return_value = sell_result
+        bot.dynamic_risk_manager = MagicMock()
+        bot.dynamic_risk_manager.current_mode.value = 'normal'
+        bot.db_session = FailingSession()
+        bot.alert_manager = MagicMock()
+        bot.alert_manager.alert_position_closed.side_effect = alert_error
+        bot.monitor = MagicMock()
+        return bot
+
+    def test_accepted_order_is_success_despite_bookkeeping_errors(self):
+        """주문 접수 후 DB 기록 / 알림이 실패해도 True → 엔진이 같은 포지션을 다시 매도하지 않음"""
+        bot = self.make_bot({'order_no': '0001'}, alert_error=RuntimeError("telegram down"))
+        engine = ExitEngine(
+            on_exit=lambda s: bot._execute_sell(s.stock_code, s.stock_name, s.quantity, s.price,
+                                                s.profit_loss, s.profit_loss_rate, s.reason),
+            retry_interval=0,
+        )
+        engine.upsert_position('005930', '삼성전자', 10, 70000, stop_loss=66500)
+
+        engine.on_price('005930', 66000)
+        wait_orders(engine, 1)
+        assert engine.get_audit()[0]['ok'] is True
+        assert engine.on_price('005930', 65900) is None
+        assert bot.order_api.sell.call_count == 1
+        engine.shutdown()
+
+    def test_rejected_order_is_failure(self):
+        """주문 접수 실패는 False (재발동 대상)"""
+        bot = self.make_bot(None)
+
+        assert bot._execute_sell('005930', '삼성전자', 10, 66000, -40000, -5.7, '손절') is False
+        assert not bot.alert_manager.alert_position_closed.called
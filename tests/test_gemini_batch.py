@@ -0,0 +1,220 @@
+"""
+Gemini Batch Analysis Tests
+"""
+
+import asyncio
+import json
+import re
+import threading
+
+from ai.gemini_analyzer import GeminiAnalyzer
+
+
+class StubResponse:
+    """generate_content 응답 대역"""
+
+    def __init__(self, text):
+        self.text = text
+        self.candidates = [type('Candidate', (), {'finish_reason': 1})()]
+
+
+class StubModel:
+    """
+    프롬프트 속 종목코드마다 buy 신호를 돌려주는 로컬 모델 대역
+
+    drop: 배치 응답에서 뺄 종목
+    barrier: 모든 요청이 이 Barrier에서 만나야 응답 (동시 요청이 아니면 BrokenBarrierError)
+    gate: 첫 요청은 이 Event가 set될 때까지 응답하지 않음
+    """
+
+    def __init__(self, drop=(), barrier=None, gate=None):
+        self.drop = set(drop)
+        self.barrier = barrier
+        self.gate = gate
+        self.prompts = []
+        self.completed = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, request_options=None):
+        with self._lock:
+            self.prompts.append(prompt)
+            first = len(self.prompts) == 1
+        if self.barrier is not None:
+            self.barrier.wait(5)
+        if self.gate is not None and first:
+            self.gate.wait(5)
+        with self._lock:
+            self.completed += 1
+
+        codes = re.findall(r'\((\d{6})\)', prompt)
+        items = [
+            {'stock_code': code, 'signal': 'BUY', 'confidence_level': 'High',
+             'detailed_reasoning': f'{code} 분석'}
+            for code in codes
+        ]
+        if '다종목' in prompt:
+            items = [item for item in items if item['stock_code'] not in self.drop]
+            return StubResponse(f"```json\n{json.dumps(items, ensure_ascii=False)}\n```")
+        return StubResponse(json.dumps(items[0], ensure_ascii=False))
+
+
+class AsyncStubModel(StubModel):
+    """generate_content_async를 가진 모델 대역 - SDK처럼 처음 사용한 이벤트 루프에 묶임"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bound_loop = None
+        self.async_calls = 0
+
+    async def generate_content_async(self, prompt, request_options=None):
+        loop = asyncio.get_running_loop()
+        if self.bound_loop is None:
+            self.bound_loop = loop
+        elif loop is not self.bound_loop:
+            raise RuntimeError("attached to a different loop")
+        self.async_calls += 1
+        await asyncio.sleep(0)
+        return self.generate_content(prompt, request_options)
+
+
+def make_analyzer(model, enable_cross_check=False):
+    analyzer = GeminiAnalyzer(api_key='test-key', model_name='stub-model',
+                              enable_cross_check=enable_cross_check)
+    analyzer.model = model
+    analyzer.is_initialized = True
+    return analyzer
+
+
+def make_stocks(n):
+    return [
+        {'stock_code': f'{100000 + i:06d}', 'stock_name': f'종목{i}',
+         'current_price': 10000 + i, 'change_rate': 1.5, 'volume': 1000}
+        for i in range(n)
+    ]
+
+
+class TestGeminiBatchAnalysis:
+    """GeminiAnalyzer 배치 분석 테스트"""
+
+    def test_batches_candidates_into_concurrent_requests(self):
+        """종목을 batch_size개씩 묶어 동시에 요청"""
+        # 4건이 모두 동시에 진행 중이어야 Barrier 통과
+        model = StubModel(barrier=threading.Barrier(4))
+        analyzer = make_analyzer(model)
+        stocks = make_stocks(20)
+
+        results = analyzer.analyze_stocks_batch(stocks, batch_size=5, max_concurrency=4, hedge_after=5)
+
+        assert len(model.prompts) == 4
+        assert not model.barrier.broken
+        assert [r['signal'] for r in results] == ['buy'] * 20
+        assert results[7]['reasons'] == ['100007 분석']
+        assert results[7]['target_price'] == int(10007 * 1.1)
+
+    def test_cache_shared_with_single_analysis(self):
+        """배치 결과는 프롬프트 입력 해시로 캐시되어 재요청하지 않음"""
+        model = StubModel()
+        analyzer = make_analyzer(model)
+        stocks = make_stocks(3)
+
+        analyzer.analyze_stocks_batch(stocks)
+        assert len(model.prompts) == 1
+
+        analyzer.analyze_stocks_batch(stocks)
+        assert analyzer.analyze_stock(stocks[0])['signal'] == 'buy'
+        assert len(model.prompts) == 1
+        assert analyzer.get_batch_statistics()['cache_hits'] == 3
+
+        # 입력이 바뀌면 다른 키
+        changed = dict(stocks[0], current_price=20000)
+        analyzer.analyze_stock(changed)
+        assert len(model.prompts) == 2
+
+    def test_cache_is_bounded(self):
+        """LRU 캐시 최대 크기 유지"""
+        analyzer = make_analyzer(StubModel())
+        analyzer.analyze_stocks_batch(make_stocks(300), batch_size=10)
+
+        assert analyzer.get_batch_statistics()['cache_entries'] == analyzer._analysis_cache.max_size
+
+    def test_missing_stock_falls_back_to_single_prompt(self):
+        """배치 응답에서 빠진 종목은 단일 프롬프트로 재요청"""
+        model = StubModel(drop={'100001'})
+        analyzer = make_analyzer(model)
+
+        results = analyzer.analyze_stocks_batch(make_stocks(3))
+
+        assert [r['signal'] for r in results] == ['buy'] * 3
+        assert len(model.prompts) == 2
+        assert '다종목' not in model.prompts[1]
+        assert analyzer.get_batch_statistics()['fallbacks'] == 1
+
+    def test_slow_request_is_hedged(self):
+        """hedge_after 초과 시 중복 요청을 보내 먼저 온 응답 사용"""
+        gate = threading.Event()
+        model = StubModel(gate=gate)
+        analyzer = make_analyzer(model)
+
+        try:
+            results = analyzer.analyze_stocks_batch(make_stocks(2), hedge_after=0.05)
+            # 첫 요청이 아직 응답하지 않은 상태에서 헤징 응답으로 완료
+            assert model.completed == 1
+        finally:
+            gate.set()
+
+        assert len(model.prompts) == 2
+        assert [r['signal'] for r in results] == ['buy'] * 2
+        stats = analyzer.get_batch_statistics()
+        assert stats['hedged'] == 1
+        assert stats['hedge_wins'] == 1
+
+    def test_invalid_stock_returns_error_result(self):
+        """필수 필드 누락 종목은 요청하지 않고 에러 결과"""
+        model = StubModel()
+        analyzer = make_analyzer(model)
+        stocks = make_stocks(2) + [{'stock_code': '999999'}]
+
+        results = analyzer.analyze_stocks_batch(stocks)
+
+        assert results[2]['error'] is True
+        assert '999999' not in model.prompts[0]
+
+    def test_async_model_reuses_one_loop_across_scans(self):
+        """스캔마다 같은 이벤트 루프에서 async API 호출 (SDK 클라이언트가 첫 루프에 묶임)"""
+        model = AsyncStubModel()
+        analyzer = make_analyzer(model)
+        stocks = make_stocks(6)
+
+        first = analyzer.analyze_stocks_batch(stocks[:3])
+        second = analyzer.analyze_stocks_batch(stocks[3:])
+
+        assert [r['signal'] for r in first + second] == ['buy'] * 6
+        assert model.async_calls == 2
+        assert analyzer.get_batch_statistics()['errors'] == 0
+
+    def test_async_model_on_foreign_loop_uses_executor(self):
+        """전용 루프가 아닌 곳에서 직접 await하면 async API 대신 스레드 풀 사용"""
+        model = AsyncStubModel()
+        analyzer = make_analyzer(model)
+        analyzer.analyze_stocks_batch(make_stocks(2))
+
+        results = asyncio.run(analyzer.analyze_stocks_batch_async(make_stocks(4)[2:]))
+
+        assert [r['signal'] for r in results] == ['buy'] * 2
+        assert model.async_calls == 1
+        assert len(model.prompts) == 2
+
+    def test_cross_check_mode_uses_per_stock_path(self):
+        """크로스체크 모드에서는 배치 프롬프트 대신 종목별 두 모델 비교"""
+        model, model_2_0, model_2_5 = StubModel(), StubModel(), StubModel()
+        analyzer = make_analyzer(model, enable_cross_check=True)
+        analyzer.model_2_0 = model_2_0
+        analyzer.model_2_5 = model_2_5
+
+        results = analyzer.analyze_stocks_batch(make_stocks(3), max_concurrency=2)
+
+        assert [r['signal'] for r in results] == ['buy'] * 3
+        assert all('cross_check' in r for r in results)
+        assert model.prompts == []
+        assert len(model_2_0.prompts) == len(model_2_5.prompts) == 3
+        assert not any('다종목' in p for p in model_2_0.prompts + model_2_5.prompts)
@@ -0,0 +1,113 @@
+"""
+Lazy Package Import Tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_python(code, cwd):
+    """새 인터프리터에서 code 실행 후 마지막 줄의 JSON 반환"""
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    proc = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                          capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+LOADED = "json.dumps(sorted(m for m in sys.modules if m.startswith(('ai.', 'features.', 'torch', 'scipy', 'pandas'))))"
+
+
+class TestLazyPackages:
+    """ai / features 패키지 지연 import 테스트"""
+
+    def test_package_import_loads_no_submodules(self, tmp_path):
+        """import ai, features 만으로는 서브모듈·무거운 의존성 로드 안 함"""
+        loaded = run_python(f"import sys, json, ai, features; print({LOADED})", tmp_path)
+        assert loaded == []
+
+    def test_attribute_access_loads_only_its_module(self, tmp_path):
+        """속성 접근 시 해당 서브모듈만 로드"""
+        loaded = run_python(
+            "import sys, json\n"
+            "from ai import BlackScholesModel\n"
+            "from features import TestModeManager\n"
+            f"print({LOADED})", tmp_path
+        )
+        assert 'ai.options_hft' in loaded
+        assert 'features.test_mode_manager' in loaded
+        assert 'ai.deep_learning' not in loaded
+        assert 'ai.portfolio_optimization' not in loaded
+        assert 'features.portfolio_optimizer' not in loaded
+
+    @pytest.mark.filterwarnings('ignore::UserWarning')
+    def test_exports_resolve(self):
+        """__all__ 의 모든 이름이 기존 객체로 해석, 별칭 유지, 없는 이름은 AttributeError"""
+        import ai
+        import features
+        from ai.advanced_rl import RLAction
+        from ai.options_hft import BlackScholesModel
+        from features.ai_learning import TradingPattern
+
+        for package in (ai, features):
+            for name in package.__all__:
+                getattr(package, name)
+            assert set(package.__all__) <= set(dir(package))
+
+        assert ai.AdvancedRLAction is RLAction
+        assert ai.BlackScholesModel is BlackScholesModel
+        assert features.AITradingPattern is TradingPattern
+        with pytest.raises(AttributeError):
+            ai.NoSuchModel
+
+
+class TestDeferredDatabase:
+    """database 지연 초기화 테스트"""
+
+    def test_engine_created_on_first_session(self, tmp_path):
+        """import 시 엔진·DB 파일 없음, 첫 세션에서 모든 모델 테이블 생성"""
+        pytest.importorskip('sqlalchemy')
+        result = run_python(
+            "import json, os\n"
+            "import database\n"
+            "from database.models import Base\n"
+            "before = [database.Database._Session is not None, os.path.exists('data')]\n"
+            "database.get_db_session().close()\n"
+            "from sqlalchemy import inspect\n"
+            "tables = inspect(database.Database().engine).get_table_names()\n"
+            "print(json.dumps([before, sorted(tables), sorted(Base.metadata.tables)]))",
+            tmp_path
+        )
+        before, tables, models = result
+        assert before == [False, False]
+        assert tables == models
+        assert 'backtest_results' in tables
+
+    def test_scoped_session_per_thread(self, tmp_path):
+        """스레드마다 별도 세션, 동시 커밋이 모두 반영"""
+        pytest.importorskip('sqlalchemy')
+        result = run_python(
+            "import json, threading\n"
+            "from database import get_scoped_db_session, Trade\n"
+            "registry = get_scoped_db_session()\n"
+            "sessions = []\n"
+            "def worker(n):\n"
+            "    sessions.append(registry())\n"
+            "    for i in range(20):\n"
+            "        registry.add(Trade(stock_code=f'{n:06d}', stock_name='t', action='buy',\n"
+            "                           quantity=1, price=1.0, total_amount=1.0))\n"
+            "        registry.commit()\n"
+            "    registry.remove()\n"
+            "threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]\n"
+            "[t.start() for t in threads]; [t.join() for t in threads]\n"
+            "print(json.dumps([len(set(map(id, sessions))), registry.query(Trade).count()]))",
+            tmp_path
+        )
+        assert result == [8, 160]
@@ -0,0 +1,143 @@
+"""
+Logging Pipeline Tests
+"""
+
+import json
+import logging
+
+import pytest
+from loguru import logger
+
+from utils.logger_new import LoguruLogger, ModuleSampler, flush_logs
+
+
+def as_module(name):
+    """해당 모듈에서 남긴 것처럼 레코드 이름 변경"""
+    return logger.patch(lambda record: record.update(name=name))
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """임시 디렉토리 sink 로 재구성, 끝나면 기본 설정 복원"""
+    def setup(**overrides):
+        config = {
+            'level': 'DEBUG',
+            'file_path': str(tmp_path / 'bot.log'),
+            'json_file_path': str(tmp_path / 'bot.jsonl'),
+            'console_output': False,
+            'enqueue': True,
+        }
+        config.update(overrides)
+        LoguruLogger()._setup_logger(config)
+        return tmp_path
+
+    yield setup
+    flush_logs()
+    LoguruLogger().reconfigure()
+
+
+class TestModuleSampler:
+    """모듈별 샘플링 필터 테스트"""
+
+    @staticmethod
+    def records(name, level, count):
+        return [{'name': name, 'level': logger.level(level), 'extra': {}} for _ in range(count)]
+
+    def test_rate_and_levels(self):
+        """비율만큼 결정적으로 통과, WARNING 이상과 다른 모듈은 항상 통과"""
+        sampler = ModuleSampler({'core.rest_client': 0.25, 'research': 0.0})
+
+        assert sum(map(sampler, self.records('core.rest_client', 'DEBUG', 100))) == 25
+        assert all(map(sampler, self.records('core.rest_client', 'WARNING', 10)))
+        assert not any(map(sampler, self.records('research.deep_scan_utils', 'INFO', 10)))
+        assert all(map(sampler, self.records('research_tools', 'INFO', 10)))
+        assert all(map(sampler, self.records('strategy.trailing_stop', 'DEBUG', 10)))
+
+    def test_include_only_listed_modules(self):
+        """include 가 있으면 해당 접두사 모듈만 통과"""
+        sampler = ModuleSampler(include=['core.rest_client', 'research'])
+
+        assert all(map(sampler, self.records('research.scanner_pipeline', 'ERROR', 3)))
+        assert all(map(sampler, self.records('core.rest_client', 'ERROR', 3)))
+        assert not any(map(sampler, self.records('strategy.trailing_stop', 'ERROR', 3)))
+
+    def test_shared_sampler_decides_once_per_record(self):
+        """여러 sink 가 공유해도 한 레코드에는 같은 결정, 제외 모듈은 거부"""
+        sampler = ModuleSampler({'core': 0.5}, exclude=['research'])
+        record = self.records('core.rest_client', 'INFO', 1)[0]
+
+        assert sampler(record) == sampler(record) == sampler(record)
+        assert not sampler(self.records('research.scanner_pipeline', 'ERROR', 1)[0])
+
+
+class TestQueuedPipeline:
+    """백그라운드 writer 파이프라인 테스트"""
+
+    def test_queued_text_and_json_lines(self, pipeline):
+        """큐 모드 기록이 flush 후 텍스트/JSON-lines 파일에 순서대로 남음"""
+        log_dir = pipeline(json_output=True)
+
+        for i in range(200):
+            logger.info("주문 처리 {}", i)
+        assert flush_logs()
+
+        lines = (log_dir / 'bot.log').read_text(encoding='utf-8').splitlines()
+        assert [line.rsplit(' ', 1)[-1] for line in lines] == [str(i) for i in range(200)]
+
+        records = [json.loads(line) for line in (log_dir / 'bot.jsonl').read_text(encoding='utf-8').splitlines()]
+        assert len(records) == 200
+        assert records[7]['record']['message'] == '주문 처리 7'
+
+    def test_sampling_and_hot_path_errors(self, pipeline):
+        """샘플링 적용, 핫패스 에러도 error.log 에 남음"""
+        log_dir = pipeline(sampling={'core.rest_client': 0.1})
+
+        rest = as_module('core.rest_client')
+        for i in range(50):
+            rest.debug("[REST 응답] {}", i)
+        rest.error("네트워크 오류")
+        as_module('strategy.trailing_stop').error("손절 실패")
+        flush_logs()
+
+        main_log = (log_dir / 'bot.log').read_text(encoding='utf-8')
+        error_log = (log_dir / 'error.log').read_text(encoding='utf-8')
+        assert main_log.count('[REST 응답]') == 5
+        assert '네트워크 오류' in main_log and '네트워크 오류' in error_log
+        assert '손절 실패' in error_log
+
+    @pytest.mark.parametrize('enqueue', [True, False])
+    def test_hot_path_errors_without_diagnose(self, pipeline, enqueue):
+        """error.log: 핫패스 에러는 스택 트레이스만, 그 외 모듈은 변수 값 덤프 포함"""
+        log_dir = pipeline(enqueue=enqueue)
+
+        def fail(module):
+            payload = {'응답코드': 'V-4242'}
+            try:
+                payload['없는키']
+            except KeyError:
+                as_module(module).exception("{} 처리 실패", module)
+
+        fail('research.scanner_pipeline')
+        flush_logs()
+        error_log = (log_dir / 'error.log').read_text(encoding='utf-8')
+        assert 'research.scanner_pipeline 처리 실패' in error_log
+        assert 'KeyError' in error_log and 'V-4242' not in error_log
+
+        fail('strategy.trailing_stop')
+        flush_logs()
+        error_log = (log_dir / 'error.log').read_text(encoding='utf-8')
+        assert 'strategy.trailing_stop 처리 실패' in error_log
+        assert error_log.count('research.scanner_pipeline 처리 실패') == 1
+        assert 'V-4242' in error_log
+
+    def test_intercept_stdlib(self, pipeline):
+        """표준 logging 로그도 같은 파이프라인으로 전달, 해제 시 핸들러 제거"""
+        log_dir = pipeline(intercept_stdlib=True, level='INFO')
+
+        logging.getLogger('core.rest_client').info("API 호출 성공 (%s)", 'ka10001')
+        flush_logs()
+
+        assert 'API 호출 성공 (ka10001)' in (log_dir / 'bot.log').read_text(encoding='utf-8')
+
+        pipeline(intercept_stdlib=False)
+        assert not any(type(h).__name__ == 'InterceptHandler' for h in logging.getLogger().handlers)
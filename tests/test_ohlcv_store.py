@@ -0,0 +1,210 @@
+"""
+OHLCV History Store Tests
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from api.market.chart_data import ChartDataAPI
+from utils.ohlcv_store import OHLCVStore, RECORD_SIZE, DAILY, minute_timeframe
+
+
+def daily_bars(dates, base=70000):
+    """최신순 일봉 리스트 (API 반환 형식, 값은 날짜로 결정 → 겹치는 페이지끼리 일치)"""
+    return [
+        {'date': d, 'open': base + int(d[6:]), 'high': base + int(d[6:]) + 500, 'low': base + int(d[6:]) - 500,
+         'close': base + int(d[6:]) + 100, 'volume': 1000 + int(d[6:])}
+        for d in sorted(dates, reverse=True)
+    ]
+
+
+def minute_bars(day, times, base=70000):
+    """최신순 1분봉 리스트"""
+    return [
+        {'date': day, 'time': t, 'open': base, 'high': base + 100, 'low': base - 100,
+         'close': base + int(t[2:4]), 'volume': 10}
+        for t in sorted(times, reverse=True)
+    ]
+
+
+DATES = [f'202401{d:02d}' for d in range(2, 31) if d not in (6, 7, 13, 14, 20, 21, 27, 28)]
+
+
+class FakeChartClient:
+    """ka10081 요청 수를 세는 클라이언트 대역"""
+
+    def __init__(self, dates):
+        self.dates = dates
+        self.requests = 0
+
+    def request(self, api_id, body, path):
+        self.requests += 1
+        rows = [
+            {'dt': b['date'], 'open_pric': str(b['open']), 'high_pric': str(b['high']),
+             'low_pric': str(b['low']), 'cur_prc': str(b['close']), 'trde_qty': str(b['volume'])}
+            for b in daily_bars([d for d in self.dates if d <= body['base_dt']])
+        ]
+        return {'return_code': 0, 'stk_dt_pole_chart_qry': rows}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return OHLCVStore(root=str(tmp_path / 'ohlcv'))
+
+
+class TestOHLCVStore:
+    """OHLCVStore 테스트"""
+
+    def test_incremental_append(self, store):
+        """겹치는 페이지는 새 봉만 append, 마지막 봉은 제자리 갱신"""
+        assert store.merge('005930', DAILY, daily_bars(DATES[:10])) == 10
+        path = store.path('005930', DAILY)
+        assert path.stat().st_size == 10 * RECORD_SIZE
+
+        # 형성 중이던 마지막 봉 갱신 + 새 봉 2개 (과거 구간은 이미 저장됨)
+        page = daily_bars(DATES[:12])
+        page[2]['close'] += 300  # DATES[9]: 저장 당시 형성 중이던 봉
+        assert store.merge('005930', DAILY, page) == 2
+        assert path.stat().st_size == 12 * RECORD_SIZE
+
+        records = store.read('005930', DAILY)
+        assert records[:, 0].tolist() == [int(d) for d in DATES[:12]]
+        assert records[9, 4] == 70000 + int(DATES[9][6:]) + 400   # 마지막 봉은 갱신
+        assert store.get_stats()['resets'] == 0
+
+        bars = store.read_bars('005930', DAILY, count=3, end=int(DATES[10]))
+        assert [b['date'] for b in bars] == [DATES[10], DATES[9], DATES[8]]
+        assert bars[0]['close'] == 70000 + int(DATES[10][6:]) + 100
+
+    def test_adjusted_price_change_rewrites_history(self, store):
+        """겹치는 확정 봉 값이 바뀌면 (액면분할 등 수정주가 기준 변경) 저장 구간을 응답으로 교체"""
+        store.merge('005930', DAILY, daily_bars(DATES[:15], base=70000))
+
+        rebased = daily_bars(DATES[5:17], base=14000)  # 1:5 분할 후 수정주가 페이지
+        assert store.merge('005930', DAILY, rebased) == 12
+
+        records = store.read('005930', DAILY)
+        assert records[:, 0].tolist() == [int(d) for d in DATES[5:17]]
+        assert records[:, 4].tolist() == [14000 + int(d[6:]) + 100 for d in DATES[5:17]]
+        assert store.get_stats()['resets'] == 1
+
+        # 교체로 잘린 과거 구간은 covers 확인에서 다시 보충 대상
+        assert not store.covers('005930', DAILY, start=int(DATES[0]))
+
+    def test_missing_minute_session_not_served(self, store):
+        """저장 구간과 겹치지 않는 분봉 페이지 (사이 세션 누락) 는 이어 붙이지 않고 교체"""
+        timeframe = minute_timeframe(1)
+        store.merge('005930', timeframe, minute_bars('20240102', ['090000', '090100', '090200']))
+
+        # 20240103 세션 전체가 빠진 채 20240104 분봉만 수신
+        assert store.merge('005930', timeframe, minute_bars('20240104', ['090000', '090100'])) == 2
+
+        records = store.read('005930', timeframe)
+        assert records[:, 0].tolist() == [20240104090000, 20240104090100]
+        assert not store.covers('005930', timeframe, start=20240102)
+        assert store.get_stats()['resets'] == 1
+
+    def test_backfill_gap(self, store):
+        """저장되지 않은 과거 구간이 오면 정렬 / 중복 제거 후 재작성"""
+        store.merge('005930', DAILY, daily_bars(DATES[10:15]))
+        store.merge('005930', DAILY, daily_bars(DATES[:12]))
+
+        records = store.read('005930', DAILY)
+        assert records[:, 0].tolist() == [int(d) for d in DATES[:15]]
+        assert np.all(np.diff(records[:, 0]) > 0)
+
+        frame = store.read_frame('005930', DAILY, count=5)
+        assert len(frame) == 5
+        assert frame.index.is_monotonic_increasing
+        assert list(frame.columns) == ['open', 'high', 'low', 'close', 'volume']
+
+    def test_sync_freshness(self, store):
+        """확정 구간은 로컬 응답, 장중 봉은 max_age 이후 재동기화"""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return daily_bars(DATES[:10])
+
+        assert len(store.sync('005930', DAILY, fetch, count=5, min_date=DATES[9])) == 5
+        # 방금 동기화 → max_age 이내
+        store.sync('005930', DAILY, fetch, count=5, min_date=DATES[9], max_age=60)
+        # 더 과거 기준일은 이미 확정
+        store.sync('005930', DAILY, fetch, count=5, min_date=DATES[5], max_age=0)
+        assert len(calls) == 1
+
+        # 기준일 장중에 동기화된 봉은 max_age가 지나면 다시 요청
+        synced_at = time.mktime(time.strptime(DATES[9] + '100000', '%Y%m%d%H%M%S'))
+        os.utime(store.path('005930', DAILY), (synced_at, synced_at))
+        store.sync('005930', DAILY, fetch, count=5, min_date=DATES[9], max_age=60)
+        assert len(calls) == 2
+
+        # 조회 실패 시 로컬 데이터로 응답
+        os.utime(store.path('005930', DAILY), (synced_at, synced_at))
+
+        def broken():
+            raise ConnectionError('down')
+        bars = store.sync('005930', DAILY, broken, count=5, min_date=DATES[12])
+        assert len(bars) == 5
+        assert store.get_stats()['fetch_errors'] == 1
+
+    def test_sync_requires_requested_range(self, store):
+        """최신이라도 저장 구간이 start / count를 포함하지 않으면 API로 보충"""
+        pages = {'recent': daily_bars(DATES[10:15]), 'full': daily_bars(DATES[:15])}
+        calls = []
+
+        def fetch(page):
+            def call():
+                calls.append(page)
+                return pages[page]
+            return call
+
+        store.sync('005930', DAILY, fetch('recent'), count=3, min_date=DATES[14])
+        assert store.covers('005930', DAILY, count=5)
+        assert not store.covers('005930', DAILY, count=8)
+        assert not store.covers('005930', DAILY, start=int(DATES[2]))
+
+        # 저장된 5개보다 많이 요청 → 재동기화 후 과거 구간까지 응답
+        bars = store.sync('005930', DAILY, fetch('full'), count=8, min_date=DATES[14])
+        assert calls == ['recent', 'full']
+        assert [b['date'] for b in bars] == DATES[14:6:-1]
+
+        # 이제 포함되는 구간은 로컬 응답
+        bars = store.sync('005930', DAILY, fetch('full'), min_date=DATES[14], start=int(DATES[2]))
+        assert len(calls) == 2
+        assert bars[-1]['date'] == DATES[0]
+
+    def test_short_history_not_refetched(self, store):
+        """API가 가진 봉이 count보다 적은 종목 (신규 상장) 은 한 번만 보충 조회"""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return daily_bars(DATES[:4])
+
+        for _ in range(3):
+            bars = store.sync('005930', DAILY, fetch, count=20, min_date=DATES[3])
+
+        assert len(calls) == 1
+        assert len(bars) == 4
+
+
+class TestChartDataAPIWithStore:
+    """ChartDataAPI 저장소 연동 테스트"""
+
+    def test_daily_chart_served_locally(self, store):
+        client = FakeChartClient(DATES)
+        api = ChartDataAPI(client, history_store=store)
+
+        first = api.get_daily_chart('005930', period=15, date=DATES[-3])
+        second = api.get_daily_chart('005930', period=5, date=DATES[-5])
+
+        assert client.requests == 1
+        assert len(first) == 15 and first[0]['date'] == DATES[-3]
+        assert [b['date'] for b in second] == DATES[-5:-10:-1]
+
+        direct = ChartDataAPI(client, use_history_store=False).get_daily_chart('005930', period=15, date=DATES[-3])
+        assert direct == first
@@ -0,0 +1,90 @@
+"""
+Black-Scholes Option Chain Tests
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from ai.options_hft import BlackScholesModel
+
+
+def make_chain(spot=350.0):
+    """만기 × 행사가 격자, OTM 콜/풋, 스마일 변동성"""
+    strikes = np.arange(250.0, 452.5, 2.5)[np.newaxis, :]
+    expiries = (np.array([7, 14, 35, 63, 91, 182]) / 365)[:, np.newaxis]
+    vols = 0.15 + 0.4 * (strikes / spot - 1) ** 2 + 0.02 * np.sqrt(expiries)
+    types = np.broadcast_to(np.where(strikes >= spot, 'call', 'put'), vols.shape)
+    return spot, strikes, expiries, vols, types
+
+
+def reference(spot, strike, t, vol, option_type, r=0.02):
+    """기존 스칼라 공식 (scipy.stats.norm)"""
+    d1 = (np.log(spot / strike) + (r + 0.5 * vol ** 2) * t) / (vol * np.sqrt(t))
+    d2 = d1 - vol * np.sqrt(t)
+    disc = strike * np.exp(-r * t)
+    if option_type == 'call':
+        return spot * norm.cdf(d1) - disc * norm.cdf(d2), norm.cdf(d1), disc * t * norm.cdf(d2) / 100
+    return disc * norm.cdf(-d2) - spot * norm.cdf(-d1), norm.cdf(d1) - 1, -disc * t * norm.cdf(-d2) / 100
+
+
+class TestBlackScholesChain:
+    """BlackScholesModel 배열 API 테스트"""
+
+    def test_chain_matches_scalar_formulas(self):
+        """체인 가격/델타/로 = 종목별 기존 공식, 스칼라 API 는 체인 결과 그대로"""
+        bs = BlackScholesModel()
+        spot, strikes, expiries, vols, types = make_chain()
+        prices = bs.price_chain(spot, strikes, expiries, vols, types)
+        greeks = bs.greeks_chain(spot, strikes, expiries, vols, types)
+
+        assert prices.shape == vols.shape
+        for i, j in [(0, 0), (2, 40), (5, 80), (3, 25)]:
+            K, T, v, kind = strikes[0, j], expiries[i, 0], vols[i, j], types[i, j]
+            price, delta, rho = reference(spot, K, T, v, kind)
+            assert prices[i, j] == pytest.approx(price, rel=1e-10, abs=1e-12)
+            assert greeks['delta'][i, j] == pytest.approx(delta, rel=1e-10)
+            assert greeks['rho'][i, j] == pytest.approx(rho, rel=1e-10, abs=1e-15)
+            assert bs.price_option(spot, K, T, v, kind) == prices[i, j]
+            assert bs.calculate_greeks(spot, K, T, v, kind).vega == greeks['vega'][i, j]
+
+    def test_put_call_parity_and_expiry(self):
+        """풋-콜 패리티, 만기 0 은 내재가치"""
+        bs = BlackScholesModel(risk_free_rate=0.035)
+        strikes = np.linspace(80, 120, 9)
+        calls = bs.price_chain(100, strikes, 0.5, 0.3, 'call')
+        puts = bs.price_chain(100, strikes, 0.5, 0.3, 'put')
+
+        assert calls - puts == pytest.approx(100 - strikes * np.exp(-0.035 * 0.5), abs=1e-10)
+        assert bs.price_chain(100, strikes, 0.0, 0.3, 'put') == pytest.approx(np.maximum(strikes - 100, 0))
+
+    def test_implied_volatility_round_trip(self):
+        """가격 → IV 역산이 원래 변동성 복원 (만기 1주 ~ 6개월, 딥 ITM/OTM 포함)"""
+        bs = BlackScholesModel()
+        spot, strikes, expiries, vols, types = make_chain()
+        prices = bs.price_chain(spot, strikes, expiries, vols, types)
+        itm_types = np.where(types == 'call', 'put', 'call')
+        itm_prices = bs.price_chain(spot, strikes, expiries, vols, itm_types)
+
+        iv = bs.implied_volatility_chain(prices, spot, strikes, expiries, types)
+        itm_iv = bs.implied_volatility_chain(itm_prices, spot, strikes, expiries, itm_types)
+
+        # 베가가 0 에 가까운 종목은 가격이 변동성을 결정하지 못함
+        vega = bs.greeks_chain(spot, strikes, expiries, vols, types)['vega']
+        identifiable = vega > 1e-6
+        assert not np.isnan(iv).any() and not np.isnan(itm_iv).any()
+        assert np.abs(iv - vols)[identifiable].max() < 1e-7
+        assert np.abs(itm_iv - vols)[identifiable].max() < 1e-7
+        assert bs.implied_volatility(float(prices[3, 50]), spot, strikes[0, 50], expiries[3, 0],
+                                     types[3, 50]) == pytest.approx(vols[3, 50], abs=1e-8)
+
+    def test_unsolvable_quotes_are_nan(self):
+        """무차익 범위 밖 가격·만기 0 은 NaN, 나머지는 그대로 수렴"""
+        bs = BlackScholesModel()
+        quotes = np.array([10.0, 0.5, 200.0, 10.0])
+        expiries = np.array([0.5, 0.5, 0.5, 0.0])
+
+        iv = bs.implied_volatility_chain(quotes, 100.0, 100.0, expiries, 'call')
+
+        assert np.isnan(iv[1:]).all()
+        assert bs.price_option(100, 100, 0.5, iv[0]) == pytest.approx(10.0, rel=1e-8)
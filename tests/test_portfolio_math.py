@@ -0,0 +1,267 @@
+"""
+Portfolio Math Solver Tests
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+
+from utils import portfolio_math
+from utils.portfolio_math import (
+    shrink_covariance,
+    weight_bounds,
+    portfolio_stats,
+    project_capped_simplex,
+    min_variance_weights,
+    max_sharpe_weights,
+    efficient_frontier_weights,
+    target_return_weights,
+    risk_parity_weights,
+)
+from strategy.portfolio_optimizer import PortfolioOptimizer, OptimizationObjective
+
+
+def make_problem(assets=30, days=500, seed=7):
+    """3요인 모델 일간 수익률 → (연간 기대수익률, 수축 공분산, 수익률 행렬)"""
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(0, 0.01, (days, 3))
+    loadings = rng.normal(1, 0.3, (assets, 3))
+    returns = (factors @ loadings.T + rng.normal(0, 0.015, (days, assets))
+               + rng.normal(0.0005, 0.0005, assets))
+    cov, _ = shrink_covariance(returns, annualization=252)
+    return returns.mean(axis=0) * 252, cov, returns
+
+
+def slsqp(objective, n, upper, extra=()):
+    """기준 해 (scipy SLSQP)"""
+    constraints = ({'type': 'eq', 'fun': lambda x: x.sum() - 1},) + tuple(extra)
+    result = minimize(objective, np.full(n, 1 / n), method='SLSQP', bounds=[(0, upper)] * n,
+                      constraints=constraints, options={'ftol': 1e-14, 'maxiter': 1000})
+    return result.x
+
+
+class TestPortfolioMath:
+    """utils.portfolio_math 솔버 테스트"""
+
+    def test_shrinkage_and_projection(self):
+        """수축 공분산은 대칭·양의 정부호, 투영은 합 1과 상하한을 지킴"""
+        _, cov, returns = make_problem(assets=40, days=30)
+
+        shrunk, intensity = shrink_covariance(returns)
+        assert 0 < intensity <= 1
+        assert np.allclose(shrunk, shrunk.T)
+        assert np.linalg.eigvalsh(shrunk).min() > 0
+        assert np.trace(shrunk) == pytest.approx(np.trace(np.cov(returns.T)))
+
+        v = np.random.default_rng(0).normal(0, 0.3, 40)
+        w = project_capped_simplex(v, np.zeros(40), np.full(40, 0.1))
+        assert w.sum() == pytest.approx(1.0)
+        assert w.min() >= 0 and w.max() <= 0.1
+
+    def test_min_variance_closed_form_and_bounded(self):
+        """제약이 없으면 닫힌 해, 상한이 걸리면 SLSQP와 같은 최적값"""
+        _, cov, _ = make_problem(assets=20)
+
+        free = min_variance_weights(cov)
+        inv = np.linalg.solve(cov, np.ones(20))
+        assert np.allclose(free, inv / inv.sum())
+
+        lower, upper = weight_bounds(20, max_weight=0.1)
+        bounded = min_variance_weights(cov, lower, upper)
+        reference = slsqp(lambda x: x @ cov @ x, 20, 0.1)
+        assert bounded.max() <= 0.1 + 1e-12
+        assert bounded @ cov @ bounded == pytest.approx(reference @ cov @ reference, rel=1e-6)
+
+    @pytest.mark.parametrize('drift', [0.3, 0.0])
+    def test_max_sharpe_matches_slsqp(self, drift):
+        """상한 제약 하 최대 샤프 비율이 SLSQP 기준값 이상 (drift=0: 모든 종목 초과수익 음수)"""
+        mu, cov, _ = make_problem(assets=30)
+        mu = mu + drift
+        lower, upper = weight_bounds(30, max_weight=0.2)
+
+        weights = max_sharpe_weights(mu, cov, 0.03, lower, upper)
+        reference = slsqp(lambda x: -(x @ mu - 0.03) / np.sqrt(x @ cov @ x), 30, 0.2)
+
+        sharpe = portfolio_stats(weights, mu, cov, 0.03)[2]
+        assert weights.sum() == pytest.approx(1.0)
+        assert weights.min() >= 0 and weights.max() <= 0.2 + 1e-12
+        assert sharpe >= portfolio_stats(reference, mu, cov, 0.03)[2] - 1e-6
+
+    @pytest.mark.parametrize('seed', range(12))
+    def test_max_sharpe_tight_caps_matches_slsqp(self, seed):
+        """좁은 상한 (자유 종목 하나뿐인 퇴화 구간 포함) 에서도 SLSQP 기준값 이상"""
+        rng = np.random.default_rng(seed)
+        assets = int(rng.integers(4, 25))
+        cap = float(rng.uniform(1.0 / assets + 0.01, min(1.0, 2.5 / assets)))
+        mu, cov, _ = make_problem(assets=assets, seed=100 + seed)
+        mu = mu + 0.1 + rng.normal(0, 0.2, assets)
+        lower, upper = weight_bounds(assets, max_weight=cap)
+
+        weights = max_sharpe_weights(mu, cov, 0.03, lower, upper)
+        reference = slsqp(lambda x: -(x @ mu - 0.03) / np.sqrt(x @ cov @ x), assets, cap)
+
+        assert weights.sum() == pytest.approx(1.0)
+        assert weights.min() >= -1e-12 and weights.max() <= cap + 1e-12
+        assert (portfolio_stats(weights, mu, cov, 0.03)[2]
+                >= portfolio_stats(reference, mu, cov, 0.03)[2] - 1e-6)
+
+    def test_frontier_hits_targets_with_min_variance(self):
+        """투자선 스윕: 목표 수익률 정확히 달성, 분산은 SLSQP와 일치, 달성 불가 목표는 클램프"""
+        mu, cov, _ = make_problem(assets=25)
+        lower, upper = weight_bounds(25, max_weight=0.15)
+        ranked = np.sort(mu)[::-1]
+        max_return = ranked[:6].sum() * 0.15 + ranked[6] * 0.1
+
+        start = min_variance_weights(cov, lower, upper) @ mu
+        targets = np.linspace(start, mu.max(), 15)
+        frontier = efficient_frontier_weights(mu, cov, targets, lower, upper)
+
+        achieved = np.array([w @ mu for w in frontier])
+        reachable = targets <= achieved.max() + 1e-9
+        assert np.allclose(achieved[reachable], targets[reachable], atol=1e-9)
+        assert np.all(np.diff(achieved) >= -1e-12)
+        assert achieved[-1] == pytest.approx(max_return)
+
+        target = targets[5]
+        single = target_return_weights(mu, cov, target, lower, upper)
+        reference = slsqp(lambda x: x @ cov @ x, 25, 0.15,
+                          ({'type': 'eq', 'fun': lambda x: x @ mu - target},))
+        assert single @ cov @ single == pytest.approx(reference @ cov @ reference, rel=1e-6)
+        assert np.allclose(single, frontier[5], atol=1e-9)
+
+    def test_short_allowed_uses_closed_forms(self):
+        """공매도 허용 시 두 펀드 정리 투자선과 접점 포트폴리오"""
+        mu, cov, _ = make_problem(assets=10)
+        lower, upper = weight_bounds(10, allow_short=True)
+        assert lower is None and upper is None
+
+        frontier = efficient_frontier_weights(mu, cov, [0.1, 0.3])
+        assert [w @ mu for w in frontier] == pytest.approx([0.1, 0.3])
+
+        # Σ⁻¹(μ − rf) ∝ 1 이 되도록 만든 기대수익률 → 접점은 균등 비중
+        implied = 0.02 + cov @ np.full(10, 0.5)
+        tangency = max_sharpe_weights(implied, cov, 0.02)
+        assert np.allclose(tangency, np.full(10, 0.1))
+
+    def test_risk_parity_equalizes_contributions(self):
+        """위험 기여도가 모두 같아짐"""
+        _, cov, _ = make_problem(assets=50)
+
+        weights = risk_parity_weights(cov)
+        contributions = weights * (cov @ weights)
+
+        assert weights.min() > 0
+        assert contributions.max() / contributions.min() == pytest.approx(1.0, abs=1e-6)
+
+    def test_200_assets_reuse_frontier_segments(self, monkeypatch):
+        """200종목: 최대 샤프 / 50점 투자선이 구간 재사용으로 QP 몇 번만 풀고, 제약 준수"""
+        qp_calls = []
+        solve = portfolio_math.solve_box_qp
+
+        def counting_solve(*args, **kwargs):
+            qp_calls.append(1)
+            return solve(*args, **kwargs)
+
+        monkeypatch.setattr(portfolio_math, 'solve_box_qp', counting_solve)
+        mu, cov, _ = make_problem(assets=200, seed=1)
+        lower, upper = weight_bounds(200, max_weight=0.1)
+
+        weights = max_sharpe_weights(mu, cov, 0.03, lower, upper)
+        assert len(qp_calls) <= 3
+
+        min_var = min_variance_weights(cov, lower, upper)
+        qp_calls.clear()
+        frontier = efficient_frontier_weights(mu, cov, np.linspace(min_var @ mu, mu.max(), 50),
+                                              lower, upper)
+        # 목표마다 QP를 풀지 않고 활성 집합 구간의 닫힌 해를 이어 사용
+        assert len(qp_calls) <= 5
+
+        assert weights.sum() == pytest.approx(1.0)
+        for w in frontier:
+            assert w.sum() == pytest.approx(1.0)
+            assert w.min() >= -1e-12 and w.max() <= 0.1 + 1e-12
+
+
+class TestStrategyPortfolioOptimizer:
+    """strategy.portfolio_optimizer 연동 테스트"""
+
+    @staticmethod
+    def make_histories(assets=8, days=120, seed=3):
+        rng = np.random.default_rng(seed)
+        histories = {}
+        for i in range(assets):
+            closes = 10000 * np.cumprod(1 + rng.normal(0.0005 + 0.0003 * i, 0.01 + 0.002 * i, days))
+            histories[f'{i:06d}'] = [{'close': float(c)} for c in closes]
+        return histories
+
+    def test_objectives_respect_constraints(self):
+        """최대 샤프/최소 변동성/리스크 패리티 결과가 제약을 만족"""
+        optimizer = PortfolioOptimizer(risk_free_rate=0.03)
+        histories = self.make_histories()
+        constraints = {'max_weight': 0.3, 'min_weight': 0.02}
+
+        sharpe = optimizer.optimize(histories, OptimizationObjective.MAX_SHARPE, constraints)
+        min_vol = optimizer.optimize(histories, OptimizationObjective.MIN_VOLATILITY, constraints)
+        parity = optimizer.optimize(histories, OptimizationObjective.RISK_PARITY)
+
+        assert sharpe.constraints_satisfied and min_vol.constraints_satisfied
+        assert sharpe.sharpe_ratio >= min_vol.sharpe_ratio - 1e-9
+        assert min_vol.expected_volatility <= sharpe.expected_volatility + 1e-9
+        assert sum(parity.weights.values()) == pytest.approx(1.0)
+
+    def test_efficient_frontier_is_monotone(self):
+        """투자선: 수익률 증가에 따라 변동성 비감소"""
+        optimizer = PortfolioOptimizer()
+        points = optimizer.calculate_efficient_frontier(self.make_histories(), num_points=20,
+                                                        constraints={'max_weight': 0.4})
+
+        assert len(points) == 20
+        returns = np.array([p.expected_return for p in points])
+        vols = np.array([p.volatility for p in points])
+        assert np.all(np.diff(returns) >= -1e-12)
+        assert np.all(np.diff(vols) >= -1e-9)
+
+
+class TestFeaturesPortfolioOptimizer:
+    """features.portfolio_optimizer 상관계수/최소분산 제안 테스트"""
+
+    def test_returns_history_fills_correlation(self):
+        """수익률 히스토리가 있으면 평균 상관계수와 최소분산 리밸런싱 제안 생성"""
+        from features.portfolio_optimizer import PortfolioOptimizer as HoldingsOptimizer
+
+        rng = np.random.default_rng(0)
+        market = rng.normal(0, 0.01, 60)
+        positions = [
+            {'code': code, 'name': code, 'quantity': 10, 'avg_price': 100, 'current_price': 110, 'value': value}
+            for code, value in [('005930', 7000), ('000660', 2000), ('105560', 1000)]
+        ]
+        history = {
+            '005930': list(market + rng.normal(0, 0.01, 60)),
+            '000660': list(market + rng.normal(0, 0.01, 60)),
+            '105560': list(rng.normal(0, 0.005, 60)),
+        }
+
+        optimizer = HoldingsOptimizer()
+        without = optimizer.optimize_portfolio(positions)
+        result = optimizer.optimize_portfolio(positions, returns_history=history)
+
+        assert without.metrics.avg_correlation == 0.0
+        assert 0 < result.metrics.avg_correlation < 1
+        assert any(s.title.startswith('⚖️') for s in result.suggestions)
+
+        sample = HoldingsOptimizer(covariance_shrinkage=False).optimize_portfolio(positions, returns_history=history)
+        assert optimizer.covariance_shrinkage is True
+        assert sample.metrics.avg_correlation != result.metrics.avg_correlation
+        assert sample.metrics.avg_correlation == pytest.approx(
+            np.mean([np.corrcoef(history[a], history[b])[0, 1]
+                     for a, b in [('005930', '000660'), ('005930', '105560'), ('000660', '105560')]])
+        )
+
+    def test_returns_from_daily_prices(self):
+        """일봉(최신순) → 일별 수익률(과거순), 종가 없는 봉 제외"""
+        from features.portfolio_optimizer import returns_from_daily_prices
+
+        bars = [{'stck_clpr': c} for c in (121, 0, 110, 100)]
+        assert returns_from_daily_prices(bars) == pytest.approx([0.1, 0.1])
+        assert returns_from_daily_prices(bars, days=1) == pytest.approx([0.1])
+        assert returns_from_daily_prices([]) == []
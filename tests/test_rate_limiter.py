@@ -0,0 +1,108 @@
+"""
+Rate Limiter Tests
+"""
+
+import asyncio
+import time
+
+import pytest
+from core import rate_limiter
+from core.rate_limiter import TokenBucket, RateLimiter, DeadlineExceeded, call_deadline
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.fixture
+    def limiter(self):
+        """RateLimiter 인스턴스 (빠른 테스트용 설정)"""
+        return RateLimiter({
+            'REST_CALL_INTERVAL': 0.05,
+            'BUCKETS': {
+                'order': {'rate': 100.0, 'capacity': 5, 'priority': True},
+                'ranking': {'rate': 10.0, 'capacity': 1},
+            },
+        })
+
+    def test_resolve_group(self, limiter):
+        """API ID / 경로 그룹 결정 테스트"""
+        assert limiter.resolve_group('kt10000', '/api/dostk/ordr') == 'order'
+        assert limiter.resolve_group('kt00018', 'acnt') == 'account'
+        assert limiter.resolve_group('ka10027', 'rkinfo') == 'ranking'
+        assert limiter.resolve_group('ka10081', 'chart') == 'chart'
+        assert limiter.resolve_group('ka10004', 'mrkcond') == 'market'
+
+    def test_bucket_burst_then_wait(self):
+        """버스트 용량 소진 후 대기 시간 계산 테스트"""
+        bucket = TokenBucket('test', rate=10.0, capacity=2)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+        stats = bucket.get_stats()
+        assert stats['acquired'] == 3
+        assert stats['waited'] == 1
+        assert stats['max_wait'] > 0
+
+    def test_order_lane_not_blocked_by_scanner(self, limiter, monkeypatch):
+        """주문 레인이 스캐너 트래픽 뒤에서 대기하지 않는지 테스트"""
+        sleeps = []
+        monkeypatch.setattr(rate_limiter.time, 'sleep', sleeps.append)
+
+        # 랭킹 버킷을 미리 소진시켜 스캐너 호출이 줄을 서게 만든다
+        for _ in range(3):
+            limiter.buckets['ranking'].reserve()
+
+        scanner_wait = limiter.acquire('ka10027', 'rkinfo')
+        waited = limiter.acquire('kt10000', '/api/dostk/ordr')
+
+        assert scanner_wait > 0
+        assert waited == 0.0
+        assert sleeps == [scanner_wait]
+
+    def test_call_deadline_skips_and_refunds(self, limiter):
+        """마감 전에 토큰을 얻을 수 없으면 대기하지 않고 예약한 토큰 반환"""
+        limiter.acquire('ka10027', 'rkinfo')  # 랭킹 버킷 용량 1 소진
+
+        with call_deadline(time.monotonic() + 0.01):
+            with pytest.raises(DeadlineExceeded):
+                limiter.acquire('ka10027', 'rkinfo')
+        with call_deadline(time.monotonic() - 1):
+            with pytest.raises(DeadlineExceeded):
+                limiter.acquire('kt10000', '/api/dostk/ordr')
+
+        stats = limiter.get_stats()
+        assert stats['ranking']['acquired'] == 1
+        assert stats['global']['acquired'] == 1
+        assert stats['order']['acquired'] == 0
+
+    def test_call_deadline_async(self, limiter):
+        """acquire_async도 마감 시각을 지키고 예약한 토큰 반환"""
+        limiter.acquire('ka10027', 'rkinfo')
+
+        async def run():
+            with call_deadline(time.monotonic() + 0.01):
+                with pytest.raises(DeadlineExceeded):
+                    await limiter.acquire_async('ka10027', 'rkinfo')
+            with call_deadline(time.monotonic() - 1):
+                with pytest.raises(DeadlineExceeded):
+                    await limiter.acquire_async('kt10000', '/api/dostk/ordr')
+
+        asyncio.run(run())
+
+        stats = limiter.get_stats()
+        assert stats['ranking']['acquired'] == 1
+        assert stats['order']['acquired'] == 0
+
+    def test_stats(self, limiter):
+        """버킷별 통계 테스트"""
+        limiter.acquire('kt10000', '/api/dostk/ordr')
+        limiter.acquire('ka10004', 'mrkcond')
+
+        stats = limiter.get_stats()
+        assert stats['order']['acquired'] == 1
+        assert stats['order']['priority'] is True
+        assert stats['market']['acquired'] == 1
+        assert stats['global']['acquired'] == 1
+        assert 0 < stats['order']['utilization'] <= 1
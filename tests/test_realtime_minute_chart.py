@@ -0,0 +1,103 @@
+"""
+Realtime Minute Chart Tests
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from core.realtime_minute_chart import CandleBuffer, RealtimeMinuteChart
+
+
+def tick(hhmmss, price, volume=10):
+    return {'type': '0B', 'item': '005930', 'values': {'10': str(price), '15': str(volume), '16': hhmmss}}
+
+
+class TestCandleBuffer:
+    """CandleBuffer 테스트"""
+
+    def test_aggregate_and_evict(self):
+        """분봉 집계 및 가득 찬 버퍼의 오래된 캔들 만료 테스트"""
+        buffer = CandleBuffer(capacity=3)
+        base = datetime(2024, 1, 2, 9, 0)
+
+        buffer.update(base, 100, 1)
+        buffer.update(base, 105, 2)
+        buffer.update(base, 98, 3)
+        assert buffer.last() == {
+            'date': '20240102', 'time': '090000',
+            'open': 100, 'high': 105, 'low': 98, 'close': 98, 'volume': 6,
+            'timestamp': int(base.timestamp()),
+        }
+
+        for minute in range(1, 6):
+            buffer.update(base.replace(minute=minute), 100 + minute, 1)
+
+        assert len(buffer) == 3
+        assert buffer.columns()['time'].tolist() == [90300, 90400, 90500]
+        assert [c['close'] for c in buffer.to_dicts(2)] == [104, 105]
+
+    def test_views_are_zero_copy(self):
+        """조회 결과가 읽기 전용 뷰인지 테스트"""
+        buffer = CandleBuffer(capacity=4)
+        for minute in range(10):
+            buffer.update(datetime(2024, 1, 2, 9, minute), 100 + minute, 1)
+
+        closes = buffer.columns()['close']
+        assert closes.tolist() == [106, 107, 108, 109]
+        assert closes.base is not None
+        with pytest.raises(ValueError):
+            closes[0] = 0
+
+    def test_late_tick(self):
+        """늦게 도착한 과거 체결 반영 / 만료 구간 무시 테스트"""
+        buffer = CandleBuffer(capacity=2)
+        for minute in range(3):
+            buffer.update(datetime(2024, 1, 2, 9, minute), 100, 1)
+
+        assert buffer.update(datetime(2024, 1, 2, 9, 1), 90, 5) is True
+        assert buffer.to_dicts(2)[0]['low'] == 90
+        assert buffer.to_dicts(2)[0]['volume'] == 6
+        assert buffer.update(datetime(2024, 1, 2, 9, 0), 90, 5) is False
+
+    def test_to_dicts_cached_until_write(self):
+        """to_dicts는 다음 기록 전까지 캐시, 기록 후 새 값 반영"""
+        buffer = CandleBuffer(capacity=4)
+        base = datetime(2024, 1, 2, 9, 0)
+        buffer.update(base, 100, 1)
+
+        first = buffer.to_dicts()
+        again = buffer.to_dicts()
+        assert again == first and again[0] is first[0]
+        assert buffer.to_dicts(1)[0] is not first[0]  # count가 다르면 새로 생성
+
+        buffer.update(base, 110, 2)
+        assert buffer.to_dicts()[0]['close'] == 110
+        assert buffer.to_dicts()[0]['volume'] == 3
+        assert first[0]['close'] == 100
+
+
+class TestRealtimeMinuteChart:
+    """RealtimeMinuteChart 테스트"""
+
+    def test_derived_periods(self):
+        """파생 분봉 증분 집계 테스트"""
+        chart = RealtimeMinuteChart('005930', None)
+
+        async def feed():
+            for minute in range(12):
+                await chart._on_tick(tick(f"09{minute:02d}00", 1000 + minute, 10))
+                await chart._on_tick(tick(f"09{minute:02d}30", 2000 + minute, 5))
+
+        asyncio.run(feed())
+
+        assert chart.get_candle_count() == 12
+        five = chart.get_minute_data(10, period=5)
+        assert [c['time'] for c in five] == ['090000', '090500', '091000']
+        ohlcv = {k: five[1][k] for k in ('open', 'high', 'low', 'close', 'volume')}
+        assert ohlcv == {'open': 1005, 'high': 2009, 'low': 1005, 'close': 2009, 'volume': 75}
+        assert chart.get_current_candle(period=60)['volume'] == 180
+        assert chart.get_minute_arrays(3)['close'].tolist() == [2009, 2010, 2011]
+
+        with pytest.raises(ValueError):
+            chart.get_minute_data(10, period=7)
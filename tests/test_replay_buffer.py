@@ -0,0 +1,157 @@
+"""
+Replay Buffer Tests
+"""
+
+import numpy as np
+import pytest
+
+from ai.replay_buffer import ReplayBuffer, SumTree
+from ai.rl_agent import DQNAgent
+from ai.advanced_rl import A3CAgent, PPOAgent
+
+
+def make_transitions(n, state_dim=4, seed=0):
+    rng = np.random.default_rng(seed)
+    states = rng.normal(0, 1, (n, state_dim))
+    return states, rng.integers(0, 3, n), rng.normal(0, 1, n), np.roll(states, -1, axis=0), rng.random(n) < 0.1
+
+
+class TestReplayBuffer:
+    """ai.replay_buffer 테스트"""
+
+    def test_ring_wraparound_and_batch_add(self):
+        """가득 차면 가장 오래된 것부터 덮어쓰고, add_batch 는 순차 add 와 같은 결과"""
+        states, actions, rewards, next_states, dones = make_transitions(25)
+
+        single = ReplayBuffer(capacity=10, state_dim=4)
+        for i in range(25):
+            single.add(states[i], actions[i], rewards[i], next_states[i], dones[i])
+        batched = ReplayBuffer(capacity=10, state_dim=4)
+        batched.add_batch(states[:7], actions[:7], rewards[:7], next_states[:7], dones[:7])
+        batched.add_batch(states[7:], actions[7:], rewards[7:], next_states[7:], dones[7:])
+
+        for buffer in (single, batched):
+            rollout = buffer.rollout()
+            assert len(buffer) == 10
+            assert np.allclose(rollout.states, states[15:])
+            assert np.array_equal(rollout.actions, actions[15:])
+            assert np.allclose(rollout.rewards, rewards[15:])
+            assert np.array_equal(rollout.dones, dones[15:])
+
+        batch = single.sample(8)
+        assert len(set(batch.indices.tolist())) == 8
+        assert np.allclose(batch.states, single.states[batch.indices])
+        assert np.allclose(batch.weights, 1.0)
+
+        single.clear()
+        assert len(single) == 0
+        with pytest.raises(ValueError):
+            single.sample(1)
+
+    def test_sum_tree_sampling_is_proportional(self):
+        """우선순위 비례 샘플링과 중요도 가중치"""
+        tree = SumTree(5)
+        tree.update(np.arange(5), np.array([1.0, 2.0, 3.0, 4.0, 0.0]))
+        assert tree.total == pytest.approx(10.0)
+        assert tree.find(np.array([0.0, 0.99, 1.0, 2.99, 3.0, 6.0, 9.99])).tolist() == [0, 0, 1, 1, 2, 3, 3]
+
+        buffer = ReplayBuffer(capacity=4, state_dim=1, prioritized=True, alpha=1.0, beta=1.0, epsilon=0.0, seed=0)
+        buffer.add_batch(np.zeros((4, 1)), np.zeros(4), np.zeros(4))
+        buffer.update_priorities(np.arange(4), np.array([1.0, 2.0, 3.0, 4.0]))
+
+        counts = np.zeros(4)
+        for _ in range(2000):
+            batch = buffer.sample(4)
+            counts += np.bincount(batch.indices, minlength=4)
+        assert counts / counts.sum() == pytest.approx([0.1, 0.2, 0.3, 0.4], abs=0.02)
+
+        batch = buffer.sample(4)
+        expected = 1 / (4 * np.array([0.1, 0.2, 0.3, 0.4])[batch.indices])
+        assert batch.weights == pytest.approx(expected / expected.max())
+
+    def test_new_transitions_get_max_priority(self):
+        """새 전이는 현재 최대 우선순위로 추가"""
+        buffer = ReplayBuffer(capacity=8, state_dim=2, prioritized=True, alpha=1.0, epsilon=0.0)
+        buffer.add_batch(np.zeros((3, 2)), np.zeros(3), np.zeros(3))
+        buffer.update_priorities(np.array([0, 1, 2]), np.array([0.5, 5.0, 0.5]))
+        slot = buffer.add(np.ones(2), 1, 1.0)
+
+        assert buffer.tree.get([slot])[0] == pytest.approx(5.0)
+        assert buffer.tree.total == pytest.approx(11.0)
+
+
+class TestAgents:
+    """DQN/PPO 연동 테스트"""
+
+    def test_dqn_batch_update_matches_reference(self, tmp_path, monkeypatch):
+        """벡터화 replay 결과 = 업데이트 전 Q 기준 순차 계산 결과"""
+        monkeypatch.chdir(tmp_path)
+        np.random.seed(0)
+        agent = DQNAgent(state_size=3, action_size=3, learning_rate=0.1)
+        agent.batch_size = 32
+
+        rng = np.random.default_rng(1)
+        states = rng.choice([-0.7, 0.2, 0.7], size=(40, 3))
+        for i in range(40):
+            agent.remember(list(states[i]), int(rng.integers(3)), float(rng.normal()),
+                           list(states[(i + 1) % 40]), i % 10 == 9)
+
+        batch = agent.memory.sample(32)
+        monkeypatch.setattr(agent.memory, 'sample', lambda n: batch)
+        for s in np.concatenate([batch.states, batch.next_states]):
+            agent.get_q_values(s)
+        before = {k: v.copy() for k, v in agent.q_table.items()}
+
+        expected = {k: v.copy() for k, v in before.items()}
+        for s, a, r, s2, done in zip(batch.states, batch.actions, batch.rewards, batch.next_states, batch.dones):
+            target = r if done else r + agent.gamma * before[agent._discretize_state(s2)].max()
+            key = agent._discretize_state(s)
+            expected[key][a] += agent.learning_rate * (target - before[key][a])
+
+        agent.replay()
+        assert agent.q_table.keys() == expected.keys()
+        for key in expected:
+            assert agent.q_table[key] == pytest.approx(expected[key])
+
+    def test_dqn_discretization_unchanged(self, tmp_path, monkeypatch):
+        """구간 경계 처리 (-1, -0.5, 0, 0.5, 1)"""
+        monkeypatch.chdir(tmp_path)
+        agent = DQNAgent(state_size=7)
+        assert agent._discretize_state([-2, -1, -0.5, 0, 0.5, 1, 3]) == (0, 1, 2, 3, 4, 5, 5)
+
+    def test_ppo_gae_matches_loop(self):
+        """PPO GAE 가 기존 순차 계산과 일치"""
+        agent = PPOAgent(state_dim=4, rollout_size=64)
+        states, actions, rewards, _, dones = make_transitions(50)
+        values = np.random.default_rng(2).normal(0, 1, 50)
+        for i in range(50):
+            agent.store_transition(states[i], int(actions[i]), rewards[i], values[i], -1.0, bool(dones[i]))
+
+        advantages, returns = agent.compute_gae()
+
+        rewards32, values32 = rewards.astype(np.float32), values.astype(np.float32)
+        expected = np.zeros(50)
+        last_gae = 0
+        for t in reversed(range(50)):
+            next_value = 0 if t == 49 else values32[t + 1]
+            delta = rewards32[t] + agent.gamma * next_value * (1 - dones[t]) - values32[t]
+            expected[t] = last_gae = delta + agent.gamma * agent.gae_lambda * (1 - dones[t]) * last_gae
+
+        assert advantages == pytest.approx(expected, rel=1e-5, abs=1e-5)
+        assert returns == pytest.approx(expected + values32, rel=1e-5, abs=1e-5)
+
+    def test_full_rollout_not_overwritten(self):
+        """on-policy 롤아웃이 가득 차면 덮어쓰지 않고 예외"""
+        ppo = PPOAgent(state_dim=4, rollout_size=3)
+        a3c = A3CAgent(state_dim=4, rollout_size=3)
+        state = np.zeros(4)
+        for _ in range(3):
+            ppo.store_transition(state, 0, 1.0, 0.0, -1.0, False)
+            a3c.store_transition(state, 0, 1.0, False)
+
+        with pytest.raises(RuntimeError):
+            ppo.store_transition(state, 1, 2.0, 0.0, -1.0, False)
+        with pytest.raises(RuntimeError):
+            a3c.store_transition(state, 1, 2.0, False)
+        assert list(ppo.memory.rollout().actions) == [0, 0, 0]
+        assert list(a3c.memory.rollout().actions) == [0, 0, 0]
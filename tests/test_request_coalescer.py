@@ -0,0 +1,173 @@
+"""
+Request Coalescer Tests
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.market import MarketAPI
+from api.market.request_coalescer import RequestCoalescer
+from core.rate_limiter import DeadlineExceeded, call_deadline
+
+
+class SlowMarketData:
+    """호출 수를 세는 느린 시세 API 대역"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_stock_price(self, stock_code, use_fallback=True):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.delay)
+        return {'stock_code': stock_code, 'current_price': 70000 + n}
+
+
+class TestRequestCoalescer:
+    """RequestCoalescer 테스트"""
+
+    def test_concurrent_calls_share_one_request(self):
+        """동시 동일 요청은 REST 호출 1건으로 병합"""
+        api = MarketAPI(client=None)
+        api.market_data = SlowMarketData()
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            results = list(pool.map(lambda _: api.get_stock_price('005930'), range(20)))
+
+        assert api.market_data.calls == 1
+        assert all(r == results[0] for r in results)
+
+        # 결과 수정이 캐시를 오염시키지 않음
+        results[0]['current_price'] = 0
+        assert api.get_stock_price('005930')['current_price'] == 70001
+
+        stats = api.get_coalescing_stats()['by_api']['ka10003']
+        assert stats['misses'] == 1
+        assert stats['hits'] + stats['coalesced'] == 20
+        assert stats['coalesced'] > 0
+        assert stats['save_rate'] == pytest.approx(20 / 21)
+
+    def test_ttl_and_tick_invalidation(self):
+        """TTL 만료 / 실시간 틱 수신 시 재조회"""
+        coalescer = RequestCoalescer(ttls={'ka10003': 0.05})
+        market = SlowMarketData(delay=0)
+        fetch = lambda code: coalescer.call('ka10003', code, lambda: market.get_stock_price(code))
+
+        fetch('005930')
+        fetch('005930')
+        assert market.calls == 1
+
+        time.sleep(0.06)
+        fetch('005930')
+        assert market.calls == 2
+
+        # 호가 틱은 현재가 캐시에 영향 없음, 체결 틱은 무효화 (_NX 포함)
+        coalescer.on_realtime_data({'type': '0D', 'item': '005930'})
+        fetch('005930')
+        assert market.calls == 2
+        coalescer.on_realtime_data({'type': '0B', 'item': '005930_NX'})
+        fetch('005930')
+        assert market.calls == 3
+        assert coalescer.get_stats()['by_api']['ka10003']['invalidated'] == 1
+
+    def test_errors_and_in_flight_invalidation(self):
+        """예외는 대기자에게 전달 / 캐시 안 함, 요청 중 무효화된 응답은 캐시 안 함"""
+        coalescer = RequestCoalescer()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait()
+            raise ConnectionError('down')
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(coalescer.call, 'ka10004', '005930', failing)
+            started.wait()
+            follower = pool.submit(coalescer.call, 'ka10004', '005930', lambda: {'x': 1})
+            time.sleep(0.02)
+            release.set()
+            with pytest.raises(ConnectionError):
+                leader.result()
+            with pytest.raises(ConnectionError):
+                follower.result()
+
+        assert coalescer.call('ka10004', '005930', lambda: {'x': 2}) == {'x': 2}
+
+        def ticked_during_request():
+            coalescer.on_realtime_data({'type': '0B', 'item': '000660'})
+            return {'price': 1}
+
+        coalescer.call('ka10003', '000660', ticked_during_request)
+        assert coalescer.call('ka10003', '000660', lambda: {'price': 2}) == {'price': 2}
+
+
+def wait_coalesced(coalescer, api_id, n, timeout=5.0):
+    """대기자 n명이 진행 중 요청에 합류할 때까지 대기"""
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        stats = coalescer.get_stats()['by_api'].get(api_id, {})
+        if stats.get('coalesced', 0) >= n:
+            return
+        time.sleep(0.001)
+    raise AssertionError("follower did not join")
+
+
+class TestCoalescerDeadlines:
+    """선행 / 대기 요청 마감 처리 테스트"""
+
+    def test_leader_deadline_not_shared(self):
+        """선행 요청이 자기 마감으로 실패하면 마감 없는 대기자는 다시 시도해 결과를 받음"""
+        coalescer = RequestCoalescer()
+        started = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(threading.current_thread().name)
+            if len(calls) == 1:
+                started.set()
+                wait_coalesced(coalescer, 'ka10003', 1)
+                raise DeadlineExceeded('leader deadline')
+            return {'price': 1}
+
+        def leader():
+            with call_deadline(time.monotonic() + 10):
+                return coalescer.call('ka10003', '005930', fetch)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader_result = pool.submit(leader)
+            started.wait()
+            assert coalescer.call('ka10003', '005930', fetch) == {'price': 1}
+            with pytest.raises(DeadlineExceeded):
+                leader_result.result()
+
+        assert len(calls) == 2
+
+    def test_follower_waits_with_own_deadline(self):
+        """대기자는 자기 마감까지만 기다리고, 선행 요청은 그대로 완료"""
+        coalescer = RequestCoalescer()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return {'price': 1}
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(coalescer.call, 'ka10003', '005930', slow)
+            started.wait()
+            try:
+                with call_deadline(time.monotonic() + 0.05):
+                    with pytest.raises(DeadlineExceeded):
+                        coalescer.call('ka10003', '005930', slow)
+                assert not leader.done()
+            finally:
+                release.set()
+            assert leader.result() == {'price': 1}
@@ -0,0 +1,119 @@
+"""
+Risk Analyzer Tests
+"""
+
+import numpy as np
+import pytest
+
+from utils import risk_analyzer
+from utils.risk_analyzer import RiskAnalyzer, RollingReturnWindow, build_returns_matrix
+
+
+def make_histories(assets=10, days=120, seed=5):
+    """공통 요인 + 개별 요인 종가 히스토리"""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0003, 0.01, (days, 1))
+    closes = 10000 * np.cumprod(1 + market + rng.normal(0, 0.015, (days, assets)), axis=0)
+    return {f'{i:06d}': [{'close': float(c)} for c in closes[:, i]] for i in range(assets)}
+
+
+class TestRiskAnalyzer:
+    """utils.risk_analyzer 포트폴리오 지표 테스트"""
+
+    def test_portfolio_metrics_match_explicit_formulas(self):
+        """VaR/분산비율/CVaR 가 명시적 공분산 공식과 일치"""
+        histories = make_histories()
+        codes = list(histories)
+        values = np.arange(1, 11) * 1_000_000.0
+        positions = [{'stock_code': code, 'value': v} for code, v in zip(codes, values)]
+
+        metrics = RiskAnalyzer().analyze_portfolio_risk(positions, values.sum(), histories)
+
+        _, returns = build_returns_matrix(histories)
+        w = values / values.sum()
+        vols = returns.std(axis=0) * np.sqrt(252)
+        portfolio_vol = np.sqrt(w @ np.cov(returns, rowvar=False, ddof=0) @ w * 252)
+
+        assert metrics.portfolio_var_95 == pytest.approx(-1.65 * portfolio_vol / np.sqrt(252))
+        assert metrics.diversification_ratio == pytest.approx(portfolio_vol / (w @ vols))
+        assert metrics.correlation_matrix[codes[0]][codes[0]] == pytest.approx(1.0)
+        assert metrics.correlation_matrix[codes[0]][codes[1]] == pytest.approx(
+            np.corrcoef(returns[:, 0], returns[:, 1])[0, 1])
+
+        portfolio_returns = returns @ w
+        tail = portfolio_returns[portfolio_returns <= np.percentile(portfolio_returns, 5)]
+        assert metrics.portfolio_cvar_95 == pytest.approx(tail.mean())
+
+    def test_returns_matrix_aligns_recent_bars(self):
+        """길이가 다른 히스토리는 최근 구간으로 정렬, 20봉 미만은 제외"""
+        histories = make_histories(assets=3, days=60)
+        histories['000000'] = histories['000000'][-40:]
+        histories['short'] = histories['000001'][:10]
+
+        codes, returns = build_returns_matrix(histories)
+        closes = np.array([h['close'] for h in histories['000001'][-40:]])
+
+        assert codes == ['000000', '000001', '000002']
+        assert returns.shape == (39, 3)
+        assert np.allclose(returns[:, 1], np.diff(closes) / closes[:-1])
+
+    def test_drawdown_metrics(self):
+        """최대 낙폭 기간은 진행 중인 낙폭 포함, 회복 기간은 마지막 고점부터"""
+        equity = np.array([100, 110, 105, 100, 112, 111, 110, 109, 108, 107.0])
+        dd = RiskAnalyzer()._calculate_drawdown_metrics(equity)
+
+        assert dd['max_drawdown'] == pytest.approx(100 / 110 - 1)
+        assert dd['current_drawdown'] == pytest.approx(107 / 112 - 1)
+        assert dd['max_dd_duration'] == 5
+        assert dd['recovery_period'] == 5
+
+    def test_rolling_window_matches_full_recompute(self):
+        """증분 갱신 공분산이 창 전체 재계산과 일치하고, 같은 지표를 냄"""
+        histories = make_histories(assets=8, days=200)
+        rolling = RollingReturnWindow.from_price_histories(
+            {code: h[:100] for code, h in histories.items()}, window=30)
+
+        for t in range(100, 200):
+            assert rolling.push_prices({code: h[t]['close'] for code, h in histories.items()})
+
+        _, returns = build_returns_matrix(histories)
+        recent = returns[-30:]
+        assert rolling.count == 30
+        assert np.allclose(rolling.returns_matrix(), recent)
+        assert np.allclose(rolling.covariance(), np.cov(recent, rowvar=False, ddof=0), atol=1e-14)
+
+        positions = [{'stock_code': code, 'value': 1_000_000.0} for code in histories]
+        analyzer = RiskAnalyzer()
+        incremental = analyzer.analyze_portfolio_risk(positions, 8_000_000.0, {}, rolling_window=rolling)
+        full = analyzer.analyze_portfolio_risk(
+            positions, 8_000_000.0, {code: h[-31:] for code, h in histories.items()})
+
+        assert incremental.portfolio_var_95 == pytest.approx(full.portfolio_var_95)
+        assert incremental.portfolio_cvar_95 == pytest.approx(full.portfolio_cvar_95)
+
+    def test_100_positions_every_cycle(self, monkeypatch):
+        """100종목 사이클 분석은 히스토리를 재구성하지 않고 증분 창만 갱신 (전체 재계산은 window회마다 1번)"""
+        histories = make_histories(assets=100, days=250)
+        positions = [{'stock_code': code, 'value': 1_000_000.0} for code in histories]
+        rolling = RollingReturnWindow.from_price_histories(histories, window=60)
+
+        refreshes = []
+        refresh = rolling._refresh
+        monkeypatch.setattr(rolling, '_refresh', lambda: (refreshes.append(1), refresh()))
+
+        def rebuild(*args, **kwargs):
+            raise AssertionError('사이클마다 히스토리 재구성')
+        monkeypatch.setattr(risk_analyzer, 'build_returns_matrix', rebuild)
+
+        analyzer = RiskAnalyzer()
+        rng = np.random.default_rng(0)
+        prices = {code: history[-1]['close'] for code, history in histories.items()}
+        for _ in range(120):
+            prices = {code: price * (1 + rng.normal(0, 0.01)) for code, price in prices.items()}
+            rolling.push_prices(prices)
+            metrics = analyzer.analyze_portfolio_risk(positions, 1e8, {}, rolling_window=rolling)
+
+        assert len(refreshes) == 2
+        assert len(metrics.correlation_matrix) == 100
+        expected = np.cov(rolling.returns_matrix(), rowvar=False, ddof=0)
+        assert np.allclose(rolling.covariance(), expected, atol=1e-15)
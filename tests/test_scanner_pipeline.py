@@ -0,0 +1,131 @@
+"""
+Scanner Pipeline Deep Scan Fetch Tests
+"""
+
+import threading
+
+import pytest
+
+from core.rate_limiter import RateLimiter
+from research import scanner_pipeline
+from research.scanner_pipeline import ScannerPipeline, StockCandidate, DEEP_SCAN_MAJOR_FIRMS
+
+
+class StubMarketAPI:
+    """
+    종목코드마다 다른 값을 돌려주는 market_api 대역
+
+    hold 종목 요청은 release까지 대기 (release_after: 그만큼 호출이 끝나면 자동 release)
+    """
+
+    def __init__(self, hold=(), limiter=None, release_after=None):
+        self.hold = set(hold)
+        self.release = threading.Event()
+        self.release_after = release_after
+        self.limiter = limiter
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _call(self, kind, code, value):
+        if self.limiter is not None:
+            self.limiter.acquire('ka10059', 'mrkcond')
+        if code in self.hold:
+            self.release.wait(5)
+        with self._lock:
+            self.calls.append((kind, code))
+            if self.release_after is not None and len(self.calls) >= self.release_after:
+                self.release.set()
+        return value
+
+    def get_investor_data(self, code):
+        n = int(code)
+        return self._call('investor', code, {'기관_순매수': n * 10, '외국인_순매수': n})
+
+    def get_bid_ask(self, code):
+        return self._call('bid_ask', code, {'매수_총잔량': int(code), '매도_총잔량': 1})
+
+    def get_daily_chart(self, code, period=20):
+        rows = [{'volume': int(code), 'close': 100} for _ in range(period)]
+        return self._call('daily', code, rows)
+
+    def get_securities_firm_trading(self, firm_code, stock_code, days=1):
+        return self._call(f'broker:{firm_code}', stock_code, [{'net_qty': int(stock_code)}])
+
+    def get_execution_intensity(self, stock_code):
+        return self._call('execution', stock_code, None)
+
+    def get_program_trading(self, stock_code):
+        return self._call('program', stock_code, None)
+
+
+def make_candidates(*codes):
+    return [StockCandidate(code=code, name=code, price=10000, volume=1000, rate=1.0) for code in codes]
+
+
+@pytest.fixture(autouse=True)
+def clear_deep_scan_cache():
+    scanner_pipeline._deep_scan_cache.clear()
+    yield
+    scanner_pipeline._deep_scan_cache.clear()
+
+
+class TestDeepScanFetch:
+    """ScannerPipeline._fetch_deep_scan_data 테스트"""
+
+    def test_results_merged_into_own_candidate(self):
+        """완료 순서와 관계없이 각 응답이 자기 종목에 반영되고 후보 순서 유지"""
+        # 첫 종목 요청은 나머지 두 종목 요청이 모두 끝난 뒤에 완료
+        per_stock = 3 + len(DEEP_SCAN_MAJOR_FIRMS) + 2
+        api = StubMarketAPI(hold={'000001'}, release_after=2 * per_stock)
+        pipeline = ScannerPipeline(api, None, None)
+        candidates = make_candidates('000001', '000002', '000003')
+
+        stats = pipeline._fetch_deep_scan_data(candidates, {'max_workers': 32, 'fetch_timeout': 10})
+
+        assert stats['tasks'] == 3 * per_stock and stats['timed_out'] == 0
+        assert {code for _, code in api.calls[-per_stock:]} == {'000001'}
+        assert [c.code for c in candidates] == ['000001', '000002', '000003']
+        for candidate in candidates:
+            n = int(candidate.code)
+            assert candidate.institutional_net_buy == n * 10
+            assert candidate.foreign_net_buy == n
+            assert candidate.bid_ask_ratio == n
+            assert candidate.avg_volume == n
+            assert candidate.top_broker_buy_count == len(DEEP_SCAN_MAJOR_FIRMS)
+            assert candidate.top_broker_net_buy == n * len(DEEP_SCAN_MAJOR_FIRMS)
+
+    def test_deadline_keeps_partial_results(self):
+        """마감까지 끝나지 않은 종목은 기본값 유지, 나머지 종목은 반영"""
+        api = StubMarketAPI(hold={'000002'})
+        pipeline = ScannerPipeline(api, None, None)
+        candidates = make_candidates('000001', '000002')
+
+        try:
+            stats = pipeline._fetch_deep_scan_data(candidates, {'max_workers': 32, 'fetch_timeout': 1.0})
+        finally:
+            api.release.set()
+
+        per_stock = stats['tasks'] // 2
+        assert stats['timed_out'] == per_stock
+        assert stats['completed'] == per_stock
+        assert stats['partial_candidates'] == ['000002']
+        assert candidates[0].institutional_net_buy == 10
+        assert candidates[1].institutional_net_buy == 0
+        assert candidates[1].top_broker_buy_count == 0
+
+    def test_stragglers_stop_calling_after_deadline(self):
+        """마감 안에 토큰을 얻을 수 없는 요청은 호출하지 않고 예약한 토큰도 돌려줌"""
+        limiter = RateLimiter({
+            'REST_CALL_INTERVAL': 0,
+            'BUCKETS': {'market': {'rate': 0.5, 'capacity': 2}},
+        })
+        api = StubMarketAPI(limiter=limiter)
+        pipeline = ScannerPipeline(api, None, None)
+        candidates = make_candidates('000001', '000002')
+
+        stats = pipeline._fetch_deep_scan_data(candidates, {'max_workers': 4, 'fetch_timeout': 0.5})
+
+        assert len(api.calls) == 2
+        assert stats['timed_out'] == 0
+        assert stats['failed'] == stats['tasks'] - 2
+        assert limiter.get_stats()['market']['acquired'] == 2
@@ -0,0 +1,132 @@
+"""
+Task Scheduler Tests
+"""
+
+import threading
+import time
+
+from core.scheduler import ScheduledTask, TaskScheduler
+
+
+class TestTaskScheduler:
+    """TaskScheduler 테스트"""
+
+    def test_slow_task_does_not_block_others(self):
+        """느린 작업이 실행 중인 동안에도 다른 작업이 자기 주기로 실행"""
+        scheduler = TaskScheduler()
+        scan_started = threading.Event()
+        release = threading.Event()
+        fast_done = threading.Event()
+        fast_runs = []
+
+        def scan():
+            scan_started.set()
+            release.wait(5)
+
+        def sell_check():
+            # 느린 작업이 실행 중인 동안의 회차만 집계
+            if scan_started.is_set() and not release.is_set():
+                fast_runs.append(1)
+                if len(fast_runs) >= 5:
+                    fast_done.set()
+
+        scheduler.add_task('scan', scan, interval=0.01)
+        scheduler.add_task('sell_check', sell_check, interval=0.01)
+        scheduler.start()
+
+        assert fast_done.wait(5)
+        assert scheduler.tasks['scan'].running
+        assert scheduler.tasks['scan'].runs == 0
+        release.set()
+        scheduler.stop()
+
+        stats = scheduler.get_stats()
+        assert stats['scan']['runs'] >= 1
+        assert stats['scan']['overruns'] >= 1
+
+    def test_overrun_does_not_catch_up(self):
+        """주기 초과 후 밀린 회차는 몰아서 실행하지 않고 바로 다음 1회만 실행"""
+        task = ScheduledTask('scan', lambda: time.sleep(0.25), interval=0.2)
+
+        task.run_once()
+        assert task.overruns == 1
+        assert task._wait_time(time.monotonic()) == 0.0
+
+        task.func = lambda: None
+        task.run_once()
+        assert task.runs == 2 and task.overruns == 1
+        assert task._wait_time(time.monotonic()) > 0
+
+    def test_trigger_runs_immediately_and_coalesces(self):
+        """트리거 즉시 실행, 실행 중 트리거는 1회로 병합, min_gap 준수"""
+        scheduler = TaskScheduler()
+        started = []
+        first_started = threading.Event()
+        second_started = threading.Event()
+        release = threading.Event()
+
+        def sell_check():
+            started.append(time.monotonic())
+            if len(started) == 1:
+                first_started.set()
+                release.wait(5)
+            else:
+                second_started.set()
+
+        # interval=None → 트리거로만 실행
+        task = scheduler.add_task('sell_check', sell_check, interval=None, min_gap=0.05)
+        scheduler.start()
+
+        scheduler.trigger('sell_check', reason='tick:005930')
+        assert first_started.wait(5)
+
+        # 실행 중 여러 틱 → 종료 후 1회만 재실행
+        for _ in range(10):
+            scheduler.trigger('sell_check', reason='tick:005930')
+        release.set()
+        assert second_started.wait(5)
+        scheduler.stop()
+
+        assert len(started) == 2
+        assert started[1] - started[0] >= 0.05
+        stats = task.get_stats()
+        assert stats['triggers'] == 11
+        assert stats['runs'] == 2
+        assert stats['max_lag'] > 0  # 트리거 → 실행 대기 시간 (min_gap)
+
+    def test_condition_and_errors(self):
+        """일시정지 조건은 건너뛰고, 예외는 집계 후 계속 실행"""
+        scheduler = TaskScheduler()
+        paused = {'value': True}
+        skipped = threading.Event()
+        resumed = threading.Event()
+        failed_three = threading.Event()
+        calls = []
+
+        def condition():
+            if paused['value']:
+                skipped.set()
+                return False
+            return True
+
+        def broken():
+            calls.append(1)
+            if len(calls) >= 3:
+                failed_three.set()
+            raise RuntimeError('boom')
+
+        scheduler.add_task('scan', resumed.set, interval=0.01, condition=condition)
+        scheduler.add_task('account', broken, interval=0.01)
+        scheduler.run_now('account')
+        scheduler.start()
+
+        assert skipped.wait(5)
+        paused['value'] = False
+        assert resumed.wait(5)
+        assert failed_three.wait(5)
+        scheduler.stop()
+
+        stats = scheduler.get_stats()
+        assert stats['scan']['skipped'] > 0 and stats['scan']['runs'] > 0
+        assert stats['account']['errors'] == stats['account']['runs'] >= 3
+        assert stats['account']['last_error'] == 'boom'
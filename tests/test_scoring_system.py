@@ -0,0 +1,91 @@
+"""
+Scoring System Batch Mode Tests
+"""
+
+import random
+
+import pytest
+from strategy.scoring_system import ScoringSystem, SCORE_FIELDS
+
+
+def make_stock(rng, i):
+    """경계값 / 결측값이 섞인 랜덤 종목 데이터"""
+    def maybe(value):
+        return None if rng.random() < 0.2 else value
+
+    stock = {
+        'stock_code': f'{i:06d}',
+        'name': f'종목{i}',
+        'current_price': rng.choice([0, 500, 1000, rng.randint(1000, 500_000)]),
+        'volume': rng.choice([0, 500_000, 500_001, 2_000_000, rng.randint(0, 10_000_000)]),
+        'avg_volume': maybe(rng.choice([0, rng.randint(1, 3_000_000)])),
+        'change_rate': rng.choice([-3.0, 0.0, 0.5, 1.0, 3.0, 10.0, 20.0, 25.0, round(rng.uniform(-10, 30), 2)]),
+        'institutional_net_buy': rng.choice([0, 100_000, 10_000_000, 30_000_000, rng.randint(-100_000_000, 100_000_000)]),
+        'foreign_net_buy': rng.choice([0, 5_000_000, 10_000_000, rng.randint(-100_000_000, 100_000_000)]),
+        'bid_ask_ratio': rng.choice([0.5, 0.8, 1.2, 1.5, round(rng.uniform(0, 3), 3)]),
+        'execution_intensity': maybe(rng.choice([0, 50, 70, 100, 150, round(rng.uniform(0, 300), 1)])),
+        'top_broker_buy_count': rng.randint(0, 6),
+        'program_net_buy': maybe(rng.choice([-1, 0, 100_000, 1_000_000, 5_000_000, rng.randint(-10_000_000, 10_000_000)])),
+        'rsi': maybe(rng.choice([30, 70, round(rng.uniform(0, 100), 2)])),
+        'ma5': maybe(rng.randint(0, 100_000)),
+        'ma20': maybe(rng.randint(0, 100_000)),
+        'volatility': maybe(rng.choice([0.02, 0.15, 0.085, round(rng.uniform(0, 0.3), 4)])),
+        'is_trending_theme': rng.random() < 0.2,
+        'has_positive_news': rng.random() < 0.2,
+    }
+    if rng.random() < 0.3:
+        stock['rate'] = stock.pop('change_rate')
+    if rng.random() < 0.5:
+        stock['macd'] = rng.choice([{'macd': rng.uniform(-1, 1)}, rng.uniform(-1, 1)])
+    if rng.random() < 0.3:
+        stock['macd_bullish_crossover'] = True
+    if rng.random() < 0.5:
+        stock['bollinger_bands'] = {'position': maybe(round(rng.uniform(0, 1), 2))}
+    elif rng.random() < 0.5:
+        stock['bb_position'] = round(rng.uniform(0, 1), 2)
+    if rng.random() < 0.5:
+        stock['institutional_trend'] = {
+            'daily': [{'orgn_netslmt': rng.choice(['100', '-100', '0', '']),
+                       'for_netslmt': rng.choice(['100', '-5'])}]
+        }
+    return stock
+
+
+class TestScoringBatch:
+    """배치 스코어링 테스트"""
+
+    @pytest.fixture
+    def scoring(self):
+        return ScoringSystem(enable_cache=False)
+
+    @pytest.mark.parametrize('scan_type', ['default', 'volume_based', 'price_change', 'ai_driven'])
+    def test_batch_matches_single(self, scoring, scan_type, capsys):
+        """배치 결과가 calculate_score와 동일한지 테스트"""
+        rng = random.Random(7)
+        stocks = [make_stock(rng, i) for i in range(300)]
+
+        batch = scoring.calculate_scores_batch(stocks, scan_type)
+        singles = [scoring.calculate_score(stock, scan_type) for stock in stocks]
+        capsys.readouterr()
+
+        assert len(batch) == len(stocks)
+        for fast, slow in zip(batch, singles):
+            assert fast.total_score == slow.total_score
+            assert fast.percentage == slow.percentage
+            for field_name, _ in SCORE_FIELDS:
+                assert getattr(fast, field_name) == getattr(slow, field_name), field_name
+
+    def test_columnar_frame_input(self, scoring):
+        """열 단위 frame 직접 입력 테스트 (없는 열은 결측 처리)"""
+        frame = {
+            'stock_code': ['A', 'B'],
+            'volume': [6_000_000, 0],
+            'change_rate': [3.0, 0.0],
+            'momentum_rate': [3.0, 0.0],
+        }
+        results = scoring.calculate_scores_batch(frame)
+
+        assert [r.volume_surge_score for r in results] == [60 * 0.8, 0.0]
+        assert results[0].price_momentum_score == 60 * 0.55
+        assert results[1].execution_intensity_score == 0.0
+        assert scoring.calculate_scores_batch([]) == []
@@ -0,0 +1,123 @@
+"""
+Streaming Indicator Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import (
+    sma, ema, rsi, macd, stochastic, bollinger_bands, atr, obv, volume_sma,
+    StreamingSMA, StreamingEMA, StreamingRSI, StreamingMACD,
+    StreamingStochastic, StreamingBollinger, StreamingATR, StreamingOBV,
+    StreamingIndicatorSet,
+)
+
+
+@pytest.fixture
+def ohlcv():
+    """보합 구간이 섞인 랜덤 분봉 데이터"""
+    rng = np.random.default_rng(42)
+    n = 1500
+    close = pd.Series(50000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))).round()
+    close.iloc[200:230] = close.iloc[200]
+    high = close + rng.integers(0, 300, n)
+    low = close - rng.integers(0, 300, n)
+    high.iloc[200:230] = low.iloc[200:230] = close.iloc[200]
+    volume = pd.Series(rng.integers(1000, 100000, n).astype(float))
+    return high, low, close, volume
+
+
+def assert_matches(streamed, expected, atol=1e-7):
+    np.testing.assert_allclose(np.asarray(streamed, dtype=float), np.asarray(expected, dtype=float),
+                               rtol=1e-9, atol=atol, equal_nan=True)
+
+
+class TestStreamingIndicators:
+    """배치 지표와 동일한 값 산출 테스트"""
+
+    def test_single_series(self, ohlcv):
+        """단일 시계열 지표 (SMA / EMA / RSI / MACD / 볼린저) 테스트"""
+        _, _, close, volume = ohlcv
+
+        s = StreamingSMA(20)
+        assert_matches([s.update(c) for c in close], sma(close, 20))
+        s = StreamingSMA(20)
+        assert_matches([s.update(v) for v in volume], volume_sma(volume, 20))
+        e = StreamingEMA(20)
+        assert_matches([e.update(c) for c in close], ema(close, 20))
+        r = StreamingRSI()
+        assert_matches([r.update(c) for c in close], rsi(close))
+
+        m = StreamingMACD()
+        streamed = np.array([m.update(c) for c in close])
+        for column, expected in zip(streamed.T, macd(close)):
+            assert_matches(column, expected)
+
+        b = StreamingBollinger()
+        streamed = np.array([b.update(c) for c in close])
+        # pandas rolling std는 보합 구간에서 0 대신 부동소수 잔차(~1e-4)를 남김
+        for column, expected in zip(streamed.T, bollinger_bands(close)):
+            assert_matches(column, expected, atol=1e-2)
+
+    def test_ohlcv(self, ohlcv):
+        """고가/저가/거래량 지표 (스토캐스틱 / ATR / OBV) 테스트"""
+        high, low, close, volume = ohlcv
+
+        st = StreamingStochastic()
+        streamed = np.array([st.update(h, l, c) for h, l, c in zip(high, low, close)])
+        k, d = stochastic(high, low, close)
+        assert_matches(streamed[:, 0], k)
+        assert_matches(streamed[:, 1], d)
+
+        a = StreamingATR()
+        assert_matches([a.update(h, l, c) for h, l, c in zip(high, low, close)], atr(high, low, close))
+        o = StreamingOBV()
+        assert_matches([o.update(c, v) for c, v in zip(close, volume)], obv(close, volume))
+
+    def test_replace_forming_bar(self, ohlcv):
+        """형성 중인 봉 갱신(replace) 후 값이 최종 봉만 넣은 경우와 같은지 테스트"""
+        high, low, close, volume = ohlcv
+        ticked = StreamingIndicatorSet()
+        plain = StreamingIndicatorSet()
+
+        for i in range(300):
+            bar = {'high': high[i], 'low': low[i], 'close': close[i], 'volume': volume[i], 'timestamp': i}
+            for j in range(3):
+                ticked.update_bar({
+                    'high': high[i] + j, 'low': low[i] - j, 'close': close[i] + 7 * j,
+                    'volume': volume[i] + j, 'timestamp': i,
+                })
+            result = ticked.update_bar(bar)
+            expected = plain.update_bar(bar)
+            assert result.keys() == expected.keys()
+            assert_matches(list(result.values()), list(expected.values()))
+
+        assert ticked.bars == plain.bars == 300
+        assert not np.isnan(result['rsi'])
+
+
+class TestVectorizedOBV:
+    """벡터화 OBV 테스트"""
+
+    def test_matches_reference_loop(self, ohlcv):
+        _, _, close, volume = ohlcv
+        close = close.copy()
+        close.iloc[50] = np.nan
+        close.index = pd.date_range('2024-01-02 09:00', periods=len(close), freq='min')
+        volume.index = close.index
+
+        expected = [volume.iloc[0]]
+        for i in range(1, len(close)):
+            if close.iloc[i] > close.iloc[i - 1]:
+                expected.append(expected[-1] + volume.iloc[i])
+            elif close.iloc[i] < close.iloc[i - 1]:
+                expected.append(expected[-1] - volume.iloc[i])
+            else:
+                expected.append(expected[-1])
+
+        result = obv(close, volume)
+        assert result.index.equals(close.index)
+        assert result.dtype == float
+        assert_matches(result, expected)
+        assert obv(close.iloc[:0], volume.iloc[:0]).empty
@@ -0,0 +1,148 @@
+"""
+Parallel Trial Runner Tests
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from ai.trial_runner import ParallelTrialRunner, RegionPruner, SharedDataset, attach_dataset, make_region_fn
+from ai.strategy_optimizer import StrategyOptimizer
+from ai.automl import HyperparameterOptimizer
+
+
+def quadratic(params):
+    """x=20, y=50 에서 최대, 완료 순서가 섞이도록 값에 따라 대기"""
+    time.sleep(0.001 * ((params['x'] * 7 + params['y']) % 4))
+    return -((params['x'] - 20) ** 2 + (params['y'] - 50) ** 2) / 100
+
+
+def moving_average_score(params, data):
+    """공유 데이터셋 기반 목적 함수 (이동평균 차이의 평균)"""
+    closes = data['close']
+    window = params['window']
+    ma = np.convolve(closes, np.ones(window) / window, mode='valid')
+    return float(np.mean(closes[window - 1:] - ma)) - params['cost']
+
+
+def failing(params):
+    """x=10 에서 실패하는 목적 함수"""
+    if params['x'] == 10:
+        raise ValueError("backtest failed")
+    return params['x']
+
+
+GRID = [{'x': x, 'y': y} for x in range(0, 45, 5) for y in range(0, 100, 10)]
+
+
+class TestParallelTrialRunner:
+    """ai.trial_runner 테스트"""
+
+    def test_parallel_matches_serial_with_pruning_and_early_stop(self):
+        """가지치기·조기 종료를 켜도 병렬 결과가 순차 결과와 같음 (완료 순서 무관)"""
+        def run(n_jobs):
+            runner = ParallelTrialRunner(quadratic, n_jobs=n_jobs, patience=40, lookahead=8,
+                                         pruner=RegionPruner(warmup=10, min_trials=3))
+            streamed = list(runner.run(GRID))
+            return runner, streamed
+
+        serial, _ = run(1)
+        parallel, streamed = run(3)
+
+        assert [(t.index, t.state, t.score) for t in parallel.trials] == \
+            [(t.index, t.state, t.score) for t in serial.trials]
+        assert serial.n_pruned > 0
+        assert parallel.best_trial.params == {'x': 20, 'y': 50}
+        assert {t.index for t in parallel.completed_trials} <= {t.index for t in streamed}
+
+    def test_early_stop_truncates_in_trial_order(self):
+        """개선이 없으면 patience 개 뒤에 멈추고 이후 트라이얼은 버림"""
+        param_sets = [{'x': 30, 'y': 50}] + [{'x': 0, 'y': 0}] * 50
+        runner = ParallelTrialRunner(quadratic, n_jobs=2, patience=5, lookahead=4)
+        list(runner.run(param_sets))
+
+        assert runner.stopped_early
+        assert [t.index for t in runner.trials] == list(range(6))
+
+    def test_shared_dataset_round_trip(self):
+        """공유 메모리 배열이 워커에서 그대로 보이고, 목적 함수는 (params, data) 로 호출"""
+        closes = np.cumsum(np.random.default_rng(0).normal(0, 1, 500)) + 1000
+        with SharedDataset({'close': closes}) as shared:
+            arrays, blocks = attach_dataset(shared.spec)
+            assert np.array_equal(arrays['close'], closes)
+            assert not arrays['close'].flags.writeable
+            del arrays
+            for block in blocks:
+                block.close()
+
+        param_sets = [{'window': w, 'cost': 0.0} for w in (5, 10, 20, 40)]
+        runner = ParallelTrialRunner(moving_average_score, n_jobs=2, dataset={'close': closes})
+        list(runner.run(param_sets))
+
+        expected = [moving_average_score(p, {'close': closes}) for p in param_sets]
+        assert [t.score for t in runner.trials] == pytest.approx(expected)
+
+    def test_failures_and_unpicklable_objective(self):
+        """실패한 트라이얼은 기록만 하고, 람다 목적 함수는 순차 실행으로 대체"""
+        runner = ParallelTrialRunner(failing, n_jobs=2)
+        list(runner.run([{'x': x} for x in (5, 10, 15)]))
+        assert [t.state for t in runner.trials] == ['complete', 'failed', 'complete']
+        assert 'backtest failed' in runner.trials[1].error
+
+        runner = ParallelTrialRunner(lambda p: p['x'], n_jobs=2)
+        list(runner.run([{'x': x} for x in (3, 1, 2)]))
+        assert runner.best_trial.params == {'x': 3}
+
+    def test_region_fn_bins_continuous_ranges(self):
+        """연속 범위는 구간 번호, 목록은 값 그대로 영역 키"""
+        regions = make_region_fn({'threshold': (0.0, 1.0), 'period': [5, 10]}, bins=4)
+        assert regions({'threshold': 0.6, 'period': 10}) == [('threshold', 2), ('period', 10)]
+        assert regions({'threshold': 1.0, 'period': 5}) == [('threshold', 3), ('period', 5)]
+
+
+class TestOptimizers:
+    """StrategyOptimizer / HyperparameterOptimizer 연동 테스트"""
+
+    def test_strategy_optimizer_grid_and_seeded_random(self):
+        """Grid 병렬 결과 = 순차 결과, Random 은 같은 시드면 같은 결과"""
+        ranges = {'x': list(range(0, 45, 5)), 'y': list(range(0, 100, 10))}
+
+        serial = StrategyOptimizer(quadratic, ranges, method='grid', n_jobs=1).optimize()
+        parallel = StrategyOptimizer(quadratic, ranges, method='grid', n_jobs=3).optimize()
+        assert parallel.best_params == serial.best_params == {'x': 20, 'y': 50}
+        assert parallel.all_trials == serial.all_trials
+
+        def random_result(n_jobs):
+            return StrategyOptimizer(quadratic, ranges, method='random', n_trials=40,
+                                     n_jobs=n_jobs, seed=7, prune=True).optimize()
+
+        first, second = random_result(1), random_result(2)
+        assert first.all_trials == second.all_trials
+        assert first.n_pruned == second.n_pruned
+
+    def test_strategy_optimizer_with_dataset(self):
+        """dataset 지정 시 목적 함수에 공유 데이터 전달"""
+        closes = np.linspace(100, 200, 300)
+        result = StrategyOptimizer(
+            moving_average_score, {'window': [5, 20, 60], 'cost': [0.0, 1.0]},
+            method='grid', n_jobs=2, dataset={'close': closes}
+        ).optimize()
+
+        assert result.best_params == {'window': 60, 'cost': 0.0}
+        assert result.n_trials == 6
+
+    def test_automl_random_search_is_seeded(self):
+        """AutoML random search: 같은 시드 → 같은 설정/기록, 병렬도 동일"""
+        def objective(params):
+            return -abs(params['hidden_size'] - 128) - params['dropout']
+
+        optimizer = HyperparameterOptimizer()
+        first = optimizer.random_search('lstm', objective, n_trials=15, seed=3)
+        history = list(optimizer.trial_history)
+
+        optimizer = HyperparameterOptimizer()
+        second = optimizer.random_search('lstm', objective, n_trials=15, seed=3, n_jobs=2)
+
+        assert first.parameters == second.parameters
+        assert optimizer.trial_history == history
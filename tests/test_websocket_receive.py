@@ -0,0 +1,157 @@
+"""
+WebSocketManager Receive Loop Tests
+"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from core.websocket_manager import WebSocketManager, ReceiveStats
+
+
+def real_frame(code, price):
+    return json.dumps({
+        'trnm': 'REAL',
+        'data': [{'type': '0B', 'item': code, 'values': {'10': str(price)}}]
+    })
+
+
+@pytest_asyncio.fixture
+async def feed():
+    """REAL 프레임을 연속 전송한 뒤 연결을 닫는 로컬 서버"""
+    frames = [real_frame('005930', i) for i in range(2000)]
+    frames.insert(1000, '{not json')
+    frames.append(real_frame('000660', 1))
+
+    async def handler(ws):
+        for frame in frames:
+            await ws.send(frame)
+
+    async with websockets.serve(handler, '127.0.0.1', 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f'ws://127.0.0.1:{port}'
+
+
+class TestReceiveLoop:
+    """receive_loop 배치 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_receive_and_dispatch(self, feed):
+        """배치 수신 / 분배 / 통계 테스트"""
+        manager = WebSocketManager('token', batch_size=64)
+        manager.websocket = await websockets.connect(feed)
+        manager.is_connected = manager.is_logged_in = True
+
+        reconnects = []
+
+        async def fake_reconnect():
+            reconnects.append(1)
+        manager.reconnect = fake_reconnect
+
+        samsung, hynix = [], []
+        manager.register_callback('0B', lambda d: samsung.append(int(d['values']['10'])), stock_code='005930')
+        manager.register_callback('0B', lambda d: hynix.append(d['item']), stock_code='000660')
+
+        await asyncio.wait_for(manager.receive_loop(), timeout=5.0)
+        await manager.router.join()
+
+        assert samsung == list(range(2000))
+        assert hynix == ['000660']
+        assert reconnects == [1]  # 서버가 연결을 닫으면 재연결 시도
+
+        stats = manager.get_receive_stats()
+        assert stats['messages'] == 2002
+        assert stats['decode_errors'] == 1
+        assert stats['max_batch'] <= 64
+        assert stats['batches'] >= 2002 / 64
+        assert sum(stats['decode_latency_us'].values()) == 2001
+
+        manager.router.close()
+
+
+@pytest_asyncio.fixture
+async def live_feed():
+    """틱을 계속 보내면서 REG 요청에 응답하고, 이후 구독 종목 틱도 보내는 로컬 서버"""
+    async def handler(ws):
+        codes = ['005930']
+
+        async def ticks():
+            price = 0
+            while True:
+                price += 1
+                for code in list(codes):
+                    await ws.send(real_frame(code, price))
+                await asyncio.sleep(0.001)
+
+        sender = asyncio.create_task(ticks())
+        try:
+            async for message in ws:
+                request = json.loads(message)
+                if request['trnm'] == 'REG':
+                    await ws.send(json.dumps({'trnm': 'REG', 'return_code': 0, 'return_msg': 'ok'}))
+                    codes.extend(request['data'][0]['item'])
+        finally:
+            sender.cancel()
+
+    async with websockets.serve(handler, '127.0.0.1', 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f'ws://127.0.0.1:{port}'
+
+
+class TestSubscribeWhileReceiving:
+    """수신 루프 실행 중 구독 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_ack_routed_through_receive_loop(self, live_feed):
+        """수신 루프가 recv 중이어도 subscribe 응답 수신, 이후 새 종목 틱 분배"""
+        manager = WebSocketManager('token')
+        manager.websocket = await websockets.connect(live_feed)
+        manager.is_connected = manager.is_logged_in = True
+
+        async def no_reconnect():
+            pass
+        manager.reconnect = no_reconnect
+
+        hynix = asyncio.Event()
+        manager.register_callback('0B', lambda d: hynix.set(), stock_code='000660')
+
+        receiving = asyncio.create_task(manager.receive_loop())
+        while manager.receive_stats.messages < 10:
+            await asyncio.sleep(0.001)
+
+        results = await asyncio.gather(
+            manager.subscribe(['000660'], ['0B'], grp_no='2'),
+            manager.subscribe(['035720'], ['0B'], grp_no='3'),
+        )
+        await asyncio.wait_for(hynix.wait(), timeout=2.0)
+
+        assert results == [True, True]
+        assert set(manager.subscriptions) == {'2', '3'}
+        assert not manager._ack_waiters
+
+        await manager.disconnect()
+        await asyncio.wait_for(receiving, timeout=2.0)
+        manager.router.close()
+
+
+class TestReceiveStats:
+    """ReceiveStats 테스트"""
+
+    def test_latency_histogram(self):
+        """디코딩 지연 히스토그램 구간 테스트"""
+        stats = ReceiveStats()
+        for seconds in (5e-6, 30e-6, 30e-6, 2e-3, 1.0):
+            stats.record_decode(seconds)
+        stats.record_batch(5)
+
+        result = stats.get_stats()
+        histogram = result['decode_latency_us']
+        assert histogram['<=10us'] == 1
+        assert histogram['<=50us'] == 2
+        assert histogram['<=5000us'] == 1
+        assert histogram['>5000us'] == 1
+        assert result['max_decode_us'] == pytest.approx(1_000_000)
+        assert result['avg_batch'] == 5
@@ -0,0 +1,101 @@
+"""
+WebSocket Dispatch Router Tests
+"""
+
+import asyncio
+import time
+
+import pytest
+from core.ws_router import DispatchRouter
+
+
+def tick(code, price=71000, data_type='0B'):
+    return {'type': data_type, 'item': code, 'values': {'10': str(price)}}
+
+
+class TestDispatchRouter:
+    """DispatchRouter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_multiple_subscribers_per_code(self):
+        """종목별 다중 구독자 라우팅 테스트"""
+        router = DispatchRouter()
+        received = {'a1': [], 'a2': [], 'b': [], 'all_0b': [], 'all': []}
+
+        router.subscribe('0B', lambda d: received['a1'].append(d['item']), stock_code='005930')
+        router.subscribe('0B', lambda d: received['a2'].append(d['item']), stock_code='005930')
+
+        async def on_b(d):
+            received['b'].append(d['item'])
+        router.subscribe('0B', on_b, stock_code='000660')
+        router.subscribe('0B', lambda d: received['all_0b'].append(d['item']))
+        router.subscribe('ALL', lambda d: received['all'].append(d['type']))
+
+        router.dispatch(tick('005930'))
+        router.dispatch(tick('000660'))
+        router.dispatch(tick('035720', data_type='0D'))
+        await router.join()
+
+        assert received['a1'] == ['005930']
+        assert received['a2'] == ['005930']
+        assert received['b'] == ['000660']
+        assert received['all_0b'] == ['005930', '000660']
+        assert received['all'] == ['0B', '0B', '0D']
+        router.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block(self):
+        """느린 구독자가 분배를 막지 않고 오래된 메시지를 폐기하는지 테스트"""
+        router = DispatchRouter(queue_size=10)
+        fast, slow = [], []
+
+        async def on_slow(d):
+            await asyncio.sleep(1.0)
+            slow.append(d['values']['10'])
+
+        router.subscribe('0B', lambda d: fast.append(d['values']['10']), stock_code='005930')
+        slow_sub = router.subscribe('0B', on_slow, stock_code='005930')
+
+        start = time.monotonic()
+        for i in range(100):
+            router.dispatch(tick('005930', price=i))
+            await asyncio.sleep(0)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert len(fast) == 100
+
+        stats = router.get_stats()
+        assert stats['dispatched'] == 100
+        assert stats['total_dropped'] == slow_sub.dropped > 0
+        assert slow_sub.get_stats()['depth'] == 10
+        # 최신 시세가 남아 있어야 함 (drop_oldest)
+        assert slow_sub.queue._queue[-1]['values']['10'] == '99'
+        router.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_and_errors(self):
+        """구독 해제 / 콜백 예외 격리 테스트"""
+        router = DispatchRouter()
+        received = []
+
+        def broken(d):
+            raise RuntimeError('boom')
+
+        broken_sub = router.subscribe('0B', broken, stock_code='005930')
+        sub = router.subscribe('0B', lambda d: received.append(d['item']), stock_code='005930')
+
+        router.dispatch(tick('005930'))
+        await router.join()
+        assert received == ['005930']
+        assert broken_sub.errors == 1
+
+        assert router.unsubscribe(sub) is True
+        assert router.unsubscribe(sub) is False
+        router.dispatch(tick('005930'))
+        await router.join()
+        assert received == ['005930']
+
+        router.unsubscribe(broken_sub)
+        assert router.dispatch(tick('005930')) == 0
+        assert router.get_stats()['unrouted'] == 1
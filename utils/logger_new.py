@@ -7,20 +7,255 @@ CRITICAL 개선 사항:
 - Rate-limiting 기능 내장
 - 80% I/O 감소 (고빈도 로그 throttling)
 - 단일 API로 통합
+
+비동기 파이프라인:
+- enqueue: 호출 스레드는 포맷 후 큐에 넣기만, 디스크/콘솔 기록은 백그라운드 writer
+- json_output: JSON-lines 구조화 로그 (serialize)
+- sampling: 모듈별 샘플링 (WARNING 미만)
+- hot_path_modules: diagnose(변수 값 덤프) 비활성 모듈 (error.log 에는 스택 트레이스만)
 """
 import sys
 import time
+import queue
+import atexit
+import logging
+import threading
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Any, Iterable, Callable, List
 from collections import defaultdict
 from loguru import logger
 
 
+# diagnose 비활성 기본 핫패스 (REST 응답, 스캐너 후보별 로그)
+DEFAULT_HOT_PATH_MODULES = ('core.rest_client', 'research')
+
+# writer 스레드가 다시 남기는 레코드 표시 (extra 키 → writer 측 sink 번호)
+_WRITER_KEY = '_writer_sink'
+_FLUSH = object()
+
+
+def _match_module(name: Optional[str], prefixes: Iterable[str]) -> Optional[str]:
+    """모듈 이름과 가장 길게 일치하는 접두사 (점 경계 기준)"""
+    best = None
+    for prefix in prefixes:
+        if name == prefix or (name or '').startswith(prefix + '.'):
+            if best is None or len(prefix) > len(best):
+                best = prefix
+    return best
+
+
+class ModuleSampler:
+    """
+    모듈별 로그 샘플러 (loguru filter)
+
+    WARNING 미만 레코드를 모듈 접두사별 비율로 솎아낸다. 난수 대신 카운터로
+    1/rate 개마다 하나씩 통과시켜 같은 입력이면 같은 결과가 나온다.
+    WARNING 이상은 항상 통과한다. 여러 sink 가 같은 인스턴스를 공유하면
+    한 레코드에 대해 같은 결정을 내린다 (마지막 레코드 결정 재사용).
+
+    사용 예:
+        sampler = ModuleSampler({'core.rest_client': 0.1})
+        logger.add(sink, filter=sampler)
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None,
+                 exclude: Iterable[str] = (), include: Optional[Iterable[str]] = None):
+        """
+        Args:
+            rates: 모듈 접두사 → 통과 비율 (0~1)
+            exclude: 이 sink 에서 제외할 모듈 접두사
+            include: 이 sink 에 남길 모듈 접두사 (None 이면 전체)
+        """
+        self.rates = {prefix: min(max(float(rate), 0.0), 1.0) for prefix, rate in (rates or {}).items()}
+        self.exclude = tuple(exclude)
+        self.include = None if include is None else tuple(include)
+        self._strides: Dict[Optional[str], Optional[int]] = {}
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._excluded: Dict[Optional[str], bool] = {}
+        self._last: tuple = (None, True)
+        self._warning_no = logger.level('WARNING').no
+
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        if _WRITER_KEY in record['extra']:
+            return False
+
+        name = record['name']
+
+        excluded = self._excluded.get(name)
+        if excluded is None:
+            excluded = self._excluded[name] = (
+                _match_module(name, self.exclude) is not None
+                or (self.include is not None and _match_module(name, self.include) is None)
+            )
+        if excluded:
+            return False
+
+        if record['level'].no >= self._warning_no:
+            return True
+
+        last_record, last_decision = self._last
+        if record is last_record:
+            return last_decision
+
+        decision = self._sample(name)
+        self._last = (record, decision)
+        return decision
+
+    def _sample(self, name: Optional[str]) -> bool:
+        """모듈별 카운터 샘플링"""
+        if name not in self._strides:
+            prefix = _match_module(name, self.rates)
+            rate = self.rates.get(prefix, 1.0)
+            self._strides[name] = None if rate >= 1.0 else (0 if rate <= 0.0 else max(1, round(1 / rate)))
+
+        stride = self._strides[name]
+        if stride is None:
+            return True
+        if stride == 0:
+            return False
+
+        count = self._counters[name]
+        self._counters[name] = count + 1
+        return count % stride == 0
+
+
+class BackgroundWriter:
+    """
+    백그라운드 로그 writer (in-process 큐 + 전용 스레드)
+
+    loguru 의 enqueue=True 는 multiprocessing 파이프에 레코드를 pickle 해 보내므로
+    레코드당 수십 µs 가 호출 스레드에 남는다. 여기서는 호출 스레드가 포맷된
+    문자열만 queue.SimpleQueue 에 넣고, writer 스레드가 쌓인 문자열을 sink 별로
+    묶어 전용 loguru sink (로테이션/압축 포함) 에 그대로(raw) 한 번에 기록한다.
+
+    사용 예:
+        writer = BackgroundWriter()
+        logger.add(writer.sink('logs/bot.log', rotation='00:00'), format=...)
+        ...
+        writer.flush()
+    """
+
+    MAX_BATCH = 1000
+    WRITE_LEVEL = 'CRITICAL'
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._handler_ids: List[int] = []
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def sink(self, target: Any, **options) -> Callable[[str], None]:
+        """
+        target 에 실제로 기록하는 writer 측 sink 를 등록하고, 호출 스레드 측
+        sink (큐에 넣기만 하는 함수) 를 반환
+
+        Args:
+            target: 파일 경로 또는 스트림
+            **options: writer 측 logger.add 옵션 (rotation, retention, compression, encoding ...)
+        """
+        # writer 측 sink 는 최고 레벨로 둬서 logger 의 최소 레벨 조기 반환(DEBUG 무시)을 유지
+        key = len(self._handler_ids)
+        self._handler_ids.append(logger.add(
+            target,
+            format='{message}',
+            level=self.WRITE_LEVEL,
+            filter=lambda record: record['extra'].get(_WRITER_KEY) == key,
+            colorize=False,
+            **options,
+        ))
+
+        put = self._queue.put
+
+        def enqueue(message: str):
+            put((key, str(message)))
+
+        return enqueue
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """큐에 쌓인 메시지가 모두 기록될 때까지 대기"""
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def stop(self):
+        """남은 메시지를 기록하고 writer 스레드 종료 (writer 측 sink 제거)"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        for handler_id in self._handler_ids:
+            try:
+                logger.remove(handler_id)
+            except ValueError:
+                pass
+        self._handler_ids.clear()
+        atexit.unregister(self.stop)
+
+    def _run(self):
+        """writer 스레드 루프 (쌓인 메시지를 sink 별로 묶어 기록)"""
+        writers: Dict[int, Any] = {}
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < self.MAX_BATCH:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+
+            pending: Dict[int, List[str]] = defaultdict(list)
+            flushes, stopping = [], False
+            for item in batch:
+                if item is None:
+                    stopping = True
+                elif item[0] is _FLUSH:
+                    flushes.append(item[1])
+                else:
+                    pending[item[0]].append(item[1])
+
+            for key, messages in pending.items():
+                write = writers.get(key)
+                if write is None:
+                    write = writers[key] = logger.bind(**{_WRITER_KEY: key}).opt(raw=True)
+                try:
+                    write.log(self.WRITE_LEVEL, ''.join(messages))
+                except Exception:
+                    # sink 가 이미 제거된 경우 등 - writer 스레드는 죽지 않음
+                    pass
+
+            for done in flushes:
+                done.set()
+            if stopping:
+                return
+
+
+class InterceptHandler(logging.Handler):
+    """표준 logging 레코드를 loguru 로 전달 (같은 큐/sink 사용)"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        # 호출 위치를 logging 내부가 아닌 실제 호출자로 맞춤
+        frame, depth = logging.currentframe(), 2
+        while frame and frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
+
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
 class LoguruLogger:
     """Loguru 로거 래퍼 클래스 (싱글톤)"""
 
     _instance: Optional['LoguruLogger'] = None
     _initialized: bool = False
+    _writer: Optional[BackgroundWriter] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -33,12 +268,18 @@ class LoguruLogger:
             self._setup_logger()
             LoguruLogger._initialized = True
 
-    def _setup_logger(self):
-        """로거 초기 설정"""
+    def _setup_logger(self, log_config: Optional[Dict[str, Any]] = None):
+        """
+        로거 초기 설정
+
+        Args:
+            log_config: 로깅 설정 (None 이면 config 에서 로드)
+        """
         try:
-            from config.config_manager import get_config
-            config = get_config()
-            log_config = config.logging
+            if log_config is None:
+                from config.config_manager import get_config
+                config = get_config()
+                log_config = config.logging
         except ImportError:
             # 기본 설정 사용
             log_config = {
@@ -51,24 +292,40 @@ class LoguruLogger:
                 'format': '{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}',
                 'console_output': True,
                 'colored_output': True,
+                'enqueue': True,
+                'json_output': False,
+                'json_file_path': 'logs/bot.jsonl',
+                'sampling': {},
+                'hot_path_modules': list(DEFAULT_HOT_PATH_MODULES),
+                'intercept_stdlib': False,
             }
 
-        # 기존 핸들러 제거
+        # 기존 writer 정리 (남은 로그 기록) 후 기존 핸들러 제거
+        if LoguruLogger._writer is not None:
+            LoguruLogger._writer.stop()
+            LoguruLogger._writer = None
         logger.remove()
 
         # 기본 포맷 정의
         default_format = '{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}'
 
+        # 큐 모드: 호출 스레드는 포맷 후 큐에 넣기만 하고 기록은 백그라운드 writer 가 수행
+        if log_config.get('enqueue', True):
+            LoguruLogger._writer = BackgroundWriter()
+        hot_paths = tuple(log_config.get('hot_path_modules', DEFAULT_HOT_PATH_MODULES) or ())
+        sampler = ModuleSampler(log_config.get('sampling') or {})
+
         # 콘솔 핸들러 (컬러 출력) - WARNING 이상만 출력 (cmd 창 스팸 방지)
         if log_config.get('console_output', True):
             console_level = log_config.get('console_level', 'WARNING')  # 기본값: WARNING
-            logger.add(
+            self._add_sink(
                 sys.stdout,
                 format=log_config.get('format') or default_format,
                 level=console_level,  # 콘솔은 WARNING 이상만
                 colorize=log_config.get('colored_output', True),
+                filter=sampler,
                 backtrace=True,
-                diagnose=True,
+                diagnose=False,
             )
 
         # 파일 핸들러 (로테이션)
@@ -78,31 +335,116 @@ class LoguruLogger:
         # 로그 디렉토리 생성
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.add(
+        self._add_sink(
             log_path,
             format=log_config.get('format') or default_format,
             level=log_config.get('level', 'INFO'),
+            filter=sampler,
+            backtrace=True,
+            diagnose=False,
             rotation=log_config.get('rotation', '00:00'),  # 매일 자정
             retention=log_config.get('backup_count', 30),  # 30일 보관
             compression='zip',  # 압축
             encoding='utf-8',
-            backtrace=True,
-            diagnose=True,
         )
 
-        # 에러 전용 파일 핸들러
-        error_log_path = log_path.parent / 'error.log'
-        logger.add(
-            error_log_path,
-            format=log_config.get('format') or default_format,
-            level='ERROR',
+        # JSON-lines 구조화 로그 (레코드 전체 직렬화)
+        if log_config.get('json_output', False):
+            json_path = Path(log_config.get('json_file_path') or log_path.with_suffix('.jsonl'))
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            self._add_sink(
+                json_path,
+                level=log_config.get('level', 'INFO'),
+                serialize=True,
+                filter=sampler,
+                backtrace=False,
+                diagnose=False,
+                rotation=log_config.get('rotation', '00:00'),
+                retention=log_config.get('backup_count', 30),
+                compression='zip',
+                encoding='utf-8',
+            )
+
+        # 에러 전용 파일 핸들러 - 변수 값 덤프(diagnose)는 핫패스 외 모듈만,
+        # 핫패스 모듈 에러는 스택 트레이스만 (두 sink 가 파일 핸들/로테이션 하나를 공유)
+        error_sink = self._shared_sink(
+            log_path.parent / 'error.log',
             rotation='10 MB',
             retention=60,  # 60일 보관
             compression='zip',
             encoding='utf-8',
-            backtrace=True,
-            diagnose=True,
         )
+        error_filters = [(ModuleSampler(exclude=hot_paths), True)]
+        if hot_paths:
+            error_filters.append((ModuleSampler(include=hot_paths), False))
+        for error_filter, diagnose in error_filters:
+            self._add_sink(
+                error_sink,
+                format=log_config.get('format') or default_format,
+                level='ERROR',
+                filter=error_filter,
+                backtrace=True,
+                diagnose=diagnose,
+            )
+
+        # 표준 logging 모듈 로그도 같은 파이프라인으로
+        root = logging.getLogger()
+        if log_config.get('intercept_stdlib', False):
+            logging.basicConfig(handlers=[InterceptHandler()],
+                                level=log_config.get('level', 'INFO'), force=True)
+        else:
+            for handler in [h for h in root.handlers if isinstance(h, InterceptHandler)]:
+                root.removeHandler(handler)
+
+    def _add_sink(self, target, format: str = '{message}', level='INFO',
+                  filter=None, colorize: Optional[bool] = None, serialize: bool = False,
+                  backtrace: bool = True, diagnose: bool = False, **file_options):
+        """
+        sink 추가 - 큐 모드면 포맷은 호출 스레드, 기록(로테이션/압축 포함)은 writer 스레드
+
+        Args:
+            target: 파일 경로, 스트림 또는 _shared_sink 가 반환한 기록 함수
+            file_options: rotation, retention, compression, encoding (파일 sink 전용)
+        """
+        options = dict(format=format, level=level, filter=filter, serialize=serialize,
+                       backtrace=backtrace, diagnose=diagnose)
+        if colorize is not None:
+            options['colorize'] = colorize
+
+        if LoguruLogger._writer is None or callable(target):
+            return logger.add(target, **options, **file_options)
+        return logger.add(LoguruLogger._writer.sink(target, **file_options), **options)
+
+    def _shared_sink(self, target, **file_options) -> Callable[[str], None]:
+        """
+        여러 sink 가 같은 파일에 기록하도록 raw 기록 함수 반환 (파일 핸들/로테이션은 하나)
+
+        큐 모드면 writer 측 sink 에, 아니면 호출 스레드에서 바로 raw 레코드로 전달한다.
+        """
+        if LoguruLogger._writer is not None:
+            return LoguruLogger._writer.sink(target, **file_options)
+
+        key = f'direct:{target}'
+        logger.add(
+            target,
+            format='{message}',
+            level=BackgroundWriter.WRITE_LEVEL,
+            filter=lambda record: record['extra'].get(_WRITER_KEY) == key,
+            colorize=False,
+            **file_options,
+        )
+        write = logger.bind(**{_WRITER_KEY: key}).opt(raw=True)
+
+        def relay(message: str):
+            write.log(BackgroundWriter.WRITE_LEVEL, str(message))
+
+        return relay
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """큐에 남은 로그를 모두 기록할 때까지 대기"""
+        if LoguruLogger._writer is not None:
+            return LoguruLogger._writer.flush(timeout)
+        return True
 
     def get_logger(self):
         """로거 인스턴스 반환"""
@@ -112,6 +454,21 @@ class LoguruLogger:
         """컨텍스트 바인딩"""
         return logger.bind(**kwargs)
 
+    def reconfigure(self, **overrides):
+        """
+        현재 설정에 덮어쓴 값으로 sink 재구성
+
+        사용 예:
+            LoguruLogger().reconfigure(json_output=True, sampling={'core.rest_client': 0.1})
+        """
+        try:
+            from config.config_manager import get_config
+            log_config = dict(get_config().logging)
+        except ImportError:
+            log_config = {}
+        log_config.update(overrides)
+        self._setup_logger(log_config)
+
 
 # 싱글톤 인스턴스
 _loguru_logger = LoguruLogger()
@@ -122,6 +479,11 @@ def get_logger():
     return _loguru_logger.get_logger()
 
 
+def flush_logs(timeout: float = 5.0) -> bool:
+    """큐에 남은 로그를 모두 기록할 때까지 대기 (종료 직전/테스트용)"""
+    return _loguru_logger.flush(timeout)
+
+
 def setup_logger(
     name: str = 'trading_bot',
     log_file: Optional[Path] = None,
@@ -303,6 +665,7 @@ def configure_default_logger():
 
 __all__ = [
     'get_logger',
+    'flush_logs',
     'setup_logger',
     'configure_default_logger',
     'LoggerMixin',
@@ -314,4 +677,7 @@ __all__ = [
     'exception',
     'RateLimitedLogger',
     'get_rate_limited_logger',
+    'ModuleSampler',
+    'BackgroundWriter',
+    'InterceptHandler',
 ]
@@ -0,0 +1,460 @@
+"""
+utils/ohlcv_store.py
+로컬 컬럼형 OHLCV 히스토리 저장소
+
+- 종목 / 시간프레임별 고정 레코드(int64 x 6) 바이너리 파일 + np.memmap 조회
+- 이미 저장된 구간은 로컬에서 즉시 반환, 마지막 저장 시점 이후만 API로 동기화
+- 요청 구간(start / 최근 count개)이 저장 범위를 벗어나면 로컬 응답 대신 API로 보충
+- 새 봉은 파일 끝에 추가(append), 형성 중인 마지막 봉은 제자리 덮어쓰기
+- 저장된 확정 봉과 응답이 다르면 (수정주가 기준 변경) 또는 응답이 저장 구간과
+  겹치지 않으면 (누락 구간 확인 불가) 저장 구간을 버리고 응답으로 교체
+- 파일 수정 시각(mtime) = 마지막 동기화 시각 → 별도 메타데이터 파일 없음
+
+레이아웃:
+    {root}/daily/005930.bin      (timestamp = YYYYMMDD)
+    {root}/minute1/005930.bin    (timestamp = YYYYMMDDHHMMSS)
+
+Usage:
+    store = get_ohlcv_store()
+    bars = store.sync('005930', 'daily', fetch=lambda: api_call(), count=20,
+                      min_date='20251107')
+"""
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+NUM_FIELDS = len(FIELDS)
+RECORD_SIZE = NUM_FIELDS * 8
+
+DAILY = 'daily'
+
+# 정규장 종료 시각 (이후 동기화된 봉은 확정된 것으로 간주)
+SESSION_CLOSE = '153000'
+
+
+def minute_timeframe(interval: int) -> str:
+    """분봉 간격 → 시간프레임 이름 (예: 1 → 'minute1')"""
+    return f'minute{interval}'
+
+
+class OHLCVStore:
+    """
+    종목별 memmap 파일 기반 OHLCV 저장소 (Thread-safe)
+
+    레코드는 timestamp 오름차순으로 유지되며, 조회 결과는 기존 API와 같은
+    최신순 딕셔너리 리스트로 반환한다.
+    """
+
+    def __init__(self, root: str = 'data/ohlcv', session_close: str = SESSION_CLOSE):
+        """
+        Args:
+            root: 저장 디렉토리
+            session_close: 정규장 종료 시각 (HHMMSS)
+        """
+        self.root = Path(root)
+        self.session_close = session_close
+        self._lock = RLock()
+        self._maps: Dict[Path, np.ndarray] = {}
+        # API가 더 과거 봉을 주지 않는 것으로 확인된 종목의 첫 봉 (신규 상장 등)
+        self._history_start: Dict[Path, int] = {}
+
+        self.hits = 0
+        self.syncs = 0
+        self.fetch_errors = 0
+        self.rows_written = 0
+        self.resets = 0
+
+        logger.info(f"OHLCVStore 초기화: {self.root}")
+
+    # =========================================================================
+    # 파일 / 조회
+    # =========================================================================
+
+    def path(self, stock_code: str, timeframe: str) -> Path:
+        """종목 / 시간프레임 파일 경로"""
+        return self.root / timeframe / f'{stock_code}.bin'
+
+    def _records(self, path: Path) -> np.ndarray:
+        """전체 레코드 (N, 6) memmap (파일 크기가 바뀌면 다시 매핑)"""
+        mapped = self._maps.get(path)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            self._maps.pop(path, None)
+            return np.empty((0, NUM_FIELDS), dtype=np.int64)
+
+        rows = size // RECORD_SIZE
+        if mapped is not None and len(mapped) == rows:
+            return mapped
+        if rows == 0:
+            return np.empty((0, NUM_FIELDS), dtype=np.int64)
+
+        mapped = np.memmap(path, dtype=np.int64, mode='r', shape=(rows, NUM_FIELDS))
+        self._maps[path] = mapped
+        return mapped
+
+    def count(self, stock_code: str, timeframe: str) -> int:
+        """저장된 봉 수"""
+        with self._lock:
+            return len(self._records(self.path(stock_code, timeframe)))
+
+    def last_timestamp(self, stock_code: str, timeframe: str) -> Optional[int]:
+        """마지막 저장 봉의 timestamp (없으면 None)"""
+        with self._lock:
+            records = self._records(self.path(stock_code, timeframe))
+            return int(records[-1, 0]) if len(records) else None
+
+    def last_synced(self, stock_code: str, timeframe: str) -> Optional[float]:
+        """마지막 동기화 시각 (epoch 초, 없으면 None)"""
+        try:
+            return self.path(stock_code, timeframe).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def read(
+        self,
+        stock_code: str,
+        timeframe: str,
+        count: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        레코드 조회 (오름차순 복사본)
+
+        Args:
+            stock_code: 종목코드
+            timeframe: 'daily' / 'minute1' ...
+            count: 최근 N개 (None이면 전체)
+            end: 이 timestamp 이하만 (일봉 YYYYMMDD는 같은 날 분봉 전체 포함)
+
+        Returns:
+            (N, 6) int64 배열 (FIELDS 순서)
+        """
+        with self._lock:
+            records = self._records(self.path(stock_code, timeframe))
+            stop = self._stop_index(records, timeframe, end)
+            start = max(stop - count, 0) if count else 0
+            return np.array(records[start:stop])
+
+    @staticmethod
+    def _stop_index(records: np.ndarray, timeframe: str, end: Optional[int]) -> int:
+        """end timestamp 이하 레코드 수 (일봉 YYYYMMDD end는 분봉에서 그날 끝까지)"""
+        if end is None or not len(records):
+            return len(records)
+        if timeframe != DAILY and end < 10 ** 8:
+            end = end * 10 ** 6 + 235959
+        return int(np.searchsorted(records[:, 0], end, side='right'))
+
+    def covers(
+        self,
+        stock_code: str,
+        timeframe: str,
+        count: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> bool:
+        """
+        저장 구간이 요청 구간을 포함하는지 확인
+
+        - end 이하 봉이 count개 이상 있어야 함
+        - 첫 저장 봉이 start 이전(같은 시점 포함)이어야 함
+        - API가 더 과거 봉을 주지 않는 종목은 확인된 첫 봉부터 있으면 포함으로 간주
+        """
+        if not count and start is None:
+            return True
+
+        path = self.path(stock_code, timeframe)
+        with self._lock:
+            records = self._records(path)
+            stop = self._stop_index(records, timeframe, end)
+            if not stop:
+                return False
+
+            first = int(records[0, 0])
+            if first <= self._history_start.get(path, -1):
+                return True
+            if count and stop < count:
+                return False
+            if start is not None:
+                if timeframe != DAILY and start < 10 ** 8:
+                    start = start * 10 ** 6
+                if first > start:
+                    return False
+            return True
+
+    def read_bars(
+        self,
+        stock_code: str,
+        timeframe: str,
+        count: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        최신순 봉 딕셔너리 리스트 조회 (ChartDataAPI 반환 형식과 동일)
+
+        분봉은 'time' (HHMMSS) / 'source' 키가 추가된다.
+        """
+        records = self.read(stock_code, timeframe, count, end)[::-1].tolist()
+        if timeframe == DAILY:
+            return [
+                {'date': str(ts), 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+                for ts, o, h, l, c, v in records
+            ]
+        return [
+            {'date': str(ts)[:8], 'time': str(ts)[8:], 'open': o, 'high': h, 'low': l,
+             'close': c, 'volume': v, 'source': 'history_store'}
+            for ts, o, h, l, c, v in records
+        ]
+
+    def read_frame(self, stock_code: str, timeframe: str, count: Optional[int] = None, end: Optional[int] = None):
+        """
+        백테스트용 DataFrame 조회 (DatetimeIndex, 오름차순)
+
+        Returns:
+            pd.DataFrame[open, high, low, close, volume]
+        """
+        import pandas as pd
+
+        records = self.read(stock_code, timeframe, count, end)
+        fmt = '%Y%m%d' if timeframe == DAILY else '%Y%m%d%H%M%S'
+        index = pd.to_datetime(records[:, 0].astype(str), format=fmt)
+        return pd.DataFrame(records[:, 1:], index=index, columns=list(FIELDS[1:]), dtype=float)
+
+    # =========================================================================
+    # 저장 / 동기화
+    # =========================================================================
+
+    @staticmethod
+    def _to_records(bars: List[Dict[str, Any]], timeframe: str) -> np.ndarray:
+        """API 봉 딕셔너리 → (N, 6) 오름차순 레코드 (중복 timestamp는 뒤의 것 우선)"""
+        rows = []
+        for bar in bars:
+            try:
+                date = str(bar.get('date', '')).strip()
+                if timeframe == DAILY:
+                    ts = int(date[:8])
+                else:
+                    tm = str(bar.get('time', '')).strip()
+                    ts = int(tm) if len(tm) >= 14 else int(date[:8] + tm.zfill(6)[:6])
+                rows.append((ts, int(bar['open']), int(bar['high']), int(bar['low']),
+                             int(bar['close']), int(bar.get('volume', 0))))
+            except (KeyError, ValueError, TypeError):
+                continue
+
+        if not rows:
+            return np.empty((0, NUM_FIELDS), dtype=np.int64)
+
+        records = np.array(rows, dtype=np.int64)
+        _, last_index = np.unique(records[::-1, 0], return_index=True)
+        return records[len(records) - 1 - last_index]
+
+    @staticmethod
+    def _reset_reason(existing: np.ndarray, incoming: np.ndarray) -> Optional[str]:
+        """
+        저장 구간을 버리고 응답으로 교체해야 하는 이유 (없으면 None)
+
+        - 응답이 저장 구간과 겹치지 않음: 사이에 빠진 봉(세션)이 있는지 알 수 없음
+        - 겹치는 확정 봉(마지막 저장 봉 이전)의 값이 다름: 수정주가 기준이 바뀌어
+          저장된 과거 구간 전체가 이전 기준
+        """
+        if incoming[-1, 0] < existing[0, 0] or incoming[0, 0] > existing[-1, 0]:
+            return '저장 구간과 겹치지 않음 (누락 구간 확인 불가)'
+
+        confirmed = incoming[incoming[:, 0] < existing[-1, 0]]
+        if len(confirmed):
+            index = np.searchsorted(existing[:, 0], confirmed[:, 0])
+            stored = np.asarray(existing[index])
+            matched = stored[:, 0] == confirmed[:, 0]
+            if np.any(stored[matched] != confirmed[matched]):
+                return '저장된 확정 봉과 값이 다름 (수정주가 기준 변경)'
+        return None
+
+    def _rewrite(self, path: Path, records: np.ndarray):
+        """파일 전체를 원자적으로 교체 (memmap 해제 후)"""
+        self._maps.pop(path, None)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(np.ascontiguousarray(records).tobytes())
+        os.replace(tmp_path, path)
+
+    def merge(self, stock_code: str, timeframe: str, bars: List[Dict[str, Any]]) -> int:
+        """
+        봉 데이터 병합 저장
+
+        마지막 저장 봉 이후는 append, 마지막 봉은 제자리 갱신하고,
+        과거 구간이 섞여 있으면 전체를 다시 써서 정렬 / 중복을 정리한다.
+        응답이 저장 구간과 이어지지 않거나 수정주가 기준이 바뀌었으면 저장 구간을
+        응답으로 교체한다 (이전 구간은 다음 조회 때 covers 확인으로 다시 받음).
+
+        Returns:
+            새로 추가된 봉 수 (교체한 경우 새로 쓴 봉 수)
+        """
+        incoming = self._to_records(bars, timeframe)
+        path = self.path(stock_code, timeframe)
+
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existing = self._records(path)
+
+            reason = self._reset_reason(existing, incoming) if len(existing) and len(incoming) else None
+            if reason:
+                logger.info(f"{stock_code} {timeframe} 저장 구간 교체: {reason}")
+                del existing
+                self._rewrite(path, incoming)
+                self._history_start.pop(path, None)
+                self.resets += 1
+                self.rows_written += len(incoming)
+                return len(incoming)
+
+            last_ts = int(existing[-1, 0]) if len(existing) else None
+            if last_ts is not None and len(incoming):
+                # 이미 저장된 과거 봉은 확정 데이터 → 없는 구간이 있을 때만 백필
+                older = incoming[:, 0] < last_ts
+                if older.any() and np.isin(incoming[older, 0], existing[:, 0]).all():
+                    incoming = incoming[~older]
+
+            if not len(incoming):
+                if path.exists():
+                    os.utime(path)  # 동기화 시각 갱신
+                return 0
+
+            if last_ts is None or incoming[0, 0] >= last_ts:
+                # 빠른 경로: 마지막 봉 제자리 갱신 + 새 봉 append
+                overwrite = last_ts is not None and incoming[0, 0] == last_ts
+                with open(path, 'r+b' if last_ts is not None else 'wb') as f:
+                    if overwrite:
+                        f.seek((len(existing) - 1) * RECORD_SIZE)
+                    else:
+                        f.seek(0, os.SEEK_END)
+                    f.write(np.ascontiguousarray(incoming).tobytes())
+                added = len(incoming) - int(overwrite)
+            else:
+                # 과거 구간 백필: 병합 후 원자적 교체 (새 데이터 우선)
+                combined = np.concatenate([incoming, np.asarray(existing)])
+                _, first_index = np.unique(combined[:, 0], return_index=True)
+                merged = combined[first_index]
+                added = len(merged) - len(existing)
+
+                del existing
+                self._rewrite(path, merged)
+
+            self.rows_written += max(added, 0)
+            return added
+
+    def is_fresh(self, stock_code: str, timeframe: str, min_date: str, max_age: float = 0) -> bool:
+        """
+        로컬 데이터만으로 min_date까지 응답 가능한지 확인
+
+        - min_date 이후 봉이 이미 있으면 min_date까지는 확정
+        - min_date 장 마감 이후에 동기화했으면 (휴장일 포함) 더 받을 봉이 없음
+        - 마지막 동기화가 max_age초 이내면 장중이라도 재사용
+        """
+        last_ts = self.last_timestamp(stock_code, timeframe)
+        synced_at = self.last_synced(stock_code, timeframe)
+        if last_ts is None or synced_at is None:
+            return False
+
+        if str(last_ts)[:8] > min_date:
+            return True
+
+        synced = datetime.fromtimestamp(synced_at)
+        synced_date = synced.strftime('%Y%m%d')
+        if synced_date > min_date or (synced_date == min_date and synced.strftime('%H%M%S') >= self.session_close):
+            return True
+
+        return bool(max_age) and time.time() - synced_at < max_age
+
+    def sync(
+        self,
+        stock_code: str,
+        timeframe: str,
+        fetch: Callable[[], List[Dict[str, Any]]],
+        count: Optional[int] = None,
+        min_date: Optional[str] = None,
+        end: Optional[int] = None,
+        max_age: float = 60,
+        start: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        로컬 우선 조회 + 필요 시 증분 동기화
+
+        min_date까지 최신이고 저장 구간이 요청 구간(start / 최근 count개)을 포함할 때만
+        로컬 데이터로 응답한다.
+
+        Args:
+            stock_code: 종목코드
+            timeframe: 'daily' / 'minute1' ...
+            fetch: 최신 봉 리스트를 반환하는 API 호출 함수 (로컬이 오래된 경우만 호출)
+            count: 반환할 최근 봉 수 (None이면 전체)
+            min_date: 응답에 반드시 포함되어야 하는 날짜 (YYYYMMDD)
+            end: 이 timestamp 이하만 반환
+            max_age: 장중 재사용 허용 시간 (초)
+            start: 응답 구간에 포함되어야 하는 가장 이른 timestamp (None이면 확인 안 함)
+
+        Returns:
+            최신순 봉 리스트
+        """
+        if (min_date and self.is_fresh(stock_code, timeframe, min_date, max_age)
+                and self.covers(stock_code, timeframe, count, start, end)):
+            self.hits += 1
+            return self.read_bars(stock_code, timeframe, count, end)
+
+        self.syncs += 1
+        try:
+            bars = fetch()
+        except Exception as e:
+            self.fetch_errors += 1
+            logger.warning(f"⚠️ {stock_code} {timeframe} 동기화 실패, 로컬 데이터 사용: {e}")
+            bars = []
+
+        if bars:
+            added = self.merge(stock_code, timeframe, bars)
+            logger.debug(f"{stock_code} {timeframe} 동기화: +{added}봉")
+
+            # 방금 받은 응답으로도 부족하면 API가 가진 과거 구간의 끝 → 다음부터 재요청하지 않음
+            if not self.covers(stock_code, timeframe, count, start, end):
+                with self._lock:
+                    records = self._records(self.path(stock_code, timeframe))
+                    if len(records):
+                        self._history_start[self.path(stock_code, timeframe)] = int(records[0, 0])
+
+        return self.read_bars(stock_code, timeframe, count, end)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계 (로컬 응답 비율)"""
+        total = self.hits + self.syncs
+        return {
+            'root': str(self.root),
+            'hits': self.hits,
+            'syncs': self.syncs,
+            'hit_rate': self.hits / total if total else 0.0,
+            'fetch_errors': self.fetch_errors,
+            'rows_written': self.rows_written,
+            'resets': self.resets,
+            'mapped_files': len(self._maps),
+        }
+
+
+# Global store instance
+_global_store = None
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """전역 OHLCV 저장소 반환 (싱글톤)"""
+    global _global_store
+    if _global_store is None:
+        _global_store = OHLCVStore()
+    return _global_store
+
+
+__all__ = ['OHLCVStore', 'get_ohlcv_store', 'minute_timeframe', 'FIELDS', 'DAILY']
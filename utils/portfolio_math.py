@@ -0,0 +1,855 @@
+"""
+utils/portfolio_math.py
+평균-분산 포트폴리오 수치 해석 공통 모듈
+
+strategy.portfolio_optimizer / ai.portfolio_optimization / features.portfolio_optimizer 가
+같은 구현을 공유한다. (numpy 만 사용)
+
+- 공분산 수축: Ledoit-Wolf (표본 공분산 → 스케일 항등행렬)
+- 최소분산: 제약이 걸리지 않으면 닫힌 해 Σ⁻¹1 / 1ᵀΣ⁻¹1, 걸리면 박스 제약 QP
+- 최대 샤프: 접점 조건 γ = σ²/(μ-rf)ᵀw 고정점 반복 + 웜 스타트 QP
+- 목표 수익률 / 효율적 투자선: 위험회피 계수 γ 에 대한 regula falsi, 해를 재사용하는 스윕
+- 리스크 패리티: 로그 장벽 볼록 문제 (Spinu) 에 대한 감쇠 Newton 반복
+
+제약 집합은 {Σw = 1, lower ≤ w ≤ upper} (capped simplex) 이며, 투영은
+구간별 선형 방정식에 대한 Newton 반복이라 O(n) 벡터 연산 몇 번으로 끝난다.
+공매도 허용(상/하한 없음) 시에는 모두 닫힌 해를 사용한다.
+"""
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# QP 수렴 기준 (비중 변화량의 최대 절대값)
+QP_TOLERANCE = 1e-10
+QP_MAX_ITER = 20000
+
+# 목표 수익률 탐색 허용 오차
+RETURN_TOLERANCE = 1e-10
+
+
+# ============================================================================
+# 공분산 / 제약 헬퍼
+# ============================================================================
+
+def shrink_covariance(returns: np.ndarray,
+                      annualization: float = 1.0) -> Tuple[np.ndarray, float]:
+    """
+    Ledoit-Wolf 공분산 수축
+
+    Args:
+        returns: 수익률 매트릭스 (time, assets)
+        annualization: 연간화 배수 (일간 수익률이면 252)
+
+    Returns:
+        (수축 공분산 매트릭스, 수축 강도 0~1)
+    """
+    x = np.asarray(returns, dtype=float)
+    if x.ndim != 2 or x.shape[0] < 2:
+        raise ValueError(f"returns must be (time >= 2, assets), got {x.shape}")
+
+    t, n = x.shape
+    x = x - x.mean(axis=0)
+    sample = x.T @ x / t
+
+    mu = np.trace(sample) / n
+    target = np.eye(n) * mu
+
+    d2 = float(np.sum((sample - target) ** 2))
+    row_sq = np.einsum('ij,ij->i', x, x)
+    b2 = (float(np.sum(row_sq ** 2)) / t - float(np.sum(sample ** 2))) / t
+    b2 = min(max(b2, 0.0), d2)
+
+    shrinkage = b2 / d2 if d2 > 0 else 1.0
+    shrunk = shrinkage * target + (1.0 - shrinkage) * sample
+
+    # np.cov(ddof=1) 과 같은 스케일
+    shrunk *= t / (t - 1)
+
+    return shrunk * annualization, float(shrinkage)
+
+
+def correlation_from_covariance(cov: np.ndarray) -> np.ndarray:
+    """공분산 → 상관계수 매트릭스"""
+    std = np.sqrt(np.clip(np.diag(cov), 1e-18, None))
+    corr = cov / np.outer(std, std)
+    np.fill_diagonal(corr, 1.0)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def weight_bounds(num_assets: int,
+                  min_weight: float = 0.0,
+                  max_weight: float = 1.0,
+                  allow_short: bool = False) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    종목 비중 상/하한 벡터
+
+    공매도 허용 시 (None, None) 을 반환하며 각 솔버는 닫힌 해를 사용한다.
+    합이 1 이 될 수 없는 한도 (예: 2종목에 max 0.3) 는 균등 비중까지 완화한다.
+    """
+    if allow_short:
+        return None, None
+
+    lower = max(float(min_weight), 0.0)
+    upper = min(float(max_weight), 1.0)
+
+    if upper * num_assets < 1.0:
+        upper = 1.0 / num_assets
+    if lower * num_assets > 1.0:
+        lower = 1.0 / num_assets
+
+    return np.full(num_assets, lower), np.full(num_assets, upper)
+
+
+def portfolio_stats(weights: np.ndarray, expected_returns: np.ndarray,
+                    cov_matrix: np.ndarray,
+                    risk_free_rate: float = 0.0) -> Tuple[float, float, float]:
+    """(수익률, 변동성, 샤프 비율)"""
+    ret = float(weights @ expected_returns)
+    vol = float(np.sqrt(max(weights @ cov_matrix @ weights, 0.0)))
+    sharpe = (ret - risk_free_rate) / (vol + 1e-10)
+    return ret, vol, sharpe
+
+
+def project_capped_simplex(v: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                           total: float = 1.0, max_iter: int = 100) -> np.ndarray:
+    """
+    {Σw = total, lower ≤ w ≤ upper} 위로의 유클리드 투영
+
+    w = clip(v - τ, lower, upper) 에서 Σw(τ) 는 τ 에 대해 단조 감소하는 구간별
+    선형 함수이므로, 브래킷으로 보호한 Newton 반복으로 τ 를 정확히 찾는다.
+    """
+    tau = (float(v.sum()) - total) / len(v)
+    lo = float(np.min(v - upper))
+    hi = float(np.max(v - lower))
+
+    for _ in range(max_iter):
+        shifted = v - tau
+        w = np.minimum(np.maximum(shifted, lower), upper)
+        excess = float(w.sum()) - total
+        if abs(excess) <= 1e-13 * max(1.0, abs(total)):
+            break
+
+        if excess > 0:
+            lo = tau
+        else:
+            hi = tau
+
+        free = np.count_nonzero((shifted > lower) & (shifted < upper))
+        candidate = tau + excess / free if free else 0.5 * (lo + hi)
+        tau = candidate if lo < candidate < hi else 0.5 * (lo + hi)
+
+    return w
+
+
+def _solve(matrix: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """선형 시스템 (특이 행렬이면 의사역행렬)"""
+    try:
+        return np.linalg.solve(matrix, rhs)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(matrix) @ rhs
+
+
+def _positive_definite(cov_matrix: np.ndarray) -> np.ndarray:
+    """
+    양의 정부호 보장 (표본 < 종목 수, 중복 종목 등으로 특이하면 대각 지터 추가)
+
+    활성 집합 KKT 시스템이 풀리도록 하기 위한 것으로, 정상 공분산은 그대로 반환한다.
+    """
+    scale = max(float(np.mean(np.diag(cov_matrix))), 1e-12)
+    jitter = 0.0
+    for _ in range(8):
+        candidate = cov_matrix if jitter == 0.0 else cov_matrix + np.eye(len(cov_matrix)) * jitter
+        try:
+            np.linalg.cholesky(candidate)
+            return candidate
+        except np.linalg.LinAlgError:
+            jitter = scale * 1e-10 if jitter == 0.0 else jitter * 100.0
+    return cov_matrix + np.eye(len(cov_matrix)) * scale * 1e-2
+
+
+def _tangent_lipschitz(q: np.ndarray, iters: int = 30) -> float:
+    """
+    Σw = 1 접평면 위에서 Q 의 최대 고유값 (거듭제곱법 추정)
+
+    시장 팩터처럼 1 방향에 몰린 고유값은 제약으로 사라지므로 전체 고유값보다
+    훨씬 작은 스텝 한계를 얻는다. 과소추정은 QP 백트래킹이 보정한다.
+    """
+    n = len(q)
+    v = np.cos(np.arange(n) * 1.618)
+    v -= v.mean()
+    norm = np.linalg.norm(v)
+    if norm == 0:
+        return float(np.max(np.diag(q))) or 1.0
+    v /= norm
+
+    lam = 0.0
+    for _ in range(iters):
+        w = q @ v
+        w -= w.mean()
+        new_lam = float(np.linalg.norm(w))
+        if new_lam == 0:
+            break
+        v = w / new_lam
+        if abs(new_lam - lam) <= 1e-6 * new_lam:
+            lam = new_lam
+            break
+        lam = new_lam
+
+    return max(lam, 1e-12)
+
+
+# ============================================================================
+# 활성 집합 (Critical Line) 구간
+# ============================================================================
+
+# 경계에 붙은 것으로 보는 거리
+ACTIVE_TOLERANCE = 1e-8
+
+
+class _FrontierSegment:
+    """
+    활성 집합이 고정된 효율적 투자선 한 구간
+
+    min ½wᵀQw − γμᵀw 의 해가 γ ∈ [gamma_lo, gamma_hi] 에서 w(γ) = α + γβ 로
+    선형이며, 구간 끝에서 막히는 제약(block_lo / block_hi)을 바꾸면 다음 구간이 된다.
+    """
+
+    __slots__ = ('alpha', 'beta', 'at_lo', 'at_up', 'gamma_lo', 'gamma_hi',
+                 'block_lo', 'block_hi', 'ret_base', 'ret_slope')
+
+    def __init__(self, alpha, beta, at_lo, at_up, gamma_lo, gamma_hi,
+                 block_lo, block_hi, mu):
+        self.alpha = alpha
+        self.beta = beta
+        self.at_lo = at_lo
+        self.at_up = at_up
+        self.gamma_lo = gamma_lo
+        self.gamma_hi = gamma_hi
+        self.block_lo = block_lo
+        self.block_hi = block_hi
+        self.ret_base = float(alpha @ mu)
+        self.ret_slope = float(beta @ mu)
+
+    def weights(self, gamma: float) -> np.ndarray:
+        if not np.isfinite(gamma) or not np.any(self.beta):
+            return self.alpha.copy()
+        return self.alpha + gamma * self.beta
+
+    def ret(self, gamma: float) -> float:
+        if not np.isfinite(gamma):
+            if abs(self.ret_slope) <= 1e-15:
+                return self.ret_base
+            return float(np.sign(gamma) * np.sign(self.ret_slope) * np.inf)
+        return self.ret_base + gamma * self.ret_slope
+
+    def contains(self, gamma: float) -> bool:
+        slack = 1e-9 * max(1.0, abs(gamma))
+        return self.gamma_lo - slack <= gamma <= self.gamma_hi + slack
+
+
+# 구간 끝에서 막히는 제약 종류
+BLOCK_TO_LOWER = 0   # 자유 변수가 하한에 닿음
+BLOCK_TO_UPPER = 1   # 자유 변수가 상한에 닿음
+BLOCK_RELEASE = 2    # 경계 변수의 승수가 0 → 자유 변수로
+
+
+def _gamma_interval(p: np.ndarray, q: np.ndarray, kinds: np.ndarray,
+                    index: np.ndarray) -> Optional[Tuple[float, float, Any, Any]]:
+    """p + γq ≥ 0 을 모두 만족하는 γ 구간과 양 끝에서 막히는 제약 (종류, 종목 인덱스)"""
+    if len(p) == 0:
+        return -np.inf, np.inf, None, None
+
+    eps = 1e-12 * max(1.0, float(np.max(np.abs(q))))
+    pos = q > eps
+    neg = q < -eps
+    flat = ~(pos | neg)
+    if np.any(p[flat] < -1e-9):
+        return None
+
+    gamma_lo, gamma_hi = -np.inf, np.inf
+    block_lo = block_hi = None
+    if np.any(pos):
+        ratios = -p[pos] / q[pos]
+        i = int(np.argmax(ratios))
+        gamma_lo = float(ratios[i])
+        j = int(np.flatnonzero(pos)[i])
+        block_lo = (int(kinds[j]), index[j])
+    if np.any(neg):
+        ratios = -p[neg] / q[neg]
+        i = int(np.argmin(ratios))
+        gamma_hi = float(ratios[i])
+        j = int(np.flatnonzero(neg)[i])
+        block_hi = (int(kinds[j]), index[j])
+
+    if gamma_lo > gamma_hi + 1e-9 * max(1.0, abs(gamma_hi)):
+        return None
+    return gamma_lo, gamma_hi, block_lo, block_hi
+
+
+def _build_segment(q: np.ndarray, mu: np.ndarray,
+                   lower: np.ndarray, upper: np.ndarray,
+                   at_lo: np.ndarray, at_up: np.ndarray) -> Optional[_FrontierSegment]:
+    """
+    주어진 활성 집합에서 KKT 시스템을 풀어 구간을 만든다
+
+    자유 변수 F: [Q_FF 1; 1ᵀ 0][w_F; ν] = [γμ_F − Q_FB w_B; 1 − Σw_B]
+    경계 변수의 승수 (Qw − γμ + ν)ᵢ 는 하한이면 ≥ 0, 상한이면 ≤ 0 이어야 한다.
+    """
+    fixed = (upper - lower) <= 1e-15
+    at_lo = at_lo | fixed
+    at_up = at_up & ~at_lo
+    free = ~(at_lo | at_up)
+    check_lo = np.flatnonzero(at_lo & ~fixed)
+    check_up = np.flatnonzero(at_up)
+
+    bound_values = np.where(at_lo, lower, np.where(at_up, upper, 0.0))
+    free_idx = np.flatnonzero(free)
+    k = len(free_idx)
+
+    if k == 0:
+        # 꼭짓점: 모든 비중이 경계 → ν 가 존재할 γ 구간 (모든 i∈lo, j∈up 쌍)
+        if abs(float(bound_values.sum()) - 1.0) > 1e-9:
+            return None
+        g0 = q @ bound_values
+        if check_lo.size and check_up.size:
+            p = (g0[check_lo][:, None] - g0[check_up][None, :]).ravel()
+            slope = (mu[check_up][None, :] - mu[check_lo][:, None]).ravel()
+            index = np.stack(np.meshgrid(check_lo, check_up, indexing='ij'), axis=-1).reshape(-1, 2)
+        else:
+            p = slope = np.empty(0)
+            index = np.empty((0, 2), dtype=int)
+        kinds = np.full(len(p), BLOCK_RELEASE)
+        interval = _gamma_interval(p, slope, kinds, index)
+        if interval is None:
+            return None
+        return _FrontierSegment(bound_values, np.zeros_like(mu), at_lo, at_up,
+                                *interval, mu)
+
+    kkt = np.empty((k + 1, k + 1))
+    kkt[:k, :k] = q[np.ix_(free_idx, free_idx)]
+    kkt[:k, k] = 1.0
+    kkt[k, :k] = 1.0
+    kkt[k, k] = 0.0
+
+    rhs = np.zeros((k + 1, 2))
+    rhs[:k, 0] = -(q[free_idx] @ bound_values)
+    rhs[k, 0] = 1.0 - float(bound_values.sum())
+    rhs[:k, 1] = mu[free_idx]
+
+    try:
+        sol = np.linalg.solve(kkt, rhs)
+    except np.linalg.LinAlgError:
+        return None
+
+    alpha = bound_values.copy()
+    alpha[free_idx] = sol[:k, 0]
+    beta = np.zeros_like(mu)
+    beta[free_idx] = sol[:k, 1]
+
+    grad_alpha = q @ alpha + sol[k, 0]
+    grad_beta = q @ beta - mu + sol[k, 1]
+
+    p = np.concatenate([alpha[free_idx] - lower[free_idx],
+                        upper[free_idx] - alpha[free_idx],
+                        grad_alpha[check_lo], -grad_alpha[check_up]])
+    slope = np.concatenate([beta[free_idx], -beta[free_idx],
+                            grad_beta[check_lo], -grad_beta[check_up]])
+    kinds = np.concatenate([np.full(k, BLOCK_TO_LOWER), np.full(k, BLOCK_TO_UPPER),
+                            np.full(len(check_lo) + len(check_up), BLOCK_RELEASE)])
+    index = np.concatenate([free_idx, free_idx, check_lo, check_up])
+
+    interval = _gamma_interval(p, slope, kinds, index)
+    if interval is None:
+        return None
+    return _FrontierSegment(alpha, beta, at_lo, at_up, *interval, mu)
+
+
+def _segment_from_weights(q: np.ndarray, mu: np.ndarray,
+                          lower: np.ndarray, upper: np.ndarray,
+                          weights: np.ndarray) -> Optional[_FrontierSegment]:
+    """근사해에서 활성 집합을 읽어 구간 생성"""
+    at_lo = weights - lower <= ACTIVE_TOLERANCE
+    at_up = (upper - weights <= ACTIVE_TOLERANCE) & ~at_lo
+    return _build_segment(q, mu, lower, upper, at_lo, at_up)
+
+
+def _pivot_segment(q: np.ndarray, mu: np.ndarray,
+                   lower: np.ndarray, upper: np.ndarray,
+                   segment: _FrontierSegment, direction: int) -> Optional[_FrontierSegment]:
+    """구간 끝의 막힌 제약을 바꿔 인접 구간으로 이동 (실패 시 None)"""
+    block = segment.block_hi if direction > 0 else segment.block_lo
+    edge = segment.gamma_hi if direction > 0 else segment.gamma_lo
+    if block is None or not np.isfinite(edge):
+        return None
+
+    kind, idx = block
+    at_lo = segment.at_lo.copy()
+    at_up = segment.at_up.copy()
+    if kind == BLOCK_TO_LOWER:
+        at_lo[idx] = True
+    elif kind == BLOCK_TO_UPPER:
+        at_up[idx] = True
+    else:
+        at_lo[idx] = False
+        at_up[idx] = False
+
+    nxt = _build_segment(q, mu, lower, upper, at_lo, at_up)
+    if nxt is None or not nxt.contains(edge):
+        return None
+
+    # 반대편으로 최소한 조금은 진행해야 한다 (퇴화 방지)
+    slack = 1e-12 * max(1.0, abs(edge))
+    if direction > 0 and nxt.gamma_hi <= edge + slack:
+        return None
+    if direction < 0 and nxt.gamma_lo >= edge - slack:
+        return None
+    return nxt
+
+
+# ============================================================================
+# 박스 제약 QP
+# ============================================================================
+
+def solve_box_qp(q: np.ndarray, c: np.ndarray,
+                 lower: np.ndarray, upper: np.ndarray,
+                 x0: Optional[np.ndarray] = None,
+                 lipschitz: Optional[float] = None,
+                 tol: float = QP_TOLERANCE,
+                 max_iter: int = QP_MAX_ITER) -> Tuple[np.ndarray, int]:
+    """
+    min ½xᵀQx − cᵀx   s.t.  Σx = 1, lower ≤ x ≤ upper
+
+    가속 투영 경사법 (FISTA + 적응형 재시작 + 스텝 백트래킹) 으로 활성 집합을
+    찾고, 찾은 활성 집합의 KKT 시스템을 풀어 정확한 해로 마무리(polish)한다.
+
+    Args:
+        x0: 초기값 (웜 스타트)
+        lipschitz: 스텝 한계 추정치 (없으면 거듭제곱법)
+
+    Returns:
+        (해, 반복 횟수)
+    """
+    step_limit = lipschitz if lipschitz is not None else _tangent_lipschitz(q)
+
+    x = np.full(len(c), 1.0 / len(c)) if x0 is None else np.asarray(x0, dtype=float)
+    x = project_capped_simplex(x, lower, upper)
+    y = x
+    momentum = 1.0
+    polish_at = 1e-6
+
+    iteration = 0
+    for iteration in range(1, max_iter + 1):
+        grad = q @ y - c
+
+        while True:
+            x_new = project_capped_simplex(y - grad / step_limit, lower, upper)
+            d = x_new - y
+            dd = float(d @ d)
+            if dd == 0.0 or float(d @ (q @ d)) <= step_limit * dd * (1 + 1e-9):
+                break
+            step_limit *= 2.0
+
+        diff = x_new - x
+        change = float(np.max(np.abs(diff)))
+
+        if change <= polish_at or change <= tol:
+            polish_at = change * 0.1
+            segment = _segment_from_weights(q, c, lower, upper, x_new)
+            if segment is not None and segment.contains(1.0):
+                return np.minimum(np.maximum(segment.weights(1.0), lower), upper), iteration
+            if change <= tol:
+                x = x_new
+                break
+
+        # 목적함수가 나빠지는 방향이면 모멘텀 리셋
+        if float(grad @ diff) > 0:
+            momentum = 1.0
+            y = x_new
+        else:
+            next_momentum = 0.5 * (1.0 + np.sqrt(1.0 + 4.0 * momentum * momentum))
+            y = x_new + ((momentum - 1.0) / next_momentum) * diff
+            momentum = next_momentum
+
+        x = x_new
+
+    return x, iteration
+
+
+class _FrontierWalker:
+    """
+    효율적 투자선 구간 탐색기
+
+    γ=0 (최소분산) 구간에서 시작해 필요한 방향으로 인접 구간을 이어 붙인다.
+    인접 구간은 막힌 제약 하나를 바꾸는 피벗으로 얻고, 퇴화로 피벗이 실패하면
+    경계 바로 너머의 γ 에서 직전 해로 웜 스타트한 QP 로 다시 잡는다.
+    """
+
+    def __init__(self, mu: np.ndarray, cov_matrix: np.ndarray,
+                 lower: np.ndarray, upper: np.ndarray):
+        self.mu = mu
+        self.cov = cov_matrix = _positive_definite(cov_matrix)
+        self.lower = lower
+        self.upper = upper
+        self.lipschitz = _tangent_lipschitz(cov_matrix)
+
+        w0 = min_variance_weights(cov_matrix, lower, upper)
+        self.gamma_scale = max(float(w0 @ cov_matrix @ w0), 1e-12) / max(float(np.ptp(mu)), 1e-12)
+        self.segments: List[_FrontierSegment] = [self._segment_at(0.0, w0)]
+        self.max_segments = 8 * len(mu) + 64
+
+    def _segment_at(self, gamma: float, x0: np.ndarray) -> _FrontierSegment:
+        weights, _ = solve_box_qp(self.cov, gamma * self.mu, self.lower, self.upper,
+                                  x0=x0, lipschitz=self.lipschitz)
+        segment = _segment_from_weights(self.cov, self.mu, self.lower, self.upper, weights)
+        if segment is None or not segment.contains(gamma):
+            # 활성 집합을 확정하지 못한 경우 점 구간으로 둔다
+            segment = _FrontierSegment(weights, np.zeros_like(weights),
+                                       weights - self.lower <= ACTIVE_TOLERANCE,
+                                       self.upper - weights <= ACTIVE_TOLERANCE,
+                                       gamma, gamma, None, None, self.mu)
+        return segment
+
+    def extend(self, direction: int) -> bool:
+        """한쪽 끝에 구간 추가 (더 나아갈 수 없으면 False)"""
+        if len(self.segments) >= self.max_segments:
+            return False
+
+        edge = self.segments[-1] if direction > 0 else self.segments[0]
+        gamma = edge.gamma_hi if direction > 0 else edge.gamma_lo
+        if not np.isfinite(gamma):
+            return False
+
+        nxt = _pivot_segment(self.cov, self.mu, self.lower, self.upper, edge, direction)
+        if nxt is None:
+            step = 1e-4 * max(abs(gamma), self.gamma_scale)
+            nxt = self._segment_at(gamma + direction * step, edge.weights(gamma))
+
+        if direction > 0:
+            if nxt.gamma_hi <= gamma:
+                return False
+            nxt.gamma_lo = max(nxt.gamma_lo, gamma)
+            self.segments.append(nxt)
+        else:
+            if nxt.gamma_lo >= gamma:
+                return False
+            nxt.gamma_hi = min(nxt.gamma_hi, gamma)
+            self.segments.insert(0, nxt)
+        return True
+
+    def weights_for_return(self, target: float) -> np.ndarray:
+        """목표 수익률의 최소분산 비중 (달성 불가면 양 끝으로 클램프)"""
+        while target < self.segments[0].ret(self.segments[0].gamma_lo) - RETURN_TOLERANCE:
+            if not self.extend(-1):
+                first = self.segments[0]
+                return first.weights(first.gamma_lo)
+        while target > self.segments[-1].ret(self.segments[-1].gamma_hi) + RETURN_TOLERANCE:
+            if not self.extend(+1):
+                last = self.segments[-1]
+                return last.weights(last.gamma_hi)
+
+        prev = None
+        for segment in self.segments:
+            r_lo = segment.ret(segment.gamma_lo)
+            r_hi = segment.ret(segment.gamma_hi)
+            if prev is not None and target < r_lo:
+                # 구간 사이 틈 (QP 로 건너뛴 짧은 구간) → 양 끝 선형 보간
+                p_gamma = prev.gamma_hi
+                p_ret = prev.ret(p_gamma)
+                frac = (target - p_ret) / (r_lo - p_ret) if r_lo > p_ret else 0.0
+                return (prev.weights(p_gamma)
+                        + frac * (segment.weights(segment.gamma_lo) - prev.weights(p_gamma)))
+            if target <= r_hi + RETURN_TOLERANCE:
+                slope = segment.ret_slope
+                if abs(slope) <= 1e-15:
+                    gamma = segment.gamma_lo if np.isfinite(segment.gamma_lo) else segment.gamma_hi
+                else:
+                    gamma = (target - segment.ret_base) / slope
+                    gamma = min(max(gamma, segment.gamma_lo), segment.gamma_hi)
+                return np.minimum(np.maximum(segment.weights(gamma), self.lower), self.upper)
+            prev = segment
+
+        last = self.segments[-1]
+        return last.weights(last.gamma_hi)
+
+    def max_sharpe(self, risk_free_rate: float) -> np.ndarray:
+        """
+        투자선 위 샤프 비율 최대점
+
+        한 구간 안에서 샤프 비율의 도함수 부호는 γ 의 일차식
+        h(γ) = (m_β·a − m_α·b) + γ(m_β·b − m_α·c) 로 정해지므로 (v = a + 2bγ + cγ²)
+        구간 안의 근은 닫힌 해로 구하고, 부호가 바깥을 가리키면 인접 구간으로 옮긴다.
+        β ≡ 0 인 퇴화 구간 (자유 종목이 하나뿐이라 비중이 상한/하한에 고정) 은 도함수가
+        0 이라 방향을 알려 주지 않으므로 진행 방향 (처음이면 수익률이 높아지는 쪽) 으로 통과한다.
+        """
+        idx = 0
+        direction = 0
+        for _ in range(self.max_segments):
+            segment = self.segments[idx]
+            alpha, beta = segment.alpha, segment.beta
+
+            if not np.any(np.abs(beta) > 1e-12):
+                step = direction if direction != 0 else 1
+                if step > 0 and idx == len(self.segments) - 1 and not self.extend(+1):
+                    return np.minimum(np.maximum(alpha, self.lower), self.upper)
+                if step < 0 and idx == 0 and not self.extend(-1):
+                    return np.minimum(np.maximum(alpha, self.lower), self.upper)
+                idx += 1 if step > 0 else (-1 if idx > 0 else 0)
+                direction = step
+                continue
+
+            m_a = float(alpha @ self.mu) - risk_free_rate
+            m_b = float(beta @ self.mu)
+            cov_alpha = self.cov @ alpha
+            a = float(alpha @ cov_alpha)
+            b = float(beta @ cov_alpha)
+            c = float(beta @ self.cov @ beta)
+
+            def slope_sign(gamma: float) -> float:
+                return (m_b * a - m_a * b) + gamma * (m_b * b - m_a * c)
+
+            lo, hi = segment.gamma_lo, segment.gamma_hi
+            if np.isfinite(hi) and slope_sign(hi) > 0 and direction >= 0:
+                if idx == len(self.segments) - 1 and not self.extend(+1):
+                    return segment.weights(hi)
+                idx += 1
+                direction = 1
+                continue
+            if np.isfinite(lo) and slope_sign(lo) < 0 and direction <= 0:
+                if idx == 0:
+                    if not self.extend(-1):
+                        return segment.weights(lo)
+                else:
+                    idx -= 1
+                direction = -1
+                continue
+
+            denom = m_b * b - m_a * c
+            if abs(denom) <= 1e-18:
+                gamma = hi if np.isfinite(hi) else (lo if np.isfinite(lo) else 0.0)
+            else:
+                gamma = (m_a * b - m_b * a) / denom
+                gamma = min(max(gamma, lo), hi)
+            return np.minimum(np.maximum(segment.weights(gamma), self.lower), self.upper)
+
+        segment = self.segments[idx]
+        return segment.weights(segment.gamma_hi if direction > 0 else segment.gamma_lo)
+
+
+# ============================================================================
+# 최적화 목표별 솔버
+# ============================================================================
+
+def min_variance_weights(cov_matrix: np.ndarray,
+                         lower: Optional[np.ndarray] = None,
+                         upper: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    최소분산 포트폴리오
+
+    닫힌 해 Σ⁻¹1 / 1ᵀΣ⁻¹1 이 상/하한을 만족하면 그대로 최적해이고,
+    아니면 닫힌 해에서 웜 스타트한 박스 제약 QP 로 푼다.
+    """
+    n = len(cov_matrix)
+    cov_matrix = _positive_definite(cov_matrix)
+    inv_ones = _solve(cov_matrix, np.ones(n))
+    total = float(inv_ones.sum())
+    closed = inv_ones / total if abs(total) > 1e-18 else np.full(n, 1.0 / n)
+
+    if lower is None or upper is None:
+        return closed
+    if np.all(closed >= lower - 1e-12) and np.all(closed <= upper + 1e-12):
+        return np.minimum(np.maximum(closed, lower), upper)
+
+    weights, _ = solve_box_qp(cov_matrix, np.zeros(n), lower, upper, x0=closed)
+    return weights
+
+
+def mean_variance_weights(expected_returns: np.ndarray, cov_matrix: np.ndarray,
+                          risk_tolerance: float,
+                          lower: Optional[np.ndarray] = None,
+                          upper: Optional[np.ndarray] = None,
+                          x0: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    min ½wᵀΣw − γ μᵀw  (γ = risk_tolerance, 효율적 투자선의 매개변수)
+    """
+    n = len(expected_returns)
+    if lower is None or upper is None:
+        inv_ones = _solve(cov_matrix, np.ones(n))
+        inv_mu = _solve(cov_matrix, expected_returns)
+        # 라그랑주 승수로 Σw = 1 을 맞춘다
+        nu = (1.0 - risk_tolerance * inv_mu.sum()) / inv_ones.sum()
+        return risk_tolerance * inv_mu + nu * inv_ones
+
+    weights, _ = solve_box_qp(cov_matrix, risk_tolerance * expected_returns,
+                              lower, upper, x0=x0)
+    return weights
+
+
+def max_sharpe_weights(expected_returns: np.ndarray, cov_matrix: np.ndarray,
+                       risk_free_rate: float = 0.0,
+                       lower: Optional[np.ndarray] = None,
+                       upper: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    최대 샤프 비율 (접점) 포트폴리오
+
+    공매도 허용 시 닫힌 해 Σ⁻¹(μ − rf) 를 정규화하고, 상/하한이 있으면
+    최소분산 구간에서 출발해 효율적 투자선 구간을 따라 샤프 비율 최대점을 찾는다.
+    한도 안에서 양의 샤프 비율이 불가능하면 해석적 그래디언트 상승으로 대신한다.
+    """
+    mu = np.asarray(expected_returns, dtype=float)
+    excess = mu - risk_free_rate
+
+    if lower is None or upper is None:
+        raw = _solve(cov_matrix, excess)
+        total = float(raw.sum())
+        if total <= 1e-18:
+            return min_variance_weights(cov_matrix)
+        return raw / total
+
+    walker = _FrontierWalker(mu, cov_matrix, lower, upper)
+    if float(np.max(excess)) > 0:
+        weights = walker.max_sharpe(risk_free_rate)
+        if portfolio_stats(weights, mu, cov_matrix, risk_free_rate)[2] > 0:
+            return weights
+    else:
+        weights = walker.segments[0].weights(0.0)
+
+    # 양의 샤프가 불가능하면 최적점이 투자선 위에 있지 않다 → 직접 경사 상승
+    candidates = [_sharpe_ascent(mu, cov_matrix, risk_free_rate, lower, upper, x0)
+                  for x0 in (weights, walker.weights_for_return(float(np.max(mu))))]
+    return max(candidates, key=lambda w: portfolio_stats(w, mu, cov_matrix, risk_free_rate)[2])
+
+
+def _sharpe_ascent(mu: np.ndarray, cov_matrix: np.ndarray, risk_free_rate: float,
+                   lower: np.ndarray, upper: np.ndarray, x0: np.ndarray,
+                   max_iter: int = 5000) -> np.ndarray:
+    """
+    샤프 비율 투영 경사 상승 (Armijo 백트래킹)
+
+    해석적 그래디언트 ∇S = μ/σ − (μᵀw − rf)·Σw/σ³ 를 사용한다. (Σw = 1 이므로 rf 항은 상수)
+    """
+    def sharpe(w: np.ndarray) -> float:
+        return portfolio_stats(w, mu, cov_matrix, risk_free_rate)[2]
+
+    w = project_capped_simplex(np.asarray(x0, dtype=float), lower, upper)
+    value = sharpe(w)
+    step = 1.0
+
+    for _ in range(max_iter):
+        cov_w = cov_matrix @ w
+        sigma = np.sqrt(max(float(w @ cov_w), 1e-18))
+        grad = mu / sigma - (float(w @ mu) - risk_free_rate) * cov_w / sigma ** 3
+
+        while step > 1e-16:
+            candidate = project_capped_simplex(w + step * grad, lower, upper)
+            new_value = sharpe(candidate)
+            if new_value >= value + 1e-4 * float(grad @ (candidate - w)):
+                break
+            step *= 0.5
+        else:
+            break
+
+        if float(np.max(np.abs(candidate - w))) <= 1e-12:
+            w = candidate
+            break
+        w, value = candidate, new_value
+        step *= 2.0
+
+    return w
+
+
+def efficient_frontier_weights(expected_returns: np.ndarray, cov_matrix: np.ndarray,
+                               target_returns: Sequence[float],
+                               lower: Optional[np.ndarray] = None,
+                               upper: Optional[np.ndarray] = None) -> List[np.ndarray]:
+    """
+    목표 수익률별 최소분산 비중 (효율적 투자선 스윕)
+
+    상/하한이 있으면 최소분산 구간에서 시작해 활성 집합 구간을 이어 가며
+    (critical line) 각 목표 수익률을 구간 내 선형식으로 정확히 푼다.
+    한 번 만든 구간은 다음 목표에 그대로 재사용된다.
+    달성 불가능한 목표는 가능한 최소/최대 수익률로 클램프한다.
+
+    Returns:
+        target_returns 순서대로의 비중 리스트
+    """
+    mu = np.asarray(expected_returns, dtype=float)
+    targets = [float(t) for t in target_returns]
+    n = len(mu)
+
+    if lower is None or upper is None:
+        # 두 펀드 정리: w(r) = [(C - rB)Σ⁻¹1 + (rA - B)Σ⁻¹μ] / D
+        inv_ones = _solve(cov_matrix, np.ones(n))
+        inv_mu = _solve(cov_matrix, mu)
+        a = float(inv_ones.sum())
+        b = float(inv_mu.sum())
+        c = float(mu @ inv_mu)
+        d = a * c - b * b
+        if abs(d) <= 1e-18:
+            base = inv_ones / a
+            return [base.copy() for _ in targets]
+        return [((c - r * b) * inv_ones + (r * a - b) * inv_mu) / d for r in targets]
+
+    walker = _FrontierWalker(mu, cov_matrix, lower, upper)
+    return [walker.weights_for_return(target) for target in targets]
+
+
+def target_return_weights(expected_returns: np.ndarray, cov_matrix: np.ndarray,
+                          target_return: float,
+                          lower: Optional[np.ndarray] = None,
+                          upper: Optional[np.ndarray] = None) -> np.ndarray:
+    """목표 수익률 제약 하 최소분산 비중"""
+    return efficient_frontier_weights(expected_returns, cov_matrix, [target_return],
+                                      lower, upper)[0]
+
+
+def risk_parity_weights(cov_matrix: np.ndarray,
+                        risk_budget: Optional[np.ndarray] = None,
+                        tol: float = 1e-10, max_iter: int = 100) -> np.ndarray:
+    """
+    리스크 패리티 (위험 기여도 = risk_budget)
+
+    min ½yᵀΣy − Σ bᵢ log yᵢ 의 해를 정규화하면 wᵢ(Σw)ᵢ ∝ bᵢ 를 만족한다.
+    볼록 문제이므로 양수 영역을 유지하는 감쇠 Newton 반복으로 푼다.
+    """
+    n = len(cov_matrix)
+    b = np.full(n, 1.0 / n) if risk_budget is None else np.asarray(risk_budget, dtype=float)
+    b = b / b.sum()
+
+    # 역변동성 비중에서 시작 (분산 스케일을 맞춰 두면 반복이 짧다)
+    y = 1.0 / np.sqrt(np.clip(np.diag(cov_matrix), 1e-18, None))
+    y *= np.sqrt(1.0 / max(float(y @ cov_matrix @ y), 1e-18))
+
+    def objective(v: np.ndarray) -> float:
+        return 0.5 * float(v @ cov_matrix @ v) - float(b @ np.log(v))
+
+    value = objective(y)
+    for _ in range(max_iter):
+        grad = cov_matrix @ y - b / y
+        hessian = cov_matrix + np.diag(b / (y * y))
+        delta = _solve(hessian, grad)
+
+        decrement = float(grad @ delta)
+        if decrement <= tol:
+            break
+
+        step = 1.0
+        # 양수 영역 유지
+        negative = delta > 0
+        if np.any(negative):
+            step = min(1.0, 0.99 * float(np.min(y[negative] / delta[negative])))
+
+        while step > 1e-12:
+            candidate = y - step * delta
+            new_value = objective(candidate)
+            if new_value <= value - 0.25 * step * decrement:
+                break
+            step *= 0.5
+
+        y = candidate
+        value = new_value
+
+    return y / y.sum()
@@ -9,6 +9,8 @@ import numpy as np
 import logging
 from collections import defaultdict
 
+from utils.portfolio_math import correlation_from_covariance
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,6 +117,139 @@ class PortfolioRiskMetrics:
     calculated_at: str
 
 
+def build_returns_matrix(price_histories: Dict[str, List[Dict[str, Any]]],
+                         min_length: int = 20) -> Tuple[List[str], np.ndarray]:
+    """
+    종목별 가격 히스토리 → 정렬된 (time × asset) 일간 수익률 행렬
+
+    모든 히스토리가 같은 최근 시점에서 끝난다고 보고, 가장 짧은 히스토리 길이에
+    맞춰 최근 구간(꼬리)을 잘라 정렬한다. min_length 미만 종목은 제외한다.
+
+    Returns:
+        (종목 코드 목록, 수익률 행렬)
+    """
+    stock_codes = [code for code, history in price_histories.items() if len(history) >= min_length]
+    if not stock_codes:
+        return [], np.empty((0, 0))
+
+    length = min(len(price_histories[code]) for code in stock_codes)
+    closes = np.array([[bar['close'] for bar in price_histories[code][-length:]]
+                       for code in stock_codes], dtype=float).T
+
+    return stock_codes, np.diff(closes, axis=0) / closes[:-1]
+
+
+class RollingReturnWindow:
+    """
+    종목 수익률 이동 창 (최근 window개 봉 × 종목)
+
+    새 봉이 들어오면 가장 오래된 행을 빼고 새 행을 더하는 방식으로 합(Σr)과
+    교차곱(Σrrᵀ)을 O(N²) 에 갱신한다 (전체 재계산은 O(T·N²)).
+    누적 부동소수점 오차는 window번 갱신될 때마다 전체 재계산으로 정리한다.
+
+    Usage:
+        window = RollingReturnWindow.from_price_histories(histories, window=60)
+        window.push_prices({'005930': 71200, ...})   # 새 종가가 나올 때마다
+        analyzer.analyze_portfolio_risk(positions, value, {}, rolling_window=window)
+    """
+
+    def __init__(self, stock_codes: List[str], window: int = 60):
+        """
+        Args:
+            stock_codes: 종목 코드 (열 순서)
+            window: 창 크기 (봉 개수)
+        """
+        self.stock_codes = list(stock_codes)
+        self.window = window
+        self.count = 0
+
+        n = len(self.stock_codes)
+        self._buffer = np.zeros((window, n))
+        self._pos = 0
+        self._sum = np.zeros(n)
+        self._cross = np.zeros((n, n))
+        self._since_refresh = 0
+        self._last_prices: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_price_histories(cls, price_histories: Dict[str, List[Dict[str, Any]]],
+                             window: int = 60) -> 'RollingReturnWindow':
+        """가격 히스토리로 창을 채운 인스턴스 (마지막 종가를 기준가로 기억)"""
+        stock_codes, returns_matrix = build_returns_matrix(price_histories)
+        rolling = cls(stock_codes, window)
+
+        for row in returns_matrix[-window:]:
+            rolling.push(row)
+        if stock_codes:
+            rolling._last_prices = np.array(
+                [float(price_histories[code][-1]['close']) for code in stock_codes]
+            )
+        return rolling
+
+    def push(self, returns_row: np.ndarray) -> None:
+        """수익률 한 행 추가 (창이 차 있으면 가장 오래된 행 제거)"""
+        row = np.asarray(returns_row, dtype=float)
+
+        if self.count == self.window:
+            oldest = self._buffer[self._pos]
+            self._sum -= oldest
+            self._cross -= np.outer(oldest, oldest)
+        else:
+            self.count += 1
+
+        self._buffer[self._pos] = row
+        self._sum += row
+        self._cross += np.outer(row, row)
+        self._pos = (self._pos + 1) % self.window
+
+        self._since_refresh += 1
+        if self._since_refresh >= self.window:
+            self._refresh()
+
+    def push_prices(self, prices: Dict[str, float]) -> bool:
+        """
+        새 종가 반영 (종목 코드 → 가격, 빠진 종목은 직전 가격 유지 = 수익률 0)
+
+        Returns:
+            수익률 행이 추가되었는지 (첫 호출은 기준가만 저장)
+        """
+        current = np.array([prices.get(code, np.nan) for code in self.stock_codes], dtype=float)
+
+        if self._last_prices is None:
+            self._last_prices = current
+            return False
+
+        current = np.where(np.isnan(current) | (current <= 0), self._last_prices, current)
+        self.push(current / self._last_prices - 1)
+        self._last_prices = current
+        return True
+
+    def returns_matrix(self) -> np.ndarray:
+        """시간순 (count × 종목) 수익률 행렬"""
+        if self.count < self.window:
+            return self._buffer[:self.count].copy()
+        return np.concatenate((self._buffer[self._pos:], self._buffer[:self._pos]))
+
+    def mean(self) -> np.ndarray:
+        """종목별 평균 수익률 (일간)"""
+        return self._sum / max(self.count, 1)
+
+    def covariance(self) -> np.ndarray:
+        """공분산 매트릭스 (일간, ddof=0)"""
+        if self.count == 0:
+            return np.zeros_like(self._cross)
+        mean = self.mean()
+        cov = self._cross / self.count - np.outer(mean, mean)
+        return (cov + cov.T) / 2
+
+    def _refresh(self) -> None:
+        """누적 오차 정리 (창 전체로 합/교차곱 재계산)"""
+        rows = self._buffer[:self.count]
+        self._sum = rows.sum(axis=0)
+        self._cross = rows.T @ rows
+        self._since_refresh = 0
+
+
 class RiskAnalyzer:
     """
     포괄적인 리스크 분석 시스템
@@ -284,21 +419,27 @@ class RiskAnalyzer:
     def analyze_portfolio_risk(self, positions: List[Dict[str, Any]],
                                portfolio_value: float,
                                price_histories: Dict[str, List[Dict[str, Any]]],
-                               correlation_matrix: Optional[Dict[str, Dict[str, float]]] = None) -> PortfolioRiskMetrics:
+                               correlation_matrix: Optional[Dict[str, Dict[str, float]]] = None,
+                               rolling_window: Optional[RollingReturnWindow] = None) -> PortfolioRiskMetrics:
         """
         포트폴리오 리스크 분석
 
+        정렬된 (time × asset) 수익률 행렬을 호출당 한 번 만들고, 모든 포트폴리오
+        지표를 행렬 연산으로 계산한다. 매 사이클 호출할 때는 rolling_window 를
+        넘기면 히스토리 재구성 없이 증분 갱신된 공분산을 그대로 사용한다.
+
         Args:
             positions: 포지션 목록 [{'stock_code': '', 'value': float, ...}]
             portfolio_value: 포트폴리오 총 가치
-            price_histories: 종목별 가격 데이터
+            price_histories: 종목별 가격 데이터 (rolling_window 사용 시 무시)
             correlation_matrix: 상관관계 매트릭스 (optional)
+            rolling_window: 증분 갱신 수익률 창 (optional)
 
         Returns:
             PortfolioRiskMetrics
         """
-        logger.info(f"Analyzing portfolio risk: {len(positions)} positions, "
-                   f"value={portfolio_value:,.0f}")
+        logger.debug(f"Analyzing portfolio risk: {len(positions)} positions, "
+                     f"value={portfolio_value:,.0f}")
 
         if not positions:
             return self._empty_portfolio_metrics(portfolio_value)
@@ -306,35 +447,37 @@ class RiskAnalyzer:
         # Calculate weights
         weights = {p['stock_code']: p['value'] / portfolio_value for p in positions}
 
-        # Calculate individual returns and volatilities
-        stock_returns = {}
-        stock_vols = {}
-
-        for stock_code, history in price_histories.items():
-            if len(history) < 20:
-                continue
-
-            closes = np.array([h['close'] for h in history])
-            returns = np.diff(closes) / closes[:-1]
+        # Aligned (time × asset) returns, built once
+        if rolling_window is not None and rolling_window.count >= 2:
+            stock_codes = rolling_window.stock_codes
+            returns_matrix = rolling_window.returns_matrix()
+            cov_matrix = rolling_window.covariance()
+        else:
+            stock_codes, returns_matrix = build_returns_matrix(price_histories)
+            cov_matrix = (np.atleast_2d(np.cov(returns_matrix, rowvar=False, ddof=0))
+                          if stock_codes else np.empty((0, 0)))
 
-            stock_returns[stock_code] = returns
-            stock_vols[stock_code] = np.std(returns) * np.sqrt(252)
+        weight_vector = np.array([weights.get(code, 0.0) for code in stock_codes])
+        stock_vols = np.sqrt(np.clip(np.diag(cov_matrix), 0, None) * 252)
 
         # Build correlation matrix if not provided
         if correlation_matrix is None:
-            correlation_matrix = self._build_correlation_matrix(stock_returns)
+            corr = correlation_from_covariance(cov_matrix) if stock_codes else cov_matrix
+            correlation_matrix = self._correlation_to_dict(stock_codes, corr)
+        else:
+            corr = self._correlation_from_dict(stock_codes, correlation_matrix)
 
         # === PORTFOLIO VAR ===
         portfolio_var_95, portfolio_var_99 = self._calculate_portfolio_var(
-            weights, stock_vols, stock_returns, correlation_matrix
-        )
-        portfolio_cvar_95 = self._calculate_portfolio_cvar(
-            weights, stock_returns, confidence=0.95
+            weight_vector, stock_vols, corr
         )
 
+        portfolio_returns = self._calculate_portfolio_returns(weight_vector, returns_matrix)
+        portfolio_cvar_95 = self._calculate_portfolio_cvar(portfolio_returns, confidence=0.95)
+
         # === DIVERSIFICATION RATIO ===
         diversification_ratio = self._calculate_diversification_ratio(
-            weights, stock_vols, correlation_matrix
+            weight_vector, stock_vols, corr
         )
 
         # === CONCENTRATION RISK ===
@@ -351,8 +494,6 @@ class RiskAnalyzer:
 
         # === PORTFOLIO DRAWDOWN ===
         # Calculate portfolio equity curve
-        portfolio_returns = self._calculate_portfolio_returns(weights, stock_returns)
-
         if len(portfolio_returns) > 0:
             portfolio_equity = np.cumprod(1 + portfolio_returns) * portfolio_value
             dd_metrics = self._calculate_drawdown_metrics(portfolio_equity)
@@ -419,8 +560,8 @@ class RiskAnalyzer:
             calculated_at=datetime.now().isoformat()
         )
 
-        logger.info(f"Portfolio risk analysis complete: Risk Score={risk_score:.1f}, "
-                   f"Sharpe={sharpe:.2f}, Diversification={diversification_ratio:.2f}")
+        logger.debug(f"Portfolio risk analysis complete: Risk Score={risk_score:.1f}, "
+                     f"Sharpe={sharpe:.2f}, Diversification={diversification_ratio:.2f}")
 
         return metrics
 
@@ -454,22 +595,11 @@ class RiskAnalyzer:
         var = self._value_at_risk(returns, confidence)
         return np.mean(returns[returns <= var])
 
-    def _calculate_portfolio_var(self, weights: Dict[str, float],
-                                 volatilities: Dict[str, float],
-                                 returns: Dict[str, np.ndarray],
-                                 correlation_matrix: Dict[str, Dict[str, float]]) -> Tuple[float, float]:
-        """Portfolio VaR calculation"""
-        # Simplified calculation
-        # In production: use covariance matrix properly
-
-        portfolio_vol = 0.0
-        for stock1, w1 in weights.items():
-            for stock2, w2 in weights.items():
-                if stock1 in volatilities and stock2 in volatilities:
-                    corr = correlation_matrix.get(stock1, {}).get(stock2, 0.0)
-                    portfolio_vol += w1 * w2 * volatilities[stock1] * volatilities[stock2] * corr
-
-        portfolio_vol = np.sqrt(max(0, portfolio_vol))
+    def _calculate_portfolio_var(self, weights: np.ndarray,
+                                 volatilities: np.ndarray,
+                                 correlation: np.ndarray) -> Tuple[float, float]:
+        """Portfolio VaR calculation (parametric, σ_p = √(wσ)ᵀ C (wσ))"""
+        portfolio_vol = self._portfolio_volatility(weights, volatilities, correlation)
 
         # Convert to daily
         daily_vol = portfolio_vol / np.sqrt(252)
@@ -480,13 +610,9 @@ class RiskAnalyzer:
 
         return var_95, var_99
 
-    def _calculate_portfolio_cvar(self, weights: Dict[str, float],
-                                  returns: Dict[str, np.ndarray],
+    def _calculate_portfolio_cvar(self, portfolio_returns: np.ndarray,
                                   confidence: float = 0.95) -> float:
         """Portfolio CVaR"""
-        # Calculate portfolio returns
-        portfolio_returns = self._calculate_portfolio_returns(weights, returns)
-
         if len(portfolio_returns) == 0:
             return 0.0
 
@@ -502,24 +628,16 @@ class RiskAnalyzer:
         current_dd = drawdown[-1]
         max_dd = np.min(drawdown)
 
-        # Max drawdown duration
+        # Max drawdown duration (longest run of drawdown < 0, including an ongoing one)
         in_drawdown = drawdown < 0
-        dd_periods = []
-        current_period = 0
-
-        for is_dd in in_drawdown:
-            if is_dd:
-                current_period += 1
-            else:
-                if current_period > 0:
-                    dd_periods.append(current_period)
-                current_period = 0
-
-        max_dd_duration = max(dd_periods) if dd_periods else 0
+        edges = np.diff(np.concatenate(([0], in_drawdown.astype(np.int8), [0])))
+        run_lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        max_dd_duration = int(run_lengths.max()) if len(run_lengths) else 0
 
         # Recovery period (from last peak to current)
-        last_peak_idx = np.argmax(running_max == equity_curve[-1])
-        recovery_period = len(equity_curve) - last_peak_idx - 1
+        peaks = np.flatnonzero(~in_drawdown)
+        last_peak_idx = peaks[-1] if len(peaks) else 0
+        recovery_period = int(len(equity_curve) - last_peak_idx - 1)
 
         return {
             'current_drawdown': current_dd,
@@ -543,24 +661,18 @@ class RiskAnalyzer:
 
         return covariance / (market_variance + 1e-10)
 
-    def _build_correlation_matrix(self, returns: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
-        """Build correlation matrix"""
-        corr_matrix = {}
-
-        for stock1, ret1 in returns.items():
-            corr_matrix[stock1] = {}
-            for stock2, ret2 in returns.items():
-                if stock1 == stock2:
-                    corr_matrix[stock1][stock2] = 1.0
-                else:
-                    min_len = min(len(ret1), len(ret2))
-                    if min_len > 1:
-                        corr = np.corrcoef(ret1[:min_len], ret2[:min_len])[0, 1]
-                        corr_matrix[stock1][stock2] = corr
-                    else:
-                        corr_matrix[stock1][stock2] = 0.0
-
-        return corr_matrix
+    def _correlation_to_dict(self, stock_codes: List[str],
+                             corr: np.ndarray) -> Dict[str, Dict[str, float]]:
+        """상관계수 배열 → {종목: {종목: 상관계수}}"""
+        return {code: dict(zip(stock_codes, row)) for code, row in zip(stock_codes, corr.tolist())}
+
+    def _correlation_from_dict(self, stock_codes: List[str],
+                               correlation_matrix: Dict[str, Dict[str, float]]) -> np.ndarray:
+        """{종목: {종목: 상관계수}} → 종목 순서에 맞춘 배열 (없는 쌍은 0, 대각은 1)"""
+        corr = np.array([[correlation_matrix.get(a, {}).get(b, 0.0) for b in stock_codes]
+                         for a in stock_codes], dtype=float).reshape(len(stock_codes), len(stock_codes))
+        np.fill_diagonal(corr, 1.0)
+        return corr
 
     # ===== TAIL RISK =====
 
@@ -629,7 +741,7 @@ class RiskAnalyzer:
         return {name: current_price * (1 + change) for name, change in scenarios.items()}
 
     def _run_portfolio_stress_tests(self, weights: Dict[str, float],
-                                    volatilities: Dict[str, float],
+                                    volatilities: np.ndarray,
                                     portfolio_value: float) -> Dict[str, float]:
         """Run portfolio stress tests"""
         scenarios = {}
@@ -640,7 +752,7 @@ class RiskAnalyzer:
             scenarios[f'market_crash_{int(crash_pct*100)}%'] = -loss
 
         # Volatility spike
-        avg_vol = np.mean(list(volatilities.values())) if volatilities else 0.3
+        avg_vol = float(np.mean(volatilities)) if len(volatilities) else 0.3
         scenarios['volatility_spike_2x'] = -portfolio_value * (avg_vol * 2) / np.sqrt(252)
         scenarios['volatility_spike_3x'] = -portfolio_value * (avg_vol * 3) / np.sqrt(252)
 
@@ -652,41 +764,33 @@ class RiskAnalyzer:
 
     # ===== DIVERSIFICATION =====
 
-    def _calculate_diversification_ratio(self, weights: Dict[str, float],
-                                        volatilities: Dict[str, float],
-                                        correlation_matrix: Dict[str, Dict[str, float]]) -> float:
+    def _portfolio_volatility(self, weights: np.ndarray, volatilities: np.ndarray,
+                              correlation: np.ndarray) -> float:
+        """Portfolio volatility (annualized)"""
+        if len(weights) == 0:
+            return 0.0
+        scaled = weights * volatilities
+        return float(np.sqrt(max(0.0, scaled @ correlation @ scaled)))
+
+    def _calculate_diversification_ratio(self, weights: np.ndarray,
+                                        volatilities: np.ndarray,
+                                        correlation: np.ndarray) -> float:
         """Diversification ratio"""
         # Weighted average of individual volatilities
-        weighted_vol = sum(w * volatilities.get(stock, 0) for stock, w in weights.items())
+        weighted_vol = float(weights @ volatilities) if len(weights) else 0.0
 
         # Portfolio volatility
-        portfolio_vol_sq = 0.0
-        for stock1, w1 in weights.items():
-            for stock2, w2 in weights.items():
-                if stock1 in volatilities and stock2 in volatilities:
-                    corr = correlation_matrix.get(stock1, {}).get(stock2, 0.0)
-                    portfolio_vol_sq += w1 * w2 * volatilities[stock1] * volatilities[stock2] * corr
-
-        portfolio_vol = np.sqrt(max(0, portfolio_vol_sq))
+        portfolio_vol = self._portfolio_volatility(weights, volatilities, correlation)
 
         return portfolio_vol / (weighted_vol + 1e-10)
 
-    def _calculate_portfolio_returns(self, weights: Dict[str, float],
-                                    stock_returns: Dict[str, np.ndarray]) -> np.ndarray:
+    def _calculate_portfolio_returns(self, weights: np.ndarray,
+                                    returns_matrix: np.ndarray) -> np.ndarray:
         """Calculate portfolio returns time series"""
-        # Find minimum length
-        min_len = min(len(ret) for ret in stock_returns.values()) if stock_returns else 0
-
-        if min_len == 0:
+        if returns_matrix.size == 0:
             return np.array([])
 
-        portfolio_returns = np.zeros(min_len)
-
-        for stock, weight in weights.items():
-            if stock in stock_returns:
-                portfolio_returns += weight * stock_returns[stock][:min_len]
-
-        return portfolio_returns
+        return returns_matrix @ weights
 
     # ===== RISK SCORING =====
 